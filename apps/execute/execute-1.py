@@ -35,9 +35,15 @@
 #
 ##########################################################################
 
+import os
 import sys
+import json
+import time
 import pathlib
+import threading
 import traceback
+import contextlib
+import concurrent.futures
 
 import imath
 
@@ -111,10 +117,54 @@ class execute( Gaffer.Application ) :
 					},
 				),
 
+				IECore.IntParameter(
+					name = "concurrentTasks",
+					description = "The number of tasks to execute concurrently. Nodes "
+						"which require sequence execution are executed as a single task, "
+						"and all other nodes as one task per frame. The tasks are executed "
+						"on threads within this process, so they share a single compute "
+						"cache and any common upstream results are computed only once. The "
+						"messages output by each task are grouped together, and the time "
+						"taken by each task is reported. A failing task does not prevent "
+						"the others from executing. Only use this if the nodes do not depend "
+						"on one another. A value of 0 uses the number of available hardware "
+						"threads, and the default of 1 executes the nodes one after another.",
+					defaultValue = 1,
+					minValue = 0,
+				),
+
+				IECore.FileNameParameter(
+					name = "performanceRecord",
+					description = "The name of a file in which to record the performance "
+						"of the execution, including the time taken by each task and the "
+						"hash, compute and cache statistics for each plug. This is used by "
+						"the LocalDispatcher, and records may be combined into a single "
+						"report using `gaffer jobstats`.",
+					defaultValue = "",
+					allowEmptyString = True,
+					extensions = "json",
+				),
+
+				IECore.BoolParameter(
+					name = "worker",
+					description = "Runs as a persistent worker process, so that the script "
+						"is loaded only once for many executions. This is used by the "
+						"LocalDispatcher. Requests are read from stdin, one per line, "
+						"each being a JSON object with \"nodes\", \"frames\" and \"context\" "
+						"items in the same form as the parameters above, and an optional "
+						"\"performanceRecord\" item. After each request "
+						"has been executed, its exit status is written to stdout on a line of "
+						"its own. Any other output to stdout is redirected to stderr. The "
+						"nodes, frames, context and performanceRecord parameters are ignored.",
+					defaultValue = False,
+				),
+
 			]
 
 		)
 
+		self.__errorConnections = set()
+
 		self.parameters().userData()["parser"] = IECore.CompoundObject(
 			{
 				"flagless" : IECore.StringVectorData( [ "script" ] )
@@ -133,9 +183,57 @@ class execute( Gaffer.Application ) :
 
 		self.root()["scripts"].addChild( scriptNode )
 
+		concurrentTasks = args["concurrentTasks"].value
+		if concurrentTasks == 0 :
+			concurrentTasks = IECore.hardwareConcurrency()
+
+		if args["worker"].value :
+			return self.__runWorker( scriptNode, concurrentTasks )
+
+		return self.__execute(
+			scriptNode, list( args["nodes"] ),
+			self.parameters()["frames"].getFrameListValue().asList(),
+			list( args["context"] ),
+			concurrentTasks,
+			args["performanceRecord"].value
+		)
+
+	def __runWorker( self, scriptNode, concurrentTasks ) :
+
+		# Keep stdout for ourselves, so that output from the tasks
+		# can't be confused with the results we report.
+		resultFile = os.fdopen( os.dup( sys.stdout.fileno() ), "w" )
+		sys.stdout.flush()
+		os.dup2( sys.stderr.fileno(), sys.stdout.fileno() )
+
+		for line in iter( sys.stdin.readline, "" ) :
+
+			if not line.strip() :
+				continue
+
+			try :
+				request = json.loads( line )
+				frames = IECore.FrameList.parse( request["frames"] ).asList()
+				result = self.__execute(
+					scriptNode, request["nodes"], frames, request["context"], concurrentTasks,
+					request.get( "performanceRecord", "" )
+				)
+			except Exception as exception :
+				IECore.msg( IECore.Msg.Level.Error, "gaffer execute : worker", str( exception ) )
+				result = 1
+
+			sys.stdout.flush()
+			sys.stderr.flush()
+			resultFile.write( "%d\n" % result )
+			resultFile.flush()
+
+		return 0
+
+	def __execute( self, scriptNode, nodeNames, frames, contextArgs, concurrentTasks, performanceRecord ) :
+
 		nodes = []
-		if len( args["nodes"] ) :
-			for nodeName in args["nodes"] :
+		if len( nodeNames ) :
+			for nodeName in nodeNames :
 				node = scriptNode.descendant( nodeName )
 				if node is None :
 					IECore.msg( IECore.Msg.Level.Error, "gaffer execute", "Node \"%s\" does not exist" % nodeName )
@@ -152,16 +250,15 @@ class execute( Gaffer.Application ) :
 				IECore.msg( IECore.Msg.Level.Error, "gaffer execute", "Script has no executable nodes" )
 				return 1
 
-		if len(args["context"]) % 2 :
+		if len( contextArgs ) % 2 :
 			IECore.msg( IECore.Msg.Level.Error, "gaffer execute", "Context parameter must have matching entry/value pairs" )
 			return 1
 
 		context = Gaffer.Context( scriptNode.context() )
-		for i in range( 0, len(args["context"]), 2 ) :
-			entry = args["context"][i].lstrip( "-" )
-			context[entry] = eval( args["context"][i+1] )
+		for i in range( 0, len( contextArgs ), 2 ) :
+			entry = contextArgs[i].lstrip( "-" )
+			context[entry] = eval( contextArgs[i+1] )
 
-		frames = self.parameters()["frames"].getFrameListValue().asList()
 		if not frames :
 			frames = [ scriptNode.context().getFrame() ]
 
@@ -169,25 +266,109 @@ class execute( Gaffer.Application ) :
 		# accidentally using the default frame set in the script
 		del context["frame"]
 
+		for node in nodes :
+			if node.fullName() not in self.__errorConnections :
+				# Only connect once, since a worker may execute the same node many times.
+				node.errorSignal().connect( Gaffer.WeakMethod( self.__error ), scoped = False )
+				self.__errorConnections.add( node.fullName() )
+
+		if performanceRecord :
+			import GafferDispatch
+			performanceRecord = GafferDispatch.PerformanceRecord( performanceRecord, scriptNode )
+		else :
+			# An empty file name means no record was requested.
+			performanceRecord = None
+
+		with performanceRecord or contextlib.nullcontext() :
+
+			if concurrentTasks > 1 :
+				return self.__executeConcurrently( scriptNode, nodes, frames, context, concurrentTasks, performanceRecord )
+
+			with context :
+				for node in nodes :
+					succeeded, duration = self.__executeTask( scriptNode, node, frames, performanceRecord )
+					if not succeeded :
+						return 1
+
+		return 0
+
+	def __executeConcurrently( self, scriptNode, nodes, frames, context, concurrentTasks, performanceRecord ) :
+
+		tasks = []
 		with context :
 			for node in nodes :
-				node.errorSignal().connect( Gaffer.WeakMethod( self.__error ), scoped = False )
 				try :
-					node["task"].executeSequence( frames )
-				except Exception as exception :
-					IECore.msg(
-						IECore.Msg.Level.Debug,
-						"gaffer execute : executing %s" % node.relativeName( scriptNode ),
-						"".join( traceback.format_exception( *sys.exc_info() ) ),
-					)
-					IECore.msg(
-						IECore.Msg.Level.Error,
-						"gaffer execute : executing %s" % node.relativeName( scriptNode ),
-						"See previous message for details",
+					requiresSequenceExecution = node["task"].requiresSequenceExecution()
+				except Exception :
+					# Execute as a single task, so that the error is
+					# reported by `__executeTask()` in the usual way.
+					requiresSequenceExecution = True
+				if requiresSequenceExecution :
+					tasks.append( ( node, frames ) )
+				else :
+					tasks.extend( ( node, [ frame ] ) for frame in frames )
+
+		messagesMutex = threading.Lock()
+
+		def executeTask( task ) :
+
+			node, taskFrames = task
+
+			# Capture the messages from each task so that we can output them
+			# together, rather than interleaved with those from other tasks.
+			# Note that this only captures messages output on the thread
+			# executing the task, and not those from any threads it uses
+			# internally.
+			messageHandler = IECore.CapturingMessageHandler()
+			monitor = performanceRecord.monitor() if performanceRecord else contextlib.nullcontext()
+			with context, messageHandler, monitor :
+				succeeded, duration = self.__executeTask( scriptNode, node, taskFrames, performanceRecord )
+
+			with messagesMutex :
+				for message in messageHandler.messages :
+					IECore.msg( message.level, message.context, message.message )
+				IECore.msg(
+					IECore.Msg.Level.Info,
+					"gaffer execute : executing %s" % node.relativeName( scriptNode ),
+					"%s frames %s in %.2fs" % (
+						"Executed" if succeeded else "Failed to execute",
+						IECore.frameListFromList( [ int( f ) for f in taskFrames ] ), duration
 					)
-					return 1
+				)
 
-		return 0
+			return succeeded
+
+		# `TaskPlug.executeSequence()` releases the GIL, so the tasks run
+		# concurrently even though they are launched from Python threads.
+		with concurrent.futures.ThreadPoolExecutor( max_workers = concurrentTasks ) as executor :
+			results = list( executor.map( executeTask, tasks ) )
+
+		return 0 if all( results ) else 1
+
+	# Returns a tuple of `( succeeded, duration )`.
+	def __executeTask( self, scriptNode, node, frames, performanceRecord = None ) :
+
+		startTime = time.perf_counter()
+		try :
+			node["task"].executeSequence( frames )
+		except Exception as exception :
+			IECore.msg(
+				IECore.Msg.Level.Debug,
+				"gaffer execute : executing %s" % node.relativeName( scriptNode ),
+				"".join( traceback.format_exception( *sys.exc_info() ) ),
+			)
+			IECore.msg(
+				IECore.Msg.Level.Error,
+				"gaffer execute : executing %s" % node.relativeName( scriptNode ),
+				"See previous message for details",
+			)
+			return False, time.perf_counter() - startTime
+
+		duration = time.perf_counter() - startTime
+		if performanceRecord is not None :
+			performanceRecord.addTask( node, frames, duration )
+
+		return True, duration
 
 	def __error( self, plug, source, message ) :
 
@@ -0,0 +1,233 @@
+##########################################################################
+#
+#  Copyright (c) 2024, Cinesite VFX Ltd. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of Cinesite VFX Ltd. nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import sys
+import json
+import pathlib
+import collections
+
+import IECore
+
+import Gaffer
+
+class jobstats( Gaffer.Application ) :
+
+	def __init__( self ) :
+
+		Gaffer.Application.__init__(
+			self,
+			"""
+			Combines the performance records written by the batches of a
+			dispatched job into a single report. This shows the time taken
+			by each node, the plugs that took longest to hash and compute,
+			and the cache hit rates for each type of node, across the whole
+			job. Records are written when the LocalDispatcher's
+			`performanceRecords` plug is on, or when `gaffer execute` is run
+			with the `-performanceRecord` argument.
+
+			Example usage :
+
+			```
+			gaffer jobstats /path/to/jobs/000012
+			```
+			"""
+		)
+
+		self.parameters().addParameters(
+
+			[
+				IECore.StringVectorParameter(
+					name = "records",
+					description = "The records to combine. These may be record "
+						"files, or job directories, in which case all the records "
+						"in the job are used.",
+					defaultValue = IECore.StringVectorData(),
+				),
+
+				IECore.FileNameParameter(
+					name = "outputFile",
+					description = "Output the report to this file on disk rather than "
+						"to the terminal.",
+					defaultValue = "",
+					allowEmptyString = True,
+				),
+
+				IECore.IntParameter(
+					name = "maxLinesPerMetric",
+					description = "The maximum number of items to list in each "
+						"section of the report.",
+					defaultValue = 50,
+				),
+
+			]
+
+		)
+
+		self.parameters().userData()["parser"] = IECore.CompoundObject(
+			{
+				"flagless" : IECore.StringVectorData( [ "records" ] )
+			}
+		)
+
+	def _run( self, args ) :
+
+		fileNames = []
+		for path in args["records"] :
+			path = pathlib.Path( path )
+			if path.is_dir() :
+				fileNames.extend( sorted( ( path / "performance" ).glob( "*.json" ) ) )
+				fileNames.extend( sorted( path.glob( "*.json" ) ) )
+			elif path.is_file() :
+				fileNames.append( path )
+			else :
+				IECore.msg( IECore.Msg.Level.Error, "jobstats", "\"%s\" does not exist" % path )
+				return 1
+
+		if not fileNames :
+			IECore.msg( IECore.Msg.Level.Error, "jobstats", "No performance records found" )
+			return 1
+
+		batchTime = 0.0
+		nodeTimes = collections.defaultdict( lambda : [ 0, 0.0 ] )
+		plugs = collections.defaultdict( collections.Counter )
+		plugNodeTypes = {}
+		plugNodes = {}
+
+		for fileName in fileNames :
+
+			try :
+				with open( fileName, encoding = "utf-8" ) as f :
+					record = json.load( f )
+			except Exception as e :
+				IECore.msg( IECore.Msg.Level.Error, "jobstats", "Unable to read \"%s\" : %s" % ( fileName, e ) )
+				return 1
+
+			batchTime += record["wallTime"]
+			for task in record["tasks"] :
+				nodeTimes[task["node"]][0] += 1
+				nodeTimes[task["node"]][1] += task["duration"]
+
+			for name, statistics in record["plugs"].items() :
+				plugNodeTypes[name] = statistics.pop( "nodeType" )
+				plugNodes[name] = statistics.pop( "node" )
+				plugs[name].update( statistics )
+
+		self.__output = open( args["outputFile"].value, "w" ) if args["outputFile"].value else sys.stdout
+		n = args["maxLinesPerMetric"].value
+
+		self.__output.write( "Job :\n\n" )
+		self.__writeItems( [
+			( "Records", len( fileNames ) ),
+			( "Tasks", sum( x[0] for x in nodeTimes.values() ) ),
+			# Batches may run concurrently, so this is the total time
+			# spent executing them, not the elapsed time for the job.
+			( "Total batch time", _duration( batchTime ) ),
+		] )
+
+		self.__output.write( "\nTask time by node :\n\n" )
+		items = sorted( nodeTimes.items(), key = lambda x : x[1][1], reverse = True )[:n]
+		self.__writeItems(
+			[ ( "", "{:<16}{}".format( "Duration", "Tasks" ) ) ] +
+			[ ( name, "{:<16}{}".format( _duration( t[1] ), t[0] ) ) for name, t in items ]
+		)
+
+		# Hash and compute durations are recorded in nanoseconds, and
+		# hashes and computes are combined for each node.
+
+		nodes = collections.defaultdict( collections.Counter )
+		for name, statistics in plugs.items() :
+			nodes[plugNodes[name]].update( statistics )
+
+		def totalDuration( statistics ) :
+			return ( statistics["hashDuration"] + statistics["computeDuration"] ) / 1e9
+
+		for title, statistics in ( ( "Hottest nodes", nodes ), ( "Hottest plugs", plugs ) ) :
+			self.__output.write( "\n{} :\n\n".format( title ) )
+			items = sorted( statistics.items(), key = lambda x : totalDuration( x[1] ), reverse = True )[:n]
+			self.__writeItems(
+				[ ( "", "{:<16}{:<16}{:<16}{:<12}{}".format( "Total", "Hash", "Compute", "Hashes", "Computes" ) ) ] +
+				[
+					(
+						name,
+						"{:<16}{:<16}{:<16}{:<12}{}".format(
+							_duration( totalDuration( s ) ), _duration( s["hashDuration"] / 1e9 ),
+							_duration( s["computeDuration"] / 1e9 ), s["hashCount"], s["computeCount"]
+						)
+					)
+					for name, s in items if totalDuration( s ) > 0
+				]
+			)
+
+		nodeTypes = collections.defaultdict( collections.Counter )
+		for name, statistics in plugs.items() :
+			nodeTypes[plugNodeTypes[name]].update( statistics )
+
+		def formatCacheStatistics( s ) :
+			lookups = s["cacheHits"] + s["cacheMisses"]
+			return "{:<12}{:<12}{}".format(
+				s["cacheHits"], s["cacheMisses"],
+				"{:.1f}%".format( 100.0 * s["cacheHits"] / lookups ) if lookups else "-"
+			)
+
+		self.__output.write( "\nCache by node type :\n\n" )
+		total = sum( nodeTypes.values(), collections.Counter() )
+		items = sorted( nodeTypes.items(), key = lambda x : x[1]["cacheMisses"], reverse = True )[:n]
+		self.__writeItems(
+			[ ( "", "{:<12}{:<12}{}".format( "Hits", "Misses", "Hit rate" ) ), ( "Total", formatCacheStatistics( total ) ) ] +
+			[ ( name, formatCacheStatistics( s ) ) for name, s in items if s["cacheHits"] + s["cacheMisses"] ]
+		)
+
+		self.__output.write( "\n" )
+		if self.__output is not sys.stdout :
+			self.__output.close()
+
+		return 0
+
+	def __writeItems( self, items ) :
+
+		if not len( items ) :
+			return
+
+		width = max( [ len( x[0] ) for x in items ] ) + 4
+		for name, value in items :
+			self.__output.write( "  {name:<{width}}{value}\n".format( name = name, width = width, value = value ) )
+
+def _duration( seconds ) :
+
+	return "%.3fs" % seconds
+
+IECore.registerRunTimeTyped( jobstats )
@@ -204,6 +204,14 @@ class stats( Gaffer.Application ) :
 					defaultValue = 50,
 				),
 
+				IECore.BoolParameter(
+					name = "cacheStatistics",
+					description = "Collects statistics about the use of the ValuePlug cache, "
+						"reporting hits, misses, evictions and memory usage for each node "
+						"type and plug name.",
+					defaultValue = False,
+				),
+
 				IECore.BoolParameter(
 					name = "contextMonitor",
 					description = "Turns on a Context monitor to provide additional "
@@ -259,6 +267,23 @@ class stats( Gaffer.Application ) :
 					defaultValue = 0,
 				),
 
+				IECore.StringVectorParameter(
+					name = "cachePartitionMemoryLimits",
+					description = "Memory limits for individual partitions of the ValuePlug "
+						"cache, specified as `partition:limit` pairs with limits measured in Mb. "
+						"For instance, `-cachePartitionMemoryLimits scene:4096 image:2048`. "
+						"Partitions without a limit share the main cache.",
+					defaultValue = IECore.StringVectorData(),
+				),
+
+				IECore.StringParameter(
+					name = "cacheEvictionPolicy",
+					description = "The eviction policy for the ValuePlug cache, either `LRU` "
+						"or `ComputeCost`. If this is not specified, the default policy will be "
+						"used, or a policy specified by an application startup file.",
+					defaultValue = "",
+				),
+
 				IECore.IntParameter(
 					name = "hashCacheSizeLimit",
 					description = "The size limit for the per-thread hash cache. If this is not "
@@ -267,6 +292,13 @@ class stats( Gaffer.Application ) :
 					defaultValue = 0,
 				),
 
+				IECore.BoolParameter(
+					name = "hashCacheAdaptive",
+					description = "Turns on adaptive sizing for the per-thread hash caches, "
+						"growing them for threads with high miss rates.",
+					defaultValue = False,
+				),
+
 			]
 
 		)
@@ -281,8 +313,24 @@ class stats( Gaffer.Application ) :
 
 		if args["cacheMemoryLimit"].value :
 			Gaffer.ValuePlug.setCacheMemoryLimit( 1024 * 1024 * args["cacheMemoryLimit"].value )
+		for partitionLimit in args["cachePartitionMemoryLimits"] :
+			partition, _, limit = partitionLimit.partition( ":" )
+			try :
+				limit = int( limit )
+			except ValueError :
+				IECore.msg( IECore.Msg.Level.Error, "stats", "Invalid cache partition memory limit \"%s\"" % partitionLimit )
+				return 1
+			Gaffer.ValuePlug.setCacheMemoryLimit( partition, 1024 * 1024 * limit )
+		if args["cacheEvictionPolicy"].value :
+			policy = getattr( Gaffer.ValuePlug.CacheEvictionPolicy, args["cacheEvictionPolicy"].value, None )
+			if policy is None :
+				IECore.msg( IECore.Msg.Level.Error, "stats", "Invalid cache eviction policy \"%s\"" % args["cacheEvictionPolicy"].value )
+				return 1
+			Gaffer.ValuePlug.setCacheEvictionPolicy( policy )
 		if args["hashCacheSizeLimit"].value :
 			Gaffer.ValuePlug.setHashCacheSizeLimit( args["hashCacheSizeLimit"].value )
+		if args["hashCacheAdaptive"].value :
+			Gaffer.ValuePlug.setHashCacheAdaptive( True )
 
 		self.__timers = collections.OrderedDict()
 		self.__memory = collections.OrderedDict()
@@ -308,6 +356,9 @@ class stats( Gaffer.Application ) :
 					postLoadScriptExecutionContext, postLoadScriptExecutionContext
 				)
 
+		if args["cacheStatistics"].value :
+			Gaffer.ValuePlug.setCacheStatisticsEnabled( True )
+
 		if args["performanceMonitor"].value :
 			self.__performanceMonitor = Gaffer.PerformanceMonitor()
 		else :
@@ -376,6 +427,10 @@ class stats( Gaffer.Application ) :
 
 		self.__output.write( "\n" )
 
+		self.__writeCacheStatistics( script, args )
+
+		self.__output.write( "\n" )
+
 		self.__writePerformance( script, args )
 
 		self.__output.write( "\n" )
@@ -659,6 +714,19 @@ class stats( Gaffer.Application ) :
 			( "", "" ),
 			( "Cache limit", _Memory( Gaffer.ValuePlug.getCacheMemoryLimit() ) ),
 			( "Cache usage", _Memory( Gaffer.ValuePlug.cacheMemoryUsage() ) ),
+			( "Cache evictions", Gaffer.ValuePlug.cacheEvictions() ),
+			( "Cache eviction policy", str( Gaffer.ValuePlug.getCacheEvictionPolicy() ) ),
+		] )
+
+		for partition in Gaffer.ValuePlug.cachePartitions() :
+			items.extend( [
+				( "", "" ),
+				( "Cache limit ({})".format( partition ), _Memory( Gaffer.ValuePlug.getCacheMemoryLimit( partition ) ) ),
+				( "Cache usage ({})".format( partition ), _Memory( Gaffer.ValuePlug.cacheMemoryUsage( partition ) ) ),
+				( "Cache evictions ({})".format( partition ), Gaffer.ValuePlug.cacheEvictions( partition ) ),
+			] )
+
+		items.extend( [
 			( "", "" ),
 			( "Object pool limit", _Memory( objectPool.getMaxMemoryUsage() ) ),
 			( "Object pool usage", _Memory( objectPool.memoryUsage() ) ),
@@ -680,6 +748,43 @@ class stats( Gaffer.Application ) :
 		self.__output.write( "Memory :\n\n" )
 		self.__writeItems( items )
 
+	def __writeCacheStatistics( self, script, args ) :
+
+		if not Gaffer.ValuePlug.getCacheStatisticsEnabled() :
+			return
+
+		byNodeType = collections.defaultdict( Gaffer.ValuePlug.CacheStatistics )
+		byPlugName = collections.defaultdict( Gaffer.ValuePlug.CacheStatistics )
+		total = Gaffer.ValuePlug.CacheStatistics()
+		# Statistics are keyed by the full name of the plug, which may
+		# no longer exist.
+		prefix = script.fullName() + "."
+		for name, statistics in Gaffer.ValuePlug.cacheStatistics().items() :
+			plug = script.descendant( name[len(prefix):] ) if name.startswith( prefix ) else None
+			node = plug.node() if plug is not None else None
+			byNodeType[node.typeName() if node is not None else ""] += statistics
+			byPlugName[plug.relativeName( node ) if node is not None else name] += statistics
+			total += statistics
+
+		def formatStatistics( s ) :
+			lookups = s.hits + s.misses
+			return "{hits:<12}{misses:<12}{hitRate:<12}{evictions:<12}{resident}".format(
+				hits = s.hits, misses = s.misses,
+				hitRate = "{:.1f}%".format( 100.0 * s.hits / lookups ) if lookups else "-",
+				evictions = s.evictions, resident = _Memory( s.residentBytes )
+			)
+
+		header = "{:<12}{:<12}{:<12}{:<12}{}".format( "Hits", "Misses", "Hit rate", "Evictions", "Resident" )
+
+		self.__output.write( "Cache :\n\n" )
+		self.__writeItems( [ ( "", header ), ( "Total", formatStatistics( total ) ) ] )
+
+		for title, statistics in ( ( "By node type", byNodeType ), ( "By plug name", byPlugName ) ) :
+			items = sorted( statistics.items(), key = lambda x : ( x[1].residentBytes, x[1].misses ), reverse = True )
+			items = items[:args["maxLinesPerMetric"].value]
+			self.__output.write( "\n{} :\n\n".format( title ) )
+			self.__writeItems( [ ( "", header ) ] + [ ( name, formatStatistics( s ) ) for name, s in items ] )
+
 	def __writeStatisticsItems( self, script, stats, key, n ) :
 
 		stats.sort( key = key, reverse = True )
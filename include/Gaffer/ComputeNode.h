@@ -84,6 +84,20 @@ class GAFFER_API ComputeNode : public DependencyNode
 		/// Called to determine how calls to `compute()` should be cached. If `compute( output )`
 		/// will spawn TBB tasks then one of the task-based policies _must_ be used.
 		virtual ValuePlug::CachePolicy computeCachePolicy( const ValuePlug *output ) const;
+		/// Called to determine if the results of `compute( output )` should be
+		/// stored in the persistent cache on disk, in addition to the in-memory
+		/// cache. This is only worthwhile for expensive computes, and requires
+		/// that `hash( output )` is stable between processes. The default
+		/// implementation returns false. See `ValuePlug::setPersistentCacheDirectory()`.
+		virtual bool computeCachePersistent( const ValuePlug *output ) const;
+		/// Called to determine which partition of the compute cache should be
+		/// used to store the results of `compute( output )`. Partitions allow
+		/// independent memory limits to be applied to different types of data,
+		/// so that one type can't evict all the others. Partitions without a
+		/// limit of their own share the default cache. The default implementation
+		/// returns "", which identifies the default cache. See
+		/// `ValuePlug::setCacheMemoryLimit()`.
+		virtual IECore::InternedString computeCachePartition( const ValuePlug *output ) const;
 
 	private :
 
@@ -366,6 +366,9 @@ class GAFFER_API Context : public IECore::RefCounted
 		const Value &internalGet( const IECore::InternedString &name ) const;
 		// Returns nullptr if variable doesn't exist.
 		const Value *internalGetIfExists( const IECore::InternedString &name ) const;
+		// Updates `m_hash` to account for a change in the
+		// hash of a single variable, if it is currently valid.
+		void updateHash( const IECore::MurmurHash &oldVariableHash, const IECore::MurmurHash &newVariableHash );
 
 		using Map = boost::container::flat_map<IECore::InternedString, Value>;
 
@@ -168,13 +168,17 @@ void Context::set( const IECore::InternedString &name, const T &value )
 
 inline bool Context::internalSet( const IECore::InternedString &name, const Value &value )
 {
+	// Note : If the variable doesn't exist yet, `v` is default
+	// constructed with a null hash, which `updateHash()` treats
+	// as having no contribution to the total.
+	Value &v = m_map[name];
 	if( !m_changedSignal )
 	{
 		// Fast path, typically in an EditableScope, where we
 		// expect the value to have changed and don't want the
 		// expense of checking.
-		m_map[name] = value;
-		m_hashValid = false;
+		updateHash( v.hash(), value.hash() );
+		v = value;
 		return true;
 	}
 	else
@@ -182,11 +186,10 @@ inline bool Context::internalSet( const IECore::InternedString &name, const Valu
 		// Avoid emitting `changedSignal` if the value hasn't
 		// actually changed. We want to avoid expensive re-evaluations
 		// that might otherwise be triggered in the UI.
-		Value &v = m_map[name];
 		if( v != value )
 		{
+			updateHash( v.hash(), value.hash() );
 			v = value;
-			m_hashValid = false;
 			(*m_changedSignal)( this, name );
 			return true;
 		}
@@ -197,6 +200,20 @@ inline bool Context::internalSet( const IECore::InternedString &name, const Valu
 	}
 }
 
+inline void Context::updateHash( const IECore::MurmurHash &oldVariableHash, const IECore::MurmurHash &newVariableHash )
+{
+	if( m_hashValid )
+	{
+		// The context hash is the sum of the variable hashes, so
+		// we can replace a single variable's contribution without
+		// visiting the others.
+		m_hash = IECore::MurmurHash(
+			m_hash.h1() - oldVariableHash.h1() + newVariableHash.h1(),
+			m_hash.h2() - oldVariableHash.h2() + newVariableHash.h2()
+		);
+	}
+}
+
 inline const Context::Value &Context::internalGet( const IECore::InternedString &name ) const
 {
 	const Value *result = internalGetIfExists( name );
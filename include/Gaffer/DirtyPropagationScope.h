@@ -58,6 +58,11 @@ namespace Gaffer
 /// // outputs of the node only once, at the exit
 /// // of the scope.
 /// ```
+///
+/// The traversal of the graph to find the affected plugs is also
+/// deferred until the scope exits, so that it is performed only once
+/// no matter how many edits are made. Values may still be computed
+/// within the scope, and will reflect the edits made so far.
 class GAFFER_API DirtyPropagationScope : boost::noncopyable
 {
 
@@ -76,6 +76,32 @@ class IECORE_EXPORT Loop : public ComputeNode
 		StringPlug *indexVariablePlug();
 		const StringPlug *indexVariablePlug() const;
 
+		/// Determines how the iterations of the loop are evaluated.
+		enum EvaluationMode
+		{
+			/// Each iteration pulls on the result of the previous
+			/// iteration, recursing until the first iteration is
+			/// reached. This evaluates only the iterations that
+			/// are actually needed, but the depth of the recursion
+			/// is proportional to the number of iterations.
+			Recursive = 0,
+			/// Iterations are evaluated in order, starting from the
+			/// first, with each taking the cached result of the previous
+			/// one. This avoids deep recursion for large numbers of
+			/// iterations, but relies on the results being retained in
+			/// the cache.
+			Sequential = 1,
+			/// As for Sequential, but the iterations are computed
+			/// concurrently. Only beneficial when much of the work
+			/// for each iteration is independent of the result of
+			/// the previous one, as otherwise the iterations must
+			/// wait on each other.
+			Parallel = 2
+		};
+
+		IntPlug *evaluationModePlug();
+		const IntPlug *evaluationModePlug() const;
+
 		Gaffer::BoolPlug *enabledPlug() override;
 		const Gaffer::BoolPlug *enabledPlug() const override;
 
@@ -88,6 +114,7 @@ class IECORE_EXPORT Loop : public ComputeNode
 
 		void hash( const ValuePlug *output, const Context *context, IECore::MurmurHash &h ) const override;
 		void compute( ValuePlug *output, const Context *context ) const override;
+		ValuePlug::CachePolicy computeCachePolicy( const ValuePlug *output ) const override;
 
 	private :
 
@@ -103,7 +130,7 @@ class IECORE_EXPORT Loop : public ComputeNode
 		void addAffectedPlug( const ValuePlug *output, DependencyNode::AffectedPlugsContainer &outputs ) const;
 		const ValuePlug *ancestorPlug( const ValuePlug *plug, std::vector<IECore::InternedString> &relativeName ) const;
 		const ValuePlug *descendantPlug( const ValuePlug *plug, const std::vector<IECore::InternedString> &relativeName ) const;
-		const ValuePlug *sourcePlug( const ValuePlug *output, const Context *context, int &sourceLoopIndex, IECore::InternedString &indexVariable ) const;
+		const ValuePlug *sourcePlug( const ValuePlug *output, const Context *context, int &sourceLoopIndex, IECore::InternedString &indexVariable, EvaluationMode &evaluationMode ) const;
 
 };
 
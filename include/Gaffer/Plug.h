@@ -237,6 +237,14 @@ class GAFFER_API Plug : public GraphComponent
 		/// DependencyNode::affects()).
 		static void propagateDirtiness( Plug *plugToDirty );
 
+		/// Within a DirtyPropagationScope, the traversal of the graph
+		/// performed by `propagateDirtiness()` is deferred until the scope
+		/// exits, so that it is performed only once for all the edits made
+		/// within the scope. This method may be used to perform any pending
+		/// traversal early, so that `dirty()` has been called for all affected
+		/// plugs. Signalling is still deferred until the scope exits.
+		static void flushDirtyPropagationScope();
+
 		/// Called by propagateDirtiness() to inform a plug that it has
 		/// been dirtied. For plugs that implement caching of results, this
 		/// provides an opportunity for the plug to invalidate its cache.
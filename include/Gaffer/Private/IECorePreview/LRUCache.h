@@ -41,6 +41,8 @@
 #include "boost/noncopyable.hpp"
 #include "boost/variant.hpp"
 
+#include <atomic>
+#include <chrono>
 #include <optional>
 
 namespace IECorePreview
@@ -87,7 +89,8 @@ class TaskParallel;
 ///
 /// The Policy determines the thread safety, eviction and performance characteristics
 /// of the cache. See the documentation for each individual policy in the LRUCachePolicy
-/// namespace.
+/// namespace. The order in which items are evicted may be further modified using
+/// `setEvictionPolicy()`.
 ///
 /// The GetterKey may be used where the GetterFunction requires some auxiliary information
 /// in addition to the Key. It must be implicitly castable to Key, and all GetterKeys
@@ -101,6 +104,7 @@ class LRUCache : private boost::noncopyable
 
 		using Cost = size_t;
 		using KeyType = Key;
+		using Duration = std::chrono::nanoseconds;
 
 		/// The GetterFunction is responsible for computing the value and cost for a cache entry
 		/// when given the key. It should throw a descriptive exception if it can't get the data for
@@ -137,8 +141,11 @@ class LRUCache : private boost::noncopyable
 		/// item is cached already.
 		/// \todo Ideally we wouldn't need the cost calculation to be duplicated
 		/// between CostFunction and GetterFunction.
+		///
+		/// If known, the time taken to compute the value may be passed as
+		/// `duration`, for use by the `ComputeCost` eviction policy.
 		template<typename CostFunction>
-		bool setIfUncached( const Key &key, const Value &value, CostFunction &&costFunction );
+		bool setIfUncached( const Key &key, const Value &value, CostFunction &&costFunction, Duration duration = Duration( 0 ) );
 
 		/// Returns true if the object is in the cache. Note that the
 		/// return value may be invalidated immediately by operations performed
@@ -164,6 +171,32 @@ class LRUCache : private boost::noncopyable
 		/// Returns the current cost of all cached items.
 		Cost currentCost() const;
 
+		/// Returns the number of items that have been removed in order
+		/// to meet the maximum cost. Items removed by `erase()` and
+		/// `clear()` are not counted.
+		size_t evictions() const;
+
+		/// Determines which items are chosen for removal when
+		/// the maximum cost is exceeded.
+		enum class EvictionPolicy
+		{
+			/// Items are removed in least recently used order (or an
+			/// approximation of it, depending on the Policy).
+			LRU,
+			/// Items are weighted by the time taken to compute them
+			/// relative to their cost, so that items which are expensive
+			/// to recompute are retained for longer than items which
+			/// are cheap to recompute. Recency is still taken into
+			/// account, so an expensive item will still be evicted if it
+			/// is not used for long enough.
+			ComputeCost
+		};
+
+		/// Sets the eviction policy. Existing items retain the weighting
+		/// they were given when they were added.
+		void setEvictionPolicy( EvictionPolicy evictionPolicy );
+		EvictionPolicy getEvictionPolicy() const;
+
 	private :
 
 		// Data
@@ -199,6 +232,10 @@ class LRUCache : private boost::noncopyable
 
 			State state;
 			Cost cost; // the cost for this item
+			// The number of times the item may be passed
+			// over for eviction, as determined by the
+			// EvictionPolicy. Always at least 1.
+			uint8_t retention;
 
 			Status status() const;
 
@@ -210,13 +247,19 @@ class LRUCache : private boost::noncopyable
 
 		Cost m_maxCost;
 		bool m_cacheErrors;
+		std::atomic<EvictionPolicy> m_evictionPolicy;
+		std::atomic_size_t m_evictions;
 
 		// Methods
 		// =======
 
 		// Updates the cached value and updates the current
 		// total cost.
-		bool setInternal( const Key &key, CacheEntry &cacheEntry, const Value &value, Cost cost );
+		bool setInternal( const Key &key, CacheEntry &cacheEntry, const Value &value, Cost cost, Duration duration );
+
+		// Returns the retention for an item, according to
+		// the current EvictionPolicy.
+		uint8_t retention( Cost cost, Duration duration ) const;
 
 		// Removes any cached value and updates the current total
 		// cost.
@@ -50,6 +50,7 @@
 #include "tbb/spin_mutex.h"
 #include "tbb/spin_rw_mutex.h"
 
+#include <algorithm>
 #include <cassert>
 #include <iostream>
 #include <tuple>
@@ -87,7 +88,8 @@ enum AcquireMode
 // performance over separate containers because it halves the
 // allocations needed, and moving items within the list doesn't
 // require any allocation at all. We keep the list in exact LRU
-// order.
+// order, except where items have been given additional chances
+// by the EvictionPolicy.
 template<typename LRUCache>
 class Serial
 {
@@ -100,7 +102,7 @@ class Serial
 		struct Item
 		{
 			Item( const Key &key )
-				:	key( key ), handleCount( 0 )
+				:	key( key ), handleCount( 0 ), chances( 0 )
 			{
 			}
 
@@ -112,6 +114,9 @@ class Serial
 			// get non-const access to it.
 			mutable CacheEntry cacheEntry;
 			mutable size_t handleCount;
+			// Number of times `pop()` will move the item
+			// to the back of the list rather than popping it.
+			mutable uint8_t chances;
 		};
 
 		using MapAndList = boost::multi_index_container<
@@ -249,6 +254,9 @@ class Serial
 		{
 			List &list = m_mapAndList.template get<1>();
 			list.relocate( list.end(), list.iterator_to( *(handle.m_it) ) );
+			// We are in exact LRU order already, so the first
+			// chance is accounted for by the relocation above.
+			handle.m_it->chances = handle.m_it->cacheEntry.retention - 1;
 		}
 
 		// Pops a copy of the least recently used CacheEntry from the policy,
@@ -265,9 +273,22 @@ class Serial
 			// to `get( someOtherKey )`, and this inner call has
 			// then entered `limitCost()`.
 			typename List::iterator it = list.begin();
-			while( it != list.end() && it->handleCount )
+			while( it != list.end() && ( it->handleCount || it->chances ) )
 			{
-				++it;
+				if( !it->handleCount )
+				{
+					// Item has remaining chances. Use one up by
+					// moving it to the back of the list. This
+					// terminates because `chances` is finite.
+					it->chances--;
+					typename List::iterator next = std::next( it );
+					list.relocate( list.end(), it );
+					it = next;
+				}
+				else
+				{
+					++it;
+				}
 			}
 
 			if( it == list.end() )
@@ -308,16 +329,18 @@ class Parallel
 
 		struct Item
 		{
-			Item() : recentlyUsed() {}
-			Item( const Key &key ) : key( key ), recentlyUsed() {}
-			Item( const Item &other ) : key( other.key ), cacheEntry( other.cacheEntry ), recentlyUsed() {}
+			Item() : chances( 0 ) {}
+			Item( const Key &key ) : key( key ), chances( 0 ) {}
+			Item( const Item &other ) : key( other.key ), cacheEntry( other.cacheEntry ), chances( 0 ) {}
 			Key key;
 			mutable CacheEntry cacheEntry;
 			// Mutex to protect cacheEntry.
 			using Mutex = tbb::spin_rw_mutex;
 			mutable Mutex mutex;
-			// Flag used in second-chance algorithm.
-			mutable std::atomic_bool recentlyUsed;
+			// Counter used in second-chance algorithm. This is
+			// typically 1 for recently used items, but may be higher
+			// for items given more chances by the EvictionPolicy.
+			mutable std::atomic_uint8_t chances;
 		};
 
 		// We would love to use one of TBB's concurrent containers as
@@ -512,8 +535,8 @@ class Parallel
 			// recently. We will then give it a second chance
 			// in pop(), so it will not be evicted immediately.
 			// We don't need the handle to be writable to write
-			// here, because `recentlyUsed` is atomic.
-			handle.m_item->recentlyUsed.store( true, std::memory_order_release );
+			// here, because `chances` is atomic.
+			handle.m_item->chances.store( handle.m_item->cacheEntry.retention, std::memory_order_release );
 		}
 
 		bool pop( Key &key, CacheEntry &cacheEntry )
@@ -559,7 +582,7 @@ class Parallel
 							// We're not empty, but we've been around and around
 							// without finding anything to pop. This could happen
 							// if other threads are frantically setting
-							// the `recentlyUsed` flag or if `clear()` is
+							// the `chances` counter or if `clear()` is
 							// called from `get()`, while `get()` holds the lock
 							// on the only item we could pop.
 							return false;
@@ -569,7 +592,8 @@ class Parallel
 
 				if( itemLock.try_acquire( m_popIterator->mutex ) )
 				{
-					if( !m_popIterator->recentlyUsed.load( std::memory_order_acquire ) )
+					const uint8_t chances = m_popIterator->chances.load( std::memory_order_acquire );
+					if( !chances )
 					{
 						// Pop this item.
 						key = m_popIterator->key;
@@ -587,10 +611,10 @@ class Parallel
 					}
 					else
 					{
-						// Item has been used recently. Flag it so we
-						// can pop it next time round, unless another
-						// thread resets the flag.
-						m_popIterator->recentlyUsed.store( false, std::memory_order_release );
+						// Item has been used recently. Use up one of its
+						// chances, so that we can pop it when they are
+						// exhausted, unless another thread resets them.
+						m_popIterator->chances.store( chances - 1, std::memory_order_release );
 						itemLock.release();
 					}
 				}
@@ -654,16 +678,18 @@ class TaskParallel
 
 		struct Item
 		{
-			Item() : recentlyUsed() {}
-			Item( const Key &key ) : key( key ), recentlyUsed() {}
-			Item( const Item &other ) : key( other.key ), cacheEntry( other.cacheEntry ), recentlyUsed() {}
+			Item() : chances( 0 ) {}
+			Item( const Key &key ) : key( key ), chances( 0 ) {}
+			Item( const Item &other ) : key( other.key ), cacheEntry( other.cacheEntry ), chances( 0 ) {}
 			Key key;
 			mutable CacheEntry cacheEntry;
 			// Mutex to protect cacheEntry.
 			using Mutex = TaskMutex;
 			mutable Mutex mutex;
-			// Flag used in second-chance algorithm.
-			mutable std::atomic_bool recentlyUsed;
+			// Counter used in second-chance algorithm. This is
+			// typically 1 for recently used items, but may be higher
+			// for items given more chances by the EvictionPolicy.
+			mutable std::atomic_uint8_t chances;
 		};
 
 		// We would love to use one of TBB's concurrent containers as
@@ -916,8 +942,8 @@ class TaskParallel
 			// recently. We will then give it a second chance
 			// in pop(), so it will not be evicted immediately.
 			// We don't need the handle to be writable to write
-			// here, because `recentlyUsed` is atomic.
-			handle.m_item->recentlyUsed.store( true, std::memory_order_release );
+			// here, because `chances` is atomic.
+			handle.m_item->chances.store( handle.m_item->cacheEntry.retention, std::memory_order_release );
 		}
 
 		bool pop( Key &key, CacheEntry &cacheEntry )
@@ -963,7 +989,7 @@ class TaskParallel
 							// We're not empty, but we've been around and around
 							// without finding anything to pop. This could happen
 							// if other threads are frantically setting
-							// the `recentlyUsed` flag or if `clear()` is
+							// the `chances` counter or if `clear()` is
 							// called from `get()`, while `get()` holds the lock
 							// on the only item we could pop.
 							return false;
@@ -973,7 +999,8 @@ class TaskParallel
 
 				if( itemLock.tryAcquire( m_popIterator->mutex ) )
 				{
-					if( !m_popIterator->recentlyUsed.load( std::memory_order_acquire ) )
+					const uint8_t chances = m_popIterator->chances.load( std::memory_order_acquire );
+					if( !chances )
 					{
 						// Pop this item.
 						key = m_popIterator->key;
@@ -991,10 +1018,10 @@ class TaskParallel
 					}
 					else
 					{
-						// Item has been used recently. Flag it so we
-						// can pop it next time round, unless another
-						// thread resets the flag.
-						m_popIterator->recentlyUsed.store( false, std::memory_order_release );
+						// Item has been used recently. Use up one of its
+						// chances, so that we can pop it when they are
+						// exhausted, unless another thread resets them.
+						m_popIterator->chances.store( chances - 1, std::memory_order_release );
 						itemLock.release();
 					}
 				}
@@ -1037,7 +1064,7 @@ class TaskParallel
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 LRUCache<Key, Value, Policy, GetterKey>::CacheEntry::CacheEntry()
-	:	cost( 0 )
+	:	cost( 0 ), retention( 1 )
 {
 }
 
@@ -1052,7 +1079,7 @@ typename LRUCache<Key, Value, Policy, GetterKey>::Status LRUCache<Key, Value, Po
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 LRUCache<Key, Value, Policy, GetterKey>::LRUCache( GetterFunction getter, Cost maxCost, RemovalCallback removalCallback, bool cacheErrors )
-	:	m_getter( getter ), m_removalCallback( removalCallback ), m_maxCost( maxCost ), m_cacheErrors( cacheErrors )
+	:	m_getter( getter ), m_removalCallback( removalCallback ), m_maxCost( maxCost ), m_cacheErrors( cacheErrors ), m_evictionPolicy( EvictionPolicy::LRU ), m_evictions( 0 )
 {
 }
 
@@ -1099,6 +1126,24 @@ typename LRUCache<Key, Value, Policy, GetterKey>::Cost LRUCache<Key, Value, Poli
 	return m_policy.currentCost;
 }
 
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+size_t LRUCache<Key, Value, Policy, GetterKey>::evictions() const
+{
+	return m_evictions;
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+void LRUCache<Key, Value, Policy, GetterKey>::setEvictionPolicy( EvictionPolicy evictionPolicy )
+{
+	m_evictionPolicy = evictionPolicy;
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+typename LRUCache<Key, Value, Policy, GetterKey>::EvictionPolicy LRUCache<Key, Value, Policy, GetterKey>::getEvictionPolicy() const
+{
+	return m_evictionPolicy;
+}
+
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key, const IECore::Canceller *canceller )
 {
@@ -1111,6 +1156,13 @@ Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key, const
 	{
 		Value value = Value();
 		Cost cost = 0;
+		// We only time the getter if the duration will be used.
+		const bool timed = m_evictionPolicy.load( std::memory_order_relaxed ) == EvictionPolicy::ComputeCost;
+		std::chrono::steady_clock::time_point startTime;
+		if( timed )
+		{
+			startTime = std::chrono::steady_clock::now();
+		}
 		try
 		{
 			handle.execute( [this, &value, &key, &cost, canceller] { value = m_getter( key, cost, canceller ); } );
@@ -1133,7 +1185,8 @@ Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key, const
 			assert( cacheEntry.status() != Cached ); // this would indicate that another thread somehow
 			assert( cacheEntry.status() != Failed ); // loaded the same thing as us, which is not the intention.
 
-			setInternal( key, handle.writable(), value, cost );
+			const Duration duration = timed ? std::chrono::duration_cast<Duration>( std::chrono::steady_clock::now() - startTime ) : Duration( 0 );
+			setInternal( key, handle.writable(), value, cost, duration );
 			m_policy.push( handle );
 
 			handle.release();
@@ -1186,7 +1239,7 @@ bool LRUCache<Key, Value, Policy, GetterKey>::set( const Key &key, const Value &
 	typename Policy<LRUCache>::Handle handle;
 	m_policy.acquire( key, handle, LRUCachePolicy::InsertWritable, /* canceller = */ nullptr );
 	assert( handle.isWritable() );
-	bool result = setInternal( key, handle.writable(), value, cost );
+	bool result = setInternal( key, handle.writable(), value, cost, Duration( 0 ) );
 	m_policy.push( handle );
 	handle.release();
 	limitCost( m_maxCost );
@@ -1195,7 +1248,7 @@ bool LRUCache<Key, Value, Policy, GetterKey>::set( const Key &key, const Value &
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 template<typename CostFunction>
-bool LRUCache<Key, Value, Policy, GetterKey>::setIfUncached( const Key &key, const Value &value, CostFunction &&costFunction )
+bool LRUCache<Key, Value, Policy, GetterKey>::setIfUncached( const Key &key, const Value &value, CostFunction &&costFunction, Duration duration )
 {
 	typename Policy<LRUCache>::Handle handle;
 	m_policy.acquire( key, handle, LRUCachePolicy::Insert, /* canceller = */ nullptr );
@@ -1205,7 +1258,7 @@ bool LRUCache<Key, Value, Policy, GetterKey>::setIfUncached( const Key &key, con
 	bool result = false;
 	if( status == Uncached && handle.isWritable() )
 	{
-		result = setInternal( key, handle.writable(), value, costFunction( value ) );
+		result = setInternal( key, handle.writable(), value, costFunction( value ), duration );
 		m_policy.push( handle );
 
 		handle.release();
@@ -1215,7 +1268,7 @@ bool LRUCache<Key, Value, Policy, GetterKey>::setIfUncached( const Key &key, con
 }
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
-bool LRUCache<Key, Value, Policy, GetterKey>::setInternal( const Key &key, CacheEntry &cacheEntry, const Value &value, Cost cost )
+bool LRUCache<Key, Value, Policy, GetterKey>::setInternal( const Key &key, CacheEntry &cacheEntry, const Value &value, Cost cost, Duration duration )
 {
 	eraseInternal( key, cacheEntry );
 
@@ -1226,12 +1279,37 @@ bool LRUCache<Key, Value, Policy, GetterKey>::setInternal( const Key &key, Cache
 
 	cacheEntry.state = value;
 	cacheEntry.cost = cost;
+	cacheEntry.retention = retention( cost, duration );
 
 	m_policy.currentCost += cost;
 
 	return true;
 }
 
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+uint8_t LRUCache<Key, Value, Policy, GetterKey>::retention( Cost cost, Duration duration ) const
+{
+	if( m_evictionPolicy.load( std::memory_order_relaxed ) == EvictionPolicy::LRU || duration.count() <= 0 )
+	{
+		return 1;
+	}
+
+	// Grant one additional chance for each factor of 4 by which the
+	// compute time exceeds 1ns per unit of cost. For the ValuePlug
+	// compute cache, this means that a value which takes 20ms to compute
+	// per kilobyte of memory gets the maximum number of chances, while
+	// one that can be recomputed at memcpy speeds gets just the one.
+	const double nanosecondsPerCost = double( duration.count() ) / double( std::max<Cost>( cost, 1 ) );
+	uint8_t result = 1;
+	double threshold = 4.0;
+	while( nanosecondsPerCost >= threshold && result < 8 )
+	{
+		result++;
+		threshold *= 4.0;
+	}
+	return result;
+}
+
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 bool LRUCache<Key, Value, Policy, GetterKey>::cached( const Key &key ) const
 {
@@ -1301,7 +1379,10 @@ void LRUCache<Key, Value, Policy, GetterKey>::limitCost( Cost cost )
 			break;
 		}
 
-		eraseInternal( key, cacheEntry );
+		if( eraseInternal( key, cacheEntry ) )
+		{
+			m_evictions++;
+		}
 	}
 }
 
@@ -42,6 +42,10 @@
 
 #include "IECore/Object.h"
 
+#include "boost/unordered_map.hpp"
+
+#include <filesystem>
+
 namespace Gaffer
 {
 
@@ -171,6 +175,130 @@ class GAFFER_API ValuePlug : public Plug
 		static size_t cacheMemoryUsage();
 		/// Clears the cache.
 		static void clearCache();
+
+		/// Determines how values are chosen for removal from the cache
+		/// when the memory limit is exceeded.
+		enum class CacheEvictionPolicy
+		{
+			/// The least recently used values are removed first.
+			LRU,
+			/// Values are weighted by the time taken to compute them
+			/// relative to their memory usage, so that values which are
+			/// expensive to recompute are retained for longer than those
+			/// which are cheap to recompute.
+			ComputeCost
+		};
+		/// Sets the eviction policy for the cache. The default may be
+		/// specified using the `GAFFER_CACHE_EVICTION_POLICY` environment
+		/// variable.
+		static void setCacheEvictionPolicy( CacheEvictionPolicy cacheEvictionPolicy );
+		static CacheEvictionPolicy getCacheEvictionPolicy();
+		//@}
+
+		/// @name Cache partitions
+		/// The cache may be divided into named partitions with independent
+		/// memory limits, so that one type of data can't evict all the others.
+		/// The partition for each value is chosen by `ComputeNode::computeCachePartition()`.
+		/// Partitions which haven't been given a limit of their own share the
+		/// default partition, which is named "" and is also managed by the functions
+		/// above. The eviction policy and `clearCache()` apply to all partitions.
+		////////////////////////////////////////////////////////////////////
+		//@{
+		/// Returns the memory limit for the partition, which is the limit for
+		/// the default partition if it hasn't been given a limit of its own.
+		static size_t getCacheMemoryLimit( const IECore::InternedString &partition );
+		/// Gives the partition its own memory limit in bytes.
+		static void setCacheMemoryLimit( const IECore::InternedString &partition, size_t bytes );
+		/// Removes the partition's own memory limit, discarding its values so
+		/// that subsequent values are stored in the default partition.
+		static void removeCacheMemoryLimit( const IECore::InternedString &partition );
+		/// Returns the memory usage of the partition in bytes.
+		static size_t cacheMemoryUsage( const IECore::InternedString &partition );
+		/// Returns the number of values that have been removed from the
+		/// partition to keep it within its memory limit.
+		static size_t cacheEvictions( const IECore::InternedString &partition = IECore::InternedString() );
+		/// Returns the names of all partitions with a memory limit of their own.
+		static std::vector<IECore::InternedString> cachePartitions();
+		//@}
+
+		/// @name Cache statistics
+		/// Statistics may be collected for each plug whose values are stored
+		/// in the cache, to help determine appropriate memory limits. Collection
+		/// is disabled by default, because it adds overhead to every cache
+		/// access.
+		////////////////////////////////////////////////////////////////////
+		//@{
+		struct GAFFER_API CacheStatistics
+		{
+
+			CacheStatistics( size_t hits = 0, size_t misses = 0, size_t evictions = 0, size_t residentBytes = 0 );
+
+			/// The number of times a value was found in the cache.
+			size_t hits;
+			/// The number of times a value had to be computed.
+			size_t misses;
+			/// The number of values removed from the cache to keep it
+			/// within its memory limit.
+			size_t evictions;
+			/// The memory currently used by values in the cache.
+			size_t residentBytes;
+
+			CacheStatistics & operator += ( const CacheStatistics &rhs );
+
+			bool operator == ( const CacheStatistics &rhs ) const;
+			bool operator != ( const CacheStatistics &rhs ) const;
+
+		};
+
+		/// Maps from the full name of each plug to its statistics. Names are
+		/// used rather than references, so that collecting statistics does not
+		/// keep plugs alive after they have been removed from the graph.
+		using CacheStatisticsMap = boost::unordered_map<std::string, CacheStatistics>;
+
+		/// Enables or disables the collection of statistics, discarding any
+		/// that have been collected already.
+		/// > Caution : This must not be called while computations are
+		/// > being performed.
+		static void setCacheStatisticsEnabled( bool enabled );
+		static bool getCacheStatisticsEnabled();
+		/// Returns the statistics collected for each plug.
+		/// > Caution : This must not be called while computations are
+		/// > being performed.
+		static CacheStatisticsMap cacheStatistics();
+		//@}
+
+		/// @name Persistent cache management
+		/// In addition to the in-memory cache, values may be stored in an
+		/// optional persistent cache on disk, allowing them to be reused by
+		/// subsequent processes. Only plugs for which
+		/// `ComputeNode::computeCachePersistent()` returns true are stored
+		/// in the persistent cache. The cache is disabled by default, and may
+		/// be enabled either by calling `setPersistentCacheDirectory()` or by
+		/// setting the `GAFFER_PERSISTENT_CACHE_DIRECTORY` environment variable.
+		////////////////////////////////////////////////////////////////////
+		//@{
+		/// Returns the directory used for the persistent cache, or an
+		/// empty path if the persistent cache is disabled.
+		static std::filesystem::path getPersistentCacheDirectory();
+		/// Sets the directory used for the persistent cache, creating it if
+		/// necessary. Any files already in the directory are reused. Passing
+		/// an empty path disables the persistent cache.
+		/// > Caution : This must not be called while computations are
+		/// > being performed.
+		static void setPersistentCacheDirectory( const std::filesystem::path &directory );
+		/// Returns the maximum amount of disk space in bytes to use for the
+		/// persistent cache.
+		static size_t getPersistentCacheLimit();
+		/// Sets the maximum amount of disk space the persistent cache may use
+		/// in bytes, removing the least recently used files as necessary.
+		static void setPersistentCacheLimit( size_t bytes );
+		/// Returns the disk space currently used by the persistent cache in bytes.
+		static size_t persistentCacheUsage();
+		/// Returns the number of values loaded from the persistent cache.
+		static size_t persistentCacheHits();
+		/// Returns the number of values which were looked up in the persistent
+		/// cache but had to be computed.
+		static size_t persistentCacheMisses();
 		//@}
 
 		/// @name Hash cache management
@@ -205,6 +333,19 @@ class GAFFER_API ValuePlug : public Plug
 		static void setHashCacheMode( HashCacheMode hashCacheMode );
 		static HashCacheMode getHashCacheMode();
 
+		/// When adaptive sizing is on, the limit for each per-thread cache is
+		/// adjusted automatically according to the hit rate observed by that
+		/// thread. The limit for a thread with a high miss rate is grown up to
+		/// 8x `getHashCacheSizeLimit()`, provided that the total usage for all
+		/// threads remains below `getHashCacheSizeLimit()` multiplied by the
+		/// number of threads. When the total usage exceeds that, or a thread's
+		/// cache is no longer well used, the limit is shrunk again, but never
+		/// below `getHashCacheSizeLimit()`. Adaptive sizing is off by default,
+		/// but may be turned on using the `GAFFER_HASHCACHE_ADAPTIVE` environment
+		/// variable.
+		static void setHashCacheAdaptive( bool adaptive );
+		static bool getHashCacheAdaptive();
+
 		//@}
 
 		/// Returns a counter that increments when this plug is been dirtied
@@ -278,6 +419,10 @@ class GAFFER_API ValuePlug : public Plug
 		class ComputeProcess;
 		class SetValueAction;
 
+		// For prefetching the results of loop iterations,
+		// regardless of the plug type.
+		friend class Loop;
+
 		IECore::ConstObjectPtr getValueInternal( const IECore::MurmurHash *precomputedHash = nullptr ) const;
 		void setValueInternal( IECore::ConstObjectPtr value, bool propagateDirtiness );
 		void childAddedOrRemoved();
@@ -160,6 +160,48 @@ class ComputeNodeWrapper : public DependencyNodeWrapper<WrappedType>
 			return WrappedType::computeCachePolicy( output );
 		}
 
+		bool computeCachePersistent( const Gaffer::ValuePlug *output ) const override
+		{
+			if( this->isSubclassed() )
+			{
+				IECorePython::ScopedGILLock gilLock;
+				try
+				{
+					boost::python::object f = this->methodOverride( "computeCachePersistent" );
+					if( f )
+					{
+						return boost::python::extract<bool>( f( Gaffer::ValuePlugPtr( const_cast<Gaffer::ValuePlug *>( output ) ) ) );
+					}
+				}
+				catch( const boost::python::error_already_set &e )
+				{
+					IECorePython::ExceptionAlgo::translatePythonException();
+				}
+			}
+			return WrappedType::computeCachePersistent( output );
+		}
+
+		IECore::InternedString computeCachePartition( const Gaffer::ValuePlug *output ) const override
+		{
+			if( this->isSubclassed() )
+			{
+				IECorePython::ScopedGILLock gilLock;
+				try
+				{
+					boost::python::object f = this->methodOverride( "computeCachePartition" );
+					if( f )
+					{
+						return boost::python::extract<std::string>( f( Gaffer::ValuePlugPtr( const_cast<Gaffer::ValuePlug *>( output ) ) ) )();
+					}
+				}
+				catch( const boost::python::error_already_set &e )
+				{
+					IECorePython::ExceptionAlgo::translatePythonException();
+				}
+			}
+			return WrappedType::computeCachePartition( output );
+		}
+
 };
 
 } // namespace GafferBindings
@@ -42,6 +42,7 @@
 
 #include "Gaffer/NumericPlug.h"
 #include "Gaffer/Signals.h"
+#include "Gaffer/TypedPlug.h"
 
 #include "IECore/CompoundData.h"
 #include "IECore/FrameList.h"
@@ -176,6 +177,27 @@ class GAFFERDISPATCH_API Dispatcher : public Gaffer::Node
 		const std::filesystem::path jobDirectory() const;
 		//@}
 
+		//! @name Incremental dispatch
+		/// When enabled, tasks are only dispatched if they have changed
+		/// since they were last executed, in the manner of `make`. Each job
+		/// records the output hashes of the tasks it dispatches, and the output
+		/// files of the tasks it executes, in a "manifest" subdirectory of the job
+		/// directory. Subsequent dispatches with the same `jobsDirectory` and
+		/// `jobName` use these records to prune any task whose `TaskPlug::outputHash()`
+		/// is unchanged,
+		/// whose output files are unmodified, and whose preTasks have all been
+		/// pruned too. Tasks which don't declare any output files via
+		/// `TaskNode::outputFiles()` are always dispatched.
+		///
+		/// > Note : Context variables prefixed with `dispatcher:` are ignored
+		/// > when determining if a task has changed, since they vary from job
+		/// > to job.
+		////////////////////////////////////////////////////////////////////////
+		//@{
+		Gaffer::BoolPlug *incrementalPlug();
+		const Gaffer::BoolPlug *incrementalPlug() const;
+		//@}
+
 		/// A function which creates a Dispatcher.
 		using Creator = std::function<DispatcherPtr ()>;
 		/// SetupPlugsFn may be registered along with a Dispatcher Creator. It will be called by setupPlugs,
@@ -282,6 +304,12 @@ class GAFFERDISPATCH_API Dispatcher : public Gaffer::Node
 
 		void executeAndPruneImmediateBatches( TaskBatch *batch, bool immediate = false ) const;
 
+		// Incremental dispatch and adaptive batching. `recordExecution()`
+		// is called by TaskPlug following successful execution.
+		class Manifest;
+		friend class TaskNode::TaskPlug;
+		static void recordExecution( const TaskNode::TaskPlug *plug, const std::vector<float> &frames, float duration );
+
 		using CreatorMap = std::map<std::string, std::pair<Creator, SetupPlugsFn>>;
 		static CreatorMap &creators();
 
@@ -0,0 +1,90 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef GAFFERDISPATCH_TASKCONTEXTPROCESSOR_H
+#define GAFFERDISPATCH_TASKCONTEXTPROCESSOR_H
+
+#include "GafferDispatch/TaskNode.h"
+
+#include "Gaffer/Context.h"
+
+namespace GafferDispatch
+{
+
+/// Base class for TaskNodes which execute their preTasks in
+/// modified contexts.
+/// \todo Since we can now use regular Gaffer::ContextProcessors
+/// with TaskNodes, the only legitimate subclass of TaskContextProcessor
+/// is the Wedge node. So we could probably just remove the
+/// TaskContextProcessor class entirely.
+class GAFFERDISPATCH_API TaskContextProcessor : public TaskNode
+{
+
+	public :
+
+		explicit TaskContextProcessor( const std::string &name=defaultName<TaskContextProcessor>() );
+		~TaskContextProcessor() override;
+
+		GAFFER_NODE_DECLARE_TYPE( GafferDispatch::TaskContextProcessor, TaskContextProcessorTypeId, TaskNode );
+
+		using Contexts = std::vector<Gaffer::ConstContextPtr>;
+
+	protected :
+
+		/// Returns a Task for each preTask in each of the
+		/// `processedContexts()`.
+		void preTasks( const Gaffer::Context *context, Tasks &tasks ) const override;
+		/// Returns a default hash, to signify that we don't
+		/// do anything in `execute()`.
+		IECore::MurmurHash hash( const Gaffer::Context *context ) const override;
+		void execute() const override;
+
+		/// Must be implemented by derived classes to return the contexts
+		/// to be used by upstream tasks.
+		virtual void processedContexts( const Gaffer::Context *context, Contexts &contexts ) const = 0;
+
+	private :
+
+		// Friendship for the bindings.
+		friend struct GafferDispatchBindings::Detail::TaskNodeAccessor;
+
+};
+
+IE_CORE_DECLAREPTR( TaskContextProcessor );
+
+} // namespace GafferDispatch
+
+#endif // GAFFERDISPATCH_TASKCONTEXTPROCESSOR_H
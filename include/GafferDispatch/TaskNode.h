@@ -151,6 +151,15 @@ class GAFFERDISPATCH_API TaskNode : public Gaffer::DependencyNode
 				/// via a single call to `executeSequence()`, and shouldn't
 				/// be split into several distinct calls.
 				bool requiresSequenceExecution() const;
+				/// Fills files with the names of the files written by `execute()`
+				/// in the current context. Primarily for use by the Dispatcher class,
+				/// to determine if a task needs to be executed again.
+				void outputFiles( std::vector<std::string> &files ) const;
+				/// Returns a hash representing the contents of the files
+				/// returned by `outputFiles()`. Primarily for use by the Dispatcher
+				/// class, to determine if a task needs to be executed again. This
+				/// may be considerably more expensive to compute than `hash()`.
+				IECore::MurmurHash outputHash() const;
 
 				/// Fills tasks with all Tasks that must be completed before `execute()`
 				/// is called in the current context. Primarily for use by the Dispatcher
@@ -225,6 +234,23 @@ class GAFFERDISPATCH_API TaskNode : public Gaffer::DependencyNode
 		/// \todo Add `const TaskPlug *plug, const Context *context` arguments.
 		virtual bool requiresSequenceExecution() const;
 
+		/// Called by `TaskPlug::outputFiles()`. Derived nodes should append
+		/// the names of the files that `execute()` writes in the given context.
+		/// Tasks that declare no output files are always executed by incremental
+		/// dispatches, so this only needs to be implemented by nodes whose side
+		/// effects are fully described by the files they write. The default
+		/// implementation appends nothing.
+		/// \todo Add `const TaskPlug *plug` argument.
+		virtual void outputFiles( const Gaffer::Context *context, std::vector<std::string> &files ) const;
+
+		/// Called by `TaskPlug::outputHash()`. Derived nodes should implement
+		/// this if `hash()` doesn't fully account for the contents of the files
+		/// they write, for instance because the input data would be too expensive
+		/// to hash on every dispatch. It is only called by incremental dispatches.
+		/// The default implementation returns `hash( context )`.
+		/// \todo Add `const TaskPlug *plug` argument.
+		virtual IECore::MurmurHash outputHash( const Gaffer::Context *context ) const;
+
 	private :
 
 		// Friendship for the bindings.
@@ -46,6 +46,8 @@ enum TypeId
 	TaskNodeTypeId = 110160,
 	TaskNodeTaskPlugTypeId = 110161,
 	DispatcherTypeId = 110162,
+	TaskContextProcessorTypeId = 110163,
+	WedgeTypeId = 110164,
 
 	LastTypeId = 110180,
 
@@ -0,0 +1,133 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef GAFFERDISPATCH_WEDGE_H
+#define GAFFERDISPATCH_WEDGE_H
+
+#include "GafferDispatch/TaskContextProcessor.h"
+
+#include "Gaffer/NumericPlug.h"
+#include "Gaffer/SplinePlug.h"
+#include "Gaffer/StringPlug.h"
+#include "Gaffer/TypedObjectPlug.h"
+
+namespace GafferDispatch
+{
+
+/// Executes its preTasks once for each of a range of values
+/// assigned to a context variable.
+class GAFFERDISPATCH_API Wedge : public TaskContextProcessor
+{
+
+	public :
+
+		explicit Wedge( const std::string &name=defaultName<Wedge>() );
+		~Wedge() override;
+
+		GAFFER_NODE_DECLARE_TYPE( GafferDispatch::Wedge, WedgeTypeId, TaskContextProcessor );
+
+		enum Mode
+		{
+			FloatRange,
+			IntRange,
+			ColorRange,
+			FloatList,
+			IntList,
+			StringList
+		};
+
+		Gaffer::StringPlug *variablePlug();
+		const Gaffer::StringPlug *variablePlug() const;
+
+		Gaffer::StringPlug *indexVariablePlug();
+		const Gaffer::StringPlug *indexVariablePlug() const;
+
+		Gaffer::IntPlug *modePlug();
+		const Gaffer::IntPlug *modePlug() const;
+
+		Gaffer::FloatPlug *floatMinPlug();
+		const Gaffer::FloatPlug *floatMinPlug() const;
+
+		Gaffer::FloatPlug *floatMaxPlug();
+		const Gaffer::FloatPlug *floatMaxPlug() const;
+
+		Gaffer::IntPlug *floatStepsPlug();
+		const Gaffer::IntPlug *floatStepsPlug() const;
+
+		Gaffer::IntPlug *intMinPlug();
+		const Gaffer::IntPlug *intMinPlug() const;
+
+		Gaffer::IntPlug *intMaxPlug();
+		const Gaffer::IntPlug *intMaxPlug() const;
+
+		Gaffer::IntPlug *intStepPlug();
+		const Gaffer::IntPlug *intStepPlug() const;
+
+		Gaffer::SplinefColor3fPlug *rampPlug();
+		const Gaffer::SplinefColor3fPlug *rampPlug() const;
+
+		Gaffer::IntPlug *colorStepsPlug();
+		const Gaffer::IntPlug *colorStepsPlug() const;
+
+		Gaffer::FloatVectorDataPlug *floatsPlug();
+		const Gaffer::FloatVectorDataPlug *floatsPlug() const;
+
+		Gaffer::IntVectorDataPlug *intsPlug();
+		const Gaffer::IntVectorDataPlug *intsPlug() const;
+
+		Gaffer::StringVectorDataPlug *stringsPlug();
+		const Gaffer::StringVectorDataPlug *stringsPlug() const;
+
+		/// Returns the values assigned to `variable`, evaluated in the
+		/// current context. The result is a FloatVectorData, IntVectorData,
+		/// Color3fVectorData or StringVectorData depending on the mode.
+		IECore::ConstDataPtr values() const;
+
+	protected :
+
+		void processedContexts( const Gaffer::Context *context, Contexts &contexts ) const override;
+
+	private :
+
+		static size_t g_firstPlugIndex;
+
+};
+
+IE_CORE_DECLAREPTR( Wedge );
+
+} // namespace GafferDispatch
+
+#endif // GAFFERDISPATCH_WEDGE_H
@@ -237,6 +237,54 @@ class TaskNodeWrapper : public GafferBindings::DependencyNodeWrapper<WrappedType
 			return WrappedType::requiresSequenceExecution();
 		}
 
+		void outputFiles( const Gaffer::Context *context, std::vector<std::string> &files ) const override
+		{
+			if( this->isSubclassed() )
+			{
+				IECorePython::ScopedGILLock gilLock;
+				try
+				{
+					boost::python::object override = this->methodOverride( "outputFiles" );
+					if( override )
+					{
+						boost::python::list pythonFiles = boost::python::extract<boost::python::list>(
+							override( Gaffer::ContextPtr( const_cast<Gaffer::Context *>( context ) ) )
+						);
+						boost::python::container_utils::extend_container( files, pythonFiles );
+						return;
+					}
+				}
+				catch( const boost::python::error_already_set &e )
+				{
+					IECorePython::ExceptionAlgo::translatePythonException();
+				}
+			}
+			WrappedType::outputFiles( context, files );
+		}
+
+		IECore::MurmurHash outputHash( const Gaffer::Context *context ) const override
+		{
+			if( this->isSubclassed() )
+			{
+				IECorePython::ScopedGILLock gilLock;
+				try
+				{
+					boost::python::object override = this->methodOverride( "outputHash" );
+					if( override )
+					{
+						return boost::python::extract<IECore::MurmurHash>(
+							override( Gaffer::ContextPtr( const_cast<Gaffer::Context *>( context ) ) )
+						);
+					}
+				}
+				catch( const boost::python::error_already_set &e )
+				{
+					IECorePython::ExceptionAlgo::translatePythonException();
+				}
+			}
+			return WrappedType::outputHash( context );
+		}
+
 };
 
 } // namespace GafferDispatchBindings
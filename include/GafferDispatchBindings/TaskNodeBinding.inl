@@ -110,6 +110,26 @@ static bool requiresSequenceExecution( T &n )
 	return n.T::requiresSequenceExecution();
 }
 
+template<typename T>
+static boost::python::list outputFiles( T &n, Gaffer::Context *context )
+{
+	std::vector<std::string> files;
+	n.T::outputFiles( context, files );
+	boost::python::list result;
+	for( const auto &f : files )
+	{
+		result.append( f );
+	}
+	return result;
+}
+
+template<typename T>
+static IECore::MurmurHash outputHash( T &n, const Gaffer::Context *context )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	return n.T::outputHash( context );
+}
+
 };
 
 } // namespace Detail
@@ -125,6 +145,8 @@ TaskNodeClass<T, Ptr>::TaskNodeClass( const char *docString )
 	this->def( "execute", &Detail::TaskNodeAccessor::execute<T> );
 	this->def( "executeSequence", &Detail::TaskNodeAccessor::executeSequence<T> );
 	this->def( "requiresSequenceExecution", &Detail::TaskNodeAccessor::requiresSequenceExecution<T> );
+	this->def( "outputFiles", &Detail::TaskNodeAccessor::outputFiles<T> );
+	this->def( "outputHash", &Detail::TaskNodeAccessor::outputHash<T> );
 }
 
 } // namespace GafferDispatchBindings
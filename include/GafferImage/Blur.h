@@ -55,6 +55,16 @@ class GAFFERIMAGE_API Blur : public FlatImageProcessor
 
 		GAFFER_NODE_DECLARE_TYPE( GafferImage::Blur, BlurTypeId, FlatImageProcessor );
 
+		enum Mode
+		{
+			/// Filters with a truncated gaussian. The cost per pixel
+			/// is proportional to the radius.
+			Accurate,
+			/// Approximates the gaussian with a series of box filters,
+			/// with a cost per pixel that grows only slowly with the radius.
+			Fast
+		};
+
 		Gaffer::V2fPlug *radiusPlug();
 		const Gaffer::V2fPlug *radiusPlug() const;
 
@@ -64,6 +74,9 @@ class GAFFERIMAGE_API Blur : public FlatImageProcessor
 		Gaffer::BoolPlug *expandDataWindowPlug();
 		const Gaffer::BoolPlug *expandDataWindowPlug() const;
 
+		Gaffer::IntPlug *modePlug();
+		const Gaffer::IntPlug *modePlug() const;
+
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
 
 	protected :
@@ -84,8 +97,19 @@ class GAFFERIMAGE_API Blur : public FlatImageProcessor
 		Resample *resample();
 		const Resample *resample() const;
 
+		// Output plugs for the passes of the Fast mode. Both are evaluated a
+		// tile at a time, using the tile origin and channel name from the
+		// context, and the vertical pass provides the final output tile.
+		Gaffer::FloatVectorDataPlug *horizontalPassPlug();
+		const Gaffer::FloatVectorDataPlug *horizontalPassPlug() const;
+
+		Gaffer::FloatVectorDataPlug *verticalPassPlug();
+		const Gaffer::FloatVectorDataPlug *verticalPassPlug() const;
+
 		void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const override;
+		Gaffer::ValuePlug::CachePolicy computeCachePolicy( const Gaffer::ValuePlug *output ) const override;
+		Gaffer::ValuePlug::CachePolicy hashCachePolicy( const Gaffer::ValuePlug *output ) const override;
 
 		void hashDataWindow( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		Imath::Box2i computeDataWindow( const Gaffer::Context *context, const ImagePlug *parent ) const override;
@@ -67,6 +67,8 @@ class GAFFERIMAGE_API ChannelDataProcessor : public ImageProcessor
 
 	protected :
 
+		int nativeLOD( int lod ) const override;
+
 		/// This implementation queries whether or not the requested channel is masked by the channelMaskPlug().
 		bool channelEnabled( const std::string &channel ) const override;
 
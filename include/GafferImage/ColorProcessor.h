@@ -66,6 +66,8 @@ class GAFFERIMAGE_API ColorProcessor : public ImageProcessor
 
 	protected :
 
+		int nativeLOD( int lod ) const override;
+
 		void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void hashChannelData( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 
@@ -83,10 +85,22 @@ class GAFFERIMAGE_API ColorProcessor : public ImageProcessor
 		/// must call their base class implementation first.
 		virtual void hashColorData( const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 		/// Must be implemented by derived classes to modify R, G and B in place.
+		/// When a ColorProcessor is connected directly to the output of another,
+		/// the downstream node may call this method on the upstream node, so that
+		/// the two can be evaluated in a single pass without caching intermediate
+		/// results. Implementations should therefore depend only on their own plugs
+		/// and the arguments passed, and must not access `inPlug()` directly.
 		virtual void processColorData( const Gaffer::Context *context, IECore::FloatVectorData *r, IECore::FloatVectorData *g, IECore::FloatVectorData *b ) const = 0;
 
 	private :
 
+		// Returns the chain of ColorProcessors whose color processing can be
+		// evaluated in a single pass when computing colorDataPlug() for the specified
+		// layer, ordered from upstream to downstream and ending with this node.
+		// Upstream nodes are included when they are connected directly to our
+		// input, are not used by any other node, and process all of R, G and B.
+		std::vector<const ColorProcessor *> fusedChain( const std::vector<std::string> &channelNames, const std::string &layerName, const Gaffer::Context *context ) const;
+
 		// Used to store the result of processColorData(), so that it can be reused in computeChannelData().
 		// Evaluated in a context with an "image:colorProcessor:__layerName" variable, so we can cache
 		// different results per layer.
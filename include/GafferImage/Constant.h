@@ -69,6 +69,8 @@ class GAFFERIMAGE_API Constant : public FlatImageSource
 
 	protected :
 
+		int nativeLOD( int lod ) const override;
+
 		void hashFormat( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void hashDataWindow( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void hashChannelNames( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
@@ -40,6 +40,7 @@
 #include "IECoreImage/ImagePrimitive.h"
 
 #include "GafferImage/Export.h"
+#include "GafferImage/Format.h"
 
 #include "Gaffer/Context.h"
 
@@ -214,6 +215,22 @@ GAFFERIMAGE_API void throwIfSampleOffsetsMismatch( const IECore::IntVectorData*
 // Return true if the current view in the context is one of the viewNames, or is covered by a default view
 GAFFERIMAGE_API bool viewIsValid( const Gaffer::Context *context, const std::vector< std::string > &viewNames );
 
+/// Level of detail
+/// ==============================
+///
+/// Utilities for working with images evaluated at a reduced level of
+/// detail, as requested via `ImagePlug::lodContextName`.
+
+/// Returns the level of detail requested by the context, or 0 if
+/// the full resolution image is required.
+GAFFERIMAGE_API int lod( const Gaffer::Context *context );
+/// Returns the equivalent of `window` at the specified level of detail.
+/// The result is rounded outwards, so that it includes every pixel which
+/// is partially covered by `window`.
+GAFFERIMAGE_API Imath::Box2i lodWindow( const Imath::Box2i &window, int lod );
+/// Returns the equivalent of `format` at the specified level of detail.
+GAFFERIMAGE_API Format lodFormat( const Format &format, int lod );
+
 } // namespace ImageAlgo
 
 } // namespace GafferImage
@@ -91,6 +91,21 @@ class GAFFERIMAGE_API ImageNode : public Gaffer::ComputeNode
 		/// \deprecated remove this once all derived classes stop using it.
 		virtual bool enabled() const;
 
+		/// Level of detail
+		/// ===============
+		///
+		/// When the `ImagePlug::lodContextName` variable is greater than 0, the
+		/// output image must be computed at a reduced resolution. Derived classes
+		/// may implement `nativeLOD()` to return the level, no greater than `lod`,
+		/// at which they are able to compute their output directly. The hash*()
+		/// and compute*() methods below are then called with that level in the
+		/// context, and ImageNode downsamples the result if it doesn't match the
+		/// requested level. The default implementation returns 0, so that nodes
+		/// which know nothing about levels of detail are always computed at full
+		/// resolution. Nodes which process each pixel independently of its
+		/// position can typically just return `lod`. Called with a GlobalScope.
+		virtual int nativeLOD( int lod ) const;
+
 		/// Implemented to call the hash*() methods below whenever output is part of an ImagePlug.
 		void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		/// Hash methods for the individual children of outPlug(). A derived class must either :
@@ -131,8 +146,15 @@ class GAFFERIMAGE_API ImageNode : public Gaffer::ComputeNode
 		virtual IECore::ConstStringVectorDataPtr computeChannelNames( const Gaffer::Context *context, const ImagePlug *parent ) const;
 		virtual IECore::ConstFloatVectorDataPtr computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const;
 
+		/// Implemented to return "image" for the children of all ImagePlugs.
+		IECore::InternedString computeCachePartition( const Gaffer::ValuePlug *output ) const override;
+
 	private :
 
+		// Calls `nativeLOD( lod )` with a GlobalScope, clamping the result
+		// to the valid range.
+		int clampedNativeLOD( int lod, const Gaffer::Context *context ) const;
+
 		static size_t g_firstPlugIndex;
 };
 
@@ -145,6 +145,12 @@ class GAFFERIMAGE_API ImagePlug : public Gaffer::ValuePlug
 		static const IECore::InternedString viewNameContextName;
 		static const IECore::InternedString channelNameContextName;
 		static const IECore::InternedString tileOriginContextName;
+		/// The name of an optional integer variable used to request that
+		/// the image is evaluated at a reduced level of detail. At level
+		/// `n` the format, data window and channel data are all reduced in
+		/// resolution by a factor of `2^n`. See `ImageNode::nativeLOD()`
+		/// for details of how nodes respond to this variable.
+		static const IECore::InternedString lodContextName;
 
 		/// Utility class to scope a temporary copy of a context,
 		/// with tile/channel specific variables removed. This can be used
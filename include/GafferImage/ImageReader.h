@@ -138,6 +138,8 @@ class GAFFERIMAGE_API ImageReader : public ImageNode
 
 	protected :
 
+		int nativeLOD( int lod ) const override;
+
 		void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const override;
 
@@ -114,6 +114,8 @@ class GAFFERIMAGE_API ImageWriter : public GafferDispatch::TaskNode
 
 		IECore::MurmurHash hash( const Gaffer::Context *context ) const override;
 		void execute() const override;
+		void outputFiles( const Gaffer::Context *context, std::vector<std::string> &files ) const override;
+		IECore::MurmurHash outputHash( const Gaffer::Context *context ) const override;
 
 	private :
 
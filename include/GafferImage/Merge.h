@@ -91,6 +91,8 @@ class GAFFERIMAGE_API Merge : public FlatImageProcessor
 
 	protected :
 
+		int nativeLOD( int lod ) const override;
+
 		/// Reimplemented to hash the connected input plugs
 		void hashDataWindow( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void hashChannelNames( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
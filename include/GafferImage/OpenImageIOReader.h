@@ -94,6 +94,8 @@ class GAFFERIMAGE_API OpenImageIOReader : public ImageNode
 
 	protected :
 
+		int nativeLOD( int lod ) const override;
+
 		void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const override;
 		Gaffer::ValuePlug::CachePolicy computeCachePolicy( const Gaffer::ValuePlug *output ) const override;
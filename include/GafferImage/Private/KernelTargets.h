@@ -0,0 +1,56 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2024, Cinesite VFX Ltd. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of Cinesite VFX Ltd. nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef GAFFERIMAGE_PRIVATE_KERNELTARGETS_H
+#define GAFFERIMAGE_PRIVATE_KERNELTARGETS_H
+
+/// Annotates a function containing a tight, branch-free loop over pixel
+/// data, so that the compiler emits an AVX2 variant alongside the baseline
+/// SSE2 one. The appropriate variant is selected at load time according to
+/// the features of the CPU we're running on. The kernels themselves are
+/// written as plain loops and rely on the compiler's auto-vectorisation,
+/// so that they remain portable to platforms where this is not available,
+/// where the macro expands to nothing.
+///
+/// > Note : The "avx2" target does not imply FMA, so the variants produce
+/// > bit-identical results.
+#if defined( __x86_64__ ) && defined( __linux__ ) && ( !defined( __clang__ ) || __clang_major__ >= 14 )
+#define GAFFERIMAGE_KERNEL_TARGETS __attribute__(( target_clones( "avx2", "default" ) ))
+#else
+#define GAFFERIMAGE_KERNEL_TARGETS
+#endif
+
+#endif // GAFFERIMAGE_PRIVATE_KERNELTARGETS_H
@@ -99,6 +99,8 @@ class GAFFERIMAGE_API Resample : public FlatImageProcessor
 
 	protected :
 
+		int nativeLOD( int lod ) const override;
+
 		void hashDataWindow( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void hashChannelData( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 
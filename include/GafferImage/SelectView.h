@@ -62,6 +62,8 @@ class GAFFERIMAGE_API SelectView : public ImageProcessor
 
 	protected :
 
+		int nativeLOD( int lod ) const override;
+
 		void hashFormat( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void hashDataWindow( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void hashMetadata( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
@@ -95,6 +95,8 @@ class GAFFERIMAGE_API Shuffle : public ImageProcessor
 
 	protected :
 
+		int nativeLOD( int lod ) const override;
+
 		void hashChannelNames( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void hashChannelData( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 
@@ -134,6 +134,14 @@ class GAFFERIMAGEUI_API ImageGadget : public GafferUI::Gadget
 		void setPaused( bool paused );
 		bool getPaused() const;
 
+		/// When on, the image is computed at a reduced level of detail
+		/// when it is zoomed out far enough for pixels to be smaller
+		/// than the screen pixels they are drawn to. This is achieved
+		/// by setting the `image:lod` context variable, as described in
+		/// `ImageAlgo::lod()`. Defaults to off.
+		void setAdaptiveResolution( bool adaptiveResolution );
+		bool getAdaptiveResolution() const;
+
 		static uint64_t tileUpdateCount();
 		static void resetTileUpdateCount();
 
@@ -202,6 +210,8 @@ class GAFFERIMAGEUI_API ImageGadget : public GafferUI::Gadget
 		bool m_paused;
 		ImageGadgetSignal m_stateChangedSignal;
 
+		bool m_adaptiveResolution;
+
 		bool m_wipeEnabled;
 		Imath::V2f m_wipePos;
 		float m_wipeAngle;
@@ -245,14 +255,14 @@ class GAFFERIMAGEUI_API ImageGadget : public GafferUI::Gadget
 
 		struct TileIndex
 		{
-			TileIndex( const Imath::V2i &tileOrigin, IECore::InternedString channelName )
-				:	tileOrigin( tileOrigin ), channelName( channelName )
+			TileIndex( const Imath::V2i &tileOrigin, IECore::InternedString channelName, int lod )
+				:	tileOrigin( tileOrigin ), channelName( channelName ), lod( lod )
 			{
 			}
 
 			bool operator == ( const TileIndex &rhs ) const
 			{
-				return tileOrigin == rhs.tileOrigin && channelName == rhs.channelName;
+				return tileOrigin == rhs.tileOrigin && channelName == rhs.channelName && lod == rhs.lod;
 			}
 
 			struct Hash
@@ -266,12 +276,14 @@ class GAFFERIMAGEUI_API ImageGadget : public GafferUI::Gadget
 					// and is sufficient because all equal InternedStrings are
 					// guaranteed to have the same pointers.
 					boost::hash_combine( result, tileIndex.channelName.c_str() );
+					boost::hash_combine( result, tileIndex.lod );
 					return result;
 				}
 			};
 
 			Imath::V2i tileOrigin;
 			IECore::InternedString channelName;
+			int lod;
 		};
 
 		struct Tile
@@ -316,7 +328,34 @@ class GAFFERIMAGEUI_API ImageGadget : public GafferUI::Gadget
 		// threads.
 
 		void updateTiles();
-		void removeOutOfBoundsTiles() const;
+		void removeOutOfBoundsTiles( int lod, const Imath::Box2i &lodDataWindow ) const;
+
+		// Level of detail. `m_lod` is the level we want to display,
+		// as determined by the viewport zoom. `m_tilesLOD` is the level
+		// of the tiles we are currently displaying, which lags behind
+		// `m_lod` until a complete set of tiles has been computed for
+		// the new level.
+
+		int viewportLOD() const;
+		void updateLOD( int lod );
+		const Imath::Box2i &tilesDataWindow() const;
+
+		int m_lod;
+		int m_tilesLOD;
+		Imath::Box2i m_tilesDataWindow;
+
+		// Region of interest. We only compute tiles within `m_region`,
+		// which is padded from the region visible in the viewport so
+		// that small pans don't each require an update. `m_tilesRegion`
+		// is the region covered by the most recent update, which we
+		// use to determine when panning has revealed tiles that haven't
+		// been computed. Both are in full resolution pixel space.
+
+		Imath::Box2i viewportRegion() const;
+		void updateRegion( const Imath::Box2i &visibleRegion );
+
+		Imath::Box2i m_region;
+		Imath::Box2i m_tilesRegion;
 
 		std::unique_ptr<Gaffer::BackgroundTask> m_tilesTask;
 		std::atomic_bool m_renderRequestPending;
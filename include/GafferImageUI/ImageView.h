@@ -114,6 +114,9 @@ class GAFFERIMAGEUI_API ImageView : public GafferUI::View
 		Gaffer::BoolPlug *lutGPUPlug();
 		const Gaffer::BoolPlug *lutGPUPlug() const;
 
+		Gaffer::BoolPlug *adaptiveResolutionPlug();
+		const Gaffer::BoolPlug *adaptiveResolutionPlug() const;
+
 		Gaffer::StringPlug *viewPlug();
 		const Gaffer::StringPlug *viewPlug() const;
 		Gaffer::StringPlug *compareModePlug();
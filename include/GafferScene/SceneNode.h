@@ -126,6 +126,8 @@ class GAFFERSCENE_API SceneNode : public Gaffer::ComputeNode
 
 		Gaffer::ValuePlug::CachePolicy hashCachePolicy( const Gaffer::ValuePlug *output ) const override;
 		Gaffer::ValuePlug::CachePolicy computeCachePolicy( const Gaffer::ValuePlug *output ) const override;
+		/// Implemented to return "scene" for the children of all ScenePlugs.
+		IECore::InternedString computeCachePartition( const Gaffer::ValuePlug *output ) const override;
 
 		/// Returns `enabledPlug()->getValue()` evaluated in a global context.
 		/// Disabling is handled automatically by the SceneNode and SceneProcessor
@@ -189,6 +189,8 @@ GAFFERTEST_API void testEditableScope();
 GAFFERTEST_API std::tuple<int,int,int,int> countContextHash32Collisions( int contexts, int mode, int seed );
 GAFFERTEST_API void testContextHashPerformance( int numEntries, int entrySize, bool startInitialized );
 GAFFERTEST_API void testContextCopyPerformance( int numEntries, int entrySize );
+GAFFERTEST_API void testContextNestedScopePerformance( int numEntries, int depth );
+GAFFERTEST_API void testContextVariationPerformance( int numEntries, int numVariables );
 GAFFERTEST_API void testCopyEditableScope();
 GAFFERTEST_API void testContextHashValidation();
 
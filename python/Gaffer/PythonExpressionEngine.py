@@ -55,45 +55,59 @@ class PythonExpressionEngine( Gaffer.Expression.Engine ) :
 
 		parser = _Parser( expression )
 
-		self.__expression = expression
-		self.__inPlugPaths = sorted( parser.plugReads )
-		self.__outPlugPaths = sorted( parser.plugWrites )
+		inPlugPaths = sorted( parser.plugReads )
+		outPlugPaths = sorted( parser.plugWrites )
 
-		inPlugs.extend( [ self.__plug( node, p ) for p in self.__inPlugPaths ] )
-		outPlugs.extend( [ self.__plug( node, p ) for p in self.__outPlugPaths ] )
+		parsedInPlugs = [ self.__plug( node, p ) for p in inPlugPaths ]
+		inPlugs.extend( parsedInPlugs )
+		outPlugs.extend( [ self.__plug( node, p ) for p in outPlugPaths ] )
 		contextNames.extend( parser.contextReads )
 
+		# `execute()` must hold the GIL, so parallel evaluations are serialised
+		# while it runs. We therefore do as much of the work as possible here,
+		# so that the GIL is held for as short a time as possible. Note that
+		# the types of the proxy plugs passed to `execute()` always match the
+		# types of the plugs we return here.
+
+		self.__code = compile( expression, "<string>", "exec" )
+		self.__inPlugLookups = [
+			( plugPath.split( "." )[:-1], plugPath.split( "." )[-1], isinstance( plug, Gaffer.CompoundDataPlug ) )
+			for plugPath, plug in zip( inPlugPaths, parsedInPlugs )
+		]
+		self.__outPlugLookups = [
+			( plugPath.split( "." )[:-1], plugPath.split( "." )[-1], plugPath )
+			for plugPath in outPlugPaths
+		]
+
 	def execute( self, context, inputs ) :
 
 		plugDict = {}
-		for plugPath, plug in zip( self.__inPlugPaths, inputs ) :
+		for ( parentPath, name, isCompoundData ), plug in zip( self.__inPlugLookups, inputs ) :
 			parentDict = plugDict
-			plugPathSplit = plugPath.split( "." )
-			for p in plugPathSplit[:-1] :
+			for p in parentPath :
 				parentDict = parentDict.setdefault( p, {} )
-			if isinstance( plug, Gaffer.CompoundDataPlug ) :
+			if isCompoundData :
 				value = IECore.CompoundData()
 				plug.fillCompoundData( value )
 			else :
 				value = plug.getValue()
-			parentDict[plugPathSplit[-1]] = value
+			parentDict[name] = value
 
-		for plugPath in self.__outPlugPaths :
+		for parentPath, name, plugPath in self.__outPlugLookups :
 			parentDict = plugDict
-			for p in plugPath.split( "." )[:-1] :
+			for p in parentPath :
 				parentDict = parentDict.setdefault( p, {} )
 
 		executionDict = { "imath" : imath, "IECore" : IECore, "parent" : plugDict, "context" : _ContextProxy( context ) }
 
-		exec( self.__expression, executionDict, executionDict )
+		exec( self.__code, executionDict, executionDict )
 
 		result = IECore.ObjectVector()
-		for plugPath in self.__outPlugPaths :
+		for parentPath, name, plugPath in self.__outPlugLookups :
 			parentDict = plugDict
-			plugPathSplit = plugPath.split( "." )
-			for p in plugPathSplit[:-1] :
+			for p in parentPath :
 				parentDict = parentDict[p]
-			r = parentDict.get( plugPathSplit[-1], IECore.NullObject.defaultNullObject() )
+			r = parentDict.get( name, IECore.NullObject.defaultNullObject() )
 			try:
 				result.append( r )
 			except:
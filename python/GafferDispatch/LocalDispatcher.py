@@ -36,6 +36,8 @@
 
 import os
 import errno
+import json
+import queue
 import signal
 import shlex
 import subprocess
@@ -57,6 +59,9 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 		self["executeInBackground"] = Gaffer.BoolPlug( defaultValue = False )
 		self["ignoreScriptLoadErrors"] = Gaffer.BoolPlug( defaultValue = False )
 		self["environmentCommand"] = Gaffer.StringPlug()
+		self["maxConcurrentTasks"] = Gaffer.IntPlug( defaultValue = 1, minValue = 1 )
+		self["persistentWorkers"] = Gaffer.BoolPlug( defaultValue = False )
+		self["performanceRecords"] = Gaffer.BoolPlug( defaultValue = False )
 
 		self.__jobPool = jobPool if jobPool else LocalDispatcher.defaultJobPool()
 
@@ -92,6 +97,11 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			self.__environmentCommand = Gaffer.Context.current().substitute(
 				dispatcher["environmentCommand"].getValue()
 			)
+			self.__maxConcurrentTasks = dispatcher["maxConcurrentTasks"].getValue()
+			self.__persistentWorkers = dispatcher["persistentWorkers"].getValue()
+			self.__idleWorkers = []
+			self.__performanceRecords = dispatcher["performanceRecords"].getValue()
+			self.__numPerformanceRecords = 0
 
 			self.__messageHandler = IECore.CapturingMessageHandler()
 			self.__messageTitle = "%s : Job %s %s" % ( self.__dispatcher.getName(), self.__name, self.__id )
@@ -112,23 +122,23 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
 		def description( self ) :
 
-			batch = self.__currentBatch()
-			if batch is None or batch.plug() is None :
+			batches = [ b for b in self.__runningBatches() if b.plug() is not None ]
+			if not batches :
 				return "N/A"
 
-			frames = str( IECore.frameListFromList( [ int(x) for x in batch.frames() ] ) )
-
-			return "Executing " + batch.blindData()["nodeName"].value + " on frames " + frames
+			return "Executing " + ", ".join(
+				b.blindData()["nodeName"].value + " on frames " + str( IECore.frameListFromList( [ int(x) for x in b.frames() ] ) )
+				for b in batches
+			)
 
 		def statistics( self ) :
 
-			batch = self.__currentBatch()
-			if batch is None or "pid" not in batch.blindData().keys() :
+			pids = [ b.blindData()["pid"].value for b in self.__runningBatches() if "pid" in b.blindData() ]
+			if not pids :
 				return {}
 
 			rss = 0
 			pcpu = 0.0
-			pid = batch.blindData().get( "pid" )
 
 			try :
 				stats = subprocess.check_output(
@@ -136,14 +146,15 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 					universal_newlines = True,
 				).split()
 				for i in range( 0, len(stats), 6 ) :
-					if str(pid) in stats[i:i+4] :
+					if any( str(pid) in stats[i:i+4] for pid in pids ) :
 						pcpu += float(stats[i+4])
 						rss += float(stats[i+5])
 			except :
 				return {}
 
 			return {
-				"pid" : pid,
+				"pid" : pids[0],
+				"pids" : pids,
 				"pcpu" : pcpu,
 				"rss" : rss,
 			}
@@ -155,6 +166,7 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 		def execute( self, background = False ) :
 
 			if background :
+				self.__dispatcher.jobPool()._queue( self )
 				threading.Thread( target = self.__backgroundDispatch ).start()
 			else :
 				with self.__messageHandler :
@@ -214,7 +226,14 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
 			try :
 				self.__setStatus( batch, LocalDispatcher.Job.Status.Running )
-				batch.execute()
+				performanceRecord = self.__performanceRecordFileName( batch )
+				if performanceRecord :
+					with GafferDispatch.PerformanceRecord( performanceRecord, batch.node().scriptNode() ) as record :
+						startTime = time.perf_counter()
+						batch.execute()
+						record.addTask( batch.node(), batch.frames(), time.perf_counter() - startTime )
+				else :
+					batch.execute()
 			except Exception as e :
 				IECore.msg( IECore.MessageHandler.Level.Debug, self.__messageTitle, traceback.format_exc() )
 				self.__reportFailed( batch )
@@ -227,44 +246,169 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 		def __backgroundDispatch( self ) :
 
 			with self.__messageHandler :
-				self.__doBackgroundDispatch( self.__batch )
+				try :
+					self.__doBackgroundDispatch( self.__batch )
+				finally :
+					for threads, worker in self.__idleWorkers :
+						worker.close()
+					self.__idleWorkers = []
+					self.__dispatcher.jobPool()._dequeue( self )
+
+		# Executes the batch graph by launching a `gaffer execute` process for
+		# each batch. Batches are launched as soon as all their preTasks have
+		# completed, so independent batches run concurrently, subject to
+		# `maxConcurrentTasks` and admission by the JobPool, which accounts for
+		# the batches of all jobs. When only one task may run at a time, this
+		# executes batches in the same depth-first order as a foreground dispatch.
+		def __doBackgroundDispatch( self, rootBatch ) :
+
+			batches = []
+			self.__postOrderWalk( rootBatch, set(), batches )
+
+			jobPool = self.__dispatcher.jobPool()
+			running = {}
+			failed = False
+
+			while True :
+
+				# Reap any processes that have finished.
+
+				for batch, process in list( running.items() ) :
+					if process.poll() is None :
+						continue
+					del running[batch]
+					jobPool._release( batch )
+					if isinstance( process, _WorkerProcess ) :
+						if process.returncode :
+							# Don't reuse workers after a failure, in case the
+							# failure has left them in a bad state.
+							process.close()
+						else :
+							self.__idleWorkers.append( ( batch.blindData()["threads"].value, process ) )
+					if process.returncode :
+						self.__setStatus( batch, LocalDispatcher.Job.Status.Failed )
+						failed = True
+					else :
+						self.__setStatus( batch, LocalDispatcher.Job.Status.Complete )
+
+				if rootBatch.blindData().get( "killed" ) :
+					for batch, process in running.items() :
+						self.__killProcess( process )
+						self.__setStatus( batch, LocalDispatcher.Job.Status.Killed )
+						jobPool._release( batch )
+					self.__reportKilled( rootBatch )
+					return False
 
-		def __doBackgroundDispatch( self, batch ) :
+				if failed :
+					# Don't launch anything new, but allow batches that are
+					# already running to finish so their output isn't left
+					# in a partial state.
+					if running :
+						time.sleep( 0.01 )
+						continue
+					batch = next( b for b in batches if self.__getStatus( b ) == LocalDispatcher.Job.Status.Failed )
+					self.__reportFailed( batch )
+					return False
 
-			if self.__getStatus( batch ) == LocalDispatcher.Job.Status.Complete :
-				return True
+				# Launch any batches whose preTasks are complete, for as long
+				# as we have the resources to do so.
 
-			for upstreamBatch in batch.preTasks() :
-				if not self.__doBackgroundDispatch( upstreamBatch ) :
-					return False
+				waiting = False
+				for batch in batches :
 
-			if batch.blindData().get( "killed" ) :
-				self.__reportKilled( batch )
-				return False
+					if self.__getStatus( batch ) != LocalDispatcher.Job.Status.Waiting :
+						continue
 
-			if batch.plug() is None :
-				self.__reportCompleted( batch )
-				return True
+					waiting = True
+					if any( self.__getStatus( b ) != LocalDispatcher.Job.Status.Complete for b in batch.preTasks() ) :
+						continue
 
-			if len( batch.frames() ) == 0 :
-				# This case occurs for nodes like TaskList and TaskContextProcessors,
-				# because they don't do anything in execute (they have empty hashes).
-				# Their batches exist only to depend on upstream batches. We don't need
-				# to do any work here, but we still signal completion for the task to
-				# provide progress feedback to the user.
-				self.__setStatus( batch, LocalDispatcher.Job.Status.Complete )
-				IECore.msg( IECore.MessageHandler.Level.Info, self.__messageTitle, "Finished " + batch.blindData()["nodeName"].value )
-				return True
+					if batch.plug() is None :
+						self.__reportCompleted( batch )
+						return True
 
-			taskContext = batch.context()
+					if len( batch.frames() ) == 0 :
+						# This case occurs for nodes like TaskList and TaskContextProcessors,
+						# because they don't do anything in execute (they have empty hashes).
+						# Their batches exist only to depend on upstream batches. We don't need
+						# to do any work here, but we still signal completion for the task to
+						# provide progress feedback to the user.
+						self.__setStatus( batch, LocalDispatcher.Job.Status.Complete )
+						IECore.msg( IECore.MessageHandler.Level.Info, self.__messageTitle, "Finished " + batch.blindData()["nodeName"].value )
+						continue
+
+					if len( running ) >= self.__maxConcurrentTasks :
+						break
+
+					if not jobPool._admit( self, batch ) :
+						continue
+
+					running[batch] = self.__launch( batch )
+
+				if not running and not waiting :
+					# Everything was already complete, for instance because the
+					# root batch was completed by another job.
+					return True
+
+				time.sleep( 0.01 )
+
+		def __launch( self, batch ) :
+
+			threads = batch.blindData()["threads"].value
+			nodeName = batch.blindData()["nodeName"].value
 			frames = str( IECore.frameListFromList( [ int(x) for x in batch.frames() ] ) )
+			contextArgs = self.__contextArgs( batch )
+			performanceRecord = self.__performanceRecordFileName( batch )
+
+			self.__setStatus( batch, LocalDispatcher.Job.Status.Running )
+
+			if self.__persistentWorkers :
+				process = self.__acquireWorker( threads )
+				IECore.msg(
+					IECore.MessageHandler.Level.Info, self.__messageTitle,
+					"Executing {} on frames {} in worker {}".format( nodeName, frames, process.pid )
+				)
+				process.execute( nodeName, frames, contextArgs, performanceRecord )
+			else :
+				args = self.__executeCommand( threads ) + [ "-nodes", nodeName, "-frames", frames ]
+				if performanceRecord :
+					args.extend( [ "-performanceRecord", performanceRecord ] )
+				if contextArgs :
+					args.extend( [ "-context" ] + contextArgs )
+				IECore.msg( IECore.MessageHandler.Level.Info, self.__messageTitle, " ".join( args ) )
+				process = subprocess.Popen( args, **self.__popenKeywords() )
+
+			batch.blindData()["pid"] = IECore.IntData( process.pid )
+
+			return process
+
+		def __acquireWorker( self, threads ) :
+
+			# Discard any workers that have exited while idle, since they
+			# can't execute anything more.
+			idleWorkers = []
+			for workerThreads, worker in self.__idleWorkers :
+				if worker.exited() :
+					worker.close()
+				else :
+					idleWorkers.append( ( workerThreads, worker ) )
+			self.__idleWorkers = idleWorkers
+
+			for i, ( workerThreads, worker ) in enumerate( self.__idleWorkers ) :
+				if workerThreads == threads :
+					del self.__idleWorkers[i]
+					return worker
+
+			args = self.__executeCommand( threads ) + [ "-worker" ]
+			IECore.msg( IECore.MessageHandler.Level.Info, self.__messageTitle, " ".join( args ) )
+			return _WorkerProcess( args, self.__popenKeywords() )
+
+		def __executeCommand( self, threads ) :
 
 			args = [
 				str( Gaffer.executablePath() ),
 				"execute",
 				"-script", str( self.__scriptFile ),
-				"-nodes", batch.blindData()["nodeName"].value,
-				"-frames", frames,
 			]
 
 			args = shlex.split( self.__environmentCommand ) + args
@@ -272,44 +416,71 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			if self.__ignoreScriptLoadErrors :
 				args.append( "-ignoreScriptLoadErrors" )
 
+			if threads :
+				args.extend( [ "-threads", str( threads ) ] )
+
+			return args
+
+		# Returns the file to record the performance of the batch in, or
+		# an empty string if performance records were not requested.
+		def __performanceRecordFileName( self, batch ) :
+
+			if not self.__performanceRecords or not len( batch.frames() ) :
+				return ""
+
+			# Batches for the same node and frames may differ by context,
+			# so we number them to give each a unique file.
+			self.__numPerformanceRecords += 1
+			return os.path.join(
+				self.__directory, "performance",
+				"{}.{}.json".format( batch.blindData()["nodeName"].value, self.__numPerformanceRecords )
+			)
+
+		def __contextArgs( self, batch ) :
+
+			taskContext = batch.context()
+
 			contextArgs = []
 			for entry in [ k for k in taskContext.keys() if k != "frame" and not k.startswith( "ui:" ) ] :
 				if entry not in self.__context.keys() or taskContext[entry] != self.__context[entry] :
 					contextArgs.extend( [ "-" + entry, IECore.repr( taskContext[entry] ) ] )
 
-			if contextArgs :
-				args.extend( [ "-context" ] + contextArgs )
+			return contextArgs
 
-			self.__setStatus( batch, LocalDispatcher.Job.Status.Running )
-			IECore.msg( IECore.MessageHandler.Level.Info, self.__messageTitle, " ".join( args ) )
-			if os.name == "nt":
-				if self.__environmentCommand :
-					process = subprocess.Popen( args, shell=True )
-				else :
-					process = subprocess.Popen( args )
-			else:
-				process = subprocess.Popen( args, start_new_session=True )
-			batch.blindData()["pid"] = IECore.IntData( process.pid )
+		def __popenKeywords( self ) :
 
-			while process.poll() is None :
+			if os.name == "nt" :
+				return { "shell" : True } if self.__environmentCommand else {}
+			else :
+				return { "start_new_session" : True }
 
-				if batch.blindData().get( "killed" ) :
-					if os.name == "nt" :
-						subprocess.check_call( [ "TASKKILL", "/F", "/PID", str( process.pid ), "/T" ] )
-					else :
-						os.killpg( process.pid, signal.SIGTERM )
-					self.__reportKilled( batch )
-					return False
+		@staticmethod
+		def __killProcess( process ) :
 
-				time.sleep( 0.01 )
+			if os.name == "nt" :
+				subprocess.check_call( [ "TASKKILL", "/F", "/PID", str( process.pid ), "/T" ] )
+			else :
+				os.killpg( process.pid, signal.SIGTERM )
 
-			if process.returncode :
-				self.__reportFailed( batch )
-				return False
+			# Reap the process so that it doesn't linger as a zombie, resorting
+			# to SIGKILL if it doesn't respond to SIGTERM in good time.
+			try :
+				process.wait( timeout = 10 )
+			except subprocess.TimeoutExpired :
+				if os.name != "nt" :
+					os.killpg( process.pid, signal.SIGKILL )
+				process.wait()
 
-			self.__setStatus( batch, LocalDispatcher.Job.Status.Complete )
+		def __postOrderWalk( self, batch, visited, result ) :
 
-			return True
+			if batch in visited :
+				return
+
+			visited.add( batch )
+			for upstreamBatch in batch.preTasks() :
+				self.__postOrderWalk( upstreamBatch, visited, result )
+
+			result.append( batch )
 
 		def __getStatus( self, batch ) :
 
@@ -338,28 +509,22 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			self.__dispatcher.jobPool()._remove( self )
 			IECore.msg( IECore.MessageHandler.Level.Info, self.__messageTitle, "Killed " + self.name() )
 
-		def __currentBatch( self ) :
-
-			## \todo Consider just storing the current batch, rather
-			# than searching each time it is requested.
-			return self.__currentBatchWalk( self.__batch, set() )
-
-		def __currentBatchWalk( self, batch, visited ) :
-
-			if batch in visited :
-				return None
-
-			visited.add( batch )
+		# Returns the number of batches still to be launched, for use in
+		# estimating when queued jobs will start.
+		def _numWaitingBatches( self ) :
 
-			if self.__getStatus( batch ) == LocalDispatcher.Job.Status.Running :
-				return batch
+			batches = []
+			self.__postOrderWalk( self.__batch, set(), batches )
+			return len( [
+				b for b in batches
+				if b.plug() is not None and len( b.frames() ) and self.__getStatus( b ) == LocalDispatcher.Job.Status.Waiting
+			] )
 
-			for upstreamBatch in batch.preTasks() :
-				currentBatch = self.__currentBatchWalk( upstreamBatch, visited )
-				if currentBatch is not None :
-					return currentBatch
+		def __runningBatches( self ) :
 
-			return None
+			batches = []
+			self.__postOrderWalk( self.__batch, set(), batches )
+			return [ b for b in batches if self.__getStatus( b ) == LocalDispatcher.Job.Status.Running ]
 
 		def __initBatchWalk( self, batch ) :
 
@@ -372,11 +537,34 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 				nodeName = batch.plug().node().relativeName( batch.plug().node().scriptNode() )
 			batch.blindData()["nodeName"] = nodeName
 
+			# Resource hints are read now rather than during a background
+			# dispatch, because the graph may be edited while that is running.
+			threads = 0
+			memory = 0
+			localPlug = batch.node()["dispatcher"].getChild( "local" ) if batch.plug() is not None else None
+			if localPlug is not None and len( batch.frames() ) :
+				with Gaffer.Context( batch.context() ) as batchContextWithFrame :
+					# As for the TractorDispatcher, hints can not be varied per-frame
+					# within a batch, but we provide the frame for the benefit of
+					# expressions that need it.
+					batchContextWithFrame["frame"] = min( batch.frames() )
+					threads = localPlug["threads"].getValue()
+					memory = localPlug["memory"].getValue()
+			batch.blindData()["threads"] = IECore.IntData( threads )
+			batch.blindData()["memory"] = IECore.IntData( memory )
+
 			self.__setStatus( batch, LocalDispatcher.Job.Status.Waiting )
 
 			for upstreamBatch in batch.preTasks() :
 				self.__initBatchWalk( upstreamBatch )
 
+	## Tracks the jobs dispatched by LocalDispatchers, and admits the batches
+	# of background jobs according to the resources available. Jobs are queued
+	# in the order they are dispatched, and a queued job starts only once all
+	# the jobs ahead of it have started. Batches are then admitted while the
+	# resource hints from the `dispatcher.local` plugs of all running batches
+	# fit within the machine, and the memory currently available to the
+	# system can accommodate them.
 	class JobPool( IECore.RunTimeTyped ) :
 
 		def __init__( self ) :
@@ -386,6 +574,13 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			self.__jobAddedSignal = Gaffer.Signals.Signal1()
 			self.__jobRemovedSignal = Gaffer.Signals.Signal1()
 			self.__jobFailedSignal = Gaffer.Signals.Signal1()
+			self.__jobQueueChangedSignal = Gaffer.Signals.Signal1()
+
+			self.__mutex = threading.Lock()
+			self.__queuedJobs = []
+			self.__runningBatches = {}
+			self.__maxConcurrentBatches = 0
+			self.__averageBatchDuration = None
 
 		def jobs( self ) :
 
@@ -412,6 +607,50 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
 			return self.__jobFailedSignal
 
+		## Emitted with a job whenever its queue position or estimated
+		# start time may have changed. Note that this may be emitted on
+		# a background thread.
+		def jobQueueChangedSignal( self ) :
+
+			return self.__jobQueueChangedSignal
+
+		## The maximum number of batches that may be executed at once,
+		# summed across all jobs. A value of 0 places no limit beyond
+		# that imposed by the available resources.
+		def setMaxConcurrentBatches( self, maxConcurrentBatches ) :
+
+			self.__maxConcurrentBatches = maxConcurrentBatches
+
+		def getMaxConcurrentBatches( self ) :
+
+			return self.__maxConcurrentBatches
+
+		## Returns the position of the job in the queue of jobs waiting to
+		# start, with 0 being the next job to start, or None if the job isn't
+		# queued.
+		def queuePosition( self, job ) :
+
+			with self.__mutex :
+				return self.__queuedJobs.index( job ) if job in self.__queuedJobs else None
+
+		## Returns an estimate of the time at which a queued job will start,
+		# in seconds since the epoch, or None if no estimate can be made.
+		# The estimate is based on the average duration of the batches
+		# executed so far, so isn't available until one has completed.
+		def estimatedStartTime( self, job ) :
+
+			with self.__mutex :
+
+				if job not in self.__queuedJobs or self.__averageBatchDuration is None :
+					return None
+
+				jobsAhead = [ j for j in self.__jobs if j not in self.__queuedJobs ]
+				jobsAhead += self.__queuedJobs[:self.__queuedJobs.index( job )]
+				concurrency = max( self.__maxConcurrentBatches or len( self.__runningBatches ), 1 )
+
+			batchesAhead = sum( j._numWaitingBatches() for j in jobsAhead )
+			return time.time() + self.__averageBatchDuration * ( 1 + batchesAhead / concurrency )
+
 		def _append( self, job ) :
 
 			assert( isinstance( job, LocalDispatcher.Job ) )
@@ -419,8 +658,93 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			self.__jobs.append( job )
 			self.jobAddedSignal()( job )
 
+		def _queue( self, job ) :
+
+			with self.__mutex :
+				self.__queuedJobs.append( job )
+
+			self.__emitJobQueueChanged()
+
+		# Returns True if the batch may be launched, in which case it is
+		# accounted for until `_release()` is called.
+		def _admit( self, job, batch ) :
+
+			with self.__mutex :
+
+				if self.__queuedJobs and self.__queuedJobs[0] is not job and job in self.__queuedJobs :
+					return False
+
+				if self.__runningBatches :
+
+					if self.__maxConcurrentBatches and len( self.__runningBatches ) >= self.__maxConcurrentBatches :
+						return False
+
+					threads = batch.blindData()["threads"].value
+					if threads and sum( b[1] for b in self.__runningBatches.values() ) + threads > IECore.hardwareConcurrency() :
+						return False
+
+					memory = batch.blindData()["memory"].value * 1024 * 1024
+					if memory :
+						physicalMemory = self.__physicalMemory()
+						if physicalMemory and sum( b[2] for b in self.__runningBatches.values() ) + memory > physicalMemory :
+							return False
+						# The hints for running batches only account for memory
+						# they may use in future, but the system as a whole may
+						# already be short of memory for other reasons.
+						availableMemory = self.__availableMemory()
+						if availableMemory is not None and memory > availableMemory :
+							return False
+
+				self.__runningBatches[batch] = (
+					job,
+					batch.blindData()["threads"].value,
+					batch.blindData()["memory"].value * 1024 * 1024,
+					time.time()
+				)
+
+				dequeued = job in self.__queuedJobs
+				if dequeued :
+					self.__queuedJobs.remove( job )
+
+			if dequeued :
+				self.__emitJobQueueChanged()
+
+			return True
+
+		def _release( self, batch ) :
+
+			with self.__mutex :
+				if batch not in self.__runningBatches :
+					# Already released by `_dequeue()`.
+					return
+				job, threads, memory, startTime = self.__runningBatches.pop( batch )
+				duration = time.time() - startTime
+				if self.__averageBatchDuration is None :
+					self.__averageBatchDuration = duration
+				else :
+					self.__averageBatchDuration += 0.2 * ( duration - self.__averageBatchDuration )
+
+			self.__emitJobQueueChanged()
+
+		# Removes the job from the queue, and releases any batches it failed
+		# to release itself, for instance because it was interrupted by an
+		# exception.
+		def _dequeue( self, job ) :
+
+			with self.__mutex :
+				dequeued = job in self.__queuedJobs
+				if dequeued :
+					self.__queuedJobs.remove( job )
+				for batch in [ b for b, r in self.__runningBatches.items() if r[0] is job ] :
+					del self.__runningBatches[batch]
+
+			if dequeued :
+				self.__emitJobQueueChanged()
+
 		def _remove( self, job, force = False ) :
 
+			self._dequeue( job )
+
 			if job in self.__jobs :
 				self.__jobs.remove( job )
 				self.jobRemovedSignal()( job )
@@ -436,6 +760,38 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 				self.jobFailedSignal()( job )
 				self._remove( job )
 
+		def __emitJobQueueChanged( self ) :
+
+			with self.__mutex :
+				queuedJobs = list( self.__queuedJobs )
+
+			for job in queuedJobs :
+				self.jobQueueChangedSignal()( job )
+
+		# Returns the total physical memory in bytes, or 0 if it can't be determined.
+		@staticmethod
+		def __physicalMemory() :
+
+			try :
+				return os.sysconf( "SC_PAGE_SIZE" ) * os.sysconf( "SC_PHYS_PAGES" )
+			except ( AttributeError, ValueError, OSError ) :
+				return 0
+
+		# Returns the memory available for new processes in bytes, or None
+		# if it can't be determined.
+		@staticmethod
+		def __availableMemory() :
+
+			try :
+				with open( "/proc/meminfo" ) as f :
+					for line in f :
+						if line.startswith( "MemAvailable:" ) :
+							return int( line.split()[1] ) * 1024
+			except ( OSError, ValueError, IndexError ) :
+				pass
+
+			return None
+
 	__jobPool = JobPool()
 
 	@staticmethod
@@ -447,6 +803,16 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
 		return self.__jobPool
 
+	@staticmethod
+	def _setupPlugs( parentPlug ) :
+
+		if "local" in parentPlug :
+			return
+
+		parentPlug["local"] = Gaffer.Plug()
+		parentPlug["local"]["threads"] = Gaffer.IntPlug( defaultValue = 0, minValue = 0 )
+		parentPlug["local"]["memory"] = Gaffer.IntPlug( defaultValue = 0, minValue = 0 )
+
 	def _doDispatch( self, batch ) :
 
 		job = LocalDispatcher.Job(
@@ -458,7 +824,114 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
 		job.execute( background = self["executeInBackground"].getValue() )
 
+# A persistent `gaffer execute -worker` process, which loads the script once
+# and then executes batches one at a time. Provides the same `pid`, `poll()`
+# and `returncode` members as `subprocess.Popen`, but with `poll()` and
+# `returncode` referring to the batch currently being executed rather than
+# the process itself.
+class _WorkerProcess( object ) :
+
+	def __init__( self, args, popenKeywords ) :
+
+		self.__process = subprocess.Popen(
+			args,
+			stdin = subprocess.PIPE, stdout = subprocess.PIPE, universal_newlines = True,
+			**popenKeywords
+		)
+
+		self.pid = self.__process.pid
+		self.returncode = None
+
+		self.__exited = False
+		self.__results = queue.Queue()
+		self.__readerThread = threading.Thread( target = self.__readResults, daemon = True )
+		self.__readerThread.start()
+
+	def execute( self, nodeName, frames, contextArgs, performanceRecord = "" ) :
+
+		self.returncode = None
+
+		# Discard any result left over from a previous batch. The only
+		# such result is the one queued by `__readResults()` when the
+		# process exits, and we check for that explicitly below.
+		while True :
+			try :
+				self.__results.get_nowait()
+			except queue.Empty :
+				break
+
+		if self.__exited :
+			self.returncode = 1
+			return
+
+		request = { "nodes" : [ nodeName ], "frames" : frames, "context" : contextArgs }
+		if performanceRecord :
+			request["performanceRecord"] = performanceRecord
+		try :
+			self.__process.stdin.write( json.dumps( request ) + "\n" )
+			self.__process.stdin.flush()
+		except OSError :
+			# The process has died.
+			self.returncode = 1
+
+	def poll( self ) :
+
+		if self.returncode is None :
+			try :
+				self.returncode = self.__results.get_nowait()
+			except queue.Empty :
+				pass
+
+		return self.returncode
+
+	# Returns True if the process has exited, in which case it can't
+	# execute any further batches.
+	def exited( self ) :
+
+		return self.__exited
+
+	# Waits for the process to exit and for the thread reading its
+	# results to finish. Raises `subprocess.TimeoutExpired` if the
+	# process doesn't exit within `timeout` seconds.
+	def wait( self, timeout = None ) :
+
+		self.__process.wait( timeout )
+		# The thread only blocks if a descendant of the process is
+		# holding its stdout open, in which case we don't wait for it.
+		self.__readerThread.join( timeout )
+
+		return self.__process.returncode
+
+	# Asks the process to exit, and waits for it to do so. If it
+	# doesn't exit within `timeout` seconds, it is killed.
+	def close( self, timeout = 10 ) :
+
+		try :
+			self.__process.stdin.close()
+		except OSError :
+			pass
+
+		try :
+			self.wait( timeout )
+		except subprocess.TimeoutExpired :
+			self.__process.kill()
+			self.wait( timeout )
+
+	def __readResults( self ) :
+
+		for line in iter( self.__process.stdout.readline, "" ) :
+			try :
+				self.__results.put( int( line ) )
+			except ValueError :
+				pass
+
+		# The process has exited, so the batch in progress (if any)
+		# has failed. We set `__exited` first, so that `execute()` can't
+		# discard this result without knowing why it was queued.
+		self.__exited = True
+		self.__results.put( 1 )
+
 IECore.registerRunTimeTyped( LocalDispatcher, typeName = "GafferDispatch::LocalDispatcher" )
 IECore.registerRunTimeTyped( LocalDispatcher.JobPool, typeName = "GafferDispatch::LocalDispatcher::JobPool" )
 
-GafferDispatch.Dispatcher.registerDispatcher( "Local", LocalDispatcher )
+GafferDispatch.Dispatcher.registerDispatcher( "Local", LocalDispatcher, LocalDispatcher._setupPlugs )
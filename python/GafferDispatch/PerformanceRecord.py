@@ -0,0 +1,147 @@
+##########################################################################
+#
+#  Copyright (c) 2024, Cinesite VFX Ltd. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of Cinesite VFX Ltd. nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import json
+import time
+import pathlib
+
+import IECore
+
+import Gaffer
+
+## Records the performance of task execution into a compact JSON file, so
+# that the records from all the batches of a job can be merged into a
+# single report by the `gaffer jobstats` app. Used as a context manager
+# around the execution of one or more tasks, with the duration of each task
+# being recorded via `addTask()`. The PerformanceMonitor is only active
+# on the thread entering the context manager, so code executing tasks on
+# other threads must enter `monitor()` itself.
+class PerformanceRecord( object ) :
+
+	version = 1
+
+	def __init__( self, fileName, scriptNode ) :
+
+		self.__fileName = pathlib.Path( fileName )
+		self.__scriptNode = scriptNode
+		self.__monitor = Gaffer.PerformanceMonitor()
+		self.__tasks = []
+
+	def monitor( self ) :
+
+		return self.__monitor
+
+	def addTask( self, node, frames, duration ) :
+
+		self.__tasks.append( {
+			"node" : node.relativeName( self.__scriptNode ),
+			"frames" : str( IECore.frameListFromList( [ int( f ) for f in frames ] ) ),
+			"duration" : duration,
+		} )
+
+	def __enter__( self ) :
+
+		self.__disableCacheStatistics = not Gaffer.ValuePlug.getCacheStatisticsEnabled()
+		Gaffer.ValuePlug.setCacheStatisticsEnabled( True )
+		# Statistics accumulate over the lifetime of the process, which
+		# may execute many batches, so we record only the difference.
+		self.__initialCacheStatistics = Gaffer.ValuePlug.cacheStatistics()
+
+		self.__monitor.__enter__()
+		self.__startTime = time.perf_counter()
+
+		return self
+
+	def __exit__( self, type, value, traceBack ) :
+
+		wallTime = time.perf_counter() - self.__startTime
+		self.__monitor.__exit__( type, value, traceBack )
+
+		plugs = {}
+		def plugRecord( plug ) :
+			name = plug.relativeName( self.__scriptNode )
+			if name not in plugs :
+				node = plug.node()
+				plugs[name] = {
+					"node" : node.relativeName( self.__scriptNode ) if node is not None else "",
+					"nodeType" : node.typeName() if node is not None else "",
+					"hashCount" : 0, "computeCount" : 0,
+					"hashDuration" : 0, "computeDuration" : 0,
+					"cacheHits" : 0, "cacheMisses" : 0,
+				}
+			return plugs[name]
+
+		for plug, statistics in self.__monitor.allStatistics().items() :
+			if not self.__scriptNode.isAncestorOf( plug ) :
+				continue
+			record = plugRecord( plug )
+			record["hashCount"] = statistics.hashCount
+			record["computeCount"] = statistics.computeCount
+			record["hashDuration"] = statistics.hashDuration
+			record["computeDuration"] = statistics.computeDuration
+
+		# Cache statistics are keyed by full name, so must be mapped back
+		# to plugs in the script.
+		prefix = self.__scriptNode.fullName() + "."
+		for name, statistics in Gaffer.ValuePlug.cacheStatistics().items() :
+			if not name.startswith( prefix ) :
+				continue
+			plug = self.__scriptNode.descendant( name[len(prefix):] )
+			if plug is None :
+				continue
+			initial = self.__initialCacheStatistics.get( name, Gaffer.ValuePlug.CacheStatistics() )
+			hits = statistics.hits - initial.hits
+			misses = statistics.misses - initial.misses
+			if hits or misses :
+				record = plugRecord( plug )
+				record["cacheHits"] = hits
+				record["cacheMisses"] = misses
+
+		if self.__disableCacheStatistics :
+			Gaffer.ValuePlug.setCacheStatisticsEnabled( False )
+
+		self.__fileName.parent.mkdir( parents = True, exist_ok = True )
+		with open( self.__fileName, "w", encoding = "utf-8" ) as f :
+			json.dump(
+				{
+					"version" : self.version,
+					"wallTime" : wallTime,
+					"tasks" : self.__tasks,
+					"plugs" : plugs,
+				},
+				f
+			)
@@ -37,11 +37,10 @@
 __import__( "Gaffer" )
 
 from ._GafferDispatch import *
+from .PerformanceRecord import PerformanceRecord
 from .LocalDispatcher import LocalDispatcher
 from .SystemCommand import SystemCommand
 from .TaskList import TaskList
-from .TaskContextProcessor import TaskContextProcessor
-from .Wedge import Wedge
 from .TaskContextVariables import TaskContextVariables
 from .TaskSwitch import TaskSwitch
 from .PythonCommand import PythonCommand
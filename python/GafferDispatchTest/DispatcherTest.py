@@ -36,6 +36,7 @@
 
 import os
 import stat
+import pathlib
 import unittest
 import functools
 import itertools
@@ -1878,5 +1879,234 @@ class DispatcherTest( GafferTest.TestCase ) :
 		self.assertEqual( log[0].frames, [ 1, 2, 3, 4 ] )
 		self.assertEqual( [ l.context.getFrame() for l in log[1:] ], [ 1, 2, 3, 4 ] )
 
+	def testOutputFiles( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["w"] = GafferDispatchTest.TextWriter()
+		s["n"] = GafferDispatchTest.LoggingTaskNode()
+
+		with Gaffer.Context() as c :
+			c.setFrame( 10 )
+			self.assertEqual( s["w"]["task"].outputFiles(), [] )
+			s["w"]["fileName"].setValue( "test.####.txt" )
+			self.assertEqual( s["w"]["task"].outputFiles(), [ "test.0010.txt" ] )
+			self.assertEqual( s["n"]["task"].outputFiles(), [] )
+
+	def testIncremental( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["w"] = GafferDispatchTest.TextWriter()
+		s["w"]["fileName"].setValue( self.temporaryDirectory() / "test.####.txt" )
+		s["w"]["mode"].setValue( "a" )
+		s["w"]["text"].setValue( "a" )
+
+		dispatcher = GafferDispatch.Dispatcher.create( "testDispatcher" )
+		dispatcher["framesMode"].setValue( GafferDispatch.Dispatcher.FramesMode.CustomRange )
+		dispatcher["frameRange"].setValue( "1-3" )
+		dispatcher["incremental"].setValue( True )
+
+		def assertContents( contents ) :
+			for frame in ( 1, 2, 3 ) :
+				with open( self.temporaryDirectory() / "test.{:04d}.txt".format( frame ) ) as f :
+					self.assertEqual( f.read(), contents[frame] )
+
+		dispatcher.dispatch( [ s["w"] ] )
+		assertContents( { 1 : "a", 2 : "a", 3 : "a" } )
+
+		# Nothing has changed, so nothing should be executed.
+
+		dispatcher.dispatch( [ s["w"] ] )
+		assertContents( { 1 : "a", 2 : "a", 3 : "a" } )
+
+		# Deleting an output should cause only that frame to be executed.
+
+		( self.temporaryDirectory() / "test.0002.txt" ).unlink()
+		dispatcher.dispatch( [ s["w"] ] )
+		assertContents( { 1 : "a", 2 : "a", 3 : "a" } )
+
+		# As should modifying an output.
+
+		with open( self.temporaryDirectory() / "test.0003.txt", "a" ) as f :
+			f.write( "x" )
+		dispatcher.dispatch( [ s["w"] ] )
+		assertContents( { 1 : "a", 2 : "a", 3 : "axa" } )
+
+		# Changing the hash should cause all frames to be executed.
+
+		s["w"]["text"].setValue( "b" )
+		dispatcher.dispatch( [ s["w"] ] )
+		assertContents( { 1 : "ab", 2 : "ab", 3 : "axab" } )
+
+		# And with `incremental` off, everything is always executed.
+
+		dispatcher["incremental"].setValue( False )
+		dispatcher.dispatch( [ s["w"] ] )
+		assertContents( { 1 : "abb", 2 : "abb", 3 : "axabb" } )
+
+	def testIncrementalOutputHash( self ) :
+
+		class OutputHashTextWriter( GafferDispatchTest.TextWriter ) :
+
+			def __init__( self, name = "OutputHashTextWriter" ) :
+
+				GafferDispatchTest.TextWriter.__init__( self, name )
+				self.outputVersion = 1
+
+			def outputHash( self, context ) :
+
+				h = GafferDispatchTest.TextWriter.outputHash( self, context )
+				h.append( self.outputVersion )
+				return h
+
+		s = Gaffer.ScriptNode()
+		s["w"] = OutputHashTextWriter()
+		s["w"]["fileName"].setValue( self.temporaryDirectory() / "test.txt" )
+		s["w"]["mode"].setValue( "a" )
+		s["w"]["text"].setValue( "a" )
+
+		# By default, `outputHash()` is the same as `hash()`.
+
+		with Gaffer.Context() :
+			self.assertEqual( GafferDispatchTest.TextWriter.outputHash( s["w"], Gaffer.Context.current() ), s["w"]["task"].hash() )
+			self.assertNotEqual( s["w"]["task"].outputHash(), s["w"]["task"].hash() )
+
+		dispatcher = GafferDispatch.Dispatcher.create( "testDispatcher" )
+		dispatcher["incremental"].setValue( True )
+
+		dispatcher.dispatch( [ s["w"] ] )
+		self.assertEqual( ( self.temporaryDirectory() / "test.txt" ).read_text(), "a" )
+
+		dispatcher.dispatch( [ s["w"] ] )
+		self.assertEqual( ( self.temporaryDirectory() / "test.txt" ).read_text(), "a" )
+
+		# Incremental dispatch uses `outputHash()` to decide what to
+		# execute, so changing it causes execution even though `hash()`
+		# is unchanged.
+
+		with Gaffer.Context() :
+			h = s["w"]["task"].hash()
+		s["w"].outputVersion = 2
+		with Gaffer.Context() :
+			self.assertEqual( s["w"]["task"].hash(), h )
+
+		dispatcher.dispatch( [ s["w"] ] )
+		self.assertEqual( ( self.temporaryDirectory() / "test.txt" ).read_text(), "aa" )
+
+	def testIncrementalWithUpstreamChanges( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["w1"] = GafferDispatchTest.TextWriter()
+		s["w1"]["fileName"].setValue( self.temporaryDirectory() / "w1.txt" )
+		s["w1"]["mode"].setValue( "a" )
+		s["w1"]["text"].setValue( "a" )
+
+		s["w2"] = GafferDispatchTest.TextWriter()
+		s["w2"]["preTasks"][0].setInput( s["w1"]["task"] )
+		s["w2"]["fileName"].setValue( self.temporaryDirectory() / "w2.txt" )
+		s["w2"]["mode"].setValue( "a" )
+		s["w2"]["text"].setValue( "a" )
+
+		s["l"] = GafferDispatchTest.LoggingTaskNode()
+		s["l"]["preTasks"][0].setInput( s["w2"]["task"] )
+
+		dispatcher = GafferDispatch.Dispatcher.create( "testDispatcher" )
+		dispatcher["incremental"].setValue( True )
+
+		def assertContents( w1, w2 ) :
+			with open( self.temporaryDirectory() / "w1.txt" ) as f :
+				self.assertEqual( f.read(), w1 )
+			with open( self.temporaryDirectory() / "w2.txt" ) as f :
+				self.assertEqual( f.read(), w2 )
+
+		dispatcher.dispatch( [ s["l"] ] )
+		assertContents( "a", "a" )
+		self.assertEqual( len( s["l"].log ), 1 )
+
+		# Tasks without output files are always executed.
+
+		dispatcher.dispatch( [ s["l"] ] )
+		assertContents( "a", "a" )
+		self.assertEqual( len( s["l"].log ), 2 )
+
+		# Downstream tasks are executed if an upstream task is.
+
+		s["w1"]["text"].setValue( "b" )
+		dispatcher.dispatch( [ s["l"] ] )
+		assertContents( "ab", "aa" )
+		self.assertEqual( len( s["l"].log ), 3 )
+
+		# But upstream tasks aren't executed if only a downstream
+		# task has changed.
+
+		s["w2"]["text"].setValue( "b" )
+		dispatcher.dispatch( [ s["l"] ] )
+		assertContents( "ab", "aab" )
+		self.assertEqual( len( s["l"].log ), 4 )
+
+	def testBatchDuration( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferDispatch.PythonCommand()
+		s["n"]["command"].setValue( "context.getFrame()" )
+		s["n"]["dispatcher"]["batchSize"].setValue( 3 )
+		s["n"]["dispatcher"]["batchDuration"].setValue( 0.5 )
+
+		def batchedFrames() :
+
+			dispatcher = self.NullDispatcher()
+			dispatcher["jobsDirectory"].setValue( self.temporaryDirectory() )
+			dispatcher["framesMode"].setValue( dispatcher.FramesMode.CustomRange )
+			dispatcher["frameRange"].setValue( "1-10" )
+			dispatcher.dispatch( [ s["n"] ] )
+
+			return [ list( b.frames() ) for b in dispatcher.lastDispatch.preTasks() ]
+
+		# Without any timings, we fall back to `batchSize`.
+
+		self.assertEqual( batchedFrames(), [ [ 1, 2, 3 ], [ 4, 5, 6 ], [ 7, 8, 9 ], [ 10 ] ] )
+
+		# Execute to record timings. We use a `batchSize` of 1 so that
+		# we get a record for each frame.
+
+		s["n"]["dispatcher"]["batchSize"].setValue( 1 )
+		dispatcher = GafferDispatch.Dispatcher.create( "testDispatcher" )
+		dispatcher["framesMode"].setValue( GafferDispatch.Dispatcher.FramesMode.CustomRange )
+		dispatcher["frameRange"].setValue( "1-10" )
+		dispatcher.dispatch( [ s["n"] ] )
+		s["n"]["dispatcher"]["batchSize"].setValue( 3 )
+
+		# The actual timings are too small and noisy to test with, so
+		# replace them with known durations : an expensive first frame
+		# followed by cheap ones.
+
+		executedFiles = list( ( pathlib.Path( dispatcher.jobDirectory() ) / "manifest" ).glob( "executed-*.txt" ) )
+		self.assertEqual( len( executedFiles ), 10 )
+		for executedFile in executedFiles :
+			lines = []
+			for line in executedFile.read_text().splitlines() :
+				if line.startswith( "task " ) :
+					frame = float( line.split()[1] )
+				elif line.startswith( "duration " ) :
+					line = "duration {}".format( 0.5 if frame == 1 else 0.05 )
+				lines.append( line )
+			executedFile.write_text( "\n".join( lines ) + "\n" )
+
+		# Now the expensive frame should be batched on its own, and the
+		# cheap frames should be batched together to take a similar time.
+
+		self.assertEqual( batchedFrames(), [ [ 1 ], [ 2, 3, 4, 5, 6, 7, 8, 9, 10 ] ] )
+
+		# Tasks requiring sequence execution can't be split.
+
+		s["n"]["sequence"].setValue( True )
+		self.assertEqual( batchedFrames(), [ list( range( 1, 11 ) ) ] )
+
+		# And `batchSize` is used if adaptive batching is turned off.
+
+		s["n"]["sequence"].setValue( False )
+		s["n"]["dispatcher"]["batchDuration"].setValue( 0 )
+		self.assertEqual( batchedFrames(), [ [ 1, 2, 3 ], [ 4, 5, 6 ], [ 7, 8, 9 ], [ 10 ] ] )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -36,6 +36,7 @@
 ##########################################################################
 
 import os
+import json
 import pathlib
 import subprocess
 import unittest
@@ -372,5 +373,141 @@ class ExecuteApplicationTest( GafferTest.TestCase ) :
 		validate( sequence = True )
 		validate( sequence = False )
 
+	def testWorker( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["t"] = GafferDispatchTest.TextWriter()
+		s["t"]["fileName"].setValue( self.temporaryDirectory() / "test.${name}.####.txt" )
+		s["t"]["text"].setValue( "${name} ${frame}" )
+		s["p"] = GafferDispatch.PythonCommand()
+		s["p"]["command"].setValue( "print( 'output which must not be confused with the result' )" )
+
+		s["fileName"].setValue( self.__scriptFileName )
+		s.save()
+
+		p = subprocess.Popen(
+			[ str( Gaffer.executablePath() ), "execute", "-script", str( self.__scriptFileName ), "-worker" ],
+			stdin = subprocess.PIPE, stdout = subprocess.PIPE, stderr = subprocess.PIPE,
+			universal_newlines = True,
+		)
+
+		def execute( request ) :
+
+			p.stdin.write( json.dumps( request ) + "\n" )
+			p.stdin.flush()
+			return int( p.stdout.readline() )
+
+		self.assertEqual( execute( { "nodes" : [ "t" ], "frames" : "1-2", "context" : [ "-name", "'a'" ] } ), 0 )
+		self.assertEqual( execute( { "nodes" : [ "t" ], "frames" : "3", "context" : [ "-name", "'b'" ] } ), 0 )
+		self.assertEqual( execute( { "nodes" : [ "p" ], "frames" : "1", "context" : [] } ), 0 )
+		self.assertEqual( execute( { "nodes" : [ "doesNotExist" ], "frames" : "1", "context" : [] } ), 1 )
+		# The worker is still usable after a failure.
+		self.assertEqual( execute( { "nodes" : [ "t" ], "frames" : "4", "context" : [ "-name", "'c'" ] } ), 0 )
+
+		p.stdin.close()
+		p.wait()
+		self.assertEqual( p.returncode, 0 )
+
+		for name, frame in [ ( "a", 1 ), ( "a", 2 ), ( "b", 3 ), ( "c", 4 ) ] :
+			fileName = self.temporaryDirectory() / "test.{}.{:04d}.txt".format( name, frame )
+			self.assertEqual( fileName.read_text(), "{} {}".format( name, frame ) )
+
+		self.assertIn( "doesNotExist", p.stderr.read() )
+
+	def testConcurrentTasks( self ) :
+
+		s = Gaffer.ScriptNode()
+		for name in [ "a", "b", "c" ] :
+			s[name] = GafferDispatchTest.TextWriter()
+			s[name]["fileName"].setValue( self.temporaryDirectory() / "{}.####.txt".format( name ) )
+			s[name]["text"].setValue( "{} ${{frame}}".format( name ) )
+
+		s["fileName"].setValue( self.__scriptFileName )
+		s.save()
+
+		subprocess.check_call( [
+			str( Gaffer.executablePath() ), "execute", str( self.__scriptFileName ),
+			"-nodes", "a", "b", "c", "-frames", "1-4", "-concurrentTasks", "4"
+		] )
+
+		for name in [ "a", "b", "c" ] :
+			for frame in range( 1, 5 ) :
+				fileName = self.temporaryDirectory() / "{}.{:04d}.txt".format( name, frame )
+				self.assertEqual( fileName.read_text(), "{} {}".format( name, frame ) )
+
+	def testConcurrentTaskFailure( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["good"] = GafferDispatchTest.TextWriter()
+		s["good"]["fileName"].setValue( self.temporaryDirectory() / "good.####.txt" )
+		s["bad"] = GafferDispatchTest.ErroringTaskNode()
+
+		s["fileName"].setValue( self.__scriptFileName )
+		s.save()
+
+		p = subprocess.Popen(
+			[
+				str( Gaffer.executablePath() ), "execute", str( self.__scriptFileName ),
+				"-nodes", "bad", "good", "-frames", "1-3", "-concurrentTasks", "0"
+			],
+			stderr = subprocess.PIPE,
+			universal_newlines = True,
+		)
+		p.wait()
+
+		# The failure is reported, but doesn't prevent the other
+		# tasks from executing.
+		self.assertEqual( p.returncode, 1 )
+		self.assertIn( "executing bad", p.stderr.read() )
+		for frame in range( 1, 4 ) :
+			self.assertTrue( ( self.temporaryDirectory() / "good.{:04d}.txt".format( frame ) ).exists() )
+
+	def testWithoutPerformanceRecord( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["t"] = GafferDispatchTest.TextWriter()
+		s["t"]["fileName"].setValue( self.temporaryDirectory() / "test.${mode}.####.txt" )
+		s["t"]["text"].setValue( "${frame}" )
+
+		s["fileName"].setValue( self.__scriptFileName )
+		s.save()
+
+		# Without `-performanceRecord`, executing serially and concurrently.
+
+		for mode, extraArgs in [ ( "serial", [] ), ( "concurrent", [ "-concurrentTasks", "2" ] ) ] :
+			with self.subTest( mode = mode ) :
+				p = subprocess.Popen(
+					[
+						str( Gaffer.executablePath() ), "execute", str( self.__scriptFileName ),
+						"-frames", "1-2", "-context", "-mode", "'{}'".format( mode )
+					] + extraArgs,
+					stderr = subprocess.PIPE,
+					universal_newlines = True,
+				)
+				p.wait()
+
+				self.assertNotIn( "Error", p.stderr.read() )
+				self.assertEqual( p.returncode, 0 )
+				for frame in ( 1, 2 ) :
+					self.assertTrue( ( self.temporaryDirectory() / "test.{}.{:04d}.txt".format( mode, frame ) ).exists() )
+
+		# And in a worker, with no `performanceRecord` item in the request.
+
+		p = subprocess.Popen(
+			[ str( Gaffer.executablePath() ), "execute", "-script", str( self.__scriptFileName ), "-worker" ],
+			stdin = subprocess.PIPE, stdout = subprocess.PIPE, stderr = subprocess.PIPE,
+			universal_newlines = True,
+		)
+
+		p.stdin.write( json.dumps( { "nodes" : [ "t" ], "frames" : "1", "context" : [ "-mode", "'worker'" ] } ) + "\n" )
+		p.stdin.flush()
+		self.assertEqual( int( p.stdout.readline() ), 0 )
+
+		p.stdin.close()
+		p.wait()
+		self.assertEqual( p.returncode, 0 )
+		self.assertNotIn( "Error", p.stderr.read() )
+		self.assertTrue( ( self.temporaryDirectory() / "test.worker.0001.txt" ).exists() )
+
 if __name__ == "__main__":
 	unittest.main()
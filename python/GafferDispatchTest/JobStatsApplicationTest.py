@@ -0,0 +1,149 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Cinesite VFX Ltd. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of John Haddon nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+import json
+import pathlib
+import unittest
+import subprocess
+
+import Gaffer
+import GafferTest
+import GafferDispatch
+import GafferDispatchTest
+
+class JobStatsApplicationTest( GafferTest.TestCase ) :
+
+	def __jobStats( self, *args ) :
+
+		return subprocess.run(
+			[ str( Gaffer.executablePath() ), "jobstats" ] + [ str( a ) for a in args ],
+			stdout = subprocess.PIPE, stderr = subprocess.PIPE,
+			universal_newlines = True
+		)
+
+	def __writeRecord( self, fileName, wallTime, tasks, plugs = {} ) :
+
+		fileName.parent.mkdir( parents = True, exist_ok = True )
+		fileName.write_text(
+			json.dumps( {
+				"version" : GafferDispatch.PerformanceRecord.version,
+				"wallTime" : wallTime,
+				"tasks" : tasks,
+				"plugs" : plugs,
+			} )
+		)
+
+	def testJobDirectory( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n1"] = GafferDispatchTest.TextWriter()
+		s["n1"]["fileName"].setValue( self.temporaryDirectory() / "n1_####.txt" )
+		s["n2"] = GafferDispatchTest.TextWriter()
+		s["n2"]["fileName"].setValue( self.temporaryDirectory() / "n2_####.txt" )
+		s["n1"]["preTasks"][0].setInput( s["n2"]["task"] )
+
+		dispatcher = GafferDispatch.LocalDispatcher()
+		dispatcher["jobsDirectory"].setValue( self.temporaryDirectory() / "jobs" )
+		dispatcher["performanceRecords"].setValue( True )
+		dispatcher["framesMode"].setValue( dispatcher.FramesMode.CustomRange )
+		dispatcher["frameRange"].setValue( "1-2" )
+		dispatcher.dispatch( [ s["n1"] ] )
+
+		result = self.__jobStats( dispatcher.jobDirectory() )
+		self.assertEqual( result.returncode, 0 )
+
+		for section in ( "Job", "Task time by node", "Hottest nodes", "Hottest plugs", "Cache by node type" ) :
+			self.assertIn( section + " :", result.stdout )
+
+		self.assertRegex( result.stdout, r"Records\s+4\n" )
+		self.assertRegex( result.stdout, r"Tasks\s+4\n" )
+		self.assertRegex( result.stdout, r"n1\s+[0-9.]+s\s+2\n" )
+		self.assertRegex( result.stdout, r"n2\s+[0-9.]+s\s+2\n" )
+
+	def testTotals( self ) :
+
+		jobDirectory = self.temporaryDirectory() / "job"
+		self.__writeRecord(
+			jobDirectory / "performance" / "a.json", 1.5,
+			[ { "node" : "n1", "frames" : "1", "duration" : 1.0 } ],
+			{
+				"n1.out" : {
+					"node" : "n1", "nodeType" : "GafferTest::AddNode",
+					"hashCount" : 1, "computeCount" : 1,
+					"hashDuration" : 1000000000, "computeDuration" : 2000000000,
+					"cacheHits" : 3, "cacheMisses" : 1,
+				}
+			}
+		)
+		self.__writeRecord(
+			jobDirectory / "performance" / "b.json", 2.0,
+			[
+				{ "node" : "n1", "frames" : "2", "duration" : 0.25 },
+				{ "node" : "n2", "frames" : "2", "duration" : 0.5 },
+			]
+		)
+
+		result = self.__jobStats( jobDirectory )
+		self.assertEqual( result.returncode, 0 )
+
+		# Batch times are summed, since batches may run concurrently.
+		self.assertRegex( result.stdout, r"Total batch time\s+3.500s\n" )
+		self.assertRegex( result.stdout, r"Tasks\s+3\n" )
+		self.assertRegex( result.stdout, r"n1\s+1.250s\s+2\n" )
+		self.assertRegex( result.stdout, r"n2\s+0.500s\s+1\n" )
+		self.assertRegex( result.stdout, r"n1.out\s+3.000s\s+1.000s\s+2.000s\s+1\s+1\n" )
+		self.assertRegex( result.stdout, r"GafferTest::AddNode\s+3\s+1\s+75.0%\n" )
+
+		# Individual records can be passed too.
+
+		result = self.__jobStats( jobDirectory / "performance" / "b.json" )
+		self.assertEqual( result.returncode, 0 )
+		self.assertRegex( result.stdout, r"Total batch time\s+2.000s\n" )
+
+	def testMissingRecords( self ) :
+
+		result = self.__jobStats( self.temporaryDirectory() / "notHere" )
+		self.assertNotEqual( result.returncode, 0 )
+		self.assertIn( "does not exist", result.stderr )
+
+		emptyDirectory = self.temporaryDirectory() / "empty"
+		emptyDirectory.mkdir()
+		result = self.__jobStats( emptyDirectory )
+		self.assertNotEqual( result.returncode, 0 )
+		self.assertIn( "No performance records found", result.stderr )
+
+if __name__ == "__main__":
+	unittest.main()
@@ -35,11 +35,14 @@
 ##########################################################################
 
 import os
+import sys
+import json
 import stat
 import shutil
 import unittest
 import time
 import inspect
+import pathlib
 import functools
 
 import imath
@@ -871,5 +874,432 @@ class LocalDispatcherTest( GafferTest.TestCase ) :
 			open( self.temporaryDirectory() / "outer.txt" ).readlines(),
 		)
 
+	def __rendezvousCommand( self, name, other ) :
+
+		# Signals that `name` is running, and then waits for `other` to
+		# signal the same, so that it can only complete if both tasks run
+		# concurrently.
+		return inspect.cleandoc(
+			"""
+			import pathlib, time
+			directory = pathlib.Path( "{directory}" )
+			( directory / "{name}.running" ).touch()
+			start = time.time()
+			while not ( directory / "{other}.running" ).exists() :
+				if time.time() - start > 10 :
+					raise RuntimeError( "Timed out waiting for {other}" )
+				time.sleep( 0.01 )
+			( directory / "{name}.done" ).touch()
+			"""
+		).format( directory = self.temporaryDirectory().as_posix(), name = name, other = other )
+
+	def testMaxConcurrentTasks( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["a"] = GafferDispatch.PythonCommand()
+		s["a"]["command"].setValue( self.__rendezvousCommand( "a", "b" ) )
+
+		s["b"] = GafferDispatch.PythonCommand()
+		s["b"]["command"].setValue( self.__rendezvousCommand( "b", "a" ) )
+
+		s["c"] = GafferDispatch.PythonCommand()
+		s["c"]["preTasks"][0].setInput( s["a"]["task"] )
+		s["c"]["preTasks"][1].setInput( s["b"]["task"] )
+		s["c"]["command"].setValue( inspect.cleandoc(
+			"""
+			import pathlib
+			directory = pathlib.Path( "{directory}" )
+			assert( ( directory / "a.done" ).exists() )
+			assert( ( directory / "b.done" ).exists() )
+			( directory / "c.done" ).touch()
+			"""
+		).format( directory = self.temporaryDirectory().as_posix() ) )
+
+		dispatcher = self.__createLocalDispatcher()
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["maxConcurrentTasks"].setValue( 2 )
+
+		dispatcher.dispatch( [ s["c"] ] )
+		dispatcher.jobPool().waitForAll()
+
+		self.assertEqual( len( dispatcher.jobPool().failedJobs() ), 0 )
+		for name in "abc" :
+			self.assertTrue( ( self.temporaryDirectory() / ( name + ".done" ) ).exists() )
+
+	def testThreadsHintLimitsConcurrency( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		for name in "ab" :
+			s[name] = GafferDispatch.PythonCommand()
+			s[name]["command"].setValue( inspect.cleandoc(
+				"""
+				import pathlib, time
+				directory = pathlib.Path( "{directory}" )
+				( directory / "{name}.start" ).write_text( str( time.time() ) )
+				time.sleep( 0.5 )
+				( directory / "{name}.end" ).write_text( str( time.time() ) )
+				"""
+			).format( directory = self.temporaryDirectory().as_posix(), name = name ) )
+			s[name]["dispatcher"]["local"]["threads"].setValue( IECore.hardwareConcurrency() )
+
+		s["list"] = GafferDispatch.TaskList()
+		s["list"]["preTasks"][0].setInput( s["a"]["task"] )
+		s["list"]["preTasks"][1].setInput( s["b"]["task"] )
+
+		dispatcher = self.__createLocalDispatcher()
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["maxConcurrentTasks"].setValue( 2 )
+
+		dispatcher.dispatch( [ s["list"] ] )
+		dispatcher.jobPool().waitForAll()
+
+		self.assertEqual( len( dispatcher.jobPool().failedJobs() ), 0 )
+
+		def times( name ) :
+			return tuple(
+				float( ( self.temporaryDirectory() / ( name + suffix ) ).read_text() )
+				for suffix in ( ".start", ".end" )
+			)
+
+		# Each task claims every thread on the machine, so they
+		# must not have overlapped.
+		first, second = sorted( [ times( "a" ), times( "b" ) ] )
+		self.assertLessEqual( first[1], second[0] )
+
+	def testKillConcurrentTasks( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		for name in ( "sleep1", "sleep2" ) :
+			s[name] = GafferDispatch.PythonCommand()
+			s[name]["command"].setValue( "import time; time.sleep( 10 )" )
+
+		s["c"] = GafferDispatchTest.TextWriter()
+		s["c"]["fileName"].setValue( self.temporaryDirectory() / "c.txt" )
+		s["c"]["preTasks"][0].setInput( s["sleep1"]["task"] )
+		s["c"]["preTasks"][1].setInput( s["sleep2"]["task"] )
+
+		dispatcher = self.__createLocalDispatcher()
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["maxConcurrentTasks"].setValue( 2 )
+
+		dispatcher.dispatch( [ s["c"] ] )
+		self.assertEqual( len( dispatcher.jobPool().jobs() ), 1 )
+
+		job = dispatcher.jobPool().jobs()[0]
+		t = time.time()
+		while "sleep1" not in job.description() or "sleep2" not in job.description() :
+			self.assertLess( time.time() - t, 10 )
+			time.sleep( 0.01 )
+
+		job.kill()
+		dispatcher.jobPool().waitForAll()
+
+		self.assertLess( time.time() - t, 5 )
+		self.assertEqual( len( dispatcher.jobPool().jobs() ), 0 )
+		self.assertFalse( ( self.temporaryDirectory() / "c.txt" ).exists() )
+
+	def testResourceHintPlugs( self ) :
+
+		n = GafferDispatchTest.LoggingTaskNode()
+		self.assertIn( "local", n["dispatcher"] )
+		self.assertEqual( n["dispatcher"]["local"]["threads"].getValue(), 0 )
+		self.assertEqual( n["dispatcher"]["local"]["memory"].getValue(), 0 )
+
+	def testPersistentWorkers( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["p"] = GafferDispatch.PythonCommand()
+		s["p"]["command"].setValue( inspect.cleandoc(
+			"""
+			import os, pathlib
+			pathlib.Path( "{directory}/pid.{{}}.txt".format( context.getFrame() ) ).write_text( str( os.getpid() ) )
+			"""
+		).format( directory = self.temporaryDirectory().as_posix() ) )
+
+		s["t"] = GafferDispatchTest.TextWriter()
+		s["t"]["fileName"].setValue( self.temporaryDirectory() / "test.####.txt" )
+		s["t"]["text"].setValue( "${frame}" )
+		s["t"]["preTasks"][0].setInput( s["p"]["task"] )
+
+		dispatcher = self.__createLocalDispatcher()
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["persistentWorkers"].setValue( True )
+		dispatcher["framesMode"].setValue( dispatcher.FramesMode.CustomRange )
+		dispatcher["frameRange"].setValue( "1-5" )
+
+		dispatcher.dispatch( [ s["t"] ] )
+		dispatcher.jobPool().waitForAll()
+
+		self.assertEqual( len( dispatcher.jobPool().failedJobs() ), 0 )
+
+		for frame in range( 1, 6 ) :
+			self.assertEqual( ( self.temporaryDirectory() / "test.{:04d}.txt".format( frame ) ).read_text(), str( frame ) )
+
+		# All batches were executed by a single worker process.
+		pids = { ( self.temporaryDirectory() / "pid.{}.txt".format( frame ) ).read_text() for frame in range( 1, 6 ) }
+		self.assertEqual( len( pids ), 1 )
+		self.assertNotEqual( pids.pop(), str( os.getpid() ) )
+
+	def testPersistentWorkersFailure( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n1"] = GafferDispatchTest.TextWriter()
+		s["n1"]["fileName"].setValue( self.temporaryDirectory() / "n1_####.txt" )
+		s["n1"]["text"].setValue( "n1 on ${frame}" )
+		s["n2"] = GafferDispatchTest.TextWriter()
+		s["n2"]["fileName"].setValue( "" )
+		s["n2"]["text"].setValue( "n2 on ${frame}" )
+		s["n3"] = GafferDispatchTest.TextWriter()
+		s["n3"]["fileName"].setValue( self.temporaryDirectory() / "n3_####.txt" )
+		s["n3"]["text"].setValue( "n3 on ${frame}" )
+		s["n1"]["preTasks"][0].setInput( s["n2"]["task"] )
+		s["n2"]["preTasks"][0].setInput( s["n3"]["task"] )
+
+		dispatcher = self.__createLocalDispatcher()
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["persistentWorkers"].setValue( True )
+		dispatcher.dispatch( [ s["n1"] ] )
+		dispatcher.jobPool().waitForAll()
+
+		self.assertEqual( len( dispatcher.jobPool().jobs() ), 0 )
+		self.assertEqual( len( dispatcher.jobPool().failedJobs() ), 1 )
+
+		# n3 executed correctly, n2 failed, so n1 never executed
+		self.assertTrue( os.path.isfile( s.context().substitute( s["n3"]["fileName"].getValue() ) ) )
+		self.assertFalse( os.path.isfile( s.context().substitute( s["n1"]["fileName"].getValue() ) ) )
+
+	def testPersistentWorkersKill( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["sleep"] = GafferDispatch.PythonCommand()
+		s["sleep"]["command"].setValue( "import time; time.sleep( 10 )" )
+
+		s["t"] = GafferDispatchTest.TextWriter()
+		s["t"]["fileName"].setValue( self.temporaryDirectory() / "t.txt" )
+		s["t"]["preTasks"][0].setInput( s["sleep"]["task"] )
+
+		dispatcher = self.__createLocalDispatcher()
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["persistentWorkers"].setValue( True )
+		dispatcher.dispatch( [ s["t"] ] )
+
+		job = dispatcher.jobPool().jobs()[0]
+		t = time.time()
+		while "sleep" not in job.description() :
+			self.assertLess( time.time() - t, 10 )
+			time.sleep( 0.01 )
+
+		job.kill()
+		dispatcher.jobPool().waitForAll()
+
+		self.assertLess( time.time() - t, 5 )
+		self.assertEqual( len( dispatcher.jobPool().jobs() ), 0 )
+		self.assertFalse( ( self.temporaryDirectory() / "t.txt" ).exists() )
+
+	def testPersistentWorkerExit( self ) :
+
+		# A fake worker which reports success for a single batch and
+		# then exits.
+		workerProcess = sys.modules[GafferDispatch.LocalDispatcher.__module__]._WorkerProcess
+		worker = workerProcess(
+			[ sys.executable, "-c", "import sys; sys.stdin.readline(); print( 0, flush = True )" ], {}
+		)
+
+		def waitForResult() :
+			t = time.time()
+			while worker.poll() is None :
+				self.assertLess( time.time() - t, 10 )
+				time.sleep( 0.01 )
+			return worker.returncode
+
+		worker.execute( "node", "1", [] )
+		self.assertEqual( waitForResult(), 0 )
+
+		t = time.time()
+		while not worker.exited() :
+			self.assertLess( time.time() - t, 10 )
+			time.sleep( 0.01 )
+
+		# The result queued when the process exited must not be mistaken
+		# for the result of a later batch, and we must not wait for a
+		# result that will never come.
+
+		worker.execute( "node", "2", [] )
+		self.assertEqual( worker.poll(), 1 )
+		self.assertEqual( worker.poll(), 1 )
+
+		worker.close()
+
+	@unittest.skipIf( os.name == "nt", "Zombie processes are specific to Unix." )
+	def testKillReapsProcesses( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		for name in ( "sleep1", "sleep2" ) :
+			s[name] = GafferDispatch.PythonCommand()
+			s[name]["command"].setValue( "import time; time.sleep( 10 )" )
+
+		s["t"] = GafferDispatchTest.TextWriter()
+		s["t"]["fileName"].setValue( self.temporaryDirectory() / "t.txt" )
+		s["t"]["preTasks"][0].setInput( s["sleep1"]["task"] )
+		s["t"]["preTasks"][1].setInput( s["sleep2"]["task"] )
+
+		for persistentWorkers in ( False, True ) :
+
+			with self.subTest( persistentWorkers = persistentWorkers ) :
+
+				dispatcher = self.__createLocalDispatcher()
+				dispatcher["executeInBackground"].setValue( True )
+				dispatcher["maxConcurrentTasks"].setValue( 2 )
+				dispatcher["persistentWorkers"].setValue( persistentWorkers )
+				dispatcher.dispatch( [ s["t"] ] )
+
+				job = dispatcher.jobPool().jobs()[0]
+				t = time.time()
+				while "sleep1" not in job.description() or "sleep2" not in job.description() :
+					self.assertLess( time.time() - t, 10 )
+					time.sleep( 0.01 )
+
+				pids = job.statistics()["pids"]
+				self.assertEqual( len( pids ), 2 )
+
+				job.kill()
+				dispatcher.jobPool().waitForAll()
+
+				# Every process must have been waited for already, so none
+				# remain as children, either running or as zombies. We use
+				# `WNOWAIT` so as not to reap any processes ourselves.
+				for pid in pids :
+					with self.assertRaises( ChildProcessError ) :
+						os.waitid( os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT )
+
+	def testJobPoolAdmission( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["p"] = GafferDispatch.PythonCommand()
+		s["p"]["command"].setValue( inspect.cleandoc(
+			"""
+			import pathlib, time
+			startTime = time.time()
+			time.sleep( 0.5 )
+			pathlib.Path( "{directory}/{{}}.{{}}.txt".format( context["name"], context.getFrame() ) ).write_text(
+				"{{}} {{}}".format( startTime, time.time() )
+			)
+			"""
+		).format( directory = self.temporaryDirectory().as_posix() ) )
+
+		jobPool = GafferDispatch.LocalDispatcher.JobPool()
+		jobPool.setMaxConcurrentBatches( 1 )
+		self.assertEqual( jobPool.getMaxConcurrentBatches(), 1 )
+
+		queueChanges = GafferTest.CapturingSlot( jobPool.jobQueueChangedSignal() )
+
+		for name in [ "a", "b" ] :
+			dispatcher = GafferDispatch.LocalDispatcher( jobPool = jobPool )
+			dispatcher["jobsDirectory"].setValue( self.temporaryDirectory() / "jobs" )
+			dispatcher["executeInBackground"].setValue( True )
+			dispatcher["maxConcurrentTasks"].setValue( 2 )
+			dispatcher["framesMode"].setValue( dispatcher.FramesMode.CustomRange )
+			dispatcher["frameRange"].setValue( "1-2" )
+			with Gaffer.Context( s.context() ) as context :
+				context["name"] = name
+				dispatcher.dispatch( [ s["p"] ] )
+
+		# The second job must wait at least until the first one has started.
+		jobB = jobPool.jobs()[1]
+		self.assertIsNotNone( jobPool.queuePosition( jobB ) )
+		self.assertIn( ( jobB, ), [ tuple( c ) for c in queueChanges ] )
+
+		jobPool.waitForAll()
+		self.assertEqual( len( jobPool.failedJobs() ), 0 )
+		self.assertIsNone( jobPool.queuePosition( jobB ) )
+		self.assertIsNone( jobPool.estimatedStartTime( jobB ) )
+
+		# Even though each job allows two concurrent tasks, the pool
+		# only allows one batch to run at a time across all jobs.
+		intervals = sorted(
+			tuple( float( t ) for t in ( self.temporaryDirectory() / "{}.{}.txt".format( name, frame ) ).read_text().split() )
+			for name in [ "a", "b" ] for frame in [ 1, 2 ]
+		)
+		for previous, next in zip( intervals, intervals[1:] ) :
+			self.assertGreaterEqual( next[0], previous[1] )
+
+	def testPerformanceRecords( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n1"] = GafferDispatchTest.TextWriter()
+		s["n1"]["fileName"].setValue( self.temporaryDirectory() / "n1_####.txt" )
+		s["n2"] = GafferDispatchTest.TextWriter()
+		s["n2"]["fileName"].setValue( self.temporaryDirectory() / "n2_####.txt" )
+		s["n1"]["preTasks"][0].setInput( s["n2"]["task"] )
+
+		for background, persistentWorkers in [ ( False, False ), ( True, False ), ( True, True ) ] :
+
+			with self.subTest( background = background, persistentWorkers = persistentWorkers ) :
+
+				dispatcher = self.__createLocalDispatcher()
+				dispatcher["jobsDirectory"].setValue( self.temporaryDirectory() / "jobs{}{}".format( background, persistentWorkers ) )
+				dispatcher["executeInBackground"].setValue( background )
+				dispatcher["persistentWorkers"].setValue( persistentWorkers )
+				dispatcher["performanceRecords"].setValue( True )
+				dispatcher["framesMode"].setValue( dispatcher.FramesMode.CustomRange )
+				dispatcher["frameRange"].setValue( "1-2" )
+
+				dispatcher.dispatch( [ s["n1"] ] )
+				dispatcher.jobPool().waitForAll()
+				self.assertEqual( len( dispatcher.jobPool().failedJobs() ), 0 )
+
+				jobDirectories = list( pathlib.Path( dispatcher["jobsDirectory"].getValue() ).glob( "*" ) )
+				self.assertEqual( len( jobDirectories ), 1 )
+
+				# One record per batch.
+				records = [ json.loads( f.read_text() ) for f in ( jobDirectories[0] / "performance" ).glob( "*.json" ) ]
+				self.assertEqual( len( records ), 4 )
+				self.assertEqual(
+					sorted( ( t["node"], t["frames"] ) for r in records for t in r["tasks"] ),
+					[ ( "n1", "1" ), ( "n1", "2" ), ( "n2", "1" ), ( "n2", "2" ) ]
+				)
+				for record in records :
+					self.assertGreater( record["wallTime"], 0 )
+
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
+	def testBatchDurationPerformance( self ) :
+
+		# Simulates a sequence where a few frames are much more expensive
+		# than the rest, as is common for renders where the camera moves
+		# towards a complex part of the scene. With `batchSize` alone, we
+		# would either pay the launch overhead for every cheap frame, or
+		# end up waiting for a batch containing several expensive ones.
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferDispatch.PythonCommand()
+		s["n"]["command"].setValue( inspect.cleandoc(
+			"""
+			import time
+			time.sleep( 1.0 if context.getFrame() % 25 == 1 else 0.01 )
+			"""
+		) )
+		s["n"]["dispatcher"]["batchDuration"].setValue( 1.0 )
+
+		dispatcher = self.__createLocalDispatcher()
+		dispatcher["framesMode"].setValue( dispatcher.FramesMode.CustomRange )
+		dispatcher["frameRange"].setValue( "1-100" )
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["maxConcurrentTasks"].setValue( 4 )
+
+		# Record timings.
+		dispatcher.dispatch( [ s["n"] ] )
+		dispatcher.jobPool().waitForAll()
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			dispatcher.dispatch( [ s["n"] ] )
+			dispatcher.jobPool().waitForAll()
+
+		self.assertEqual( len( dispatcher.jobPool().failedJobs() ), 0 )
+
 if __name__ == "__main__":
 	unittest.main()
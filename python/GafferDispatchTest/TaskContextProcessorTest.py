@@ -0,0 +1,108 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Cinesite VFX Ltd. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of John Haddon nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+import unittest
+
+import IECore
+
+import Gaffer
+import GafferTest
+import GafferDispatch
+import GafferDispatchTest
+
+class TaskContextProcessorTest( GafferTest.TestCase ) :
+
+	class NameProcessor( GafferDispatch.TaskContextProcessor ) :
+
+		def __init__( self, name = "NameProcessor" ) :
+
+			GafferDispatch.TaskContextProcessor.__init__( self, name )
+
+			self["names"] = Gaffer.StringVectorDataPlug( defaultValue = IECore.StringVectorData() )
+
+		def _processedContexts( self, context ) :
+
+			result = []
+			for name in self["names"].getValue() :
+				c = Gaffer.Context( context )
+				c["name"] = name
+				result.append( c )
+
+			return result
+
+	IECore.registerRunTimeTyped( NameProcessor, typeName = "GafferDispatchTest::TaskContextProcessorTest::NameProcessor" )
+
+	def testPythonSubclass( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		script["writer"] = GafferDispatchTest.TextWriter()
+		script["writer"]["fileName"].setValue( self.temporaryDirectory() / "${name}.txt" )
+
+		script["processor"] = self.NameProcessor()
+		script["processor"]["preTasks"][0].setInput( script["writer"]["task"] )
+		script["processor"]["names"].setValue( IECore.StringVectorData( [ "a", "b", "c" ] ) )
+
+		with Gaffer.Context() :
+			preTasks = script["processor"]["task"].preTasks()
+			self.assertEqual( len( preTasks ), 3 )
+			self.assertEqual( [ t.context()["name"] for t in preTasks ], [ "a", "b", "c" ] )
+			self.assertEqual( script["processor"]["task"].hash(), IECore.MurmurHash() )
+
+		dispatcher = GafferDispatch.LocalDispatcher()
+		dispatcher["jobsDirectory"].setValue( self.temporaryDirectory() / "jobs" )
+		dispatcher.dispatch( [ script["processor"] ] )
+
+		self.assertEqual(
+			set( self.temporaryDirectory().glob( "*.txt" ) ),
+			{ self.temporaryDirectory() / "{}.txt".format( n ) for n in "abc" }
+		)
+
+	def testMissingOverride( self ) :
+
+		class NoOverride( GafferDispatch.TaskContextProcessor ) :
+
+			pass
+
+		node = NoOverride()
+		node["preTasks"][0].setInput( GafferDispatchTest.TextWriter()["task"] )
+
+		with Gaffer.Context() :
+			with self.assertRaises( Exception ) :
+				node["task"].preTasks()
+
+if __name__ == "__main__":
+	unittest.main()
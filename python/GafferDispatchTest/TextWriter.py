@@ -100,6 +100,11 @@ class TextWriter( GafferDispatch.TaskNode ) :
 
 		return h
 
+	def outputFiles( self, context ) :
+
+		fileName = self["fileName"].getValue()
+		return [ fileName ] if fileName else []
+
 	def requiresSequenceExecution( self ) :
 
 		return self.__requiresSequenceExecution
@@ -364,5 +364,78 @@ class WedgeTest( GafferTest.TestCase ) :
 		# the wedge variable at all.
 		self.assertEqual( len( script["constant"].log ), 1 )
 
+	def testValues( self ) :
+
+		wedge = GafferDispatch.Wedge()
+
+		wedge["mode"].setValue( int( GafferDispatch.Wedge.Mode.IntRange ) )
+		wedge["intMin"].setValue( 7 )
+		wedge["intMax"].setValue( 3 )
+		wedge["intStep"].setValue( -2 )
+		self.assertEqual( wedge.values(), [ 3, 5, 7 ] )
+
+		wedge["intStep"].setValue( 0 )
+		with self.assertRaisesRegex( RuntimeError, "Invalid step" ) :
+			wedge.values()
+
+		wedge["mode"].setValue( int( GafferDispatch.Wedge.Mode.FloatRange ) )
+		wedge["floatMin"].setValue( 0 )
+		wedge["floatMax"].setValue( 1 )
+		wedge["floatSteps"].setValue( 3 )
+		self.assertEqual( wedge.values(), [ 0, 0.5, 1 ] )
+
+		wedge["mode"].setValue( int( GafferDispatch.Wedge.Mode.StringList ) )
+		wedge["strings"].setValue( IECore.StringVectorData( [ "a", "b" ] ) )
+		self.assertEqual( wedge.values(), IECore.StringVectorData( [ "a", "b" ] ) )
+
+		# The result must be a copy, so that modifying it doesn't
+		# affect the plug value.
+		values = wedge.values()
+		values.append( "c" )
+		self.assertEqual( wedge["strings"].getValue(), IECore.StringVectorData( [ "a", "b" ] ) )
+
+	def testManyValues( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		script["writer"] = GafferDispatchTest.TextWriter()
+		script["writer"]["fileName"].setValue( self.temporaryDirectory() / "${wedge:index}.txt" )
+		script["writer"]["text"].setValue( "${wedge:value}" )
+
+		script["wedge"] = GafferDispatch.Wedge()
+		script["wedge"]["preTasks"][0].setInput( script["writer"]["task"] )
+		script["wedge"]["mode"].setValue( int( GafferDispatch.Wedge.Mode.IntRange ) )
+		script["wedge"]["intMin"].setValue( 0 )
+		script["wedge"]["intMax"].setValue( 999 )
+
+		self.__dispatcher().dispatch( [ script["wedge"] ] )
+
+		self.assertEqual( len( list( self.temporaryDirectory().glob( "*.txt" ) ) ), 1000 )
+		for i in ( 0, 500, 999 ) :
+			self.assertEqual( next( open( self.temporaryDirectory() / "{}.txt".format( i ) ) ), str( i ) )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testBatchingPerformance( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		script["writer"] = GafferDispatchTest.TextWriter()
+		script["writer"]["fileName"].setValue( self.temporaryDirectory() / "${wedge:index}.txt" )
+		script["writer"]["text"].setValue( "${wedge:value}" )
+
+		script["wedge"] = GafferDispatch.Wedge()
+		script["wedge"]["preTasks"][0].setInput( script["writer"]["task"] )
+		script["wedge"]["mode"].setValue( int( GafferDispatch.Wedge.Mode.IntRange ) )
+		script["wedge"]["intMin"].setValue( 0 )
+		script["wedge"]["intMax"].setValue( 49999 )
+
+		dispatcher = GafferDispatchTest.DispatcherTest.NullDispatcher()
+		dispatcher["jobsDirectory"].setValue( self.temporaryDirectory() / "jobs" )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			dispatcher.dispatch( [ script["wedge"] ] )
+
+		self.assertEqual( len( dispatcher.lastDispatch.preTasks()[0].preTasks() ), 50000 )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -52,12 +52,14 @@ from .SystemCommandTest import SystemCommandTest
 from .TaskListTest import TaskListTest
 from .WedgeTest import WedgeTest
 from .TaskContextVariablesTest import TaskContextVariablesTest
+from .TaskContextProcessorTest import TaskContextProcessorTest
 from .ExecuteApplicationTest import ExecuteApplicationTest
 from .TaskPlugTest import TaskPlugTest
 from .FrameMaskTest import FrameMaskTest
 from .DispatchApplicationTest import DispatchApplicationTest
 from .ModuleTest import ModuleTest
 from .StatsApplicationTest import StatsApplicationTest
+from .JobStatsApplicationTest import JobStatsApplicationTest
 
 if __name__ == "__main__":
 	import unittest
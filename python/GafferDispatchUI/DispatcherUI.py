@@ -118,6 +118,19 @@ Gaffer.Metadata.registerNode(
 
 		),
 
+		"incremental" : (
+
+			"description",
+			"""
+			Skips tasks which were executed by a previous dispatch to the
+			same job directory, and whose hash and output files are unchanged
+			since then. Tasks are only skipped if all of their upstream tasks
+			are also skipped, and tasks which don't declare their output files
+			are always executed.
+			""",
+
+		),
+
 	}
 
 )
@@ -152,6 +165,22 @@ Gaffer.Metadata.registerNode(
 
 		),
 
+		"dispatcher.batchDuration" : (
+
+			"description",
+			"""
+			The approximate time in seconds that each batch should take to
+			execute. When non-zero, the time taken to execute each frame is
+			recorded, and subsequent dispatches to the same jobs directory use
+			these timings to batch frames together, such that all batches take
+			approximately the same time. The `batchSize` is used until
+			timings are available, and is ignored thereafter.
+			""",
+
+			"layout:activator", "doesNotRequireSequenceExecution",
+
+		),
+
 		"dispatcher.immediate" : (
 
 			"description",
@@ -34,6 +34,7 @@
 #
 ##########################################################################
 
+import time
 import weakref
 
 import Gaffer
@@ -97,6 +98,94 @@ Gaffer.Metadata.registerNode(
 
 		),
 
+		"maxConcurrentTasks" : (
+
+			"description",
+			"""
+			The maximum number of tasks that may be executed concurrently
+			when executing in the background. Tasks are only executed
+			concurrently when they don't depend on one another, and only
+			while the resource hints specified by the `dispatcher.local`
+			plugs on each task fit within the resources of the machine.
+			""",
+
+		),
+
+		"persistentWorkers" : (
+
+			"description",
+			"""
+			Executes background tasks using long-lived worker processes,
+			rather than launching a new process for each batch of frames.
+			Each worker loads the script once and then executes many
+			batches, avoiding the startup cost of each process and keeping
+			its cache warm between batches. This is particularly beneficial
+			when there are many short tasks.
+			""",
+
+		),
+
+		"performanceRecords" : (
+
+			"description",
+			"""
+			Records the performance of each batch in the `performance`
+			subdirectory of the job directory. This includes the time
+			taken by each task, and the hash, compute and cache statistics
+			for each plug. The records for a job may be combined into a
+			single report using `gaffer jobstats`.
+			""",
+
+		),
+
+	}
+
+)
+
+Gaffer.Metadata.registerNode(
+
+	GafferDispatch.TaskNode,
+
+	plugs = {
+
+		"dispatcher.local" : [
+
+			"description",
+			"""
+			Settings that control how tasks are
+			executed by the LocalDispatcher.
+			""",
+
+			"layout:section", "Local",
+			"plugValueWidget:type", "GafferUI.LayoutPlugValueWidget",
+
+		],
+
+		"dispatcher.local.threads" : [
+
+			"description",
+			"""
+			The number of threads used by the task when it is executed
+			in the background. Tasks are not executed concurrently if the
+			total number of threads would exceed the number of cores on the
+			machine. A value of 0 places no limit on the task, and doesn't
+			prevent other tasks from running concurrently.
+			""",
+
+		],
+
+		"dispatcher.local.memory" : [
+
+			"description",
+			"""
+			An estimate of the memory used by the task in megabytes. Tasks
+			are not executed concurrently if their total memory would exceed
+			the physical memory of the machine. A value of 0 means the
+			memory usage is unknown.
+			""",
+
+		],
+
 	}
 
 )
@@ -137,6 +226,7 @@ class _LocalJobsPath( Gaffer.Path ) :
 			"localDispatcher:directory",
 			"localDispatcher:cpu",
 			"localDispatcher:memory",
+			"localDispatcher:queue",
 		]
 
 	def property( self, name, canceller = None ) :
@@ -167,6 +257,14 @@ class _LocalJobsPath( Gaffer.Path ) :
 		elif name == "localDispatcher:memory" :
 			stats = self.__job.statistics()
 			return "{0:.2f} GB".format( stats["rss"] / 1024.0  / 1024.0 ) if "rss" in stats.keys() else "N/A"
+		elif name == "localDispatcher:queue" :
+			position = self.__jobPool.queuePosition( self.__job )
+			if position is None :
+				return ""
+			startTime = self.__jobPool.estimatedStartTime( self.__job )
+			if startTime is None :
+				return "Queued ({})".format( position + 1 )
+			return "Queued ({}), starting at {}".format( position + 1, time.strftime( "%H:%M", time.localtime( startTime ) ) )
 
 		return None
 
@@ -217,6 +315,7 @@ class _LocalJobsWindow( GafferUI.Window ) :
 						GafferUI.PathListingWidget.StandardColumn( "Id", "localDispatcher:id" ),
 						GafferUI.PathListingWidget.StandardColumn( "CPU", "localDispatcher:cpu" ),
 						GafferUI.PathListingWidget.StandardColumn( "Memory", "localDispatcher:memory" ),
+						GafferUI.PathListingWidget.StandardColumn( "Queue", "localDispatcher:queue" ),
 					),
 					selectionMode = GafferUI.PathListingWidget.SelectionMode.Rows,
 				)
@@ -261,6 +360,7 @@ class _LocalJobsWindow( GafferUI.Window ) :
 
 		jobPool.jobAddedSignal().connect( Gaffer.WeakMethod( self.__jobAdded ), scoped = False )
 		jobPool.jobRemovedSignal().connect( Gaffer.WeakMethod( self.__jobRemoved ), scoped = False )
+		jobPool.jobQueueChangedSignal().connect( Gaffer.WeakMethod( self.__jobQueueChanged ), scoped = False )
 
 	## Acquires the LocalJobsWindow for the specified application.
 	@staticmethod
@@ -292,6 +392,10 @@ class _LocalJobsWindow( GafferUI.Window ) :
 
 		GafferUI.EventLoop.executeOnUIThread( self.__update )
 
+	def __jobQueueChanged( self, job ) :
+
+		GafferUI.EventLoop.executeOnUIThread( self.__update )
+
 	def __update( self ) :
 
 		self.__jobListingWidget.getPath()._emitPathChanged()
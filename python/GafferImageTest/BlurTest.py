@@ -41,6 +41,7 @@ import pathlib
 import IECore
 
 import Gaffer
+import GafferTest
 import GafferImage
 import GafferImageTest
 import os
@@ -198,5 +199,146 @@ class BlurTest( GafferImageTest.ImageTestCase ) :
 
 		self.assertImagesEqual( finalCrop["out"], expectedReader["out"], maxDifference = 0.00001, ignoreMetadata = True )
 
+	def testFastModeApproximatesAccurate( self ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 300, 200 ) )
+		checker["size"].setValue( imath.V2f( 40 ) )
+
+		accurate = GafferImage.Blur()
+		accurate["in"].setInput( checker["out"] )
+		accurate["radius"].setValue( imath.V2f( 20, 30 ) )
+
+		fast = GafferImage.Blur()
+		fast["in"].setInput( checker["out"] )
+		fast["radius"].setValue( imath.V2f( 20, 30 ) )
+		fast["mode"].setValue( GafferImage.Blur.Mode.Fast )
+
+		self.assertNotEqual( fast["out"].channelDataHash( "R", imath.V2i( 0 ) ), accurate["out"].channelDataHash( "R", imath.V2i( 0 ) ) )
+		self.assertImagesEqual( fast["out"], accurate["out"], maxDifference = 0.03 )
+
+		for boundingMode in ( GafferImage.Sampler.BoundingMode.Black, GafferImage.Sampler.BoundingMode.Clamp ) :
+			for expandDataWindow in ( False, True ) :
+				with self.subTest( boundingMode = boundingMode, expandDataWindow = expandDataWindow ) :
+					accurate["boundingMode"].setValue( boundingMode )
+					fast["boundingMode"].setValue( boundingMode )
+					accurate["expandDataWindow"].setValue( expandDataWindow )
+					fast["expandDataWindow"].setValue( expandDataWindow )
+					self.assertImagesEqual( fast["out"], accurate["out"], maxDifference = 0.03, ignoreDataWindow = expandDataWindow )
+
+	def testFastModeExpandDataWindow( self ) :
+
+		c = GafferImage.Constant()
+
+		b = GafferImage.Blur()
+		b["in"].setInput( c["out"] )
+		b["radius"].setValue( imath.V2f( 20 ) )
+		b["mode"].setValue( GafferImage.Blur.Mode.Fast )
+
+		self.assertEqual( b["out"]["dataWindow"].getValue(), c["out"]["dataWindow"].getValue() )
+
+		b["expandDataWindow"].setValue( True )
+
+		# Three box filters of width 13 each extend the support by 6 pixels.
+		self.assertEqual( b["out"]["dataWindow"].getValue().min(), c["out"]["dataWindow"].getValue().min() - imath.V2i( 18 ) )
+		self.assertEqual( b["out"]["dataWindow"].getValue().max(), c["out"]["dataWindow"].getValue().max() + imath.V2i( 18 ) )
+
+	def testFastModeEnergyPreservation( self ) :
+
+		constant = GafferImage.Constant()
+		constant["color"].setValue( imath.Color4f( 1 ) )
+
+		crop = GafferImage.Crop()
+		crop["in"].setInput( constant["out"] )
+		crop["area"].setValue( imath.Box2i( imath.V2i( 100 ), imath.V2i( 110 ) ) )
+		crop["affectDisplayWindow"].setValue( False )
+
+		blur = GafferImage.Blur()
+		blur["in"].setInput( crop["out"] )
+		blur["expandDataWindow"].setValue( True )
+		blur["mode"].setValue( GafferImage.Blur.Mode.Fast )
+
+		stats = GafferImage.ImageStats()
+		stats["in"].setInput( blur["out"] )
+		stats["area"].setValue( imath.Box2i( imath.V2i( 0 ), imath.V2i( 210 ) ) )
+
+		for radius in ( 1, 5, 20, 50 ) :
+
+			blur["radius"].setValue( imath.V2f( radius ) )
+			self.assertAlmostEqual( stats["average"]["r"].getValue(), 100 / 210.0 ** 2, delta = 0.00001 )
+
+	def testFastModeSymmetry( self ) :
+
+		constant = GafferImage.Constant()
+		constant["color"].setValue( imath.Color4f( 1 ) )
+
+		crop = GafferImage.Crop()
+		crop["in"].setInput( constant["out"] )
+		crop["area"].setValue( imath.Box2i( imath.V2i( 100 ), imath.V2i( 101 ) ) )
+		crop["affectDisplayWindow"].setValue( False )
+
+		blur = GafferImage.Blur()
+		blur["in"].setInput( crop["out"] )
+		blur["radius"].setValue( imath.V2f( 10 ) )
+		blur["expandDataWindow"].setValue( True )
+		blur["mode"].setValue( GafferImage.Blur.Mode.Fast )
+
+		sampler = GafferImage.Sampler( blur["out"], "R", imath.Box2i( imath.V2i( 50 ), imath.V2i( 150 ) ) )
+
+		self.assertGreater( sampler.sample( 100, 100 ), sampler.sample( 105, 100 ) )
+		for offset in range( 1, 15 ) :
+			self.assertAlmostEqual( sampler.sample( 100 + offset, 100 ), sampler.sample( 100 - offset, 100 ), places = 6 )
+			self.assertAlmostEqual( sampler.sample( 100, 100 + offset ), sampler.sample( 100, 100 - offset ), places = 6 )
+			self.assertAlmostEqual( sampler.sample( 100 + offset, 100 ), sampler.sample( 100, 100 + offset ), places = 6 )
+
+	def testFastModeTileLocality( self ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 4096, 3112 ) )
+
+		blur = GafferImage.Blur()
+		blur["in"].setInput( checker["out"] )
+		blur["radius"].setValue( imath.V2f( 20 ) )
+		blur["mode"].setValue( GafferImage.Blur.Mode.Fast )
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			blur["out"].channelData( "R", imath.V2i( 1024 ) )
+
+		# The filter support is 18 pixels, so we need only the 3x3 block of
+		# input tiles surrounding the output tile, and the horizontal pass for
+		# the 3 tiles in the same column.
+		self.assertGreater( monitor.plugStatistics( checker["out"]["channelData"] ).computeCount, 0 )
+		self.assertLessEqual( monitor.plugStatistics( checker["out"]["channelData"] ).computeCount, 9 )
+		self.assertEqual( monitor.plugStatistics( blur["__horizontalPass"] ).computeCount, 3 )
+		self.assertEqual( monitor.plugStatistics( blur["__verticalPass"] ).computeCount, 1 )
+
+	def __largeRadiusPerformance( self, mode ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 4096, 3112 ) )
+
+		blur = GafferImage.Blur()
+		blur["in"].setInput( checker["out"] )
+		blur["radius"].setValue( imath.V2f( 200 ) )
+		blur["mode"].setValue( mode )
+
+		# Compute the input image first, so that we're only timing the blur.
+		GafferImageTest.processTiles( checker["out"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( blur["out"] )
+
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testAccurateModePerformance( self ) :
+
+		self.__largeRadiusPerformance( GafferImage.Blur.Mode.Accurate )
+
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testFastModePerformance( self ) :
+
+		self.__largeRadiusPerformance( GafferImage.Blur.Mode.Fast )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -0,0 +1,164 @@
+##########################################################################
+#
+#  Copyright (c) 2024, Cinesite VFX Ltd. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of Cinesite VFX Ltd. nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import unittest
+import imath
+
+import Gaffer
+import GafferTest
+import GafferImage
+import GafferImageTest
+
+class ColorProcessorTest( GafferImageTest.ImageTestCase ) :
+
+	def __chain( self, branch, channels = "[RGB]" ) :
+
+		# Builds a chain of ColorProcessors. If `branch` is True,
+		# every intermediate image is also used by another node,
+		# which prevents the chain from being evaluated in a single
+		# pass.
+
+		script = Gaffer.ScriptNode()
+
+		script["checker"] = GafferImage.Checkerboard()
+		script["checker"]["format"].setValue( GafferImage.Format( 200, 150 ) )
+		script["checker"]["colorA"].setValue( imath.Color4f( 0.1, 0.5, 0.9, 0.5 ) )
+		script["checker"]["colorB"].setValue( imath.Color4f( 0.8, 0.3, 0.2, 0 ) )
+
+		script["saturation1"] = GafferImage.Saturation()
+		script["saturation1"]["saturation"].setValue( 0.5 )
+		script["saturation1"]["processUnpremultiplied"].setValue( True )
+
+		script["cdl"] = GafferImage.CDL()
+		script["cdl"]["slope"].setValue( imath.Color3f( 1.5, 0.75, 1.25 ) )
+		script["cdl"]["channels"].setValue( channels )
+
+		script["disabled"] = GafferImage.Saturation()
+		script["disabled"]["saturation"].setValue( 0 )
+		script["disabled"]["enabled"].setValue( False )
+
+		script["saturation2"] = GafferImage.Saturation()
+		script["saturation2"]["saturation"].setValue( 1.5 )
+
+		chain = [ script["saturation1"], script["cdl"], script["disabled"], script["saturation2"] ]
+		previous = script["checker"]["out"]
+		for node in chain :
+			node["in"].setInput( previous )
+			previous = node["out"]
+
+		if branch :
+			script["consumer"] = Gaffer.Node()
+			for node in chain[:-1] :
+				script["consumer"][node.getName()] = GafferImage.ImagePlug()
+				script["consumer"][node.getName()].setInput( node["out"] )
+
+		return script
+
+	def testFusedChain( self ) :
+
+		fused = self.__chain( branch = False )
+		unfused = self.__chain( branch = True )
+
+		self.assertImagesEqual( fused["saturation2"]["out"], unfused["saturation2"]["out"] )
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			GafferImageTest.processTiles( fused["saturation2"]["out"] )
+
+		# Only the last node in the chain needs to compute its color data.
+		self.assertEqual( monitor.plugStatistics( fused["saturation1"]["__colorData"] ).computeCount, 0 )
+		self.assertEqual( monitor.plugStatistics( fused["cdl"]["__colorData"] ).computeCount, 0 )
+		self.assertGreater( monitor.plugStatistics( fused["saturation2"]["__colorData"] ).computeCount, 0 )
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			GafferImageTest.processTiles( unfused["saturation2"]["out"] )
+
+		self.assertGreater( monitor.plugStatistics( unfused["saturation1"]["__colorData"] ).computeCount, 0 )
+		self.assertGreater( monitor.plugStatistics( unfused["cdl"]["__colorData"] ).computeCount, 0 )
+
+	def testPartialChannelMaskIsNotFused( self ) :
+
+		fused = self.__chain( branch = False, channels = "R" )
+		unfused = self.__chain( branch = True, channels = "R" )
+
+		self.assertImagesEqual( fused["saturation2"]["out"], unfused["saturation2"]["out"] )
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			GafferImageTest.processTiles( fused["saturation2"]["out"] )
+
+		# The CDL only processes R, so can't be evaluated as part of the
+		# chain, and neither can anything upstream of it.
+		self.assertGreater( monitor.plugStatistics( fused["cdl"]["__colorData"] ).computeCount, 0 )
+		self.assertGreater( monitor.plugStatistics( fused["saturation1"]["__colorData"] ).computeCount, 0 )
+
+	def testEditUpstreamOfFusedChain( self ) :
+
+		script = self.__chain( branch = False )
+		reference = self.__chain( branch = True )
+		GafferImageTest.processTiles( script["saturation2"]["out"] )
+
+		# The edits must be reflected in the output, even though the
+		# intermediate results were never computed.
+		for s in ( script, reference ) :
+			s["saturation1"]["saturation"].setValue( 0.25 )
+			s["cdl"]["offset"].setValue( imath.Color3f( 0.1 ) )
+
+		self.assertImagesEqual( script["saturation2"]["out"], reference["saturation2"]["out"] )
+
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 5 )
+	def testChainPerformance( self ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 4096, 3112, 1.000 ) )
+		checker["size"].setValue( imath.V2f( 64.01 ) )
+
+		chain = []
+		previous = checker["out"]
+		for i in range( 0, 10 ) :
+			saturation = GafferImage.Saturation()
+			saturation["in"].setInput( previous )
+			saturation["saturation"].setValue( 0.9 + i * 0.02 )
+			chain.append( saturation )
+			previous = saturation["out"]
+
+		GafferImageTest.processTiles( checker["out"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( previous )
+
+if __name__ == "__main__":
+	unittest.main()
@@ -138,5 +138,35 @@ class DilateTest( GafferImageTest.ImageTestCase ) :
 			# a master
 			self.assertImagesEqual( masterDilateSingleChannel["out"], defaultDilateSingleChannel["out"] )
 
+	def __testPerformance( self, radius ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 2048, 2048 ) )
+		checker["size"].setValue( imath.V2f( 7 ) )
+
+		node = GafferImage.Dilate()
+		node["in"].setInput( checker["out"] )
+		node["radius"].setValue( imath.V2i( radius ) )
+
+		GafferImageTest.processTiles( checker["out"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( node["out"] )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testPerformanceRadius4( self ) :
+
+		self.__testPerformance( 4 )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testPerformanceRadius16( self ) :
+
+		self.__testPerformance( 16 )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testPerformanceRadius64( self ) :
+
+		self.__testPerformance( 64 )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -275,6 +275,27 @@ class ImageAlgoTest( GafferImageTest.ImageTestCase ) :
 			numTilesX * numTilesY * 4
 		)
 
+	def testLOD( self ) :
+
+		self.assertEqual( GafferImage.ImageAlgo.lod( Gaffer.Context() ), 0 )
+		c = Gaffer.Context()
+		c["image:lod"] = 2
+		self.assertEqual( GafferImage.ImageAlgo.lod( c ), 2 )
+
+		for window, lod, expected in [
+			( imath.Box2i( imath.V2i( 0 ), imath.V2i( 100 ) ), 0, imath.Box2i( imath.V2i( 0 ), imath.V2i( 100 ) ) ),
+			( imath.Box2i( imath.V2i( 0 ), imath.V2i( 100 ) ), 1, imath.Box2i( imath.V2i( 0 ), imath.V2i( 50 ) ) ),
+			( imath.Box2i( imath.V2i( 0 ), imath.V2i( 101 ) ), 1, imath.Box2i( imath.V2i( 0 ), imath.V2i( 51 ) ) ),
+			( imath.Box2i( imath.V2i( -3 ), imath.V2i( 5 ) ), 1, imath.Box2i( imath.V2i( -2 ), imath.V2i( 3 ) ) ),
+			( imath.Box2i( imath.V2i( -3 ), imath.V2i( 5 ) ), 2, imath.Box2i( imath.V2i( -1 ), imath.V2i( 2 ) ) ),
+			( imath.Box2i(), 3, imath.Box2i() ),
+		] :
+			self.assertEqual( GafferImage.ImageAlgo.lodWindow( window, lod ), expected )
+
+		format = GafferImage.ImageAlgo.lodFormat( GafferImage.Format( 1920, 1080, 2.0 ), 1 )
+		self.assertEqual( format.getDisplayWindow(), imath.Box2i( imath.V2i( 0 ), imath.V2i( 960, 540 ) ) )
+		self.assertEqual( format.getPixelAspect(), 2.0 )
+
 	def testSortedChannelNames( self ):
 
 		# Sort RGBA
@@ -106,17 +106,123 @@ class ImageNodeTest( GafferImageTest.ImageTestCase ) :
 		self.assertNodesConstructWithDefaultValues( GafferImage )
 		self.assertNodesConstructWithDefaultValues( GafferImageTest )
 
+	def testCachePartition( self ) :
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.setCacheMemoryLimit( "image", 1024 * 1024 * 1024 )
+		self.assertEqual( Gaffer.ValuePlug.cacheMemoryUsage( "image" ), 0 )
+
+		constant = GafferImage.Constant()
+		constant["out"].channelData( "R", imath.V2i( 0 ) )
+		self.assertGreater( Gaffer.ValuePlug.cacheMemoryUsage( "image" ), 0 )
+
+	def testLODFallback( self ) :
+
+		# Checkerboard has no native support for reduced levels of detail,
+		# so should be computed at full resolution and then downsampled.
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 70, 50 ) )
+		checker["size"].setValue( imath.V2f( 5 ) )
+		checker["colorA"].setValue( imath.Color4f( 0.1, 0.2, 0.3, 1 ) )
+		checker["colorB"].setValue( imath.Color4f( 0.9, 0.8, 0.7, 0.5 ) )
+
+		full = GafferImage.ImageAlgo.image( checker["out"] )
+
+		with Gaffer.Context() as context :
+
+			context["image:lod"] = 1
+			self.assertEqual(
+				checker["out"].format().getDisplayWindow(),
+				imath.Box2i( imath.V2i( 0 ), imath.V2i( 35, 25 ) )
+			)
+			self.assertEqual( checker["out"].dataWindow(), imath.Box2i( imath.V2i( 0 ), imath.V2i( 35, 25 ) ) )
+			reduced = GafferImage.ImageAlgo.image( checker["out"] )
+
+		for channelName in "RGBA" :
+			fullChannel = full[channelName]
+			reducedChannel = reduced[channelName]
+			for y in range( 0, 25 ) :
+				for x in range( 0, 35 ) :
+					expected = sum(
+						fullChannel[( y * 2 + j ) * 70 + x * 2 + i]
+						for i in range( 0, 2 ) for j in range( 0, 2 )
+					) / 4.0
+					self.assertAlmostEqual( reducedChannel[y*35+x], expected, places = 5 )
+
+	def testLODHash( self ) :
+
+		checker = GafferImage.Checkerboard()
+		constant = GafferImage.Constant()
+
+		with Gaffer.Context() as context :
+
+			hashes = {}
+			for lod in ( 0, 1 ) :
+				context["image:lod"] = lod
+				for node in ( checker, constant ) :
+					hashes[node, lod] = (
+						node["out"].formatHash(),
+						node["out"].dataWindowHash(),
+						node["out"].channelNamesHash(),
+						node["out"].channelDataHash( "R", imath.V2i( 0 ) ),
+					)
+
+		for node in ( checker, constant ) :
+			self.assertNotEqual( hashes[node, 0][0], hashes[node, 1][0] )
+			self.assertNotEqual( hashes[node, 0][1], hashes[node, 1][1] )
+			self.assertEqual( hashes[node, 0][2], hashes[node, 1][2] )
+
+		# Checkerboard must be downsampled, so has a different hash
+		# at each level. But Constant computes natively, and its tiles
+		# are identical at all levels, so they can be shared in the cache.
+		self.assertNotEqual( hashes[checker, 0][3], hashes[checker, 1][3] )
+		self.assertEqual( hashes[constant, 0][3], hashes[constant, 1][3] )
+
+	def testNativeLOD( self ) :
+
+		constant = GafferImage.Constant()
+		constant["format"].setValue( GafferImage.Format( 1920, 1080 ) )
+		constant["color"].setValue( imath.Color4f( 0.25, 0.5, 0.75, 1 ) )
+
+		grade = GafferImage.Grade()
+		grade["in"].setInput( constant["out"] )
+		grade["multiply"].setValue( imath.Color4f( 2 ) )
+
+		with Gaffer.Context() as context :
+			context["image:lod"] = 2
+			for plug in ( constant["out"], grade["out"] ) :
+				self.assertEqual( plug.format().getDisplayWindow(), imath.Box2i( imath.V2i( 0 ), imath.V2i( 480, 270 ) ) )
+				self.assertEqual( plug.dataWindow(), imath.Box2i( imath.V2i( 0 ), imath.V2i( 480, 270 ) ) )
+			self.assertEqual( grade["out"].channelData( "G", imath.V2i( 0 ) )[0], 1.0 )
+
+	def testLODWithDeepImage( self ) :
+
+		constant = GafferImage.Constant()
+		flatToDeep = GafferImage.FlatToDeep()
+		flatToDeep["in"].setInput( constant["out"] )
+		offset = GafferImage.Offset()
+		offset["in"].setInput( flatToDeep["out"] )
+
+		with Gaffer.Context() as context :
+			context["image:lod"] = 1
+			with self.assertRaisesRegex( Gaffer.ProcessException, "Deep images cannot be computed at a reduced level of detail" ) :
+				offset["out"].channelData( "R", imath.V2i( 0 ) )
+
 	def setUp( self ) :
 
 		GafferImageTest.ImageTestCase.setUp( self )
 
 		self.__previousCacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		self.__previousCachePartitions = Gaffer.ValuePlug.cachePartitions()
 
 	def tearDown( self ) :
 
 		GafferImageTest.ImageTestCase.tearDown( self )
 
 		Gaffer.ValuePlug.setCacheMemoryLimit( self.__previousCacheMemoryLimit )
+		if "image" not in self.__previousCachePartitions :
+			Gaffer.ValuePlug.removeCacheMemoryLimit( "image" )
 
 if __name__ == "__main__":
 	unittest.main()
@@ -286,6 +286,58 @@ class ImageStatsTest( GafferImageTest.ImageTestCase ) :
 		s["view"].setValue( "right" )
 		self.assertEqual( s["max"].getValue(), imath.Color4f( 0.5, 0.5, 0.5, 0.875 ) )
 
+	def testOnlyIntersectingTilesComputed( self ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 8192, 4320 ) )
+
+		grade = GafferImage.Grade()
+		grade["in"].setInput( checker["out"] )
+		grade["gamma"].setValue( imath.Color4f( 2 ) )
+
+		stats = GafferImage.ImageStats()
+		stats["in"].setInput( grade["out"] )
+		# Lies entirely within a single tile.
+		stats["area"].setValue( imath.Box2i( imath.V2i( 4128, 2080 ), imath.V2i( 4192, 2144 ) ) )
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			stats["average"].getValue()
+
+		# One tile for each of the four channels, rather than all 8704
+		# ( 128 x 68 ) tiles for each channel.
+		for plug in ( grade["out"]["channelData"], checker["out"]["channelData"] ) :
+			self.assertGreater( monitor.plugStatistics( plug ).computeCount, 0 )
+			self.assertLessEqual( monitor.plugStatistics( plug ).computeCount, 4 )
+
+	def __areaPerformance( self, area ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 8192, 4320 ) )
+
+		blur = GafferImage.Blur()
+		blur["in"].setInput( checker["out"] )
+		blur["radius"].setValue( imath.V2f( 20 ) )
+
+		stats = GafferImage.ImageStats()
+		stats["in"].setInput( blur["out"] )
+		stats["area"].setValue( area )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			for plug in ( stats["average"], stats["min"], stats["max"] ) :
+				plug.getValue()
+
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testSmallAreaPerformance( self ) :
+
+		self.__areaPerformance( imath.Box2i( imath.V2i( 4000, 2000 ), imath.V2i( 4064, 2064 ) ) )
+
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testMediumAreaPerformance( self ) :
+
+		self.__areaPerformance( imath.Box2i( imath.V2i( 3000, 1500 ), imath.V2i( 4024, 2524 ) ) )
+
 	def __assertColour( self, colour1, colour2 ) :
 		for i in range( 0, 4 ):
 			self.assertEqual( "%.4f" % colour2[i], "%.4f" % colour1[i] )
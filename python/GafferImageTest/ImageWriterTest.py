@@ -647,6 +647,16 @@ class ImageWriterTest( GafferImageTest.ImageTestCase ) :
 		writer["channels"].setValue( "R" )
 		self.assertNotEqual( writer.hash( c ), current )
 
+		# But the image itself doesn't, because it would be too expensive
+		# to hash on every dispatch. It is accounted for by `outputHash()`
+		# instead, which is only used by incremental dispatches.
+		current = writer.hash( c )
+		currentOutput = writer.outputHash( c )
+		self.assertNotEqual( currentOutput, current )
+		constant["color"].setValue( imath.Color4f( 0.5 ) )
+		self.assertEqual( writer.hash( c ), current )
+		self.assertNotEqual( writer.outputHash( c ), currentOutput )
+
 	def testPassThrough( self ) :
 
 		s = Gaffer.ScriptNode()
@@ -1067,6 +1077,79 @@ class ImageWriterTest( GafferImageTest.ImageTestCase ) :
 
 		self.assertTrue( pathlib.Path( s["w"]["fileName"].getValue() ).is_file() )
 
+	def testIncrementalDispatch( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["c"] = GafferImage.Constant()
+		s["c"]["color"].setValue( imath.Color4f( 0.25 ) )
+
+		s["w"] = GafferImage.ImageWriter()
+		s["w"]["in"].setInput( s["c"]["out"] )
+		s["w"]["fileName"].setValue( self.temporaryDirectory() / "test.exr" )
+
+		with s.context() :
+			self.assertEqual( s["w"]["task"].outputFiles(), [ s["w"]["fileName"].getValue() ] )
+
+		d = GafferDispatch.LocalDispatcher()
+		d["jobsDirectory"].setValue( self.temporaryDirectory() / "jobs" )
+		d["incremental"].setValue( True )
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setInput( s["w"]["fileName"] )
+
+		def assertWritten( color ) :
+			reader["refreshCount"].setValue( reader["refreshCount"].getValue() + 1 )
+			self.assertEqual( GafferImage.ImageAlgo.image( reader["out"] )["R"][0], color )
+
+		with s.context() :
+			d.dispatch( [ s["w"] ] )
+		assertWritten( 0.25 )
+		modificationTime = pathlib.Path( s["w"]["fileName"].getValue() ).stat().st_mtime_ns
+
+		# Nothing has changed, so the file shouldn't be written again.
+
+		with s.context() :
+			d.dispatch( [ s["w"] ] )
+		self.assertEqual( pathlib.Path( s["w"]["fileName"].getValue() ).stat().st_mtime_ns, modificationTime )
+
+		# But changing the image should cause it to be written.
+
+		s["c"]["color"].setValue( imath.Color4f( 0.5 ) )
+		with s.context() :
+			d.dispatch( [ s["w"] ] )
+		assertWritten( 0.5 )
+
+	def testIncrementalDispatchWithMissingInput( self ) :
+
+		# The input to `w2` doesn't exist until `w1` has executed, so
+		# `outputHash()` can't be computed at dispatch time. This must not
+		# prevent dispatch, and `w2` must be executed.
+
+		s = Gaffer.ScriptNode()
+
+		s["c"] = GafferImage.Constant()
+		s["w1"] = GafferImage.ImageWriter()
+		s["w1"]["in"].setInput( s["c"]["out"] )
+		s["w1"]["fileName"].setValue( self.temporaryDirectory() / "w1.exr" )
+
+		s["r"] = GafferImage.ImageReader()
+		s["r"]["fileName"].setInput( s["w1"]["fileName"] )
+
+		s["w2"] = GafferImage.ImageWriter()
+		s["w2"]["in"].setInput( s["r"]["out"] )
+		s["w2"]["fileName"].setValue( self.temporaryDirectory() / "w2.exr" )
+		s["w2"]["preTasks"][0].setInput( s["w1"]["task"] )
+
+		d = GafferDispatch.LocalDispatcher()
+		d["jobsDirectory"].setValue( self.temporaryDirectory() / "jobs" )
+		d["incremental"].setValue( True )
+
+		with s.context() :
+			d.dispatch( [ s["w2"] ] )
+
+		self.assertTrue( ( self.temporaryDirectory() / "w2.exr" ).exists() )
+
 	def testDerivingInPython( self ) :
 
 		class DerivedImageWriter( GafferImage.ImageWriter ) :
@@ -1896,5 +1979,88 @@ class ImageWriterTest( GafferImageTest.ImageTestCase ) :
 			['character.Z,', '32-bit'], ['character.ZBack,', '32-bit'], ['character.custom,', '32-bit'], ['character.mask,', '32-bit']
 		] )
 
+	def testDataWindowNotAlignedToTiles( self ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 1000, 700 ) )
+
+		crop = GafferImage.Crop()
+		crop["in"].setInput( checker["out"] )
+		crop["affectDisplayWindow"].setValue( False )
+		crop["area"].setValue( imath.Box2i( imath.V2i( 37, 11 ), imath.V2i( 931, 650 ) ) )
+
+		writer = GafferImage.ImageWriter()
+		writer["in"].setInput( crop["out"] )
+		writer["openexr"]["dataType"].setValue( "float" )
+
+		reader = GafferImage.ImageReader()
+		reader["fileName"].setInput( writer["fileName"] )
+
+		for mode in ( GafferImage.ImageWriter.Mode.Scanline, GafferImage.ImageWriter.Mode.Tile ) :
+			for compression in ( "none", "zip", "piz" ) :
+				with self.subTest( mode = mode, compression = compression ) :
+
+					writer["fileName"].setValue( self.temporaryDirectory() / "test{}{}.exr".format( mode, compression ) )
+					writer["openexr"]["mode"].setValue( mode )
+					writer["openexr"]["compression"].setValue( compression )
+					writer["task"].execute()
+
+					self.assertImagesEqual( reader["out"], crop["out"], ignoreMetadata = True )
+
+	def testThroughputMessage( self ) :
+
+		checker = GafferImage.Checkerboard()
+
+		writer = GafferImage.ImageWriter()
+		writer["in"].setInput( checker["out"] )
+		writer["fileName"].setValue( self.temporaryDirectory() / "test.exr" )
+
+		with IECore.CapturingMessageHandler() as mh :
+			writer["task"].execute()
+
+		messages = [ m.message for m in mh.messages if m.level == IECore.Msg.Level.Info and m.message.startswith( "Wrote" ) ]
+		self.assertEqual( len( messages ), 1 )
+		self.assertRegex(
+			messages[0],
+			r'^Wrote [0-9.]+ MB to "{}" in [0-9.]+s \([0-9.]+ MB/s\)$'.format( re.escape( writer["fileName"].getValue() ) )
+		)
+
+	def __writeManyChannels( self, mode ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 3840, 2160 ) )
+
+		# 40 channels, as is typical for a render with AOVs.
+		shuffle = GafferImage.Shuffle()
+		shuffle["in"].setInput( checker["out"] )
+		for i in range( 0, 9 ) :
+			for channel in "RGBA" :
+				shuffle["channels"].addChild( GafferImage.Shuffle.ChannelPlug( channel, "aov{}.{}".format( i, channel ) ) )
+
+		writer = GafferImage.ImageWriter()
+		writer["in"].setInput( shuffle["out"] )
+		writer["channels"].setValue( "*" )
+		writer["fileName"].setValue( self.temporaryDirectory() / "test.exr" )
+		writer["openexr"]["mode"].setValue( mode )
+		writer["openexr"]["compression"].setValue( "dwaa" )
+
+		# Precompute the input, so we only time the writing.
+		GafferImageTest.processTiles( shuffle["out"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			writer["task"].execute()
+
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 3 )
+	def testWriteManyChannelsScanlinePerformance( self ) :
+
+		self.__writeManyChannels( GafferImage.ImageWriter.Mode.Scanline )
+
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 3 )
+	def testWriteManyChannelsTilePerformance( self ) :
+
+		self.__writeManyChannels( GafferImage.ImageWriter.Mode.Tile )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -95,6 +95,44 @@ class MedianTest( GafferImageTest.ImageTestCase ) :
 			for x in range( dataWindow.min().x, dataWindow.max().x ) :
 				self.assertAlmostEqual( s.sample( x, y ), uMin + x * uStep, delta = 0.011 )
 
+	def testAgainstReferenceImplementation( self ) :
+
+		r = GafferImage.ImageReader()
+		r["fileName"].setValue( self.imagesPath() / "noisyRamp.exr" )
+
+		for mode, reference in [
+			( GafferImage.Median, lambda v : sorted( v )[len(v)//2] ),
+			( GafferImage.Erode, min ),
+			( GafferImage.Dilate, max ),
+		] :
+
+			for radius in [ imath.V2i( 1 ), imath.V2i( 3, 1 ), imath.V2i( 0, 2 ) ] :
+
+				for boundingMode in ( GafferImage.Sampler.BoundingMode.Black, GafferImage.Sampler.BoundingMode.Clamp ) :
+
+					with self.subTest( mode = mode, radius = radius, boundingMode = boundingMode ) :
+
+						m = mode()
+						m["in"].setInput( r["out"] )
+						m["radius"].setValue( radius )
+						m["boundingMode"].setValue( boundingMode )
+
+						dataWindow = m["out"]["dataWindow"].getValue()
+						inputSampler = GafferImage.Sampler(
+							r["out"], "R", imath.Box2i( dataWindow.min() - radius, dataWindow.max() + radius ), boundingMode
+						)
+						outputSampler = GafferImage.Sampler( m["out"], "R", dataWindow )
+
+						# Check a region spanning tile boundaries and the bottom-left corner of the data window.
+						for y in range( dataWindow.min().y, min( dataWindow.max().y, dataWindow.min().y + 80 ), 3 ) :
+							for x in range( dataWindow.min().x, min( dataWindow.max().x, dataWindow.min().x + 80 ), 3 ) :
+								values = [
+									inputSampler.sample( x + i, y + j )
+									for j in range( -radius.y, radius.y + 1 )
+									for i in range( -radius.x, radius.x + 1 )
+								]
+								self.assertEqual( outputSampler.sample( x, y ), reference( values ) )
+
 	def testDriverChannel( self ) :
 
 		rRaw = GafferImage.ImageReader()
@@ -172,5 +210,35 @@ class MedianTest( GafferImageTest.ImageTestCase ) :
 		bt.cancelAndWait()
 		self.assertLess( time.time() - t, acceptableCancellationDelay )
 
+	def __testPerformance( self, radius ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 2048, 2048 ) )
+		checker["size"].setValue( imath.V2f( 7 ) )
+
+		node = GafferImage.Median()
+		node["in"].setInput( checker["out"] )
+		node["radius"].setValue( imath.V2i( radius ) )
+
+		GafferImageTest.processTiles( checker["out"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( node["out"] )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testPerformanceRadius4( self ) :
+
+		self.__testPerformance( 4 )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testPerformanceRadius16( self ) :
+
+		self.__testPerformance( 16 )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testPerformanceRadius64( self ) :
+
+		self.__testPerformance( 64 )
+
 if __name__ == "__main__":
 	unittest.main()
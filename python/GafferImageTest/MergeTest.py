@@ -864,6 +864,49 @@ class MergeTest( GafferImageTest.ImageTestCase ) :
 		merge["in"][0].setInput( c1["out"] )
 		self.assertImagesEqual( merge["out"], c1["out"] )
 
+	def testMultipleInputsMatchChainedMerges( self ) :
+
+		# Merging more than two inputs operates in place on the merge
+		# buffers, so check it gives identical results to chaining separate
+		# Merges, including where the data windows only partially overlap.
+
+		inputs = []
+		for i, offset in enumerate( [ ( 0, 0 ), ( 37, 11 ), ( -20, 90 ), ( 150, -45 ) ] ) :
+			checkerboard = GafferImage.Checkerboard()
+			checkerboard["format"].setValue( GafferImage.Format( 300, 200, 1.000 ) )
+			checkerboard["size"].setValue( imath.V2f( 7 + i * 3 ) )
+			checkerboard["colorA"].setValue( imath.Color4f( 0.1 * i, 0.2, 0.3, 0.25 ) )
+			checkerboard["colorB"].setValue( imath.Color4f( 0.6, 0.5 - 0.1 * i, 0.4, 0.75 ) )
+
+			offsetNode = GafferImage.Offset()
+			offsetNode["in"].setInput( checkerboard["out"] )
+			offsetNode["offset"].setValue( imath.V2i( *offset ) )
+
+			inputs.append( ( checkerboard, offsetNode ) )
+
+		merge = GafferImage.Merge()
+		for i, ( checkerboard, offsetNode ) in enumerate( inputs ) :
+			merge["in"][i].setInput( offsetNode["out"] )
+
+		chained = []
+		previous = inputs[0][1]["out"]
+		for checkerboard, offsetNode in inputs[1:] :
+			chainedMerge = GafferImage.Merge()
+			chainedMerge["in"][0].setInput( previous )
+			chainedMerge["in"][1].setInput( offsetNode["out"] )
+			chained.append( chainedMerge )
+			previous = chainedMerge["out"]
+
+		for operation in GafferImage.Merge.Operation.values.values() :
+			if operation == GafferImage.Merge.Operation.Divide :
+				# Dividing by the zeroes outside the data windows produces NaNs,
+				# which would never compare equal.
+				continue
+			merge["operation"].setValue( operation )
+			for chainedMerge in chained :
+				chainedMerge["operation"].setValue( operation )
+			self.assertImagesEqual( merge["out"], previous )
+
 	def mergePerf( self, operation, mismatch ):
 		r = GafferImage.Checkerboard( "Checkerboard" )
 		r["format"].setValue( GafferImage.Format( 4096, 3112, 1.000 ) )
@@ -1056,5 +1099,32 @@ class MergeTest( GafferImageTest.ImageTestCase ) :
 	def testMaxMismatchPerf( self ):
 		self.mergePerf( GafferImage.Merge.Operation.Max, True )
 
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 5)
+	def testOverManyInputsPerf( self ):
+
+		checkerboard = GafferImage.Checkerboard()
+		checkerboard["format"].setValue( GafferImage.Format( 4096, 3112, 1.000 ) )
+		checkerboard["size"].setValue( imath.V2f( 64.01 ) )
+
+		alphaShuffle = GafferImage.Shuffle()
+		alphaShuffle["in"].setInput( checkerboard["out"] )
+		alphaShuffle["channels"].addChild( GafferImage.Shuffle.ChannelPlug( "A", "R" ) )
+
+		merge = GafferImage.Merge()
+		merge["operation"].setValue( GafferImage.Merge.Operation.Over )
+
+		offsets = []
+		for i in range( 0, 8 ) :
+			offset = GafferImage.Offset()
+			offset["in"].setInput( alphaShuffle["out"] )
+			offset["offset"].setValue( imath.V2i( 13 * i, 7 * i ) )
+			merge["in"][i].setInput( offset["out"] )
+			offsets.append( offset )
+			GafferImageTest.processTiles( offset["out"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( merge["out"] )
+
 if __name__ == "__main__":
 	unittest.main()
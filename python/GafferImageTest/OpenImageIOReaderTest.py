@@ -58,6 +58,7 @@ class OpenImageIOReaderTest( GafferImageTest.ImageTestCase ) :
 	negativeDataWindowFileName = GafferImageTest.ImageTestCase.imagesPath() / "checkerWithNegativeDataWindow.200x150.exr"
 	negativeDisplayWindowFileName = GafferImageTest.ImageTestCase.imagesPath() / "negativeDisplayWindow.exr"
 	circlesExrFileName = GafferImageTest.ImageTestCase.imagesPath() / "circles.exr"
+	mipMappedFileName = pathlib.Path( __file__ ).parents[1] / "GafferOSLTest" / "images" / "vRamp.tx"
 	circlesJpgFileName = GafferImageTest.ImageTestCase.imagesPath() / "circles.jpg"
 	alignmentTestSourceFileName = GafferImageTest.ImageTestCase.imagesPath() / "colorbars_half_max.exr"
 	multipartFileName = GafferImageTest.ImageTestCase.imagesPath() / "multipart.exr"
@@ -691,6 +692,41 @@ class OpenImageIOReaderTest( GafferImageTest.ImageTestCase ) :
 		self.assertNotIn( "oiio:subimagename", metadata )
 		self.assertNotIn( "oiio:subimages", metadata )
 
+	def testMipLevels( self ) :
+
+		reader = GafferImage.OpenImageIOReader()
+		reader["fileName"].setValue( self.mipMappedFileName )
+
+		fullImage = GafferImage.ImageAlgo.image( reader["out"] )
+		mean = lambda d : sum( d ) / len( d )
+
+		with Gaffer.Context() as context :
+
+			channelDataHashes = set()
+			for lod in range( 0, 6 ) :
+
+				context["image:lod"] = lod
+				window = imath.Box2i( imath.V2i( 0 ), imath.V2i( 32 >> lod ) )
+				self.assertEqual( reader["out"].format().getDisplayWindow(), window )
+				self.assertEqual( reader["out"].dataWindow(), window )
+
+				channelDataHashes.add( reader["out"].channelDataHash( "G", imath.V2i( 0 ) ) )
+
+				# Mip levels are averages of the level above, so
+				# should preserve the mean value of the image.
+				image = GafferImage.ImageAlgo.image( reader["out"] )
+				for channelName in "RGB" :
+					self.assertAlmostEqual( mean( image[channelName] ), mean( fullImage[channelName] ), places = 2 )
+
+			self.assertEqual( len( channelDataHashes ), 6 )
+
+			# Levels beyond those in the file are downsampled from
+			# the smallest level.
+			context["image:lod"] = 7
+			self.assertEqual( reader["out"].dataWindow(), imath.Box2i( imath.V2i( 0 ), imath.V2i( 1 ) ) )
+			image = GafferImage.ImageAlgo.image( reader["out"] )
+			self.assertAlmostEqual( image["G"][0], mean( fullImage["G"] ), places = 2 )
+
 	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
 	@GafferTest.TestRunner.PerformanceTestMethod()
 	def testImageOpenPerformance( self ):
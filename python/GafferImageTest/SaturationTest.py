@@ -42,6 +42,7 @@ import imath
 import IECore
 
 import Gaffer
+import GafferTest
 import GafferImage
 import GafferImageTest
 
@@ -82,3 +83,23 @@ class SaturationTest( GafferImageTest.ImageTestCase ) :
 		sat["saturation"].setValue( 2 )
 		ref["color"].setValue( imath.Color4f( 0.67874, 0.47874, 0.47874, 1 ) )
 		self.assertImagesEqual( sat["out"], ref["out"], maxDifference = 1e-7 )
+
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 5 )
+	def testPerformance( self ) :
+
+		checkerboard = GafferImage.Checkerboard()
+		checkerboard["format"].setValue( GafferImage.Format( 4096, 3112, 1.000 ) )
+		checkerboard["size"].setValue( imath.V2f( 64.01 ) )
+		checkerboard["colorA"].setValue( imath.Color4f( 0.1, 0.2, 0.3, 0.5 ) )
+		checkerboard["colorB"].setValue( imath.Color4f( 0.5, 0.4, 0.3, 0 ) )
+
+		saturation = GafferImage.Saturation()
+		saturation["in"].setInput( checkerboard["out"] )
+		saturation["saturation"].setValue( 0.5 )
+		saturation["processUnpremultiplied"].setValue( True )
+
+		GafferImageTest.processTiles( checkerboard["out"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( saturation["out"] )
@@ -111,6 +111,7 @@ from .DeleteViewsTest import DeleteViewsTest
 from .CopyViewsTest import CopyViewsTest
 from .AnaglyphTest import AnaglyphTest
 from .LookTransformTest import LookTransformTest
+from .ColorProcessorTest import ColorProcessorTest
 
 if __name__ == "__main__":
 	import unittest
@@ -91,7 +91,26 @@ Gaffer.Metadata.registerNode(
 			which the blur will bleed onto.
 			"""
 
-		]
+		],
+
+		"mode" : [
+
+			"description",
+			"""
+			The method used to compute the blur. Accurate uses a true
+			gaussian filter, whose cost per pixel grows with the radius.
+			Fast approximates the gaussian using a series of box filters,
+			with a cost that grows only slowly with the radius. Fast is recommended
+			for large radii, where the difference is negligible, but may
+			look noticeably boxy for radii of just a few pixels.
+			""",
+
+			"preset:Accurate", GafferImage.Blur.Mode.Accurate,
+			"preset:Fast", GafferImage.Blur.Mode.Fast,
+
+			"plugValueWidget:type", "GafferUI.PresetsPlugValueWidget",
+
+		],
 
 	}
 
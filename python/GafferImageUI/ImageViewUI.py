@@ -256,6 +256,21 @@ Gaffer.Metadata.registerNode(
 			"toolbarLayout:visibilityActivator", False,
 		],
 
+		"adaptiveResolution" : [
+			"description",
+			"""
+			Computes the image at a reduced resolution when the Viewer is zoomed
+			out, so that time isn't spent computing pixels which can't be seen.
+			Nodes with native support for this read from mip-mapped files or
+			process fewer pixels, and all others compute at full resolution
+			before being downsampled.
+			""",
+
+			# This is primarily a performance optimisation, so we don't expose it
+			# in the toolbar. It may be turned off via the API for debugging.
+			"toolbarLayout:visibilityActivator", False,
+		],
+
 		"colorInspector" : [
 			"plugValueWidget:type", "GafferUI.LayoutPlugValueWidget",
 			"toolbarLayout:section", "Bottom",
@@ -1672,3 +1687,13 @@ class _CompareImageWidget( GafferUI.Frame ) :
 		)
 
 		return True
+
+##########################################################################
+# Playback prefetching
+##########################################################################
+
+def __prefetchImage( image ) :
+
+	GafferImage.ImageAlgo.image( image )
+
+GafferUI.PlaybackPrefetcher.registerPrefetchFunction( GafferImage.ImagePlug, __prefetchImage )
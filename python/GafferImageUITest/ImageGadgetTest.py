@@ -34,6 +34,7 @@
 #
 ##########################################################################
 
+import time
 import unittest
 import imath
 
@@ -127,5 +128,58 @@ class ImageGadgetTest( GafferUITest.TestCase ) :
 		self.assertEqual( len( cs ), 2 )
 		self.assertNotEqual( gadget.state(), gadget.State.Paused )
 
+	def testOnlyVisibleTilesComputed( self ) :
+
+		checker = GafferImage.Checkerboard()
+		checker["format"].setValue( GafferImage.Format( 4096, 4096 ) )
+		allTiles = 64 * 64 * 4
+
+		gadget = GafferImageUI.ImageGadget()
+		gadget.setImage( checker["out"] )
+
+		with GafferUI.Window() as window :
+			gadgetWidget = GafferUI.GadgetWidget( gadget )
+
+		def waitForTiles() :
+
+			self.waitForIdle( 1000 )
+			startTime = time.time()
+			while gadget.state() != gadget.State.Complete :
+				self.assertLess( time.time() - startTime, 10 )
+				self.waitForIdle( 100 )
+
+		# Pause the gadget until we've framed the region we want, so it
+		# doesn't compute tiles for the default framing.
+
+		gadget.setPaused( True )
+		window.setVisible( True )
+		self.waitForIdle( 1000 )
+
+		# Zoom in on a small region in the middle of the image. Only the
+		# tiles near that region should be computed.
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			gadgetWidget.getViewportGadget().frame( imath.Box3f( imath.V3f( 1920, 1920, 0 ), imath.V3f( 2176, 2176, 0 ) ) )
+			gadget.setPaused( False )
+			waitForTiles()
+
+		computeCount = monitor.plugStatistics( checker["out"]["channelData"] ).computeCount
+		self.assertGreater( computeCount, 0 )
+		self.assertLess( computeCount, allTiles / 4 )
+
+		# Panning to a region we haven't computed yet should trigger an
+		# update, again computing only the tiles we can see.
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			gadgetWidget.getViewportGadget().frame( imath.Box3f( imath.V3f( 128, 128, 0 ), imath.V3f( 384, 384, 0 ) ) )
+			waitForTiles()
+
+		computeCount = monitor.plugStatistics( checker["out"]["channelData"] ).computeCount
+		self.assertGreater( computeCount, 0 )
+		self.assertLess( computeCount, allTiles / 4 )
+
+		window.setVisible( False )
+		del gadget, gadgetWidget, window
+
 if __name__ == "__main__":
 	unittest.main()
@@ -451,17 +451,30 @@ class SceneNodeTest( GafferSceneTest.SceneTestCase ) :
 			# cleanly if it has been fixed.
 			backgroundTask.cancelAndWait()
 
+	def testCachePartition( self ) :
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.setCacheMemoryLimit( "scene", 1024 * 1024 * 1024 )
+		self.assertEqual( Gaffer.ValuePlug.cacheMemoryUsage( "scene" ), 0 )
+
+		sphere = GafferScene.Sphere()
+		sphere["out"].object( "/sphere" )
+		self.assertGreater( Gaffer.ValuePlug.cacheMemoryUsage( "scene" ), 0 )
+
 	def setUp( self ) :
 
 		GafferSceneTest.SceneTestCase.setUp( self )
 
 		self.__previousCacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		self.__previousCachePartitions = Gaffer.ValuePlug.cachePartitions()
 
 	def tearDown( self ) :
 
 		GafferSceneTest.SceneTestCase.tearDown( self )
 
 		Gaffer.ValuePlug.setCacheMemoryLimit( self.__previousCacheMemoryLimit )
+		if "scene" not in self.__previousCachePartitions :
+			Gaffer.ValuePlug.removeCacheMemoryLimit( "scene" )
 
 if __name__ == "__main__":
 	unittest.main()
@@ -1141,3 +1141,30 @@ class _StateWidget( GafferUI.Widget ) :
 		self.__button.setImage( "viewPause.png" if not paused else "viewPaused.png" )
 		self.__busyWidget.setBusy( self.__sceneGadget.state() == self.__sceneGadget.State.Running )
 		self.__button.setToolTip( "Viewer updates suspended, click to resume" if paused else "Click to suspend viewer updates [esc]" )
+
+##########################################################################
+# Playback prefetching
+##########################################################################
+
+def __prefetchScene( scene ) :
+
+	# Compute the locations the SceneGadget draws for the
+	# current expansion state.
+
+	visibleSet = GafferSceneUI.ContextAlgo.getVisibleSet( Gaffer.Context.current() )
+	expandedPaths = IECore.PathMatcher()
+	GafferScene.SceneAlgo.matchingPaths( visibleSet.expansions, scene, expandedPaths )
+	expandedPaths.addPath( "/" )
+
+	scene.globals()
+	scene.bound( "/" )
+
+	for path in expandedPaths.paths() :
+		for childName in scene.childNames( path ) :
+			childPath = path.rstrip( "/" ) + "/" + str( childName )
+			scene.transform( childPath )
+			scene.bound( childPath )
+			scene.attributes( childPath )
+			scene.object( childPath )
+
+GafferUI.PlaybackPrefetcher.registerPrefetchFunction( GafferScene.ScenePlug, __prefetchScene )
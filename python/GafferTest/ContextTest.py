@@ -773,6 +773,75 @@ class ContextTest( GafferTest.TestCase ) :
 
 		GafferTest.testContextCopyPerformance( 10, 10 )
 
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testContextNestedScopePerformance( self ) :
+
+		GafferTest.testContextNestedScopePerformance( 20, 100 )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testContextVariationPerformance( self ) :
+
+		GafferTest.testContextVariationPerformance( 20, 4 )
+
+	def testIncrementalHash( self ) :
+
+		# Hashes are updated incrementally as variables are edited, so check
+		# that they always match the hash of a context built from scratch.
+
+		def assertExpectedHash( context ) :
+
+			fresh = Gaffer.Context()
+			for name in fresh.names() :
+				fresh.remove( name )
+			for name in context.names() :
+				fresh[name] = context[name]
+
+			self.assertEqual( context.hash(), fresh.hash() )
+
+		c = Gaffer.Context()
+		assertExpectedHash( c )
+
+		c["a"] = 1
+		assertExpectedHash( c )
+		c["a"] = 2
+		assertExpectedHash( c )
+		c["a"] = 2
+		assertExpectedHash( c )
+		c["b"] = "b"
+		c["ui:c"] = "c"
+		assertExpectedHash( c )
+		c["ui:c"] = "d"
+		assertExpectedHash( c )
+		c.remove( "a" )
+		assertExpectedHash( c )
+		c.remove( "notAVariable" )
+		assertExpectedHash( c )
+
+		c2 = Gaffer.Context( c )
+		assertExpectedHash( c2 )
+		c2.setFrame( 10 )
+		assertExpectedHash( c2 )
+		assertExpectedHash( c )
+
+		c2["x_1"] = 1
+		c2["x_2"] = 2
+		c2["y"] = 3
+		assertExpectedHash( c2 )
+		c2.removeMatching( "x*" )
+		assertExpectedHash( c2 )
+		self.assertEqual( set( c2.names() ), { "b", "ui:c", "y", "frame", "framesPerSecond" } )
+
+	def testRemoveMatchingSignalling( self ) :
+
+		c = Gaffer.Context()
+		c["a_1"] = 1
+		c["a_2"] = 2
+		c["b"] = 3
+
+		cs = GafferTest.CapturingSlot( c.changedSignal() )
+		c.removeMatching( "a*" )
+		self.assertEqual( { x[1] for x in cs }, { "a_1", "a_2" } )
+
 	def testCopyEditableScope( self ) :
 
 		GafferTest.testCopyEditableScope()
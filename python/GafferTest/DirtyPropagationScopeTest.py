@@ -60,5 +60,105 @@ class DirtyPropagationScopeTest( GafferTest.TestCase ) :
 
 		self.assertEqual( len( [ x[0] for x in cs if x[0].isSame( n["sum"] ) ] ), 1 )
 
+	def testValuesWithinScope( self ) :
+
+		n1 = GafferTest.AddNode()
+		n2 = GafferTest.AddNode()
+		n2["op1"].setInput( n1["sum"] )
+
+		cs = GafferTest.CapturingSlot( n2.plugDirtiedSignal() )
+
+		with Gaffer.DirtyPropagationScope() :
+
+			n1["op1"].setValue( 1 )
+			self.assertEqual( n2["sum"].getValue(), 1 )
+			n1["op1"].setValue( 2 )
+			self.assertEqual( n2["sum"].getValue(), 2 )
+			n1["op2"].setValue( 3 )
+			self.assertEqual( n2["sum"].getValue(), 5 )
+
+			self.assertEqual( len( cs ), 0 )
+
+		self.assertEqual( len( [ x[0] for x in cs if x[0].isSame( n2["sum"] ) ] ), 1 )
+
+	def testRewiringWithinScope( self ) :
+
+		n1 = GafferTest.AddNode()
+		n2 = GafferTest.AddNode()
+		n3 = GafferTest.AddNode()
+
+		cs2 = GafferTest.CapturingSlot( n2.plugDirtiedSignal() )
+		cs3 = GafferTest.CapturingSlot( n3.plugDirtiedSignal() )
+
+		with Gaffer.DirtyPropagationScope() :
+
+			n1["op1"].setValue( 1 )
+			n2["op1"].setInput( n1["sum"] )
+			n3["op1"].setInput( n2["sum"] )
+			n1["op1"].setValue( 2 )
+
+		self.assertEqual( n3["sum"].getValue(), 2 )
+		self.assertEqual( len( [ x[0] for x in cs2 if x[0].isSame( n2["sum"] ) ] ), 1 )
+		self.assertEqual( len( [ x[0] for x in cs3 if x[0].isSame( n3["sum"] ) ] ), 1 )
+
+	def testPlugRemovalWithinScope( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferTest.AddNode()
+		s["n"]["user"]["p"] = Gaffer.IntPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+		s["n"]["op1"].setInput( s["n"]["user"]["p"] )
+
+		cs = GafferTest.CapturingSlot( s["n"].plugDirtiedSignal() )
+
+		with Gaffer.DirtyPropagationScope() :
+			s["n"]["user"]["p"].setValue( 10 )
+			del s["n"]["user"]["p"]
+
+		self.assertIn( s["n"]["sum"], [ x[0] for x in cs ] )
+		self.assertEqual( s["n"]["sum"].getValue(), 0 )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testSpreadsheetEditPerformance( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["spreadsheet"] = Gaffer.Spreadsheet()
+		for i in range( 0, 10 ) :
+			s["spreadsheet"]["rows"].addColumn( Gaffer.IntPlug( "c{}".format( i ) ) )
+		s["spreadsheet"]["rows"].addRows( 500 )
+
+		previous = None
+		for i in range( 0, 10 ) :
+			s["add{}".format( i )] = GafferTest.AddNode()
+			s["add{}".format( i )]["op1"].setInput( s["spreadsheet"]["out"]["c{}".format( i )] )
+			if previous is not None :
+				s["add{}".format( i )]["op2"].setInput( previous["sum"] )
+			previous = s["add{}".format( i )]
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			with Gaffer.DirtyPropagationScope() :
+				for row in s["spreadsheet"]["rows"].children()[1:] :
+					for cell in row["cells"] :
+						cell["value"].setValue( 1 )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testExpressionEditPerformance( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["source"] = GafferTest.AddNode()
+		for i in range( 0, 200 ) :
+			s["add{}".format( i )] = GafferTest.AddNode()
+			s["expression{}".format( i )] = Gaffer.Expression()
+			s["expression{}".format( i )].setExpression(
+				'parent["add{0}"]["op1"] = parent["source"]["sum"] + {0}'.format( i )
+			)
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			with Gaffer.DirtyPropagationScope() :
+				for i in range( 0, 1000 ) :
+					s["source"]["op1"].setValue( i )
+					s["source"]["op2"].setValue( i )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -1497,6 +1497,47 @@ class ExpressionTest( GafferTest.TestCase ) :
 		with GafferTest.TestRunner.PerformanceScope() :
 			GafferTest.parallelGetValue( s["n"]["user"]["p"], 100 )
 
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testParallelContextVariationPerformance( self ) :
+
+		# Many cheap evaluations, each in a different context, as is typical
+		# when driving Instancer context variations. Each evaluation must hold
+		# the GIL while the expression executes, so this measures the overhead
+		# of `PythonExpressionEngine.execute()`.
+
+		s = Gaffer.ScriptNode()
+		s["n"] = Gaffer.Node()
+		s["n"]["user"]["p"] = Gaffer.IntPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+
+		s["e"] = Gaffer.Expression()
+		s["e"].setExpression( 'parent["n"]["user"]["p"] = context["iteration"] % 10' )
+
+		with IECore.tbb_global_control( IECore.tbb_global_control.parameter.max_allowed_parallelism, 16 ) :
+			with GafferTest.TestRunner.PerformanceScope() :
+				GafferTest.parallelGetValue( s["n"]["user"]["p"], 100000, "iteration" )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testParallelPlugReadPerformance( self ) :
+
+		# As above, but also reading plugs, as is typical when
+		# driving Spreadsheet cells.
+
+		s = Gaffer.ScriptNode()
+		s["n"] = Gaffer.Node()
+		s["n"]["user"]["p"] = Gaffer.IntPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+		for i in range( 0, 10 ) :
+			s["n"]["user"]["i{}".format( i )] = Gaffer.IntPlug( defaultValue = i, flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+
+		s["e"] = Gaffer.Expression()
+		s["e"].setExpression(
+			'parent["n"]["user"]["p"] = context["iteration"] + ' +
+			" + ".join( 'parent["n"]["user"]["i{}"]'.format( i ) for i in range( 0, 10 ) )
+		)
+
+		with IECore.tbb_global_control( IECore.tbb_global_control.parameter.max_allowed_parallelism, 16 ) :
+			with GafferTest.TestRunner.PerformanceScope() :
+				GafferTest.parallelGetValue( s["n"]["user"]["p"], 100000, "iteration" )
+
 	def testRemoveDrivenSpreadsheetRow( self ) :
 
 		s = Gaffer.ScriptNode()
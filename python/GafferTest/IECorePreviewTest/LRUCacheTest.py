@@ -243,5 +243,17 @@ class LRUCacheTest( GafferTest.TestCase ) :
 			with self.subTest( policy = policy ) :
 				GafferTest.testLRUCacheSetIfUncachedRecursion( policy )
 
+	def testComputeCostEviction( self ) :
+
+		for policy in [ "serial", "parallel", "taskParallel" ] :
+			with self.subTest( policy = policy ) :
+				GafferTest.testLRUCacheComputeCostEviction( policy )
+
+	def testEvictions( self ) :
+
+		for policy in [ "serial", "parallel", "taskParallel" ] :
+			with self.subTest( policy = policy ) :
+				GafferTest.testLRUCacheEvictions( policy )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -282,5 +282,147 @@ class LoopTest( GafferTest.TestCase ) :
 		for plug, value in valuesWhenDirtied.items() :
 			self.assertEqual( plugValue( plug ), value )
 
+	def testEvaluationModes( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["loop"] = self.intLoop()
+		self.assertEqual( s["loop"]["evaluationMode"].getValue(), Gaffer.Loop.EvaluationMode.Recursive )
+
+		s["add"] = GafferTest.AddNode()
+		s["loop"]["in"].setValue( 1 )
+		s["loop"]["next"].setInput( s["add"]["sum"] )
+		s["add"]["op1"].setInput( s["loop"]["previous"] )
+
+		# Add the loop index, so that each iteration differs.
+		s["expression"] = Gaffer.Expression()
+		s["expression"].setExpression( 'parent["add"]["op2"] = context["loop:index"]' )
+
+		loop = s["loop"]
+
+		for mode in Gaffer.Loop.EvaluationMode.values.values() :
+
+			loop["evaluationMode"].setValue( mode )
+			for iterations in ( 0, 1, 2, 10 ) :
+				with self.subTest( mode = mode, iterations = iterations ) :
+					loop["iterations"].setValue( iterations )
+					self.assertEqual( loop["out"].getValue(), 1 + sum( range( 0, iterations ) ) )
+
+			# Edits upstream must invalidate the cached iterations.
+			loop["in"].setValue( 2 )
+			self.assertEqual( loop["out"].getValue(), 2 + sum( range( 0, 10 ) ) )
+			loop["in"].setValue( 1 )
+			self.assertEqual( loop["out"].getValue(), 1 + sum( range( 0, 10 ) ) )
+
+			# As must changes to the context.
+			with Gaffer.Context() as c :
+				c["loop:index"] = 100
+				self.assertEqual( loop["out"].getValue(), 1 + sum( range( 0, 10 ) ) )
+				self.assertEqual( loop["previous"].getValue(), 1 + sum( range( 0, 100 ) ) )
+
+	def testEvaluationModeDoesntAffectHash( self ) :
+
+		loop = self.intLoop()
+		add = GafferTest.AddNode()
+		loop["next"].setInput( add["sum"] )
+		add["op1"].setInput( loop["previous"] )
+		add["op2"].setValue( 1 )
+
+		h = loop["out"].hash()
+		for mode in Gaffer.Loop.EvaluationMode.values.values() :
+			loop["evaluationMode"].setValue( mode )
+			self.assertEqual( loop["out"].hash(), h )
+
+	def testManyIterations( self ) :
+
+		loop = self.intLoop()
+		add = GafferTest.AddNode()
+		loop["next"].setInput( add["sum"] )
+		add["op1"].setInput( loop["previous"] )
+		add["op2"].setValue( 1 )
+
+		# Deep enough to exhaust the stack if evaluated recursively.
+		loop["iterations"].setValue( 100000 )
+
+		for mode in ( Gaffer.Loop.EvaluationMode.Sequential, Gaffer.Loop.EvaluationMode.Parallel ) :
+			with self.subTest( mode = mode ) :
+				Gaffer.ValuePlug.clearCache()
+				Gaffer.ValuePlug.clearHashCache()
+				loop["evaluationMode"].setValue( mode )
+				self.assertEqual( loop["out"].getValue(), 100000 )
+
+	def testParallelEvaluationFromManyThreads( self ) :
+
+		loop = self.intLoop()
+		add = GafferTest.AddNode()
+		loop["next"].setInput( add["sum"] )
+		add["op1"].setInput( loop["previous"] )
+		add["op2"].setValue( 1 )
+		loop["iterations"].setValue( 1000 )
+		loop["evaluationMode"].setValue( Gaffer.Loop.EvaluationMode.Parallel )
+
+		for i in range( 0, 10 ) :
+			Gaffer.ValuePlug.clearCache()
+			Gaffer.ValuePlug.clearHashCache()
+			# Many threads requesting the same result at once, all of which
+			# must wait on the single compute which spawns tasks.
+			GafferTest.parallelGetValue( loop["out"], 100 )
+			self.assertEqual( loop["out"].getValue(), 1000 )
+
+	def testSequentialEvaluationComputesEachIterationOnce( self ) :
+
+		loop = self.intLoop()
+		add = GafferTest.AddNode()
+		loop["next"].setInput( add["sum"] )
+		add["op1"].setInput( loop["previous"] )
+		add["op2"].setValue( 1 )
+		loop["iterations"].setValue( 100 )
+		loop["evaluationMode"].setValue( Gaffer.Loop.EvaluationMode.Sequential )
+
+		with Gaffer.PerformanceMonitor() as m :
+			self.assertEqual( loop["out"].getValue(), 100 )
+
+		self.assertEqual( m.plugStatistics( add["sum"] ).computeCount, 100 )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testSequentialPerformance( self ) :
+
+		loop = self.intLoop()
+		add = GafferTest.AddNode()
+		loop["next"].setInput( add["sum"] )
+		add["op1"].setInput( loop["previous"] )
+		add["op2"].setValue( 1 )
+		loop["iterations"].setValue( 10000 )
+		loop["evaluationMode"].setValue( Gaffer.Loop.EvaluationMode.Sequential )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			loop["out"].getValue()
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testContextPerformance( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["n"] = self.intLoop()
+		s["a"] = GafferTest.AddNode()
+
+		s["n"]["next"].setInput( s["a"]["sum"] )
+		s["a"]["op1"].setInput( s["n"]["previous"] )
+		s["a"]["op2"].setValue( 1 )
+		s["n"]["iterations"].setValue( 200 )
+
+		# A context with a realistic number of variables, so that
+		# the cost of creating and hashing the context for each
+		# iteration is representative.
+		context = Gaffer.Context()
+		for i in range( 0, 50 ) :
+			context["variable{}".format( i )] = i
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			for frame in range( 0, 200 ) :
+				context.setFrame( frame )
+				with context :
+					s["n"]["out"].hash()
+
 if __name__ == "__main__":
 	unittest.main()
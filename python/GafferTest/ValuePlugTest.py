@@ -38,9 +38,11 @@
 import gc
 import inspect
 import os
+import pathlib
 import subprocess
 import threading
 import time
+import unittest
 import imath
 
 import IECore
@@ -982,17 +984,321 @@ class ValuePlugTest( GafferTest.TestCase ) :
 			backgroundTask2.cancelAndWait()
 			backgroundTask1.cancelAndWait()
 
+	def testCacheEvictionPolicy( self ) :
+
+		for policy in Gaffer.ValuePlug.CacheEvictionPolicy.values.values() :
+
+			Gaffer.ValuePlug.setCacheEvictionPolicy( policy )
+			self.assertEqual( Gaffer.ValuePlug.getCacheEvictionPolicy(), policy )
+
+			# Regardless of policy, values should be cached and the
+			# memory limit should be respected.
+
+			n = GafferTest.CachingTestNode()
+			n["in"].setValue( str( policy ) )
+			v1 = n["out"].getValue( _copy = False )
+			v2 = n["out"].getValue( _copy = False )
+			self.assertTrue( v1.isSame( v2 ) )
+
+			Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+			self.assertEqual( Gaffer.ValuePlug.cacheMemoryUsage(), 0 )
+			Gaffer.ValuePlug.setCacheMemoryLimit( self.__originalCacheMemoryLimit )
+
+	def testCachePartitions( self ) :
+
+		class PartitionedCachingNode( GafferTest.CachingTestNode ) :
+
+			def __init__( self, name = "PartitionedCachingNode" ) :
+
+				GafferTest.CachingTestNode.__init__( self, name )
+
+			def computeCachePartition( self, output ) :
+
+				return "test"
+
+		self.assertNotIn( "test", Gaffer.ValuePlug.cachePartitions() )
+		self.assertEqual( Gaffer.ValuePlug.getCacheMemoryLimit( "test" ), Gaffer.ValuePlug.getCacheMemoryLimit() )
+		self.assertEqual( Gaffer.ValuePlug.getCacheMemoryLimit( "" ), Gaffer.ValuePlug.getCacheMemoryLimit() )
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( "test", 1024 * 1024 * 1024 )
+		self.assertIn( "test", Gaffer.ValuePlug.cachePartitions() )
+		self.assertEqual( Gaffer.ValuePlug.getCacheMemoryLimit( "test" ), 1024 * 1024 * 1024 )
+		self.assertEqual( Gaffer.ValuePlug.cacheMemoryUsage( "test" ), 0 )
+
+		n = PartitionedCachingNode()
+		n["in"].setValue( "partitioned" )
+		v1 = n["out"].getValue( _copy = False )
+		self.assertGreater( Gaffer.ValuePlug.cacheMemoryUsage( "test" ), 0 )
+
+		# Values in the partition are unaffected by the limit for the
+		# default partition.
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+		self.assertEqual( Gaffer.ValuePlug.cacheMemoryUsage(), 0 )
+		self.assertTrue( n["out"].getValue( _copy = False ).isSame( v1 ) )
+		Gaffer.ValuePlug.setCacheMemoryLimit( self.__originalCacheMemoryLimit )
+
+		# But are subject to the limit for the partition itself.
+
+		evictions = Gaffer.ValuePlug.cacheEvictions( "test" )
+		Gaffer.ValuePlug.setCacheMemoryLimit( "test", 0 )
+		self.assertEqual( Gaffer.ValuePlug.cacheMemoryUsage( "test" ), 0 )
+		self.assertGreater( Gaffer.ValuePlug.cacheEvictions( "test" ), evictions )
+		self.assertFalse( n["out"].getValue( _copy = False ).isSame( v1 ) )
+
+		# Removing the limit returns the partition to the default cache.
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( "test", 1024 * 1024 * 1024 )
+		Gaffer.ValuePlug.removeCacheMemoryLimit( "test" )
+		self.assertNotIn( "test", Gaffer.ValuePlug.cachePartitions() )
+		self.assertEqual( Gaffer.ValuePlug.getCacheMemoryLimit( "test" ), Gaffer.ValuePlug.getCacheMemoryLimit() )
+
+		v2 = n["out"].getValue( _copy = False )
+		self.assertTrue( n["out"].getValue( _copy = False ).isSame( v2 ) )
+		self.assertEqual( Gaffer.ValuePlug.cacheMemoryUsage( "test" ), Gaffer.ValuePlug.cacheMemoryUsage() )
+
+		with self.assertRaisesRegex( Exception, "Cannot remove memory limit for default cache partition" ) :
+			Gaffer.ValuePlug.removeCacheMemoryLimit( "" )
+
+	def testCacheStatistics( self ) :
+
+		self.assertFalse( Gaffer.ValuePlug.getCacheStatisticsEnabled() )
+		self.assertEqual( Gaffer.ValuePlug.cacheStatistics(), {} )
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.setCacheStatisticsEnabled( True )
+		self.assertTrue( Gaffer.ValuePlug.getCacheStatisticsEnabled() )
+
+		n = GafferTest.CachingTestNode()
+		n["in"].setValue( "statistics" )
+		refCount = n["out"].refCount()
+
+		# First access is a miss, subsequent ones are hits.
+
+		n["out"].getValue( _copy = False )
+		statistics = Gaffer.ValuePlug.cacheStatistics()[n["out"].fullName()]
+		self.assertEqual( statistics.hits, 0 )
+		self.assertEqual( statistics.misses, 1 )
+		self.assertEqual( statistics.evictions, 0 )
+		self.assertGreater( statistics.residentBytes, 0 )
+		self.assertEqual( statistics.residentBytes, Gaffer.ValuePlug.cacheMemoryUsage() )
+
+		n["out"].getValue( _copy = False )
+		n["out"].getValue( _copy = False )
+		self.assertEqual(
+			Gaffer.ValuePlug.cacheStatistics()[n["out"].fullName()],
+			Gaffer.ValuePlug.CacheStatistics( hits = 2, misses = 1, evictions = 0, residentBytes = statistics.residentBytes )
+		)
+
+		# Values removed to meet the memory limit are counted as evictions.
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+		self.assertEqual(
+			Gaffer.ValuePlug.cacheStatistics()[n["out"].fullName()],
+			Gaffer.ValuePlug.CacheStatistics( hits = 2, misses = 1, evictions = 1, residentBytes = 0 )
+		)
+		Gaffer.ValuePlug.setCacheMemoryLimit( self.__originalCacheMemoryLimit )
+
+		# But values removed by clearing the cache are not.
+
+		n["out"].getValue( _copy = False )
+		self.assertGreater( Gaffer.ValuePlug.cacheStatistics()[n["out"].fullName()].residentBytes, 0 )
+		Gaffer.ValuePlug.clearCache()
+		self.assertEqual(
+			Gaffer.ValuePlug.cacheStatistics()[n["out"].fullName()],
+			Gaffer.ValuePlug.CacheStatistics( hits = 2, misses = 2, evictions = 1, residentBytes = 0 )
+		)
+
+		# Statistics are keyed by name, so don't keep the plug alive.
+
+		self.assertEqual( n["out"].refCount(), refCount )
+
+		# Disabling discards the statistics.
+
+		Gaffer.ValuePlug.setCacheStatisticsEnabled( False )
+		self.assertEqual( Gaffer.ValuePlug.cacheStatistics(), {} )
+
+	@unittest.skipIf( IECore.hardwareConcurrency() < 2, "Adaptive growth requires budget from other threads" )
+	def testHashCacheAdaptive( self ) :
+
+		Gaffer.ValuePlug.setHashCacheSizeLimit( 100 )
+		Gaffer.ValuePlug.setHashCacheAdaptive( True )
+		self.assertTrue( Gaffer.ValuePlug.getHashCacheAdaptive() )
+		Gaffer.ValuePlug.clearHashCache()
+
+		# Cycle through a working set of hashes too large for the limit,
+		# which would miss every time if the limit was fixed. The cache
+		# should grow to accommodate it.
+
+		node = GafferTest.AddNode()
+		with Gaffer.Context() as context :
+			for i in range( 0, 50000 ) :
+				context.setFrame( i % 200 )
+				node["sum"].hash()
+
+		self.assertGreater( Gaffer.ValuePlug.hashCacheTotalUsage(), 100 )
+
+		# Turning off adaptive sizing returns to the fixed limit.
+
+		Gaffer.ValuePlug.setHashCacheAdaptive( False )
+		self.assertFalse( Gaffer.ValuePlug.getHashCacheAdaptive() )
+		node["sum"].hash()
+		self.assertLessEqual( Gaffer.ValuePlug.hashCacheTotalUsage(), 100 )
+
+	def testPersistentCache( self ) :
+
+		class PersistentCachingNode( GafferTest.CachingTestNode ) :
+
+			def __init__( self, name = "PersistentCachingNode" ) :
+
+				GafferTest.CachingTestNode.__init__( self, name )
+				self.numComputeCalls = 0
+
+			def compute( self, plug, context ) :
+
+				self.numComputeCalls += 1
+				GafferTest.CachingTestNode.compute( self, plug, context )
+
+			def computeCachePersistent( self, output ) :
+
+				return True
+
+		n = PersistentCachingNode()
+		n["in"].setValue( "persist" )
+
+		# No caching to disk until we provide a directory.
+
+		self.assertEqual( Gaffer.ValuePlug.getPersistentCacheDirectory(), pathlib.Path() )
+		self.assertEqual( n["out"].getValue(), IECore.StringData( "persist" ) )
+		self.assertEqual( n.numComputeCalls, 1 )
+		self.assertEqual( Gaffer.ValuePlug.persistentCacheUsage(), 0 )
+
+		# With a directory, results are written to disk.
+
+		directory = self.temporaryDirectory() / "persistentCache"
+		Gaffer.ValuePlug.setPersistentCacheDirectory( directory )
+		self.assertEqual( Gaffer.ValuePlug.getPersistentCacheDirectory(), directory )
+		self.assertTrue( directory.is_dir() )
+
+		Gaffer.ValuePlug.clearCache()
+		self.assertEqual( n["out"].getValue(), IECore.StringData( "persist" ) )
+		self.assertEqual( n.numComputeCalls, 2 )
+		self.assertEqual( Gaffer.ValuePlug.persistentCacheMisses(), 1 )
+		self.assertEqual( Gaffer.ValuePlug.persistentCacheHits(), 0 )
+		self.assertGreater( Gaffer.ValuePlug.persistentCacheUsage(), 0 )
+		self.assertEqual( len( list( directory.iterdir() ) ), 1 )
+
+		# After clearing the in-memory cache, results are loaded
+		# from disk rather than recomputed.
+
+		Gaffer.ValuePlug.clearCache()
+		self.assertEqual( n["out"].getValue(), IECore.StringData( "persist" ) )
+		self.assertEqual( n.numComputeCalls, 2 )
+		self.assertEqual( Gaffer.ValuePlug.persistentCacheHits(), 1 )
+
+		# Files are reused when the directory is reopened, as they
+		# would be by a subsequent process.
+
+		usage = Gaffer.ValuePlug.persistentCacheUsage()
+		Gaffer.ValuePlug.setPersistentCacheDirectory( "" )
+		Gaffer.ValuePlug.setPersistentCacheDirectory( directory )
+		self.assertEqual( Gaffer.ValuePlug.persistentCacheUsage(), usage )
+
+		Gaffer.ValuePlug.clearCache()
+		self.assertEqual( n["out"].getValue(), IECore.StringData( "persist" ) )
+		self.assertEqual( n.numComputeCalls, 2 )
+
+		# Reducing the limit removes files.
+
+		Gaffer.ValuePlug.setPersistentCacheLimit( 0 )
+		self.assertEqual( Gaffer.ValuePlug.persistentCacheUsage(), 0 )
+		self.assertEqual( len( list( directory.iterdir() ) ), 0 )
+
+		Gaffer.ValuePlug.clearCache()
+		self.assertEqual( n["out"].getValue(), IECore.StringData( "persist" ) )
+		self.assertEqual( n.numComputeCalls, 3 )
+		self.assertEqual( len( list( directory.iterdir() ) ), 0 )
+
+		# Nodes which don't opt in are never cached to disk.
+
+		Gaffer.ValuePlug.setPersistentCacheLimit( self.__originalPersistentCacheLimit )
+
+		n2 = GafferTest.CachingTestNode()
+		n2["in"].setValue( "memoryOnly" )
+		self.assertEqual( n2["out"].getValue(), IECore.StringData( "memoryOnly" ) )
+		self.assertEqual( len( list( directory.iterdir() ) ), 0 )
+
+	def testReconfigurePersistentCacheDuringCompute( self ) :
+
+		class PersistentCachingNode( GafferTest.CachingTestNode ) :
+
+			def computeCachePersistent( self, output ) :
+
+				return True
+
+		script = Gaffer.ScriptNode()
+		script["n"] = PersistentCachingNode()
+		script["e"] = Gaffer.Expression()
+		script["e"].setExpression( 'parent["n"]["in"] = str( context["testVar"] )' )
+
+		errors = []
+		def compute() :
+			try :
+				GafferTest.parallelGetValue( script["n"]["out"], 10000, "testVar" )
+			except Exception as e :
+				errors.append( e )
+
+		thread = threading.Thread( target = compute )
+		thread.start()
+
+		# Repeatedly replace and disable the cache while the computes
+		# are running. The computes in flight must continue to use a valid
+		# cache, or none at all.
+
+		directories = [ self.temporaryDirectory() / "cacheA", "", self.temporaryDirectory() / "cacheB", "" ]
+		i = 0
+		while thread.is_alive() :
+			Gaffer.ValuePlug.setPersistentCacheDirectory( directories[i % len( directories )] )
+			i += 1
+			# Give the computes a chance to take the GIL.
+			time.sleep( 0.001 )
+
+		thread.join()
+		self.assertEqual( errors, [] )
+
+		Gaffer.ValuePlug.setPersistentCacheDirectory( directories[0] )
+		Gaffer.ValuePlug.clearCache()
+		with Gaffer.Context() as c :
+			for v in range( 0, 10000, 1000 ) :
+				c["testVar"] = v
+				self.assertEqual( script["n"]["out"].getValue(), IECore.StringData( str( v ) ) )
+
 	def setUp( self ) :
 
 		GafferTest.TestCase.setUp( self )
 
 		self.__originalCacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		self.__originalCachePartitions = Gaffer.ValuePlug.cachePartitions()
+		self.__originalCacheEvictionPolicy = Gaffer.ValuePlug.getCacheEvictionPolicy()
+		self.__originalHashCacheSizeLimit = Gaffer.ValuePlug.getHashCacheSizeLimit()
+		self.__originalHashCacheAdaptive = Gaffer.ValuePlug.getHashCacheAdaptive()
+		self.__originalPersistentCacheDirectory = Gaffer.ValuePlug.getPersistentCacheDirectory()
+		self.__originalPersistentCacheLimit = Gaffer.ValuePlug.getPersistentCacheLimit()
 
 	def tearDown( self ) :
 
 		GafferTest.TestCase.tearDown( self )
 
 		Gaffer.ValuePlug.setCacheMemoryLimit( self.__originalCacheMemoryLimit )
+		for partition in Gaffer.ValuePlug.cachePartitions() :
+			if partition not in self.__originalCachePartitions :
+				Gaffer.ValuePlug.removeCacheMemoryLimit( partition )
+		Gaffer.ValuePlug.setCacheEvictionPolicy( self.__originalCacheEvictionPolicy )
+		Gaffer.ValuePlug.setCacheStatisticsEnabled( False )
+		Gaffer.ValuePlug.setHashCacheSizeLimit( self.__originalHashCacheSizeLimit )
+		Gaffer.ValuePlug.setHashCacheAdaptive( self.__originalHashCacheAdaptive )
+		Gaffer.ValuePlug.setPersistentCacheDirectory( self.__originalPersistentCacheDirectory )
+		Gaffer.ValuePlug.setPersistentCacheLimit( self.__originalPersistentCacheLimit )
 
 if __name__ == "__main__":
 	unittest.main()
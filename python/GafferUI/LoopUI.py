@@ -122,6 +122,34 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		"evaluationMode" : [
+
+			"description",
+			"""
+			Determines how the iterations of the loop are evaluated.
+
+			- Recursive : Each iteration pulls on the result of the
+				previous iteration as it is needed. This evaluates only the
+				iterations that are required, but may exhaust the stack
+				for large numbers of iterations.
+			- Sequential : Iterations are evaluated in order, starting
+				with the first. Recommended for large numbers of iterations,
+				provided that the cache is large enough to hold the result
+				of each iteration.
+			- Parallel : As for Sequential, but iterations are computed
+				concurrently. Only beneficial when much of the work in
+				each iteration does not depend on the previous iteration.
+			""",
+
+			"plugValueWidget:type", "GafferUI.PresetsPlugValueWidget",
+			"nodule:type", "",
+
+			"preset:Recursive", Gaffer.Loop.EvaluationMode.Recursive,
+			"preset:Sequential", Gaffer.Loop.EvaluationMode.Sequential,
+			"preset:Parallel", Gaffer.Loop.EvaluationMode.Parallel,
+
+		],
+
 	}
 
 )
@@ -0,0 +1,248 @@
+##########################################################################
+#
+#  Copyright (c) 2024, Cinesite VFX Ltd. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of Cinesite VFX Ltd. nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+import IECore
+
+import Gaffer
+import GafferUI
+
+## The PlaybackPrefetcher uses idle time to compute a plug's value for the
+# frames either side of the current frame of a Playback object, so that
+# subsequent playback or stepping through frames is served from the
+# ValuePlug cache. Computation is performed on a background thread using a
+# `Gaffer.BackgroundTask`, so it is cancelled automatically by any edit to
+# the graph upstream of the plug. It is also cancelled whenever the context
+# changes or playback starts, and restarted around the new frame once the
+# UI is idle again.
+#
+# Prefetching stops early if the compute cache becomes full, as continuing
+# would only evict the values needed for the current frame.
+class PlaybackPrefetcher( object ) :
+
+	def __init__( self, plug, playback ) :
+
+		self.__plug = plug
+		self.__playback = playback
+		self.__backgroundTask = None
+		self.__updatePending = False
+
+		self.__contextChangedConnection = playback.context().changedSignal().connect(
+			Gaffer.WeakMethod( self.__contextChanged ), scoped = True
+		)
+		self.__stateChangedConnection = playback.stateChangedSignal().connect(
+			Gaffer.WeakMethod( self.__stateChanged ), scoped = True
+		)
+		self.__plugDirtiedConnection = plug.node().plugDirtiedSignal().connect(
+			Gaffer.WeakMethod( self.__plugDirtied ), scoped = True
+		)
+
+		self.__scheduleUpdate()
+
+	def __del__( self ) :
+
+		self.__cancel()
+
+	def plug( self ) :
+
+		return self.__plug
+
+	def playback( self ) :
+
+		return self.__playback
+
+	## Blocks until any prefetching in progress has completed.
+	# Intended primarily for use in unit tests.
+	def wait( self ) :
+
+		if self.__backgroundTask is not None :
+			self.__backgroundTask.wait()
+
+	__frames = 0
+
+	## Sets the number of frames either side of the current frame
+	# which are prefetched. A value of 0 disables prefetching. This
+	# applies to all PlaybackPrefetchers, and takes effect the next
+	# time the frame changes.
+	@classmethod
+	def setFrames( cls, frames ) :
+
+		cls.__frames = max( frames, 0 )
+
+	@classmethod
+	def getFrames( cls ) :
+
+		return cls.__frames
+
+	__prefetchFunctions = {}
+
+	## Registers a function used to prefetch plugs of the specified type.
+	# The function is called as `prefetchFunction( plug )` from a background
+	# thread, with the context to compute in already current. It should compute
+	# everything the Viewer needs to display the plug.
+	@classmethod
+	def registerPrefetchFunction( cls, plugClassOrTypeId, prefetchFunction ) :
+
+		if isinstance( plugClassOrTypeId, IECore.TypeId ) :
+			plugTypeId = plugClassOrTypeId
+		else :
+			plugTypeId = plugClassOrTypeId.staticTypeId()
+
+		cls.__prefetchFunctions[plugTypeId] = prefetchFunction
+
+	@classmethod
+	def __prefetchFunction( cls, plug ) :
+
+		for plugTypeId in [ plug.typeId() ] + IECore.RunTimeTyped.baseTypeIds( plug.typeId() ) :
+			prefetchFunction = cls.__prefetchFunctions.get( plugTypeId )
+			if prefetchFunction is not None :
+				return prefetchFunction
+
+		return None
+
+	def __contextChanged( self, context, key ) :
+
+		self.__scheduleUpdate()
+
+	def __stateChanged( self, playback ) :
+
+		self.__scheduleUpdate()
+
+	def __plugDirtied( self, plug ) :
+
+		if plug.isSame( self.__plug ) or self.__plug.isAncestorOf( plug ) :
+			self.__scheduleUpdate()
+
+	def __scheduleUpdate( self ) :
+
+		# Cancel rather than `cancelAndWait()`, so that we don't
+		# block the UI. The BackgroundTask itself makes sure that
+		# the prefetch is not running when the graph is edited.
+		if self.__backgroundTask is not None :
+			self.__backgroundTask.cancel()
+
+		if self.__updatePending or not self.getFrames() :
+			return
+
+		GafferUI.EventLoop.addIdleCallback( Gaffer.WeakMethod( self.__idle, fallbackResult = False ) )
+		self.__updatePending = True
+
+	def __idle( self ) :
+
+		self.__updatePending = False
+		self.__update()
+		return False # Remove idle callback
+
+	def __update( self ) :
+
+		self.__cancel()
+
+		if self.__playback.getState() != self.__playback.State.Stopped :
+			return
+
+		frames = self.__framesToPrefetch()
+		prefetchFunction = self.__prefetchFunction( self.__plug )
+		if not frames or prefetchFunction is None :
+			return
+
+		self.__backgroundTask = Gaffer.BackgroundTask(
+			self.__plug,
+			# Bind everything we need now, rather than binding `self`,
+			# so the task doesn't extend our lifetime or access our state
+			# concurrently with the UI thread.
+			lambda canceller, plug = self.__plug, context = Gaffer.Context( self.__playback.context() ) :
+				PlaybackPrefetcher.__prefetch( plug, context, frames, prefetchFunction, canceller )
+		)
+
+	def __cancel( self ) :
+
+		if self.__backgroundTask is not None :
+			self.__backgroundTask.cancelAndWait()
+			self.__backgroundTask = None
+
+	def __framesToPrefetch( self ) :
+
+		currentFrame = self.__playback.context().getFrame()
+		startFrame, endFrame = self.__playback.getFrameRange()
+
+		# Nearest frames first, alternating forwards and backwards.
+		result = []
+		for offset in range( 1, self.getFrames() + 1 ) :
+			for frame in ( currentFrame + offset, currentFrame - offset ) :
+				if startFrame <= frame <= endFrame :
+					result.append( frame )
+
+		return result
+
+	@staticmethod
+	def __prefetch( plug, context, frames, prefetchFunction, canceller ) :
+
+		with Gaffer.Context( context, canceller ) as prefetchContext :
+			for frame in frames :
+				if PlaybackPrefetcher.__cacheFull() :
+					return
+				prefetchContext.setFrame( frame )
+				try :
+					prefetchFunction( plug )
+				except IECore.Cancelled :
+					raise
+				except Exception :
+					# Errors will be reported to the user when the frame
+					# is viewed, so there is no need to report them here.
+					pass
+				IECore.Canceller.check( canceller )
+
+	@staticmethod
+	def __cacheFull() :
+
+		if Gaffer.ValuePlug.cacheMemoryUsage() >= Gaffer.ValuePlug.getCacheMemoryLimit() * 0.9 :
+			return True
+
+		for partition in Gaffer.ValuePlug.cachePartitions() :
+			limit = Gaffer.ValuePlug.getCacheMemoryLimit( partition )
+			if Gaffer.ValuePlug.cacheMemoryUsage( partition ) >= limit * 0.9 :
+				return True
+
+		return False
+
+def __prefetchValuePlug( plug ) :
+
+	if hasattr( plug, "getValue" ) :
+		plug.getValue()
+	else :
+		for child in Gaffer.ValuePlug.Range( plug ) :
+			__prefetchValuePlug( child )
+
+PlaybackPrefetcher.registerPrefetchFunction( Gaffer.ValuePlug, __prefetchValuePlug )
@@ -141,6 +141,7 @@ class Viewer( GafferUI.NodeSetEditor ) :
 
 		self.__views = []
 		self.__currentView = None
+		self.__prefetcher = None
 
 		self.keyPressSignal().connect( Gaffer.WeakMethod( self.__keyPress ), scoped = False )
 		self.contextMenuSignal().connect( Gaffer.WeakMethod( self.__contextMenu ), scoped = False )
@@ -213,6 +214,8 @@ class Viewer( GafferUI.NodeSetEditor ) :
 		else :
 			self.__updateViewportMessage()
 
+		self.__updatePrefetcher()
+
 		self.__primaryToolChanged()
 
 	def _titleFormat( self ) :
@@ -224,6 +227,19 @@ class Viewer( GafferUI.NodeSetEditor ) :
 		for toolbar in self.__toolToolbars :
 			toolbar.setNode( self.__toolChooser.primaryTool() )
 
+	def __updatePrefetcher( self ) :
+
+		if self.__currentView is None :
+			self.__prefetcher = None
+			return
+
+		if self.__prefetcher is not None and self.__prefetcher.plug().isSame( self.__currentView["in"] ) :
+			return
+
+		self.__prefetcher = GafferUI.PlaybackPrefetcher(
+			self.__currentView["in"], GafferUI.Playback.acquire( self.getContext() )
+		)
+
 	def __keyPress( self, widget, event ) :
 
 		if event.modifiers :
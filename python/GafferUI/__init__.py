@@ -259,6 +259,7 @@ from .ButtonPlugValueWidget import ButtonPlugValueWidget
 from . import ViewUI
 from . import ToolUI
 from .Playback import Playback
+from .PlaybackPrefetcher import PlaybackPrefetcher
 from . import MetadataWidget
 from .UIEditor import UIEditor
 from . import GraphBookmarksUI
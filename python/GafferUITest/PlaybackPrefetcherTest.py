@@ -0,0 +1,134 @@
+##########################################################################
+#
+#  Copyright (c) 2024, Cinesite VFX Ltd. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of Cinesite VFX Ltd. nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+import unittest
+
+import Gaffer
+import GafferTest
+import GafferUI
+import GafferUITest
+
+class PlaybackPrefetcherTest( GafferUITest.TestCase ) :
+
+	def setUp( self ) :
+
+		GafferUITest.TestCase.setUp( self )
+
+		self.addCleanup( GafferUI.PlaybackPrefetcher.setFrames, GafferUI.PlaybackPrefetcher.getFrames() )
+		self.addCleanup( Gaffer.ValuePlug.setCacheMemoryLimit, Gaffer.ValuePlug.getCacheMemoryLimit() )
+		Gaffer.ValuePlug.clearCache()
+
+	def __assertPrefetched( self, plug, context, frames ) :
+
+		for frame, prefetched in frames.items() :
+			with Gaffer.PerformanceMonitor() as monitor :
+				with Gaffer.Context( context ) as c :
+					c.setFrame( frame )
+					self.assertEqual( plug.getValue(), frame )
+			self.assertEqual( monitor.plugStatistics( plug ).computeCount, 0 if prefetched else 1 )
+
+	def testPrefetch( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["frame"] = GafferTest.FrameNode()
+
+		playback = GafferUI.Playback.acquire( script.context() )
+		playback.setFrameRange( 1, 6 )
+
+		GafferUI.PlaybackPrefetcher.setFrames( 2 )
+		prefetcher = GafferUI.PlaybackPrefetcher( script["frame"]["output"], playback )
+		script.context().setFrame( 5 )
+
+		self.waitForIdle()
+		prefetcher.wait()
+
+		self.__assertPrefetched(
+			script["frame"]["output"], script.context(),
+			# Frame 5 is the current frame, and is left for the Viewer to compute.
+			# Frame 7 is outside the frame range.
+			{ 2 : False, 3 : True, 4 : True, 5 : False, 6 : True, 7 : False }
+		)
+
+	def testDisabled( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["frame"] = GafferTest.FrameNode()
+
+		GafferUI.PlaybackPrefetcher.setFrames( 0 )
+		prefetcher = GafferUI.PlaybackPrefetcher( script["frame"]["output"], GafferUI.Playback.acquire( script.context() ) )
+		script.context().setFrame( 5 )
+
+		self.waitForIdle()
+		prefetcher.wait()
+
+		self.__assertPrefetched( script["frame"]["output"], script.context(), { 4 : False, 6 : False } )
+
+	def testNoPrefetchDuringPlayback( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["frame"] = GafferTest.FrameNode()
+
+		playback = GafferUI.Playback.acquire( script.context() )
+		playback.setState( playback.State.Scrubbing )
+		self.addCleanup( playback.setState, playback.State.Stopped )
+
+		GafferUI.PlaybackPrefetcher.setFrames( 2 )
+		prefetcher = GafferUI.PlaybackPrefetcher( script["frame"]["output"], playback )
+		script.context().setFrame( 5 )
+
+		self.waitForIdle()
+		prefetcher.wait()
+
+		self.__assertPrefetched( script["frame"]["output"], script.context(), { 4 : False, 6 : False } )
+
+	def testRespectsCacheMemoryLimit( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["frame"] = GafferTest.FrameNode()
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+
+		GafferUI.PlaybackPrefetcher.setFrames( 2 )
+		prefetcher = GafferUI.PlaybackPrefetcher( script["frame"]["output"], GafferUI.Playback.acquire( script.context() ) )
+		script.context().setFrame( 5 )
+
+		self.waitForIdle()
+		prefetcher.wait()
+
+		self.__assertPrefetched( script["frame"]["output"], script.context(), { 4 : False, 6 : False } )
+
+if __name__ == "__main__":
+	unittest.main()
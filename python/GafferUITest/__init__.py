@@ -87,6 +87,7 @@ from .NameWidgetTest import NameWidgetTest
 from .GLWidgetTest import GLWidgetTest
 from .BookmarksTest import BookmarksTest
 from .PlaybackTest import PlaybackTest
+from .PlaybackPrefetcherTest import PlaybackPrefetcherTest
 from .SpacerGadgetTest import SpacerGadgetTest
 from .BoxUITest import BoxUITest
 from .ConnectionGadgetTest import ConnectionGadgetTest
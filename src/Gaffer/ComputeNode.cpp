@@ -93,3 +93,13 @@ ValuePlug::CachePolicy ComputeNode::computeCachePolicy( const ValuePlug *output
 	/// known to be declaring an appropriate policy.
 	return ValuePlug::CachePolicy::Legacy;
 }
+
+bool ComputeNode::computeCachePersistent( const ValuePlug *output ) const
+{
+	return false;
+}
+
+IECore::InternedString ComputeNode::computeCachePartition( const ValuePlug *output ) const
+{
+	return IECore::InternedString();
+}
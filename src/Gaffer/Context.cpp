@@ -270,15 +270,18 @@ Context::Context( const Context &other, CopyMode mode )
 			)
 			{
 				// The value is already owned by `other`, and is immutable, so we
-				// can just add our own reference to it to share ownership
-				// and then call `internalSet()`.
+				// can just add our own reference to it to share ownership.
 				m_allocMap[i.first] = allocIt->second;
-				internalSet( i.first, i.second );
+				m_map.insert( m_map.end(), i );
 			}
 			else
 			{
-				// Data not owned by `other`. Take a copy that we own, and call `internalSet()`.
-				internalSet( i.first, i.second.copy( m_allocMap[i.first] ) );
+				// Data not owned by `other`. Take a copy that we own.
+				//
+				// > Note : We bypass `internalSet()` in both cases, because
+				// > we have already copied the hash from `other`. The copied
+				// > values have identical hashes.
+				m_map.insert( m_map.end(), Map::value_type( i.first, i.second.copy( m_allocMap[i.first] ) ) );
 			}
 		}
 	}
@@ -337,8 +340,8 @@ void Context::remove( const IECore::InternedString &name )
 	Map::iterator it = m_map.find( name );
 	if( it != m_map.end() )
 	{
+		updateHash( it->second.hash(), MurmurHash() );
 		m_map.erase( it );
-		m_hashValid = false;
 		if( m_changedSignal )
 		{
 			(*m_changedSignal)( this, name );
@@ -357,11 +360,12 @@ void Context::removeMatching( const StringAlgo::MatchPattern &pattern )
 	{
 		if( StringAlgo::matchMultiple( it->first, pattern ) )
 		{
+			const InternedString name = it->first;
+			updateHash( it->second.hash(), MurmurHash() );
 			it = m_map.erase( it );
-			m_hashValid = false;
 			if( m_changedSignal )
 			{
-				(*m_changedSignal)( this, it->first );
+				(*m_changedSignal)( this, name );
 			}
 		}
 		else
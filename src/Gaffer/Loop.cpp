@@ -36,11 +36,67 @@
 
 #include "Gaffer/Loop.h"
 
+#include "Gaffer/Context.h"
 #include "Gaffer/ContextAlgo.h"
 #include "Gaffer/MetadataAlgo.h"
+#include "Gaffer/Private/IECorePreview/LRUCache.h"
 
 #include "boost/bind/bind.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+#include "tbb/task_arena.h"
+
+namespace
+{
+
+// Iteration hash cache
+// ====================
+//
+// Hashing iteration `i` requires the hash of iteration `i - 1`, so
+// without caching, hashing the final iteration recurses through all the
+// others. The ValuePlug hash cache is per-thread, so doesn't help
+// when iterations are pulled from different threads. We therefore keep
+// our own shared cache of iteration hashes, keyed in the same way as
+// the ValuePlug cache, so that invalidation is provided by the plug's
+// dirty count.
+
+IECore::MurmurHash iterationHashCacheKey( const Gaffer::ValuePlug *plug, const Gaffer::Context *context )
+{
+	IECore::MurmurHash result;
+	result.append( (uint64_t)plug );
+	result.append( plug->dirtyCount() );
+	result.append( context->hash() );
+	return result;
+}
+
+IECore::MurmurHash iterationHashGetter( const IECore::MurmurHash &key, size_t &cost, const IECore::Canceller *canceller )
+{
+	// We only ever access the cache via `getIfCached()` and `set()`,
+	// so that no lock is held while we recurse into the loop body.
+	// Holding one could deadlock if the body spawns TBB tasks.
+	throw IECore::Exception( "Iteration hashes must be computed by `iterationHash()`" );
+}
+
+using IterationHashCache = IECorePreview::LRUCache<IECore::MurmurHash, IECore::MurmurHash, IECorePreview::LRUCachePolicy::Parallel>;
+IterationHashCache g_iterationHashCache( iterationHashGetter, 100000 );
+
+// Returns the hash of `plug` in the current context.
+IECore::MurmurHash iterationHash( const Gaffer::ValuePlug *plug )
+{
+	const IECore::MurmurHash key = iterationHashCacheKey( plug, Gaffer::Context::current() );
+	if( auto h = g_iterationHashCache.getIfCached( key ) )
+	{
+		return *h;
+	}
+
+	const IECore::MurmurHash result = plug->hash();
+	g_iterationHashCache.set( key, result, 1 );
+	return result;
+}
+
+} // namespace
+
 namespace Gaffer
 {
 
@@ -140,6 +196,16 @@ const StringPlug *Loop::indexVariablePlug() const
 	return m_firstPlugIndex ? getChild<StringPlug>( m_firstPlugIndex + 3 ) : nullptr;
 }
 
+IntPlug *Loop::evaluationModePlug()
+{
+	return m_firstPlugIndex ? getChild<IntPlug>( m_firstPlugIndex + 5 ) : nullptr;
+}
+
+const IntPlug *Loop::evaluationModePlug() const
+{
+	return m_firstPlugIndex ? getChild<IntPlug>( m_firstPlugIndex + 5 ) : nullptr;
+}
+
 Gaffer::BoolPlug *Loop::enabledPlug()
 {
 	return m_firstPlugIndex ? getChild<BoolPlug>( m_firstPlugIndex + 4 ) : nullptr;
@@ -192,18 +258,33 @@ void Loop::hash( const ValuePlug *output, const Context *context, IECore::Murmur
 {
 	int index = -1;
 	IECore::InternedString indexVariable;
-	if( const ValuePlug *plug = sourcePlug( output, context, index, indexVariable ) )
+	EvaluationMode evaluationMode = Recursive;
+	if( const ValuePlug *plug = sourcePlug( output, context, index, indexVariable, evaluationMode ) )
 	{
 		Context::EditableScope tmpContext( context );
 		if( index >= 0 )
 		{
+			if( evaluationMode != Recursive )
+			{
+				// Hash the preceding iterations in order, so that each
+				// finds the hash for the one before it in the cache,
+				// rather than recursing. Hashes are cheap, and each depends
+				// on the last, so there is nothing to be gained by doing
+				// this in parallel, even in Parallel mode.
+				for( int i = 0; i < index; ++i )
+				{
+					tmpContext.set( indexVariable, &i );
+					iterationHash( plug );
+				}
+			}
 			tmpContext.set( indexVariable, &index );
+			h = iterationHash( plug );
 		}
 		else
 		{
 			tmpContext.remove( indexVariable );
+			h = plug->hash();
 		}
-		h = plug->hash();
 		return;
 	}
 
@@ -214,11 +295,51 @@ void Loop::compute( ValuePlug *output, const Context *context ) const
 {
 	int index = -1;
 	IECore::InternedString indexVariable;
-	if( const ValuePlug *plug = sourcePlug( output, context, index, indexVariable ) )
+	EvaluationMode evaluationMode = Recursive;
+	if( const ValuePlug *plug = sourcePlug( output, context, index, indexVariable, evaluationMode ) )
 	{
 		Context::EditableScope tmpContext( context );
 		if( index >= 0 )
 		{
+			// Compute the preceding iterations up front, so that each
+			// is available from the cache by the time it is needed by
+			// the next.
+			if( evaluationMode == Sequential )
+			{
+				for( int i = 0; i < index; ++i )
+				{
+					tmpContext.set( indexVariable, &i );
+					const IECore::MurmurHash h = iterationHash( plug );
+					plug->getObjectValue( &h );
+				}
+			}
+			else if( evaluationMode == Parallel )
+			{
+				// We work through the iterations in blocks, so that if
+				// an iteration does depend on the one before after all,
+				// any recursion is bounded by the size of the block
+				// rather than the total number of iterations.
+				const int blockSize = tbb::this_task_arena::max_concurrency();
+				const ThreadState &threadState = ThreadState::current();
+				tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+				for( int blockBegin = 0; blockBegin < index; blockBegin += blockSize )
+				{
+					tbb::parallel_for(
+						tbb::blocked_range<int>( blockBegin, std::min( blockBegin + blockSize, index ) ),
+						[&]( const tbb::blocked_range<int> &r )
+						{
+							Context::EditableScope iterationContext( threadState );
+							for( int i = r.begin(); i != r.end(); ++i )
+							{
+								iterationContext.set( indexVariable, &i );
+								const IECore::MurmurHash h = iterationHash( plug );
+								plug->getObjectValue( &h );
+							}
+						},
+						taskGroupContext
+					);
+				}
+			}
 			tmpContext.set( indexVariable, &index );
 		}
 		else
@@ -232,6 +353,24 @@ void Loop::compute( ValuePlug *output, const Context *context ) const
 	ComputeNode::compute( output, context );
 }
 
+ValuePlug::CachePolicy Loop::computeCachePolicy( const ValuePlug *output ) const
+{
+	std::vector<IECore::InternedString> relativeName;
+	const ValuePlug *out = outPlug();
+	if( out && ancestorPlug( output, relativeName ) == out )
+	{
+		ContextAlgo::GlobalScope globalScope( Context::current(), inPlug() );
+		if( evaluationModePlug()->getValue() == Parallel )
+		{
+			// `compute()` spawns TBB tasks, so threads waiting on the
+			// result must collaborate rather than block.
+			return ValuePlug::CachePolicy::TaskCollaboration;
+		}
+	}
+
+	return ComputeNode::computeCachePolicy( output );
+}
+
 void Loop::childAdded()
 {
 	setupPlugs();
@@ -257,6 +396,7 @@ bool Loop::setupPlugs()
 	addChild( new IntPlug( "iterations", Gaffer::Plug::In, 10, 0 ) );
 	addChild( new StringPlug( "indexVariable", Gaffer::Plug::In, "loop:index" ) );
 	addChild( new BoolPlug( "enabled", Gaffer::Plug::In, true ) );
+	addChild( new IntPlug( "evaluationMode", Gaffer::Plug::In, Recursive, Recursive, Parallel ) );
 
 	// Only assign after adding all plugs, because our plug accessors
 	// use a non-zero value to indicate that all plugs are now available.
@@ -340,9 +480,10 @@ const ValuePlug *Loop::descendantPlug( const ValuePlug *plug, const std::vector<
 	return plug;
 }
 
-const ValuePlug *Loop::sourcePlug( const ValuePlug *output, const Context *context, int &sourceLoopIndex, IECore::InternedString &indexVariable ) const
+const ValuePlug *Loop::sourcePlug( const ValuePlug *output, const Context *context, int &sourceLoopIndex, IECore::InternedString &indexVariable, EvaluationMode &evaluationMode ) const
 {
 	sourceLoopIndex = -1;
+	evaluationMode = Recursive;
 
 	ContextAlgo::GlobalScope globalScope( context, inPlug() );
 
@@ -370,6 +511,10 @@ const ValuePlug *Loop::sourcePlug( const ValuePlug *output, const Context *conte
 		if( iterations > 0 && enabledPlug()->getValue() )
 		{
 			sourceLoopIndex = iterations - 1;
+			// Only the final result is evaluated specially. The
+			// previous plug is pulled by each iteration in turn, and
+			// just takes its value from the iteration before.
+			evaluationMode = (EvaluationMode)evaluationModePlug()->getValue();
 			return descendantPlug( nextPlug(), relativeName );
 		}
 		else
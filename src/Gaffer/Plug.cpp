@@ -55,6 +55,9 @@
 
 #include "tbb/enumerable_thread_specific.h"
 
+#include <atomic>
+#include <unordered_set>
+
 using namespace boost;
 using namespace Gaffer;
 
@@ -578,6 +581,9 @@ void Plug::parentChanging( Gaffer::GraphComponent *newParent )
 	if( node() )
 	{
 		propagateDirtinessForParentChange( this );
+		// Traverse immediately rather than waiting for the scope to
+		// exit, as after that `affects()` can't be called for the plug.
+		flushDirtyPropagationScope();
 	}
 
 	// This method manages the connections between plugs when
@@ -735,6 +741,15 @@ void Plug::propagateDirtinessForParentChange( Plug *plugToDirty )
 // Instead we collect all the dirty plugs in this container as we traverse
 // the graph and only when the traversal is complete do we emit the plugDirtiedSignal().
 //
+// Likewise, we don't traverse the graph immediately for each source plug
+// that is dirtied. Edits made within a DirtyPropagationScope often dirty the
+// same plugs repeatedly, or dirty plugs that are subsequently rewired or
+// removed. So we just collect the sources, and `flush()` them in a single
+// traversal when the scope exits. Because dirtying a ValuePlug invalidates its
+// hash cache entries, we must also flush before any hashes are computed within
+// the scope - `ValuePlug` takes care of that by calling
+// `flushDirtyPropagationScope()`.
+//
 // The container used is stored per-thread as although it's illegal to be
 // monkeying with a script from multiple threads, it's perfectly legal to
 // be monkeying with a different script in each thread.
@@ -744,7 +759,7 @@ class Plug::DirtyPlugs
 	public :
 
 		DirtyPlugs()
-			:	m_scopeCount( 0 ), m_emitting( false )
+			:	m_scopeCount( 0 ), m_emitting( false ), m_generation( 0 )
 		{
 		}
 
@@ -755,35 +770,20 @@ class Plug::DirtyPlugs
 				return;
 			}
 
-			if( !insertVertex( plugToDirty ).second )
+			// See comment in `insertVertex()`.
+			assert( plugToDirty->refCount() );
+
+			if( !m_sources.insert( plugToDirty ).second )
 			{
-				// Previously inserted, so we'll already
-				// have visited the dependents.
+				// Already pending, so will be visited by `flush()`.
 				return;
 			}
 
-			for( DownstreamIterator it( plugToDirty ); !it.done(); ++it )
+			if( m_pendingSources.empty() )
 			{
-				// The `const_casts()` are harmless because we're starting iteration from
-				// a non-const plug. But they are necessary because DownstreamIterator
-				// doesn't currently have a non-const form, and always yields const plugs.
-				InsertedVertex v = insertVertex( const_cast<Plug *>( &*it ) );
-				if( !it->getFlags( Plug::AcceptsDependencyCycles ) )
-				{
-					add_edge(
-						v.first,
-						insertVertex( const_cast<Plug *>( it.upstream() ) ).first,
-						m_graph
-					);
-				}
-
-				if( !v.second )
-				{
-					// Already visited this plug by another path,
-					// so we can prune the iteration.
-					it.prune();
-				}
+				g_threadsWithPendingSources++;
 			}
+			m_pendingSources.push_back( plugToDirty );
 		}
 
 		void pushScope()
@@ -798,19 +798,86 @@ class Plug::DirtyPlugs
 			{
 				if( !m_emitting ) // see comment in emit()
 				{
+					flush();
 					emit();
 				}
 			}
 		}
 
+		// Traverses the graph downstream of all the pending
+		// sources, dirtying every affected plug.
+		void flush()
+		{
+			if( m_pendingSources.empty() )
+			{
+				return;
+			}
+
+			// Take ownership of the sources before traversing, in case
+			// `DependencyNode::affects()` calls back into `flush()` via a
+			// compute.
+			std::vector<PlugPtr> sources;
+			sources.swap( m_pendingSources );
+			m_sources.clear();
+			g_threadsWithPendingSources--;
+
+			// Each flush is a new generation, so that plugs dirtied
+			// by a previous flush in the same scope are dirtied again.
+			// This is necessary because their hashes may have been
+			// computed in the meantime.
+			m_generation++;
+			for( const auto &source : sources )
+			{
+				traverse( source.get() );
+			}
+		}
+
 		static DirtyPlugs &local()
 		{
 			static tbb::enumerable_thread_specific<Plug::DirtyPlugs> g_dirtyPlugs;
 			return g_dirtyPlugs.local();
 		}
 
+		static bool anyPendingSources()
+		{
+			return g_threadsWithPendingSources.load( std::memory_order_relaxed );
+		}
+
 	private :
 
+		void traverse( Plug *plugToDirty )
+		{
+			if( !insertVertex( plugToDirty ).second )
+			{
+				// Already visited by this flush, so we'll
+				// already have visited the dependents.
+				return;
+			}
+
+			for( DownstreamIterator it( plugToDirty ); !it.done(); ++it )
+			{
+				// The `const_casts()` are harmless because we're starting iteration from
+				// a non-const plug. But they are necessary because DownstreamIterator
+				// doesn't currently have a non-const form, and always yields const plugs.
+				InsertedVertex v = insertVertex( const_cast<Plug *>( &*it ) );
+				if( !it->getFlags( Plug::AcceptsDependencyCycles ) )
+				{
+					add_edge(
+						v.first,
+						insertVertex( const_cast<Plug *>( it.upstream() ) ).first,
+						m_graph
+					);
+				}
+
+				if( !v.second )
+				{
+					// Already visited this plug by another path,
+					// so we can prune the iteration.
+					it.prune();
+				}
+			}
+		}
+
 		// We use this graph structure to keep track of the dirty propagation.
 		// Vertices in the graph represent plugs which have been dirtied, and
 		// edges represent the relationships that caused the dirtying - an
@@ -822,12 +889,19 @@ class Plug::DirtyPlugs
 		using VertexDescriptor = Graph::vertex_descriptor;
 		using EdgeDescriptor = Graph::edge_descriptor;
 
-		using PlugMap = std::unordered_map<const Plug *, VertexDescriptor>;
+		struct Vertex
+		{
+			VertexDescriptor descriptor;
+			// The flush in which the plug was last dirtied.
+			size_t generation;
+		};
+
+		using PlugMap = std::unordered_map<const Plug *, Vertex>;
 
 		// Equivalent to the return type for map::insert - the first
 		// field is the vertex descriptor, and the second field is
-		// false if the vertex was already there, true if it was
-		// inserted.
+		// false if the plug has already been visited by the current
+		// flush, and true otherwise.
 		using InsertedVertex = std::pair<VertexDescriptor, bool>;
 
 		InsertedVertex insertVertex( Plug *plug )
@@ -840,15 +914,27 @@ class Plug::DirtyPlugs
 			// would make for an ideal use.
 			assert( plug->refCount() );
 
-			PlugMap::const_iterator it = m_plugs.find( plug );
-			if( it != m_plugs.end() )
+			PlugMap::iterator it = m_plugs.find( plug );
+			const bool newVertex = it == m_plugs.end();
+			if( !newVertex && it->second.generation == m_generation )
 			{
-				return InsertedVertex( it->second, false );
+				return InsertedVertex( it->second.descriptor, false );
 			}
 
-			VertexDescriptor result = add_vertex( m_graph );
-			m_graph[result] = plug;
-			m_plugs[plug] = result;
+			VertexDescriptor result;
+			if( newVertex )
+			{
+				result = add_vertex( m_graph );
+				m_graph[result] = plug;
+				m_plugs[plug] = { result, m_generation };
+			}
+			else
+			{
+				// Visited by a previous flush in the same scope. We
+				// must dirty it again, but the edges already exist.
+				result = it->second.descriptor;
+				it->second.generation = m_generation;
+			}
 			plug->dirty();
 
 			// Insert parent plug.
@@ -857,7 +943,10 @@ class Plug::DirtyPlugs
 				if( parent->refCount() )
 				{
 					VertexDescriptor parentVertex = insertVertex( parent ).first;
-					add_edge( parentVertex, result, m_graph );
+					if( newVertex )
+					{
+						add_edge( parentVertex, result, m_graph );
+					}
 				}
 				else
 				{
@@ -958,15 +1047,33 @@ class Plug::DirtyPlugs
 		PlugMap m_plugs;
 		size_t m_scopeCount;
 		bool m_emitting;
+		size_t m_generation;
+
+		// Sources waiting for `flush()`. We use the vector to
+		// preserve the order in which sources were dirtied.
+		std::vector<PlugPtr> m_pendingSources;
+		std::unordered_set<const Plug *> m_sources;
+
+		static std::atomic_size_t g_threadsWithPendingSources;
 
 };
 
+std::atomic_size_t Plug::DirtyPlugs::g_threadsWithPendingSources( 0 );
+
 void Plug::propagateDirtiness( Plug *plugToDirty )
 {
 	DirtyPropagationScope scope;
 	DirtyPlugs::local().insert( plugToDirty );
 }
 
+void Plug::flushDirtyPropagationScope()
+{
+	if( DirtyPlugs::anyPendingSources() )
+	{
+		DirtyPlugs::local().flush();
+	}
+}
+
 void Plug::pushDirtyPropagationScope()
 {
 	DirtyPlugs::local().pushScope();
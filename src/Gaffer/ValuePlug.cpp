@@ -43,14 +43,23 @@
 #include "Gaffer/Private/IECorePreview/LRUCache.h"
 #include "Gaffer/Process.h"
 
+#include "IECore/MemoryIndexedIO.h"
 #include "IECore/MessageHandler.h"
+#include "IECore/VectorTypedData.h"
 
 #include "boost/bind/bind.hpp"
 #include "boost/format.hpp"
 
+#include "tbb/concurrent_hash_map.h"
+#include "tbb/concurrent_unordered_map.h"
 #include "tbb/enumerable_thread_specific.h"
 
+#include <algorithm>
 #include <atomic>
+#include <chrono>
+#include <fstream>
+#include <mutex>
+#include <thread>
 
 using namespace Gaffer;
 
@@ -198,6 +207,15 @@ ValuePlug::HashCacheMode defaultHashCacheMode()
 	return ValuePlug::HashCacheMode::Standard;
 }
 
+bool defaultHashCacheAdaptive()
+{
+	if( const char *e = getenv( "GAFFER_HASHCACHE_ADAPTIVE" ) )
+	{
+		return !strcmp( e, "1" );
+	}
+	return false;
+}
+
 } // namespace
 
 class ValuePlug::HashProcess : public Process
@@ -207,6 +225,10 @@ class ValuePlug::HashProcess : public Process
 
 		static IECore::MurmurHash hash( const ValuePlug *plug )
 		{
+			// Make sure any edits made in the current DirtyPropagationScope
+			// have been reflected in the dirty counts used by our cache keys.
+			flushDirtyPropagationScope();
+
 			const ValuePlug *p = sourcePlug( plug );
 
 			if( const ValuePlug *input = p->getInput<ValuePlug>() )
@@ -273,7 +295,14 @@ class ValuePlug::HashProcess : public Process
 					threadData.clearCache.store( 0, std::memory_order_release );
 				}
 
-				if( threadData.cache.getMaxCost() != g_cacheSizeLimit )
+				if( g_adaptive )
+				{
+					if( ++threadData.lookups >= g_adaptiveWindow )
+					{
+						adaptCacheSize( threadData );
+					}
+				}
+				else if( threadData.cache.getMaxCost() != g_cacheSizeLimit )
 				{
 					threadData.cache.setMaxCost( g_cacheSizeLimit );
 				}
@@ -386,6 +415,16 @@ class ValuePlug::HashProcess : public Process
 			return g_hashCacheMode;
 		}
 
+		static void setHashCacheAdaptive( bool adaptive )
+		{
+			g_adaptive = adaptive;
+		}
+
+		static bool getHashCacheAdaptive()
+		{
+			return g_adaptive;
+		}
+
 		static const IECore::InternedString staticType;
 
 	private :
@@ -459,6 +498,10 @@ class ValuePlug::HashProcess : public Process
 		{
 			assert( canceller == Context::current()->canceller() );
 			cost = 1;
+			if( g_adaptive )
+			{
+				g_threadData.local().misses++;
+			}
 			switch( key.cachePolicy )
 			{
 				case CachePolicy::TaskCollaboration :
@@ -489,15 +532,87 @@ class ValuePlug::HashProcess : public Process
 
 		struct ThreadData
 		{
-			ThreadData() : cache( localCacheGetter, g_cacheSizeLimit, Cache::RemovalCallback(), /* cacheErrors = */ false ), clearCache( 0 ) {}
+			ThreadData() : cache( localCacheGetter, g_cacheSizeLimit, Cache::RemovalCallback(), /* cacheErrors = */ false ), clearCache( 0 ), lookups( 0 ), misses( 0 ), publishedUsage( 0 ) {}
 			Cache cache;
 			// Flag to request that hashCache be cleared.
 			std::atomic_int clearCache;
+			// Counts for the current window of adaptive sizing.
+			size_t lookups;
+			size_t misses;
+			// Our contribution to `g_localCacheUsage`.
+			size_t publishedUsage;
 		};
 
 		static tbb::enumerable_thread_specific<ThreadData, tbb::cache_aligned_allocator<ThreadData>, tbb::ets_key_per_instance > g_threadData;
 		static std::atomic_size_t g_cacheSizeLimit;
 
+		// Adaptive sizing. The limit for each thread is reconsidered after
+		// every `g_adaptiveWindow` lookups, based on the miss rate over that
+		// window.
+		static std::atomic_bool g_adaptive;
+		static constexpr size_t g_adaptiveWindow = 10000;
+		static constexpr size_t g_adaptiveMaxGrowth = 8;
+		// Total usage of the per-thread caches, as last published by each
+		// thread in `adaptCacheSize()`. Threads may not inspect each other's
+		// caches while they are in use, so this is how they learn about the
+		// usage of the others.
+		static std::atomic_size_t g_localCacheUsage;
+
+		static void adaptCacheSize( ThreadData &threadData )
+		{
+			const size_t baseLimit = g_cacheSizeLimit;
+			const size_t maxLimit = baseLimit * g_adaptiveMaxGrowth;
+			const size_t limit = std::clamp( threadData.cache.getMaxCost(), baseLimit, maxLimit );
+			const size_t usage = threadData.cache.currentCost();
+			if( usage >= threadData.publishedUsage )
+			{
+				g_localCacheUsage += usage - threadData.publishedUsage;
+			}
+			else
+			{
+				g_localCacheUsage -= threadData.publishedUsage - usage;
+			}
+			threadData.publishedUsage = usage;
+
+			const float missRate = (float)threadData.misses / (float)threadData.lookups;
+
+			threadData.lookups = 0;
+			threadData.misses = 0;
+
+			// The total budget is what the caches would use if every
+			// thread was limited to `baseLimit`, so growing the cache
+			// for a busy thread is paid for by less busy threads.
+			const size_t budget = baseLimit * tbb::this_task_arena::max_concurrency();
+			const size_t totalUsage = g_globalCache.currentCost() + g_localCacheUsage;
+
+			size_t newLimit = limit;
+			if( totalUsage > budget )
+			{
+				// Memory pressure. Shrink back towards the base limit.
+				newLimit = std::max( limit / 2, baseLimit );
+			}
+			else if( missRate > 0.05f && usage >= limit )
+			{
+				// The cache is full and we're missing often, so evictions
+				// are likely to be costing us hits. Grow if the budget allows.
+				if( totalUsage + limit <= budget )
+				{
+					newLimit = std::min( limit * 2, maxLimit );
+				}
+			}
+			else if( missRate < 0.01f && usage < limit / 2 )
+			{
+				// The working set fits comfortably, so we don't need as
+				// much headroom.
+				newLimit = std::max( limit / 2, baseLimit );
+			}
+
+			if( newLimit != threadData.cache.getMaxCost() )
+			{
+				threadData.cache.setMaxCost( newLimit );
+			}
+		}
+
 		IECore::MurmurHash m_result;
 
 };
@@ -509,6 +624,398 @@ std::atomic_size_t ValuePlug::HashProcess::g_cacheSizeLimit( 128000 );
 ValuePlug::HashProcess::GlobalCache ValuePlug::HashProcess::g_globalCache( globalCacheGetter, g_cacheSizeLimit, Cache::RemovalCallback(), /* cacheErrors = */ false );
 std::atomic<uint64_t> ValuePlug::HashProcess::g_legacyGlobalDirtyCount( 0 );
 ValuePlug::HashCacheMode ValuePlug::HashProcess::g_hashCacheMode( defaultHashCacheMode() );
+std::atomic_bool ValuePlug::HashProcess::g_adaptive( defaultHashCacheAdaptive() );
+std::atomic_size_t ValuePlug::HashProcess::g_localCacheUsage( 0 );
+
+//////////////////////////////////////////////////////////////////////////
+// The PersistentCache provides an optional second level of caching for
+// the ComputeProcess, storing values on disk so they can be reused by
+// other processes.
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Stores serialised objects in a directory, with one file per value, named
+// according to the hash of the value. An in-memory index tracks the size of
+// each file so that the total size can be limited by removing the least
+// recently used files. Because the directory may be shared by several
+// processes, we treat the file system as the source of truth when loading,
+// and any failure to read a file is considered to be a cache miss.
+class PersistentCache : boost::noncopyable
+{
+
+	public :
+
+		PersistentCache( const std::filesystem::path &directory, size_t maxBytes )
+			:	m_directory( directory ),
+				m_index(
+					indexGetter, maxBytes,
+					[this] ( const std::string &name, size_t bytes ) {
+						std::error_code e;
+						std::filesystem::remove( fileName( name ), e );
+					},
+					/* cacheErrors = */ false
+				),
+				m_hits( 0 ), m_misses( 0 )
+		{
+			std::filesystem::create_directories( m_directory );
+
+			// Index any files left by previous processes, inserting
+			// them in order of modification time so that the oldest
+			// are the first to be removed.
+
+			std::vector<std::tuple<std::filesystem::file_time_type, std::string, size_t>> files;
+			for( const auto &entry : std::filesystem::directory_iterator( m_directory ) )
+			{
+				std::error_code e;
+				if( !entry.is_regular_file( e ) || entry.path().extension() != g_extension )
+				{
+					continue;
+				}
+				const size_t size = entry.file_size( e );
+				const auto time = entry.last_write_time( e );
+				if( !e )
+				{
+					files.push_back( { time, entry.path().stem().string(), size } );
+				}
+			}
+
+			std::sort( files.begin(), files.end() );
+			for( const auto &[time, name, size] : files )
+			{
+				index( name, size );
+			}
+		}
+
+		const std::filesystem::path &directory() const
+		{
+			return m_directory;
+		}
+
+		size_t getMaxBytes() const
+		{
+			return m_index.getMaxCost();
+		}
+
+		void setMaxBytes( size_t maxBytes )
+		{
+			m_index.setMaxCost( maxBytes );
+		}
+
+		size_t currentBytes() const
+		{
+			return m_index.currentCost();
+		}
+
+		size_t hits() const
+		{
+			return m_hits;
+		}
+
+		size_t misses() const
+		{
+			return m_misses;
+		}
+
+		IECore::ConstObjectPtr load( const IECore::MurmurHash &hash )
+		{
+			const std::string name = hash.toString();
+			const std::filesystem::path path = fileName( name );
+
+			std::error_code e;
+			const size_t size = std::filesystem::file_size( path, e );
+			if( e )
+			{
+				m_misses++;
+				return nullptr;
+			}
+
+			IECore::ConstObjectPtr result;
+			try
+			{
+				// MemoryIndexedIO needs the data in a CharVectorData, so we
+				// read the file straight into one rather than mapping it and
+				// then copying it.
+				IECore::CharVectorDataPtr buffer = new IECore::CharVectorData;
+				std::vector<char> &data = buffer->writable();
+				data.resize( size );
+				std::ifstream file( path, std::ios::binary );
+				file.read( data.data(), size );
+				if( !file )
+				{
+					throw IECore::Exception( "Unable to read persistent cache file" );
+				}
+				IECore::MemoryIndexedIOPtr io = new IECore::MemoryIndexedIO( buffer, {}, IECore::IndexedIO::Read );
+				result = IECore::Object::load( io, "o" );
+			}
+			catch( const std::exception & )
+			{
+				// The file may have been removed by another process, or
+				// may have been truncated by a process that crashed while
+				// writing it. Either way, we just recompute the value.
+				m_index.erase( name );
+				m_misses++;
+				return nullptr;
+			}
+
+			// Update the index, so that this file is considered to be
+			// recently used. This also adds files written by other
+			// processes since we were constructed.
+			index( name, size );
+			m_hits++;
+			return result;
+		}
+
+		void store( const IECore::MurmurHash &hash, const IECore::Object *value )
+		{
+			const std::string name = hash.toString();
+			if( m_index.cached( name ) )
+			{
+				// Already stored, most likely by a concurrent
+				// compute of the same value.
+				return;
+			}
+
+			IECore::MemoryIndexedIOPtr io = new IECore::MemoryIndexedIO( nullptr, {}, IECore::IndexedIO::Write );
+			value->save( io, "o" );
+			IECore::ConstCharVectorDataPtr buffer = io->buffer();
+			const std::vector<char> &data = buffer->readable();
+			if( data.size() > m_index.getMaxCost() )
+			{
+				return;
+			}
+
+			// Write to a temporary file and then rename it, so that other
+			// processes never see a partially written file.
+
+			const std::filesystem::path path = fileName( name );
+			std::filesystem::path temporaryPath = path;
+			temporaryPath += temporarySuffix();
+
+			{
+				std::ofstream file( temporaryPath, std::ios::binary );
+				file.write( data.data(), data.size() );
+				if( !file )
+				{
+					IECore::msg( IECore::Msg::Warning, "ValuePlug", boost::format( "Unable to write persistent cache file \"%1%\"" ) % temporaryPath.string() );
+					std::error_code e;
+					std::filesystem::remove( temporaryPath, e );
+					return;
+				}
+			}
+
+			std::error_code e;
+			std::filesystem::rename( temporaryPath, path, e );
+			if( e )
+			{
+				std::filesystem::remove( temporaryPath, e );
+				return;
+			}
+
+			index( name, data.size() );
+		}
+
+	private :
+
+		static size_t indexGetter( const std::string &name, size_t &cost, const IECore::Canceller *canceller )
+		{
+			// We only access the index via `getIfCached()` and `setIfUncached()`.
+			throw IECore::Exception( "PersistentCache index does not support `get()`" );
+		}
+
+		void index( const std::string &name, size_t size )
+		{
+			if( m_index.getIfCached( name ) )
+			{
+				// `getIfCached()` has marked the file as recently used,
+				// which is all we need.
+				return;
+			}
+
+			if( !m_index.setIfUncached( name, size, [] ( size_t bytes ) { return bytes; } ) )
+			{
+				if( size > m_index.getMaxCost() )
+				{
+					// Too big to fit within our limit.
+					std::error_code e;
+					std::filesystem::remove( fileName( name ), e );
+				}
+			}
+		}
+
+		std::filesystem::path fileName( const std::string &name ) const
+		{
+			std::filesystem::path result = m_directory / name;
+			result += g_extension;
+			return result;
+		}
+
+		std::string temporarySuffix() const
+		{
+			// Must be unique among all threads in all processes
+			// writing to the same directory.
+			IECore::MurmurHash h;
+			h.append( (uint64_t)this );
+			h.append( (uint64_t)std::hash<std::thread::id>()( std::this_thread::get_id() ) );
+			h.append( (uint64_t)std::chrono::steady_clock::now().time_since_epoch().count() );
+			h.append( (uint64_t)std::chrono::system_clock::now().time_since_epoch().count() );
+			return "." + h.toString() + ".tmp";
+		}
+
+		static const std::string g_extension;
+
+		const std::filesystem::path m_directory;
+		// Maps from file name to file size.
+		using Index = IECorePreview::LRUCache<std::string, size_t, IECorePreview::LRUCachePolicy::Parallel>;
+		Index m_index;
+
+		std::atomic_size_t m_hits;
+		std::atomic_size_t m_misses;
+
+};
+
+const std::string PersistentCache::g_extension( ".gfrcache" );
+
+using PersistentCachePtr = std::shared_ptr<PersistentCache>;
+
+PersistentCachePtr defaultPersistentCache( size_t maxBytes )
+{
+	if( const char *d = getenv( "GAFFER_PERSISTENT_CACHE_DIRECTORY" ) )
+	{
+		if( *d )
+		{
+			try
+			{
+				return std::make_shared<PersistentCache>( d, maxBytes );
+			}
+			catch( const std::exception &e )
+			{
+				IECore::msg( IECore::Msg::Warning, "ValuePlug", boost::format( "Unable to use GAFFER_PERSISTENT_CACHE_DIRECTORY : %1%" ) % e.what() );
+			}
+		}
+	}
+	return nullptr;
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// The CacheStatisticsCollector records optional statistics about the
+// use of the ComputeProcess cache.
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// For performance reasons, counts are accumulated into thread local storage
+// and only summed when queried, as in PerformanceMonitor. The plug responsible
+// for each cached value is tracked separately, so that evictions and memory
+// usage can be attributed to it when the value is removed. Plugs are identified
+// by their full name rather than by reference, because the collector lives for
+// as long as statistics are enabled, and must not keep deleted plugs alive.
+class CacheStatisticsCollector : boost::noncopyable
+{
+
+	public :
+
+		CacheStatisticsCollector()
+			:	m_clearing( false )
+		{
+		}
+
+		void lookup( const ValuePlug *plug )
+		{
+			m_threadData.local()[plug->fullName()].hits++;
+		}
+
+		void miss( const ValuePlug *plug )
+		{
+			// Every miss was first counted as a lookup, which
+			// we must now remove from the hits. Counts may be
+			// made on different threads, but the wraparound
+			// of unsigned arithmetic means that the sum is still
+			// correct.
+			ValuePlug::CacheStatistics &s = m_threadData.local()[plug->fullName()];
+			s.hits--;
+			s.misses++;
+		}
+
+		void inserted( const IECore::MurmurHash &key, const ValuePlug *plug, size_t bytes )
+		{
+			ValuePlug::CacheStatisticsMap &threadStatistics = m_threadData.local();
+
+			ResidentMap::accessor a;
+			if( !m_resident.insert( a, key ) )
+			{
+				// Already resident in another cache partition.
+				threadStatistics[a->second.plugName].residentBytes -= a->second.bytes;
+			}
+			a->second.plugName = plug->fullName();
+			a->second.bytes = bytes;
+			threadStatistics[a->second.plugName].residentBytes += bytes;
+		}
+
+		void removed( const IECore::MurmurHash &key )
+		{
+			ResidentMap::accessor a;
+			if( !m_resident.find( a, key ) )
+			{
+				return;
+			}
+
+			ValuePlug::CacheStatistics &s = m_threadData.local()[a->second.plugName];
+			s.residentBytes -= a->second.bytes;
+			if( !m_clearing )
+			{
+				s.evictions++;
+			}
+			m_resident.erase( a );
+		}
+
+		// Removals made between calls to `beginClear()` and
+		// `endClear()` are not counted as evictions.
+		void beginClear()
+		{
+			m_clearing = true;
+		}
+
+		void endClear()
+		{
+			m_clearing = false;
+		}
+
+		ValuePlug::CacheStatisticsMap statistics()
+		{
+			ValuePlug::CacheStatisticsMap result;
+			for( const auto &threadStatistics : m_threadData )
+			{
+				for( const auto &s : threadStatistics )
+				{
+					result[s.first] += s.second;
+				}
+			}
+			return result;
+		}
+
+	private :
+
+		tbb::enumerable_thread_specific<ValuePlug::CacheStatisticsMap, tbb::cache_aligned_allocator<ValuePlug::CacheStatisticsMap>, tbb::ets_key_per_instance> m_threadData;
+
+		struct Resident
+		{
+			std::string plugName;
+			size_t bytes;
+		};
+
+		using ResidentMap = tbb::concurrent_hash_map<IECore::MurmurHash, Resident>;
+		ResidentMap m_resident;
+
+		std::atomic_bool m_clearing;
+
+};
+
+} // namespace
 
 //////////////////////////////////////////////////////////////////////////
 // The ComputeProcess manages the task of calling ComputeNode::compute()
@@ -564,6 +1071,26 @@ bool spawnsTasks( const ComputeProcessKey &key )
 	return key.cachePolicy == ValuePlug::CachePolicy::TaskCollaboration;
 }
 
+ValuePlug::CacheEvictionPolicy defaultCacheEvictionPolicy()
+{
+	if( const char *e = getenv( "GAFFER_CACHE_EVICTION_POLICY" ) )
+	{
+		if( !strcmp( e, "LRU" ) )
+		{
+			return ValuePlug::CacheEvictionPolicy::LRU;
+		}
+		else if( !strcmp( e, "ComputeCost" ) )
+		{
+			return ValuePlug::CacheEvictionPolicy::ComputeCost;
+		}
+		else
+		{
+			IECore::msg( IECore::Msg::Warning, "ValuePlug", "Invalid value for GAFFER_CACHE_EVICTION_POLICY. Must be LRU or ComputeCost." );
+		}
+	}
+	return ValuePlug::CacheEvictionPolicy::LRU;
+}
+
 } // namespace
 
 class ValuePlug::ComputeProcess : public Process
@@ -588,7 +1115,204 @@ class ValuePlug::ComputeProcess : public Process
 
 		static void clearCache()
 		{
+			if( g_cacheStatistics )
+			{
+				g_cacheStatistics->beginClear();
+			}
+
 			g_cache.clear();
+			for( auto &p : g_partitions )
+			{
+				p.second->cache.clear();
+			}
+
+			if( g_cacheStatistics )
+			{
+				g_cacheStatistics->endClear();
+			}
+		}
+
+		static void setCacheEvictionPolicy( CacheEvictionPolicy cacheEvictionPolicy )
+		{
+			g_cache.setEvictionPolicy( evictionPolicy( cacheEvictionPolicy ) );
+			for( auto &p : g_partitions )
+			{
+				p.second->cache.setEvictionPolicy( evictionPolicy( cacheEvictionPolicy ) );
+			}
+		}
+
+		static CacheEvictionPolicy getCacheEvictionPolicy()
+		{
+			return g_cache.getEvictionPolicy() == Cache::EvictionPolicy::ComputeCost ? CacheEvictionPolicy::ComputeCost : CacheEvictionPolicy::LRU;
+		}
+
+		static size_t getCacheMemoryLimit( const IECore::InternedString &partition )
+		{
+			return cache( partition ).getMaxCost();
+		}
+
+		static void setCacheMemoryLimit( const IECore::InternedString &partitionName, size_t bytes )
+		{
+			if( partitionName == IECore::InternedString() )
+			{
+				g_cache.setMaxCost( bytes );
+				return;
+			}
+
+			auto it = g_partitions.find( partitionName );
+			if( it == g_partitions.end() )
+			{
+				it = g_partitions.emplace( partitionName, std::make_unique<Partition>() ).first;
+			}
+
+			Partition &p = *it->second;
+			p.cache.setEvictionPolicy( g_cache.getEvictionPolicy() );
+			p.cache.setMaxCost( bytes );
+			if( !p.enabled.exchange( true ) )
+			{
+				g_numEnabledPartitions++;
+			}
+		}
+
+		static void removeCacheMemoryLimit( const IECore::InternedString &partitionName )
+		{
+			if( partitionName == IECore::InternedString() )
+			{
+				throw IECore::Exception( "Cannot remove memory limit for default cache partition" );
+			}
+
+			Partition *p = partition( partitionName );
+			if( !p )
+			{
+				return;
+			}
+
+			p->enabled = false;
+			g_numEnabledPartitions--;
+			// Computes already in flight may still be using the partition,
+			// so we set the limit to 0 to prevent them from storing values
+			// that would never be removed.
+			if( g_cacheStatistics )
+			{
+				g_cacheStatistics->beginClear();
+			}
+			p->cache.clear();
+			p->cache.setMaxCost( 0 );
+			if( g_cacheStatistics )
+			{
+				g_cacheStatistics->endClear();
+			}
+		}
+
+		static size_t cacheMemoryUsage( const IECore::InternedString &partition )
+		{
+			return cache( partition ).currentCost();
+		}
+
+		static size_t cacheEvictions( const IECore::InternedString &partition )
+		{
+			return cache( partition ).evictions();
+		}
+
+		static std::vector<IECore::InternedString> cachePartitions()
+		{
+			std::vector<IECore::InternedString> result;
+			for( const auto &p : g_partitions )
+			{
+				if( p.second->enabled )
+				{
+					result.push_back( p.first );
+				}
+			}
+			std::sort( result.begin(), result.end(), [] ( const IECore::InternedString &a, const IECore::InternedString &b ) { return a.string() < b.string(); } );
+			return result;
+		}
+
+		static void setCacheStatisticsEnabled( bool enabled )
+		{
+			if( enabled )
+			{
+				g_cacheStatistics = std::make_unique<CacheStatisticsCollector>();
+			}
+			else
+			{
+				g_cacheStatistics.reset();
+			}
+		}
+
+		static bool getCacheStatisticsEnabled()
+		{
+			return g_cacheStatistics != nullptr;
+		}
+
+		static CacheStatisticsMap cacheStatistics()
+		{
+			return g_cacheStatistics ? g_cacheStatistics->statistics() : CacheStatisticsMap();
+		}
+
+		static std::filesystem::path getPersistentCacheDirectory()
+		{
+			PersistentCachePtr persistentCache = currentPersistentCache();
+			return persistentCache ? persistentCache->directory() : std::filesystem::path();
+		}
+
+		static void setPersistentCacheDirectory( const std::filesystem::path &directory )
+		{
+			if( directory == getPersistentCacheDirectory() )
+			{
+				return;
+			}
+
+			// Index the directory before taking the lock, so that we don't
+			// stall computes while we do it.
+			PersistentCachePtr persistentCache;
+			if( !directory.empty() )
+			{
+				persistentCache = std::make_shared<PersistentCache>( directory, g_persistentCacheLimit );
+			}
+
+			std::lock_guard<std::mutex> lock( g_persistentCacheMutex );
+			if( persistentCache && persistentCache->getMaxBytes() != g_persistentCacheLimit )
+			{
+				// Limit changed while we were indexing.
+				persistentCache->setMaxBytes( g_persistentCacheLimit );
+			}
+			// Computes in flight keep their own reference to the previous
+			// cache, so it is only destroyed once they have finished with it.
+			g_persistentCache.swap( persistentCache );
+		}
+
+		static size_t getPersistentCacheLimit()
+		{
+			return g_persistentCacheLimit;
+		}
+
+		static void setPersistentCacheLimit( size_t bytes )
+		{
+			std::lock_guard<std::mutex> lock( g_persistentCacheMutex );
+			g_persistentCacheLimit = bytes;
+			if( g_persistentCache )
+			{
+				g_persistentCache->setMaxBytes( bytes );
+			}
+		}
+
+		static size_t persistentCacheUsage()
+		{
+			PersistentCachePtr persistentCache = currentPersistentCache();
+			return persistentCache ? persistentCache->currentBytes() : 0;
+		}
+
+		static size_t persistentCacheHits()
+		{
+			PersistentCachePtr persistentCache = currentPersistentCache();
+			return persistentCache ? persistentCache->hits() : 0;
+		}
+
+		static size_t persistentCacheMisses()
+		{
+			PersistentCachePtr persistentCache = currentPersistentCache();
+			return persistentCache ? persistentCache->misses() : 0;
 		}
 
 		static IECore::ConstObjectPtr value( const ValuePlug *plug, const IECore::MurmurHash *precomputedHash )
@@ -620,12 +1344,22 @@ class ValuePlug::ComputeProcess : public Process
 			{
 				return ComputeProcess( processKey ).m_result;
 			}
-			else if( Process::forceMonitoring( threadState, plug, ValuePlug::ComputeProcess::staticType ) )
+
+			Cache &cache = ComputeProcess::cache( processKey );
+			if( g_cacheStatistics )
+			{
+				g_cacheStatistics->lookup( p );
+			}
+
+			if( Process::forceMonitoring( threadState, plug, ValuePlug::ComputeProcess::staticType ) )
 			{
+				const auto startTime = std::chrono::steady_clock::now();
+				recordMiss( processKey );
 				ComputeProcess process( processKey );
-				g_cache.setIfUncached(
+				cache.setIfUncached(
 					processKey, process.m_result,
-					[]( const IECore::ConstObjectPtr &v ) { return v->memoryUsage(); }
+					costFunction( processKey, cache ),
+					std::chrono::steady_clock::now() - startTime
 				);
 				return process.m_result;
 			}
@@ -637,11 +1371,33 @@ class ValuePlug::ComputeProcess : public Process
 				// from inside a lock. If tasks were spawned without being
 				// isolated, TBB could steal an outer task which tries to get
 				// the same item from the cache, leading to deadlock.
-				if( auto result = g_cache.getIfCached( processKey ) )
+				if( auto result = cache.getIfCached( processKey ) )
 				{
 					return *result;
 				}
+
+				recordMiss( processKey );
+
+				PersistentCachePtr persistentCache = ComputeProcess::persistentCache( processKey );
+				if( persistentCache )
+				{
+					if( IECore::ConstObjectPtr result = persistentCache->load( processKey ) )
+					{
+						cache.setIfUncached(
+							processKey, result,
+							costFunction( processKey, cache )
+						);
+						return result;
+					}
+				}
+
+				const auto startTime = std::chrono::steady_clock::now();
 				ComputeProcess process( processKey );
+				const auto duration = std::chrono::steady_clock::now() - startTime;
+				if( persistentCache && process.m_result )
+				{
+					persistentCache->store( processKey, process.m_result.get() );
+				}
 				// Store the value in the cache, but only if it isn't there
 				// already. The check is useful because it's common for an
 				// upstream compute triggered by us to have already done the
@@ -653,15 +1409,18 @@ class ValuePlug::ComputeProcess : public Process
 				// already have computed the same result) and the attribute data
 				// itself consists of many small objects for which computing
 				// memory usage is slow.
-				g_cache.setIfUncached(
+				cache.setIfUncached(
 					processKey, process.m_result,
-					[]( const IECore::ConstObjectPtr &v ) { return v->memoryUsage(); }
+					costFunction( processKey, cache ),
+					// Recording the duration allows the ComputeCost
+					// eviction policy to weight the entry.
+					duration
 				);
 				return process.m_result;
 			}
 			else
 			{
-				return g_cache.get( processKey, currentContext->canceller() );
+				return cache.get( processKey, currentContext->canceller() );
 			}
 		}
 
@@ -726,6 +1485,23 @@ class ValuePlug::ComputeProcess : public Process
 			// Canceller will be passed to `ComputeNode::hash()` implicitly
 			// via the context.
 			assert( canceller == Context::current()->canceller() );
+
+			recordMiss( key );
+
+			PersistentCachePtr persistentCache = ComputeProcess::persistentCache( key );
+			if( persistentCache )
+			{
+				if( IECore::ConstObjectPtr result = persistentCache->load( key ) )
+				{
+					cost = result->memoryUsage();
+					if( g_cacheStatistics )
+					{
+						recordInsertion( key, cache( key ), cost );
+					}
+					return result;
+				}
+			}
+
 			IECore::ConstObjectPtr result;
 			switch( key.cachePolicy )
 			{
@@ -758,21 +1534,183 @@ class ValuePlug::ComputeProcess : public Process
 					break;
 			}
 
+			if( persistentCache && result )
+			{
+				persistentCache->store( key, result.get() );
+			}
+
 			cost = result->memoryUsage();
+			if( g_cacheStatistics )
+			{
+				recordInsertion( key, cache( key ), cost );
+			}
 			return result;
 		}
 
+		// Returns the persistent cache if it should be used for `key`,
+		// and null otherwise. The caller must hold on to the result for
+		// as long as it uses it, since the cache may be replaced by
+		// `setPersistentCacheDirectory()` at any time.
+		static PersistentCachePtr persistentCache( const ComputeProcessKey &key )
+		{
+			PersistentCachePtr result = currentPersistentCache();
+			if(
+				!result || !key.computeNode || key.plug->getInput() ||
+				!key.computeNode->computeCachePersistent( key.plug )
+			)
+			{
+				return nullptr;
+			}
+			return result;
+		}
+
+		static PersistentCachePtr currentPersistentCache()
+		{
+			std::lock_guard<std::mutex> lock( g_persistentCacheMutex );
+			return g_persistentCache;
+		}
+
 		// A cache mapping from ValuePlug::hash() to the result of the previous computation
 		// for that hash. This allows us to cache results for faster repeat evaluation
 		using Cache = IECorePreview::LRUCache<IECore::MurmurHash, IECore::ConstObjectPtr, IECorePreview::LRUCachePolicy::TaskParallel, ComputeProcessKey>;
 		static Cache g_cache;
 
+		static Cache::EvictionPolicy evictionPolicy( CacheEvictionPolicy cacheEvictionPolicy )
+		{
+			switch( cacheEvictionPolicy )
+			{
+				case CacheEvictionPolicy::ComputeCost :
+					return Cache::EvictionPolicy::ComputeCost;
+				default :
+					return Cache::EvictionPolicy::LRU;
+			}
+		}
+
+		static void recordMiss( const ComputeProcessKey &key )
+		{
+			if( g_cacheStatistics )
+			{
+				g_cacheStatistics->miss( key.plug );
+			}
+		}
+
+		// Records a value in the cache statistics, provided that
+		// its cost allows it to be stored in `cache`.
+		static void recordInsertion( const ComputeProcessKey &key, const Cache &cache, size_t cost )
+		{
+			if( g_cacheStatistics && cost <= cache.getMaxCost() )
+			{
+				g_cacheStatistics->inserted( key, key.plug, cost );
+			}
+		}
+
+		// Returns a cost function for use with `Cache::setIfUncached()`.
+		static auto costFunction( const ComputeProcessKey &key, const Cache &cache )
+		{
+			return [&key, &cache] ( const IECore::ConstObjectPtr &value ) {
+				const size_t cost = value->memoryUsage();
+				recordInsertion( key, cache, cost );
+				return cost;
+			};
+		}
+
+		static void removalCallback( const IECore::MurmurHash &key, const IECore::ConstObjectPtr &value )
+		{
+			if( g_cacheStatistics )
+			{
+				g_cacheStatistics->removed( key );
+			}
+		}
+
+		// Additional caches for partitions with their own memory limit. Partitions
+		// are never removed from the map, because `concurrent_unordered_map` doesn't
+		// support concurrent erasure. Instead they are disabled, so that `cache()`
+		// falls back to `g_cache`.
+		struct Partition
+		{
+			Partition()
+				:	cache( cacheGetter, 0, removalCallback, /* cacheErrors = */ false ), enabled( false )
+			{
+			}
+			Cache cache;
+			std::atomic_bool enabled;
+		};
+
+		struct PartitionHash
+		{
+			size_t operator()( const IECore::InternedString &partition ) const
+			{
+				// InternedStrings are unique, so the address is sufficient.
+				return std::hash<const char *>()( partition.c_str() );
+			}
+		};
+
+		using Partitions = tbb::concurrent_unordered_map<IECore::InternedString, std::unique_ptr<Partition>, PartitionHash>;
+		static Partitions g_partitions;
+		static std::atomic_size_t g_numEnabledPartitions;
+
+		static Partition *partition( const IECore::InternedString &name )
+		{
+			auto it = g_partitions.find( name );
+			if( it == g_partitions.end() || !it->second->enabled )
+			{
+				return nullptr;
+			}
+			return it->second.get();
+		}
+
+		static Cache &cache( const IECore::InternedString &partitionName )
+		{
+			if( partitionName != IECore::InternedString() )
+			{
+				if( Partition *p = partition( partitionName ) )
+				{
+					return p->cache;
+				}
+			}
+			return g_cache;
+		}
+
+		static Cache &cache( const ComputeProcessKey &key )
+		{
+			if( !g_numEnabledPartitions || !key.computeNode )
+			{
+				// Fast path, avoiding the virtual function call
+				// and map lookup.
+				return g_cache;
+			}
+			return cache( key.computeNode->computeCachePartition( key.plug ) );
+		}
+
+		static struct CacheInitialiser
+		{
+			CacheInitialiser()
+			{
+				setCacheEvictionPolicy( defaultCacheEvictionPolicy() );
+			}
+		} g_cacheInitialiser;
+
+		static std::atomic_size_t g_persistentCacheLimit;
+		// Protects `g_persistentCache`, which is read by computes on
+		// arbitrary threads.
+		static std::mutex g_persistentCacheMutex;
+		static PersistentCachePtr g_persistentCache;
+
+		static std::unique_ptr<CacheStatisticsCollector> g_cacheStatistics;
+
 		IECore::ConstObjectPtr m_result;
 
 };
 
 const IECore::InternedString ValuePlug::ComputeProcess::staticType( ValuePlug::computeProcessType() );
-ValuePlug::ComputeProcess::Cache ValuePlug::ComputeProcess::g_cache( cacheGetter, 1024 * 1024 * 1024 * 1, ValuePlug::ComputeProcess::Cache::RemovalCallback(), /* cacheErrors = */ false ); // 1 gig
+ValuePlug::ComputeProcess::Cache ValuePlug::ComputeProcess::g_cache( cacheGetter, 1024 * 1024 * 1024 * 1, removalCallback, /* cacheErrors = */ false ); // 1 gig
+ValuePlug::ComputeProcess::Partitions ValuePlug::ComputeProcess::g_partitions;
+std::atomic_size_t ValuePlug::ComputeProcess::g_numEnabledPartitions( 0 );
+ValuePlug::ComputeProcess::CacheInitialiser ValuePlug::ComputeProcess::g_cacheInitialiser;
+std::atomic_size_t ValuePlug::ComputeProcess::g_persistentCacheLimit( size_t( 1024 ) * 1024 * 1024 * 10 ); // 10 gig
+std::mutex ValuePlug::ComputeProcess::g_persistentCacheMutex;
+PersistentCachePtr ValuePlug::ComputeProcess::g_persistentCache( defaultPersistentCache( g_persistentCacheLimit ) );
+std::unique_ptr<CacheStatisticsCollector> ValuePlug::ComputeProcess::g_cacheStatistics;
 
 //////////////////////////////////////////////////////////////////////////
 // SetValueAction implementation
@@ -835,6 +1773,39 @@ class ValuePlug::SetValueAction : public Gaffer::Action
 
 IE_CORE_DEFINERUNTIMETYPED( ValuePlug::SetValueAction );
 
+//////////////////////////////////////////////////////////////////////////
+// CacheStatistics implementation
+//////////////////////////////////////////////////////////////////////////
+
+ValuePlug::CacheStatistics::CacheStatistics( size_t hits, size_t misses, size_t evictions, size_t residentBytes )
+	:	hits( hits ), misses( misses ), evictions( evictions ), residentBytes( residentBytes )
+{
+}
+
+ValuePlug::CacheStatistics &ValuePlug::CacheStatistics::operator += ( const CacheStatistics &rhs )
+{
+	hits += rhs.hits;
+	misses += rhs.misses;
+	evictions += rhs.evictions;
+	residentBytes += rhs.residentBytes;
+	return *this;
+}
+
+bool ValuePlug::CacheStatistics::operator == ( const CacheStatistics &rhs ) const
+{
+	return
+		hits == rhs.hits &&
+		misses == rhs.misses &&
+		evictions == rhs.evictions &&
+		residentBytes == rhs.residentBytes
+	;
+}
+
+bool ValuePlug::CacheStatistics::operator != ( const CacheStatistics &rhs ) const
+{
+	return !( *this == rhs );
+}
+
 //////////////////////////////////////////////////////////////////////////
 // ValuePlug implementation
 //////////////////////////////////////////////////////////////////////////
@@ -1231,6 +2202,96 @@ void ValuePlug::clearCache()
 	ComputeProcess::clearCache();
 }
 
+void ValuePlug::setCacheEvictionPolicy( CacheEvictionPolicy cacheEvictionPolicy )
+{
+	ComputeProcess::setCacheEvictionPolicy( cacheEvictionPolicy );
+}
+
+ValuePlug::CacheEvictionPolicy ValuePlug::getCacheEvictionPolicy()
+{
+	return ComputeProcess::getCacheEvictionPolicy();
+}
+
+size_t ValuePlug::getCacheMemoryLimit( const IECore::InternedString &partition )
+{
+	return ComputeProcess::getCacheMemoryLimit( partition );
+}
+
+void ValuePlug::setCacheMemoryLimit( const IECore::InternedString &partition, size_t bytes )
+{
+	ComputeProcess::setCacheMemoryLimit( partition, bytes );
+}
+
+void ValuePlug::removeCacheMemoryLimit( const IECore::InternedString &partition )
+{
+	ComputeProcess::removeCacheMemoryLimit( partition );
+}
+
+size_t ValuePlug::cacheMemoryUsage( const IECore::InternedString &partition )
+{
+	return ComputeProcess::cacheMemoryUsage( partition );
+}
+
+size_t ValuePlug::cacheEvictions( const IECore::InternedString &partition )
+{
+	return ComputeProcess::cacheEvictions( partition );
+}
+
+std::vector<IECore::InternedString> ValuePlug::cachePartitions()
+{
+	return ComputeProcess::cachePartitions();
+}
+
+void ValuePlug::setCacheStatisticsEnabled( bool enabled )
+{
+	ComputeProcess::setCacheStatisticsEnabled( enabled );
+}
+
+bool ValuePlug::getCacheStatisticsEnabled()
+{
+	return ComputeProcess::getCacheStatisticsEnabled();
+}
+
+ValuePlug::CacheStatisticsMap ValuePlug::cacheStatistics()
+{
+	return ComputeProcess::cacheStatistics();
+}
+
+std::filesystem::path ValuePlug::getPersistentCacheDirectory()
+{
+	return ComputeProcess::getPersistentCacheDirectory();
+}
+
+void ValuePlug::setPersistentCacheDirectory( const std::filesystem::path &directory )
+{
+	ComputeProcess::setPersistentCacheDirectory( directory );
+}
+
+size_t ValuePlug::getPersistentCacheLimit()
+{
+	return ComputeProcess::getPersistentCacheLimit();
+}
+
+void ValuePlug::setPersistentCacheLimit( size_t bytes )
+{
+	ComputeProcess::setPersistentCacheLimit( bytes );
+}
+
+size_t ValuePlug::persistentCacheUsage()
+{
+	return ComputeProcess::persistentCacheUsage();
+}
+
+size_t ValuePlug::persistentCacheHits()
+{
+	return ComputeProcess::persistentCacheHits();
+}
+
+size_t ValuePlug::persistentCacheMisses()
+{
+	return ComputeProcess::persistentCacheMisses();
+}
+
 size_t ValuePlug::getHashCacheSizeLimit()
 {
 	return HashProcess::getCacheSizeLimit();
@@ -1261,6 +2322,16 @@ ValuePlug::HashCacheMode ValuePlug::getHashCacheMode()
 	return HashProcess::getHashCacheMode();
 }
 
+void ValuePlug::setHashCacheAdaptive( bool adaptive )
+{
+	HashProcess::setHashCacheAdaptive( adaptive );
+}
+
+bool ValuePlug::getHashCacheAdaptive()
+{
+	return HashProcess::getHashCacheAdaptive();
+}
+
 const IECore::InternedString &ValuePlug::hashProcessType()
 {
 	static IECore::InternedString g_hashProcessType( "computeNode:hash" );
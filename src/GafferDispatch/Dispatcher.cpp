@@ -43,12 +43,24 @@
 #include "Gaffer/StringPlug.h"
 #include "Gaffer/SubGraph.h"
 #include "Gaffer/Switch.h"
+#include "Gaffer/ThreadState.h"
 
 #include "IECore/FrameRange.h"
 #include "IECore/MessageHandler.h"
 
 #include "boost/algorithm/string/predicate.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
+#include <cmath>
+#include <fstream>
+#include <iomanip>
+#include <memory>
+#include <optional>
+#include <sstream>
+#include <unordered_map>
+
 using namespace std;
 using namespace IECore;
 using namespace Gaffer;
@@ -104,10 +116,12 @@ tuple<const Plug *, ConstContextPtr> computedSource( const Plug *plug )
 
 static InternedString g_frame( "frame" );
 static InternedString g_batchSize( "batchSize" );
+static InternedString g_batchDuration( "batchDuration" );
 static InternedString g_immediatePlugName( "immediate" );
 static InternedString g_postTaskIndexBlindDataName( "dispatcher:postTaskIndex" );
 static InternedString g_immediateBlindDataName( "dispatcher:immediate" );
 static InternedString g_sizeBlindDataName( "dispatcher:size" );
+static InternedString g_durationBlindDataName( "dispatcher:duration" );
 static InternedString g_executedBlindDataName( "dispatcher:executed" );
 static InternedString g_visitedBlindDataName( "dispatcher:visited" );
 static InternedString g_jobDirectoryContextEntry( "dispatcher:jobDirectory" );
@@ -131,6 +145,7 @@ Dispatcher::Dispatcher( const std::string &name )
 	addChild( new StringPlug( "frameRange", Plug::In, "1-100x10" ) );
 	addChild( new StringPlug( "jobName", Plug::In, "" ) );
 	addChild( new StringPlug( "jobsDirectory", Plug::In, "" ) );
+	addChild( new BoolPlug( "incremental", Plug::In, false ) );
 }
 
 Dispatcher::~Dispatcher()
@@ -177,6 +192,16 @@ const StringPlug *Dispatcher::jobsDirectoryPlug() const
 	return getChild<StringPlug>( g_firstPlugIndex + 3 );
 }
 
+BoolPlug *Dispatcher::incrementalPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 4 );
+}
+
+const BoolPlug *Dispatcher::incrementalPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 4 );
+}
+
 const std::filesystem::path Dispatcher::jobDirectory() const
 {
 	return m_jobDirectory;
@@ -285,6 +310,7 @@ Dispatcher::PostDispatchSignal &Dispatcher::postDispatchSignal()
 void Dispatcher::setupPlugs( Plug *parentPlug )
 {
 	parentPlug->addChild( new IntPlug( g_batchSize, Plug::In, 1 ) );
+	parentPlug->addChild( new FloatPlug( g_batchDuration, Plug::In, 0.0f, 0.0f ) );
 	parentPlug->addChild( new BoolPlug( g_immediatePlugName, Plug::In, false ) );
 
 	const CreatorMap &m = creators();
@@ -401,6 +427,380 @@ const CompoundData *Dispatcher::TaskBatch::blindData() const
 	return m_blindData.get();
 }
 
+//////////////////////////////////////////////////////////////////////////
+// Manifest class. This is an internal utility class for reading and
+// writing the records used by incremental dispatch and adaptive batching.
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+const std::string g_manifestDirectoryName( "manifest" );
+const std::string g_dispatchedFileName( "dispatched.txt" );
+const std::string g_executedFilePrefix( "executed-" );
+
+// Returns a key which identifies a task independently of the work it
+// does, so that it can be matched against the records from previous
+// jobs. Variables which vary from job to job are ignored.
+std::string manifestKey( const TaskNode::TaskPlug *plug, const Context *context )
+{
+	vector<InternedString> names;
+	context->names( names );
+	// Sort the names, because variables may have been set in a different
+	// order in the process that executed the task.
+	std::sort(
+		names.begin(), names.end(),
+		[] ( const InternedString &a, const InternedString &b ) { return a.string() < b.string(); }
+	);
+
+	MurmurHash h;
+	for( const auto &name : names )
+	{
+		if(
+			name == g_frame ||
+			boost::starts_with( name.string(), "ui:" ) ||
+			boost::starts_with( name.string(), "dispatcher:" )
+		)
+		{
+			continue;
+		}
+		h.append( context->variableHash( name ) );
+	}
+
+	return plug->relativeName( plug->ancestor<ScriptNode>() ) + ":" + h.toString();
+}
+
+std::string formatFrame( float frame )
+{
+	std::ostringstream s;
+	s << std::setprecision( 9 ) << frame;
+	return s.str();
+}
+
+struct OutputFile
+{
+	std::string fileName;
+	std::uintmax_t size;
+	std::filesystem::file_time_type::rep time;
+};
+
+std::optional<OutputFile> outputFile( const std::string &fileName )
+{
+	std::error_code e;
+	const std::filesystem::path path = std::filesystem::absolute( fileName, e );
+	if( e )
+	{
+		return std::nullopt;
+	}
+
+	const std::uintmax_t size = std::filesystem::file_size( path, e );
+	if( e )
+	{
+		return std::nullopt;
+	}
+
+	const std::filesystem::file_time_type time = std::filesystem::last_write_time( path, e );
+	if( e )
+	{
+		return std::nullopt;
+	}
+
+	return OutputFile{ path.generic_string(), size, time.time_since_epoch().count() };
+}
+
+} // namespace
+
+// Reads the records written by previous jobs, and uses them to prune
+// unchanged tasks from the batches for the current job, and to estimate
+// the time taken to execute each task. The hashes of the tasks that remain
+// after pruning are recorded for use by subsequent jobs.
+class Dispatcher::Manifest
+{
+
+	public :
+
+		Manifest( const std::filesystem::path &jobDirectory )
+		{
+			readPreviousJobs( jobDirectory );
+
+			const std::filesystem::path manifestDirectory = jobDirectory / g_manifestDirectoryName;
+			std::filesystem::create_directories( manifestDirectory );
+			// We append rather than overwrite, because a nested dispatch
+			// may share the job directory of an outer dispatch.
+			m_dispatched.open( manifestDirectory / g_dispatchedFileName, std::ios::app );
+		}
+
+		// Removes the frames which don't need to be executed again, and
+		// returns true if nothing remains to be done for the batch or any
+		// of its preTasks.
+		bool prune( TaskBatch *batch )
+		{
+			auto it = m_visited.find( batch );
+			if( it != m_visited.end() )
+			{
+				return it->second;
+			}
+
+			bool preTasksPruned = true;
+			TaskBatches &preTasks = batch->preTasks();
+			for( auto pIt = preTasks.begin(); pIt != preTasks.end(); )
+			{
+				if( prune( pIt->get() ) )
+				{
+					pIt = preTasks.erase( pIt );
+				}
+				else
+				{
+					preTasksPruned = false;
+					++pIt;
+				}
+			}
+
+			if( batch->plug() && !batch->frames().empty() )
+			{
+				pruneFrames( batch, preTasksPruned );
+			}
+
+			const bool result = batch->plug() && batch->frames().empty() && preTasks.empty();
+			m_visited[batch] = result;
+			return result;
+		}
+
+		// Returns the time in seconds that a previous job took to execute
+		// the task for the specified frame. If the frame hasn't been executed
+		// before, the average for all other frames is returned instead.
+		std::optional<float> frameDuration( const std::string &key, float frame ) const
+		{
+			auto it = m_durations.find( key );
+			if( it == m_durations.end() )
+			{
+				return std::nullopt;
+			}
+
+			auto fIt = it->second.frames.find( frame );
+			if( fIt != it->second.frames.end() )
+			{
+				return fIt->second;
+			}
+
+			return it->second.total / it->second.frames.size();
+		}
+
+	private :
+
+		void pruneFrames( TaskBatch *batch, bool preTasksPruned )
+		{
+			const TaskNode::TaskPlug *plug = batch->plug();
+			const std::string key = manifestKey( plug, batch->context() );
+
+			ContextPtr context = new Context( *batch->context() );
+			context->removeMatching( "dispatcher:*" );
+			Context::Scope scopedContext( context.get() );
+
+			// Sequences must be executed in their entirety, so if any
+			// frame has changed, we keep them all.
+			const bool requiresSequenceExecution = plug->requiresSequenceExecution();
+
+			const std::vector<float> &frames = batch->frames();
+			std::vector<std::string> hashes;
+			std::vector<bool> changed;
+			bool anyChanged = false;
+			for( float frame : frames )
+			{
+				context->setFrame( frame );
+				std::string hash;
+				try
+				{
+					hash = plug->outputHash().toString();
+				}
+				catch( const std::exception & )
+				{
+					// The hash may depend on the variables we removed, or on
+					// inputs that won't exist until preTasks have executed.
+					// Leave `hash` empty, so the task is always executed.
+				}
+				changed.push_back( !preTasksPruned || !unchanged( key, frame, hash ) );
+				anyChanged = anyChanged || changed.back();
+				hashes.push_back( hash );
+			}
+
+			std::vector<float> changedFrames;
+			for( size_t i = 0; i < frames.size(); ++i )
+			{
+				if( changed[i] || ( requiresSequenceExecution && anyChanged ) )
+				{
+					changedFrames.push_back( frames[i] );
+					if( !hashes[i].empty() )
+					{
+						m_dispatched << formatFrame( frames[i] ) << " " << hashes[i] << " " << key << "\n";
+					}
+				}
+			}
+
+			batch->frames() = changedFrames;
+		}
+
+		bool unchanged( const std::string &key, float frame, const std::string &hash ) const
+		{
+			auto it = m_records.find( { key, frame } );
+			if( it == m_records.end() || hash.empty() || it->second.hash != hash || it->second.outputs.empty() )
+			{
+				return false;
+			}
+
+			for( const auto &output : it->second.outputs )
+			{
+				std::optional<OutputFile> current = outputFile( output.fileName );
+				if( !current || current->size != output.size || current->time != output.time )
+				{
+					return false;
+				}
+			}
+
+			return true;
+		}
+
+		void readPreviousJobs( const std::filesystem::path &jobDirectory )
+		{
+			// Find all the sibling job directories, and read them from newest to
+			// oldest, so that the most recent record for each task takes precedence.
+
+			std::vector<std::pair<long, std::filesystem::path>> jobDirectories;
+			std::error_code e;
+			for( const auto &d : std::filesystem::directory_iterator( jobDirectory.parent_path(), e ) )
+			{
+				const std::string name = d.path().filename().string();
+				char *end;
+				const long i = strtol( name.c_str(), &end, 10 );
+				if( end != name.c_str() && *end == '\0' && d.path() != jobDirectory )
+				{
+					jobDirectories.push_back( { i, d.path() } );
+				}
+			}
+
+			std::sort( jobDirectories.begin(), jobDirectories.end(), std::greater<>() );
+			for( const auto &[i, directory] : jobDirectories )
+			{
+				readJob( directory / g_manifestDirectoryName );
+			}
+		}
+
+		void readJob( const std::filesystem::path &manifestDirectory )
+		{
+			// Read the durations and outputs of the tasks that were executed
+			// successfully.
+
+			std::map<Key, std::vector<OutputFile>> executed;
+			std::map<Key, float> durations;
+			std::error_code e;
+			for( const auto &f : std::filesystem::directory_iterator( manifestDirectory, e ) )
+			{
+				if( !boost::starts_with( f.path().filename().string(), g_executedFilePrefix ) || f.path().extension() != ".txt" )
+				{
+					continue;
+				}
+
+				std::ifstream file( f.path() );
+				std::optional<Key> task;
+				std::vector<OutputFile> *outputs = nullptr;
+				std::string line;
+				while( std::getline( file, line ) )
+				{
+					std::istringstream lineStream( line );
+					std::string type;
+					lineStream >> type;
+					if( type == "task" )
+					{
+						float frame; std::string key;
+						if( lineStream >> frame >> key )
+						{
+							task = Key( key, frame );
+							outputs = &executed[*task];
+						}
+					}
+					else if( type == "duration" && task )
+					{
+						float duration;
+						if( lineStream >> duration )
+						{
+							durations[*task] = duration;
+						}
+					}
+					else if( type == "output" && outputs )
+					{
+						OutputFile output;
+						if( lineStream >> output.size >> output.time >> std::ws && std::getline( lineStream, output.fileName ) )
+						{
+							outputs->push_back( output );
+						}
+					}
+				}
+			}
+
+			for( const auto &[task, duration] : durations )
+			{
+				Durations &keyDurations = m_durations[task.first];
+				if( keyDurations.frames.insert( { task.second, duration } ).second )
+				{
+					// We didn't already have a duration from a more recent job.
+					keyDurations.total += duration;
+				}
+			}
+
+			// Combine the outputs with the hashes of the tasks that were dispatched.
+			// Tasks which were dispatched but never executed successfully are
+			// recorded without outputs, so that older records don't cause them
+			// to be pruned.
+
+			std::ifstream dispatched( manifestDirectory / g_dispatchedFileName );
+			std::string line;
+			while( std::getline( dispatched, line ) )
+			{
+				std::istringstream lineStream( line );
+				float frame; std::string hash; std::string key;
+				if( !( lineStream >> frame >> hash >> key ) )
+				{
+					continue;
+				}
+
+				auto [it, inserted] = m_records.insert( { { key, frame }, Record() } );
+				if( !inserted )
+				{
+					// We already have a record from a more recent job.
+					continue;
+				}
+
+				it->second.hash = hash;
+				auto eIt = executed.find( { key, frame } );
+				if( eIt != executed.end() )
+				{
+					it->second.outputs = eIt->second;
+				}
+			}
+		}
+
+		using Key = std::pair<std::string, float>;
+
+		struct Record
+		{
+			std::string hash;
+			std::vector<OutputFile> outputs;
+		};
+
+		std::map<Key, Record> m_records;
+
+		struct Durations
+		{
+			std::map<float, float> frames;
+			float total = 0.0f;
+		};
+
+		std::unordered_map<std::string, Durations> m_durations;
+		std::ofstream m_dispatched;
+		std::unordered_map<const TaskBatch *, bool> m_visited;
+
+};
+
 //////////////////////////////////////////////////////////////////////////
 // Batcher class. This is an internal utility class for constructing
 // the DAG of TaskBatches to be dispatched. It is a separate class so
@@ -412,14 +812,14 @@ class Dispatcher::Batcher
 
 	public :
 
-		Batcher()
-			:	m_rootBatch( new TaskBatch() )
+		Batcher( const std::filesystem::path &jobDirectory, const std::vector<FrameList::Frame> &frames )
+			:	m_rootBatch( new TaskBatch() ), m_jobDirectory( jobDirectory ), m_frames( frames )
 		{
 		}
 
 		void addTask( const TaskNode::Task &task )
 		{
-			if( auto batch = batchTasksWalk( task ) )
+			if( auto batch = batchTasksWalk( prepareTask( task ) ) )
 			{
 				addPreTask( m_rootBatch.get(), batch );
 			}
@@ -430,35 +830,103 @@ class Dispatcher::Batcher
 			return m_rootBatch.get();
 		}
 
+		// The manifest is only created on demand, so that we don't
+		// incur the cost of reading previous jobs unless it is needed.
+		Manifest *manifest()
+		{
+			if( !m_manifest )
+			{
+				m_manifest = std::make_unique<Manifest>( m_jobDirectory );
+			}
+			return m_manifest.get();
+		}
+
 	private :
 
-		TaskBatchPtr batchTasksWalk( TaskNode::Task task, const std::set<const TaskBatch *> &ancestors = std::set<const TaskBatch *>() )
+		// A task resolved to its source TaskPlug, along with the hash of
+		// that plug. `task` is empty if the source isn't a task we should
+		// dispatch.
+		struct PreparedTask
+		{
+			std::optional<TaskNode::Task> task;
+			IECore::MurmurHash hash;
+		};
+
+		using PreparedTasks = std::vector<PreparedTask>;
+
+		PreparedTask prepareTask( const TaskNode::Task &task ) const
 		{
+			PreparedTask result;
+
 			// Find source task, taking into account
 			// Switches and ContextProcessors.
+			Context::Scope scopedTaskContext( task.context() );
+			const Plug *sourcePlug; ConstContextPtr sourceContext;
+			tie( sourcePlug, sourceContext ) = computedSource( task.plug() );
+			auto sourceTaskPlug = runTimeCast<const TaskNode::TaskPlug>( sourcePlug );
+			if( !sourceTaskPlug || sourceTaskPlug->direction() != Plug::Out )
 			{
-				Context::Scope scopedTaskContext( task.context() );
-				const Plug *sourcePlug; ConstContextPtr sourceContext;
-				tie( sourcePlug, sourceContext ) = computedSource( task.plug() );
-				if( auto sourceTaskPlug = runTimeCast<const TaskNode::TaskPlug>( sourcePlug ) )
-				{
-					task = TaskNode::Task( sourceTaskPlug, sourceContext ? sourceContext.get() : task.context() );
-				}
-				else
+				return result;
+			}
+
+			result.task = TaskNode::Task( sourceTaskPlug, sourceContext ? sourceContext.get() : task.context() );
+
+			// Several plugs may be evaluated by the hash, and they may vary
+			// by context, so we need to be in the correct context for the
+			// source task.
+			Context::Scope scopedSourceContext( result.task->context() );
+			result.hash = sourceTaskPlug->hash();
+
+			return result;
+		}
+
+		// Resolving and hashing tasks is the most expensive part of building
+		// the batch graph, and a task may have a great many preTasks (a Wedge
+		// with thousands of values for instance). So we prepare all the tasks
+		// at one level of the graph in parallel, leaving the recursion and
+		// cycle detection in `batchTasksWalk()` to be done serially.
+		PreparedTasks prepareTasks( const TaskNode::Tasks &tasks ) const
+		{
+			PreparedTasks result( tasks.size() );
+			if( tasks.size() < 2 )
+			{
+				for( size_t i = 0; i < tasks.size(); ++i )
 				{
-					return nullptr;
+					result[i] = prepareTask( tasks[i] );
 				}
+				return result;
 			}
 
-			if( task.plug()->direction() != Plug::Out )
+			const ThreadState &threadState = ThreadState::current();
+			tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, tasks.size() ),
+				[&]( const tbb::blocked_range<size_t> &r ) {
+					ThreadState::Scope threadStateScope( threadState );
+					for( size_t i = r.begin(); i != r.end(); ++i )
+					{
+						result[i] = prepareTask( tasks[i] );
+					}
+				},
+				taskGroupContext
+			);
+
+			return result;
+		}
+
+		TaskBatchPtr batchTasksWalk( const PreparedTask &preparedTask, const std::set<const TaskBatch *> &ancestors = std::set<const TaskBatch *>() )
+		{
+			if( !preparedTask.task )
 			{
 				return nullptr;
 			}
 
+			const TaskNode::Task &task = *preparedTask.task;
+
 			// Acquire a batch with this task placed in it,
 			// and check that we haven't discovered a cyclic
 			// dependency.
-			TaskBatchPtr batch = acquireBatch( task );
+			TaskBatchPtr batch = acquireBatch( task, preparedTask.hash );
 			if( ancestors.find( batch.get() ) != ancestors.end() )
 			{
 				throw IECore::Exception( ( boost::format( "Dispatched tasks cannot have cyclic dependencies but %s is involved in a cycle." ) % batch->plug()->relativeName( batch->plug()->ancestor<ScriptNode>() ) ).str() );
@@ -478,9 +946,9 @@ class Dispatcher::Batcher
 			// in the ancestors for cycle detection when getting
 			// the preTask batches.
 			TaskBatches postBatches;
-			for( TaskNode::Tasks::const_iterator it = postTasks.begin(); it != postTasks.end(); ++it )
+			for( const auto &postTask : prepareTasks( postTasks ) )
 			{
-				if( auto postBatch = batchTasksWalk( *it ) )
+				if( auto postBatch = batchTasksWalk( postTask ) )
 				{
 					postBatches.push_back( postBatch );
 				}
@@ -496,9 +964,9 @@ class Dispatcher::Batcher
 				preTaskAncestors.insert( it->get() );
 			}
 
-			for( TaskNode::Tasks::const_iterator it = preTasks.begin(); it != preTasks.end(); ++it )
+			for( const auto &preTask : prepareTasks( preTasks ) )
 			{
-				if( auto preBatch = batchTasksWalk( *it, preTaskAncestors ) )
+				if( auto preBatch = batchTasksWalk( preTask, preTaskAncestors ) )
 				{
 					addPreTask( batch.get(), preBatch );
 				}
@@ -518,7 +986,7 @@ class Dispatcher::Batcher
 			return batch;
 		}
 
-		TaskBatchPtr acquireBatch( const TaskNode::Task &task )
+		TaskBatchPtr acquireBatch( const TaskNode::Task &task, const IECore::MurmurHash &hash )
 		{
 			// Several plugs will be evaluated that may vary by context,
 			// so we need to be in the correct context for this task
@@ -529,7 +997,7 @@ class Dispatcher::Batcher
 			// have placed it in a batch already, which we can return
 			// unchanged. The `taskHash` is used as the unique identity of
 			// the task.
-			MurmurHash taskHash = task.plug()->hash();
+			MurmurHash taskHash = hash;
 			const bool taskIsNoOp = taskHash == IECore::MurmurHash();
 			if( taskIsNoOp )
 			{
@@ -554,6 +1022,23 @@ class Dispatcher::Batcher
 
 			const bool requiresSequenceExecution = task.plug()->requiresSequenceExecution();
 
+			// If we're batching adaptively, estimate how long the task
+			// will take to execute.
+
+			std::optional<float> frameDuration;
+			float targetDuration = 0.0f;
+			if( !requiresSequenceExecution && !taskIsNoOp )
+			{
+				const FloatPlug *batchDurationPlug = dispatcherPlug( task )->getChild<const FloatPlug>( g_batchDuration );
+				const float batchDuration = batchDurationPlug ? batchDurationPlug->getValue() : 0.0f;
+				if( batchDuration > 0.0f )
+				{
+					const std::string key = manifestKey( task.plug(), task.context() );
+					frameDuration = manifest()->frameDuration( key, task.context()->getFrame() );
+					targetDuration = this->targetDuration( key, batchDuration );
+				}
+			}
+
 			TaskBatchPtr batch = nullptr;
 			const MurmurHash batchMapHash = batchHash( task );
 			BatchMap::iterator bIt = m_currentBatches.find( batchMapHash );
@@ -563,12 +1048,33 @@ class Dispatcher::Batcher
 				// Unfortunately we have to track batch size separately from `batch->frames().size()`,
 				// because no-ops don't update `frames()`, but _do_ count towards batch size.
 				IntDataPtr batchSizeData = candidateBatch->blindData()->member<IntData>( g_sizeBlindDataName );
-				const IntPlug *batchSizePlug = dispatcherPlug( task )->getChild<const IntPlug>( g_batchSize );
-				const int batchSizeLimit = ( batchSizePlug ) ? batchSizePlug->getValue() : 1;
-				if( requiresSequenceExecution || ( batchSizeData->readable() < batchSizeLimit ) )
+				FloatDataPtr batchDurationData = candidateBatch->blindData()->member<FloatData>( g_durationBlindDataName );
+				bool accept = false;
+				if( requiresSequenceExecution )
+				{
+					accept = true;
+				}
+				else if( frameDuration && batchDurationData )
+				{
+					// Accept the frame if doing so takes us closer to the
+					// target duration than starting a new batch would.
+					accept = batchDurationData->readable() + *frameDuration / 2.0f <= targetDuration;
+				}
+				else
+				{
+					const IntPlug *batchSizePlug = dispatcherPlug( task )->getChild<const IntPlug>( g_batchSize );
+					const int batchSizeLimit = ( batchSizePlug ) ? batchSizePlug->getValue() : 1;
+					accept = batchSizeData->readable() < batchSizeLimit;
+				}
+
+				if( accept )
 				{
 					batch = candidateBatch;
 					batchSizeData->writable()++;
+					if( frameDuration && batchDurationData )
+					{
+						batchDurationData->writable() += *frameDuration;
+					}
 				}
 			}
 
@@ -576,6 +1082,10 @@ class Dispatcher::Batcher
 			{
 				batch = new TaskBatch( task.plug(), task.context() );
 				batch->blindData()->writable()[g_sizeBlindDataName] = new IntData( 1 );
+				if( frameDuration )
+				{
+					batch->blindData()->writable()[g_durationBlindDataName] = new FloatData( *frameDuration );
+				}
 				m_currentBatches[batchMapHash] = batch;
 			}
 
@@ -609,6 +1119,30 @@ class Dispatcher::Batcher
 			return batch;
 		}
 
+		// Returns the duration to aim for when batching the tasks identified by
+		// `key`. Rather than use `batchDuration` directly, which would typically
+		// leave a shorter batch at the end of the frame range, we divide the
+		// estimated total duration equally, so that all batches finish at around
+		// the same time.
+		float targetDuration( const std::string &key, float batchDuration )
+		{
+			auto [it, inserted] = m_targetDurations.insert( { { key, batchDuration }, 0.0f } );
+			if( !inserted )
+			{
+				return it->second;
+			}
+
+			float totalDuration = 0.0f;
+			for( auto frame : m_frames )
+			{
+				totalDuration += manifest()->frameDuration( key, frame ).value_or( 0.0f );
+			}
+
+			const float numBatches = std::max( std::round( totalDuration / batchDuration ), 1.0f );
+			it->second = totalDuration / numBatches;
+			return it->second;
+		}
+
 		// Hash used to determine how to coalesce tasks into batches.
 		// If `batchHash( task1 ) == batchHash( task2 )` then the two
 		// tasks can be placed in the same batch.
@@ -688,6 +1222,11 @@ class Dispatcher::Batcher
 		BatchMap m_currentBatches;
 		TaskToBatchMap m_tasksToBatches;
 
+		const std::filesystem::path m_jobDirectory;
+		const std::vector<FrameList::Frame> &m_frames;
+		std::unique_ptr<Manifest> m_manifest;
+		std::map<std::pair<std::string, float>, float> m_targetDurations;
+
 };
 
 //////////////////////////////////////////////////////////////////////////
@@ -802,7 +1341,7 @@ void Dispatcher::dispatch( const std::vector<NodePtr> &nodes ) const
 	FrameListPtr frameList = frameRange( script, Context::current() );
 	frameList->asList( frames );
 
-	Batcher batcher;
+	Batcher batcher( m_jobDirectory, frames );
 	for( std::vector<FrameList::Frame>::const_iterator fIt = frames.begin(); fIt != frames.end(); ++fIt )
 	{
 		for( std::vector<TaskNodePtr>::const_iterator nIt = taskNodes.begin(); nIt != taskNodes.end(); ++nIt )
@@ -814,6 +1353,11 @@ void Dispatcher::dispatch( const std::vector<NodePtr> &nodes ) const
 
 	executeAndPruneImmediateBatches( batcher.rootBatch() );
 
+	if( incrementalPlug()->getValue() )
+	{
+		batcher.manifest()->prune( batcher.rootBatch() );
+	}
+
 	// Save the script. If we're in a nested dispatch, this may have been done already by
 	// the outer dispatch, hence the call to `exists()`. Performing the saving here is
 	// unsatisfactory for a couple of reasons :
@@ -882,6 +1426,112 @@ void Dispatcher::executeAndPruneImmediateBatches( TaskBatch *batch, bool immedia
 	batch->blindData()->writable()[g_visitedBlindDataName] = g_trueBoolData;
 }
 
+//////////////////////////////////////////////////////////////////////////
+// Execution records
+//////////////////////////////////////////////////////////////////////////
+
+void Dispatcher::recordExecution( const TaskNode::TaskPlug *plug, const std::vector<float> &frames, float duration )
+{
+	const Context *context = Context::current();
+	const std::string jobDirectory = context->get<std::string>( g_jobDirectoryContextEntry, "" );
+	if( jobDirectory.empty() )
+	{
+		return;
+	}
+
+	// The manifest directory only exists for incremental dispatches and
+	// dispatches using adaptive batching.
+	const std::filesystem::path manifestDirectory = std::filesystem::path( jobDirectory ) / g_manifestDirectoryName;
+	std::error_code e;
+	if( !std::filesystem::is_directory( manifestDirectory, e ) )
+	{
+		return;
+	}
+
+	const std::string key = manifestKey( plug, context );
+	// We only know the time taken for the batch as a whole,
+	// so divide it equally between the frames.
+	const float frameDuration = frames.size() ? duration / frames.size() : 0.0f;
+
+	std::ostringstream record;
+	Context::EditableScope frameScope( context );
+	for( float frame : frames )
+	{
+		frameScope.setFrame( frame );
+		record << "task " << formatFrame( frame ) << " " << key << "\n";
+		record << "duration " << frameDuration << "\n";
+
+		std::vector<std::string> files;
+		try
+		{
+			plug->outputFiles( files );
+		}
+		catch( const std::exception &exception )
+		{
+			// The task itself succeeded, so we don't want to report failure. But
+			// we can't record its outputs, so it will be executed again next time.
+			IECore::msg( IECore::Msg::Warning, "Dispatcher", boost::format( "Unable to record output files for \"%1%\" : %2%" ) % plug->fullName() % exception.what() );
+			continue;
+		}
+
+		std::ostringstream outputs;
+		bool valid = true;
+		for( const auto &fileName : files )
+		{
+			std::optional<OutputFile> output = outputFile( fileName );
+			if( !output )
+			{
+				valid = false;
+				break;
+			}
+			outputs << "output " << output->size << " " << output->time << " " << output->fileName << "\n";
+		}
+
+		if( valid )
+		{
+			record << outputs.str();
+		}
+	}
+
+	const std::string recordString = record.str();
+	if( recordString.empty() )
+	{
+		return;
+	}
+
+	// Write to a temporary file and then rename it, so that subsequent
+	// dispatches never see a partially written record.
+
+	MurmurHash h;
+	h.append( key );
+	for( float frame : frames )
+	{
+		h.append( frame );
+	}
+
+	const std::filesystem::path path = manifestDirectory / ( g_executedFilePrefix + h.toString() + ".txt" );
+	std::filesystem::path temporaryPath = path;
+	temporaryPath += ".tmp";
+
+	{
+		std::ofstream file( temporaryPath );
+		file << recordString;
+		if( !file )
+		{
+			IECore::msg( IECore::Msg::Warning, "Dispatcher", boost::format( "Unable to write manifest file \"%1%\"" ) % temporaryPath.string() );
+			std::filesystem::remove( temporaryPath, e );
+			return;
+		}
+	}
+
+	std::filesystem::rename( temporaryPath, path, e );
+	if( e )
+	{
+		IECore::msg( IECore::Msg::Warning, "Dispatcher", boost::format( "Unable to write manifest file \"%1%\"" ) % path.string() );
+		std::filesystem::remove( temporaryPath, e );
+	}
+}
+
 //////////////////////////////////////////////////////////////////////////
 // Registration
 //////////////////////////////////////////////////////////////////////////
@@ -0,0 +1,82 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#include "GafferDispatch/TaskContextProcessor.h"
+
+#include "Gaffer/ArrayPlug.h"
+
+using namespace IECore;
+using namespace Gaffer;
+using namespace GafferDispatch;
+
+GAFFER_NODE_DEFINE_TYPE( TaskContextProcessor )
+
+TaskContextProcessor::TaskContextProcessor( const std::string &name )
+	:	TaskNode( name )
+{
+}
+
+TaskContextProcessor::~TaskContextProcessor()
+{
+}
+
+void TaskContextProcessor::preTasks( const Context *context, Tasks &tasks ) const
+{
+	Contexts contexts;
+	processedContexts( context, contexts );
+
+	tasks.reserve( tasks.size() + contexts.size() * preTasksPlug()->children().size() );
+	for( TaskPlug::Iterator it( preTasksPlug() ); !it.done(); ++it )
+	{
+		for( const auto &c : contexts )
+		{
+			tasks.push_back( Task( *it, c.get() ) );
+		}
+	}
+}
+
+IECore::MurmurHash TaskContextProcessor::hash( const Context *context ) const
+{
+	return IECore::MurmurHash();
+}
+
+void TaskContextProcessor::execute() const
+{
+	// We don't need to do anything here because our
+	// sole purpose is to manipulate the context
+	// in which our preTasks are executed.
+}
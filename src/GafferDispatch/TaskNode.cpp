@@ -45,6 +45,8 @@
 #include "Gaffer/ScriptNode.h"
 #include "Gaffer/SubGraph.h"
 
+#include <chrono>
+
 using namespace IECore;
 using namespace Gaffer;
 using namespace GafferDispatch;
@@ -113,6 +115,8 @@ class TaskNodeProcess : public Gaffer::Process
 		static InternedString executeProcessType;
 		static InternedString executeSequenceProcessType;
 		static InternedString requiresSequenceExecutionProcessType;
+		static InternedString outputFilesProcessType;
+		static InternedString outputHashProcessType;
 		static InternedString preTasksProcessType;
 		static InternedString postTasksProcessType;
 
@@ -122,6 +126,8 @@ InternedString TaskNodeProcess::hashProcessType( "taskNode:hash" );
 InternedString TaskNodeProcess::executeProcessType( "taskNode:execute" );
 InternedString TaskNodeProcess::executeSequenceProcessType( "taskNode:executeSequence" );
 InternedString TaskNodeProcess::requiresSequenceExecutionProcessType( "taskNode:requiresSequenceExecution" );
+InternedString TaskNodeProcess::outputFilesProcessType( "taskNode:outputFiles" );
+InternedString TaskNodeProcess::outputHashProcessType( "taskNode:outputHash" );
 InternedString TaskNodeProcess::preTasksProcessType( "taskNode:preTasks" );
 InternedString TaskNodeProcess::postTasksProcessType( "taskNode:postTasks" );
 
@@ -203,6 +209,7 @@ IECore::MurmurHash TaskNode::TaskPlug::hash() const
 void TaskNode::TaskPlug::execute() const
 {
 	TaskNodeProcess p( TaskNodeProcess::executeProcessType, this );
+	const auto startTime = std::chrono::steady_clock::now();
 	try
 	{
 		p.taskNode()->execute();
@@ -212,11 +219,15 @@ void TaskNode::TaskPlug::execute() const
 		p.handleException();
 		return;
 	}
+
+	const std::chrono::duration<float> duration = std::chrono::steady_clock::now() - startTime;
+	Dispatcher::recordExecution( this, { p.context()->getFrame() }, duration.count() );
 }
 
 void TaskNode::TaskPlug::executeSequence( const std::vector<float> &frames ) const
 {
 	TaskNodeProcess p( TaskNodeProcess::executeSequenceProcessType, this );
+	const auto startTime = std::chrono::steady_clock::now();
 	try
 	{
 		p.taskNode()->executeSequence( frames );
@@ -226,6 +237,9 @@ void TaskNode::TaskPlug::executeSequence( const std::vector<float> &frames ) con
 		p.handleException();
 		return;
 	}
+
+	const std::chrono::duration<float> duration = std::chrono::steady_clock::now() - startTime;
+	Dispatcher::recordExecution( this, frames, duration.count() );
 }
 
 bool TaskNode::TaskPlug::requiresSequenceExecution() const
@@ -242,6 +256,34 @@ bool TaskNode::TaskPlug::requiresSequenceExecution() const
 	}
 }
 
+void TaskNode::TaskPlug::outputFiles( std::vector<std::string> &files ) const
+{
+	TaskNodeProcess p( TaskNodeProcess::outputFilesProcessType, this );
+	try
+	{
+		p.taskNode()->outputFiles( p.context(), files );
+	}
+	catch( ... )
+	{
+		p.handleException();
+		return;
+	}
+}
+
+IECore::MurmurHash TaskNode::TaskPlug::outputHash() const
+{
+	TaskNodeProcess p( TaskNodeProcess::outputHashProcessType, this );
+	try
+	{
+		return p.taskNode()->outputHash( p.context() );
+	}
+	catch( ... )
+	{
+		p.handleException();
+		return MurmurHash();
+	}
+}
+
 void TaskNode::TaskPlug::preTasks( Tasks &tasks ) const
 {
 	TaskNodeProcess p( TaskNodeProcess::preTasksProcessType, this );
@@ -402,3 +444,12 @@ bool TaskNode::requiresSequenceExecution() const
 {
 	return false;
 }
+
+void TaskNode::outputFiles( const Context *context, std::vector<std::string> &files ) const
+{
+}
+
+IECore::MurmurHash TaskNode::outputHash( const Context *context ) const
+{
+	return hash( context );
+}
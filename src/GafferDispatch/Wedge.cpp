@@ -0,0 +1,352 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#include "GafferDispatch/Wedge.h"
+
+#include "IECore/VectorTypedData.h"
+
+#include <algorithm>
+
+using namespace Imath;
+using namespace IECore;
+using namespace Gaffer;
+using namespace GafferDispatch;
+
+namespace
+{
+
+template<typename VectorData>
+void appendContexts( const VectorData *values, const Context *context, const std::string &variable, const std::string &indexVariable, TaskContextProcessor::Contexts &contexts )
+{
+	const auto &v = values->readable();
+	contexts.reserve( contexts.size() + v.size() );
+	for( size_t i = 0; i < v.size(); ++i )
+	{
+		ContextPtr c = new Context( *context );
+		c->set( variable, v[i] );
+		c->set( indexVariable, (int)i );
+		contexts.push_back( c );
+	}
+}
+
+} // namespace
+
+GAFFER_NODE_DEFINE_TYPE( Wedge )
+
+size_t Wedge::g_firstPlugIndex = 0;
+
+Wedge::Wedge( const std::string &name )
+	:	TaskContextProcessor( name )
+{
+	storeIndexOfNextChild( g_firstPlugIndex );
+
+	addChild( new StringPlug( "variable", Plug::In, "wedge:value" ) );
+	addChild( new StringPlug( "indexVariable", Plug::In, "wedge:index" ) );
+
+	addChild( new IntPlug( "mode", Plug::In, FloatRange, FloatRange, StringList ) );
+
+	// float range
+
+	addChild( new FloatPlug( "floatMin", Plug::In, 0.0f ) );
+	addChild( new FloatPlug( "floatMax", Plug::In, 1.0f ) );
+	addChild( new IntPlug( "floatSteps", Plug::In, 11, 2 ) );
+
+	// int range
+
+	addChild( new IntPlug( "intMin", Plug::In, 0 ) );
+	addChild( new IntPlug( "intMax", Plug::In, 5 ) );
+	addChild( new IntPlug( "intStep", Plug::In, 1, 1 ) );
+
+	// color range
+
+	SplinefColor3fPlug::ValueType rampDefault;
+	rampDefault.points.insert( SplinefColor3fPlug::ValueType::Point( 0.0f, Color3f( 0.0f ) ) );
+	rampDefault.points.insert( SplinefColor3fPlug::ValueType::Point( 1.0f, Color3f( 1.0f ) ) );
+	rampDefault.interpolation = SplineDefinitionInterpolationCatmullRom;
+	addChild( new SplinefColor3fPlug( "ramp", Plug::In, rampDefault ) );
+
+	addChild( new IntPlug( "colorSteps", Plug::In, 5, 2 ) );
+
+	// lists
+
+	addChild( new FloatVectorDataPlug( "floats", Plug::In, new FloatVectorData ) );
+	addChild( new IntVectorDataPlug( "ints", Plug::In, new IntVectorData ) );
+	addChild( new StringVectorDataPlug( "strings", Plug::In, new StringVectorData ) );
+}
+
+Wedge::~Wedge()
+{
+}
+
+Gaffer::StringPlug *Wedge::variablePlug()
+{
+	return getChild<StringPlug>( g_firstPlugIndex );
+}
+
+const Gaffer::StringPlug *Wedge::variablePlug() const
+{
+	return getChild<StringPlug>( g_firstPlugIndex );
+}
+
+Gaffer::StringPlug *Wedge::indexVariablePlug()
+{
+	return getChild<StringPlug>( g_firstPlugIndex + 1 );
+}
+
+const Gaffer::StringPlug *Wedge::indexVariablePlug() const
+{
+	return getChild<StringPlug>( g_firstPlugIndex + 1 );
+}
+
+Gaffer::IntPlug *Wedge::modePlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 2 );
+}
+
+const Gaffer::IntPlug *Wedge::modePlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 2 );
+}
+
+Gaffer::FloatPlug *Wedge::floatMinPlug()
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 3 );
+}
+
+const Gaffer::FloatPlug *Wedge::floatMinPlug() const
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 3 );
+}
+
+Gaffer::FloatPlug *Wedge::floatMaxPlug()
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 4 );
+}
+
+const Gaffer::FloatPlug *Wedge::floatMaxPlug() const
+{
+	return getChild<FloatPlug>( g_firstPlugIndex + 4 );
+}
+
+Gaffer::IntPlug *Wedge::floatStepsPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 5 );
+}
+
+const Gaffer::IntPlug *Wedge::floatStepsPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 5 );
+}
+
+Gaffer::IntPlug *Wedge::intMinPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 6 );
+}
+
+const Gaffer::IntPlug *Wedge::intMinPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 6 );
+}
+
+Gaffer::IntPlug *Wedge::intMaxPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 7 );
+}
+
+const Gaffer::IntPlug *Wedge::intMaxPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 7 );
+}
+
+Gaffer::IntPlug *Wedge::intStepPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 8 );
+}
+
+const Gaffer::IntPlug *Wedge::intStepPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 8 );
+}
+
+Gaffer::SplinefColor3fPlug *Wedge::rampPlug()
+{
+	return getChild<SplinefColor3fPlug>( g_firstPlugIndex + 9 );
+}
+
+const Gaffer::SplinefColor3fPlug *Wedge::rampPlug() const
+{
+	return getChild<SplinefColor3fPlug>( g_firstPlugIndex + 9 );
+}
+
+Gaffer::IntPlug *Wedge::colorStepsPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 10 );
+}
+
+const Gaffer::IntPlug *Wedge::colorStepsPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 10 );
+}
+
+Gaffer::FloatVectorDataPlug *Wedge::floatsPlug()
+{
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 11 );
+}
+
+const Gaffer::FloatVectorDataPlug *Wedge::floatsPlug() const
+{
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 11 );
+}
+
+Gaffer::IntVectorDataPlug *Wedge::intsPlug()
+{
+	return getChild<IntVectorDataPlug>( g_firstPlugIndex + 12 );
+}
+
+const Gaffer::IntVectorDataPlug *Wedge::intsPlug() const
+{
+	return getChild<IntVectorDataPlug>( g_firstPlugIndex + 12 );
+}
+
+Gaffer::StringVectorDataPlug *Wedge::stringsPlug()
+{
+	return getChild<StringVectorDataPlug>( g_firstPlugIndex + 13 );
+}
+
+const Gaffer::StringVectorDataPlug *Wedge::stringsPlug() const
+{
+	return getChild<StringVectorDataPlug>( g_firstPlugIndex + 13 );
+}
+
+IECore::ConstDataPtr Wedge::values() const
+{
+	switch( (Mode)modePlug()->getValue() )
+	{
+		case FloatRange : {
+			const double min = floatMinPlug()->getValue();
+			const double max = floatMaxPlug()->getValue();
+			const int steps = floatStepsPlug()->getValue();
+
+			FloatVectorDataPtr result = new FloatVectorData;
+			std::vector<float> &values = result->writable();
+			values.reserve( steps );
+			for( int i = 0; i < steps; ++i )
+			{
+				const double t = (double)i / ( steps - 1 );
+				values.push_back( min + t * ( max - min ) );
+			}
+			return result;
+		}
+		case IntRange : {
+			int min = intMinPlug()->getValue();
+			int max = intMaxPlug()->getValue();
+			int step = intStepPlug()->getValue();
+
+			if( max < min )
+			{
+				std::swap( min, max );
+			}
+
+			if( step == 0 )
+			{
+				throw IECore::Exception( "Invalid step - step must not be 0" );
+			}
+			else if( step < 0 )
+			{
+				step = -step;
+			}
+
+			IntVectorDataPtr result = new IntVectorData;
+			std::vector<int> &values = result->writable();
+			for( int64_t value = min; value <= max; value += step )
+			{
+				values.push_back( value );
+			}
+			return result;
+		}
+		case ColorRange : {
+			const SplinefColor3f spline = rampPlug()->getValue().spline();
+			const int steps = colorStepsPlug()->getValue();
+
+			Color3fVectorDataPtr result = new Color3fVectorData;
+			std::vector<Color3f> &values = result->writable();
+			values.reserve( steps );
+			for( int i = 0; i < steps; ++i )
+			{
+				values.push_back( spline( (float)( (double)i / ( steps - 1 ) ) ) );
+			}
+			return result;
+		}
+		case FloatList :
+			return floatsPlug()->getValue();
+		case IntList :
+			return intsPlug()->getValue();
+		case StringList :
+			return stringsPlug()->getValue();
+		default :
+			throw IECore::Exception( "Invalid mode" );
+	}
+}
+
+void Wedge::processedContexts( const Gaffer::Context *context, Contexts &contexts ) const
+{
+	// Make a context for each of the wedge values. We do this directly
+	// from the values, rather than constructing intermediate objects per
+	// value, so that wedges with many thousands of values remain cheap.
+
+	const std::string variable = variablePlug()->getValue();
+	const std::string indexVariable = indexVariablePlug()->getValue();
+	ConstDataPtr values = this->values();
+
+	switch( values->typeId() )
+	{
+		case FloatVectorDataTypeId :
+			appendContexts( static_cast<const FloatVectorData *>( values.get() ), context, variable, indexVariable, contexts );
+			break;
+		case IntVectorDataTypeId :
+			appendContexts( static_cast<const IntVectorData *>( values.get() ), context, variable, indexVariable, contexts );
+			break;
+		case Color3fVectorDataTypeId :
+			appendContexts( static_cast<const Color3fVectorData *>( values.get() ), context, variable, indexVariable, contexts );
+			break;
+		case StringVectorDataTypeId :
+			appendContexts( static_cast<const StringVectorData *>( values.get() ), context, variable, indexVariable, contexts );
+			break;
+		default :
+			break;
+	}
+}
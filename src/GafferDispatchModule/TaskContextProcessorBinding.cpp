@@ -0,0 +1,143 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2015, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#include "boost/python.hpp"
+
+#include "TaskContextProcessorBinding.h"
+
+#include "GafferDispatchBindings/TaskNodeBinding.h"
+
+#include "GafferDispatch/TaskContextProcessor.h"
+#include "GafferDispatch/Wedge.h"
+
+#include "IECorePython/ScopedGILRelease.h"
+
+using namespace boost::python;
+using namespace IECore;
+using namespace IECorePython;
+using namespace Gaffer;
+using namespace GafferDispatch;
+using namespace GafferDispatchBindings;
+
+namespace
+{
+
+class TaskContextProcessorWrapper : public TaskNodeWrapper<TaskContextProcessor>
+{
+
+	public :
+
+		TaskContextProcessorWrapper( PyObject *self, const std::string &name )
+			:	TaskNodeWrapper<TaskContextProcessor>( self, name )
+		{
+		}
+
+		void processedContexts( const Context *context, Contexts &contexts ) const override
+		{
+			if( isSubclassed() )
+			{
+				ScopedGILLock gilLock;
+				try
+				{
+					object override = methodOverride( "_processedContexts" );
+					if( override )
+					{
+						object pythonContexts = override( ContextPtr( const_cast<Context *>( context ) ) );
+						for( long i = 0, e = len( pythonContexts ); i < e; ++i )
+						{
+							contexts.push_back( extract<ConstContextPtr>( pythonContexts[i] )() );
+						}
+						return;
+					}
+				}
+				catch( const error_already_set &e )
+				{
+					ExceptionAlgo::translatePythonException();
+				}
+			}
+
+			throw IECore::NotImplementedException( "TaskContextProcessor::_processedContexts" );
+		}
+
+};
+
+// For compatibility with the original Python implementation,
+// the range modes return a list, and the list modes return a copy
+// of the plug value.
+object wedgeValues( const Wedge &w )
+{
+	ConstDataPtr values;
+	int mode;
+	{
+		ScopedGILRelease gilRelease;
+		values = w.values();
+		mode = w.modePlug()->getValue();
+	}
+
+	object result( values->copy() );
+	switch( mode )
+	{
+		case Wedge::FloatRange :
+		case Wedge::IntRange :
+		case Wedge::ColorRange :
+			return list( result );
+		default :
+			return result;
+	}
+}
+
+} // namespace
+
+void GafferDispatchModule::bindTaskContextProcessor()
+{
+
+	TaskNodeClass<TaskContextProcessor, TaskContextProcessorWrapper>();
+
+	scope s = TaskNodeClass<Wedge, TaskNodeWrapper<Wedge>>()
+		.def( "values", &wedgeValues )
+	;
+
+	enum_<Wedge::Mode>( "Mode" )
+		.value( "FloatRange", Wedge::FloatRange )
+		.value( "IntRange", Wedge::IntRange )
+		.value( "ColorRange", Wedge::ColorRange )
+		.value( "FloatList", Wedge::FloatList )
+		.value( "IntList", Wedge::IntList )
+		.value( "StringList", Wedge::StringList )
+	;
+
+}
@@ -99,6 +99,27 @@ void taskPlugExecuteSequence( const TaskNode::TaskPlug &t, const boost::python::
 	t.executeSequence( frames );
 }
 
+boost::python::list taskPlugOutputFiles( const TaskNode::TaskPlug &t )
+{
+	std::vector<std::string> files;
+	{
+		IECorePython::ScopedGILRelease gilRelease;
+		t.outputFiles( files );
+	}
+	boost::python::list result;
+	for( const auto &f : files )
+	{
+		result.append( f );
+	}
+	return result;
+}
+
+IECore::MurmurHash taskPlugOutputHash( const TaskNode::TaskPlug &t )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	return t.outputHash();
+}
+
 boost::python::list taskPlugPreTasks( const TaskNode::TaskPlug &t )
 {
 	GafferDispatch::TaskNode::Tasks tasks;
@@ -159,6 +180,8 @@ void GafferDispatchModule::bindTaskNode()
 		.def( "execute", &taskPlugExecute )
 		.def( "executeSequence", &taskPlugExecuteSequence )
 		.def( "requiresSequenceExecution", &TaskNode::TaskPlug::requiresSequenceExecution )
+		.def( "outputFiles", &taskPlugOutputFiles )
+		.def( "outputHash", &taskPlugOutputHash )
 		.def( "preTasks", &taskPlugPreTasks )
 		.def( "postTasks", &taskPlugPostTasks )
 		// Adjusting the name so that it correctly reflects
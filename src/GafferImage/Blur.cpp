@@ -36,12 +36,23 @@
 
 #include "GafferImage/Blur.h"
 
+#include "GafferImage/BufferAlgo.h"
 #include "GafferImage/FilterAlgo.h"
 #include "GafferImage/Resample.h"
+#include "GafferImage/Sampler.h"
 
 #include "Gaffer/StringPlug.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
+#include <algorithm>
+#include <array>
+#include <cmath>
+
+using namespace std;
 using namespace Imath;
+using namespace IECore;
 using namespace Gaffer;
 using namespace GafferImage;
 
@@ -49,6 +60,180 @@ GAFFER_NODE_DEFINE_TYPE( Blur );
 
 const char *g_blurFilterName = "smoothGaussian";
 
+namespace
+{
+
+// Fast mode
+// =========
+//
+// We approximate the gaussian by applying a series of box filters, each of
+// which can be computed using a running sum at a constant cost per pixel,
+// regardless of width. Three passes are sufficient to be visually
+// indistinguishable from a true gaussian in most cases. Both passes are
+// computed a tile at a time, so that computing an output tile only requires
+// the input tiles near it. Each pass must also read the `support` pixels
+// either side of the tile, so the cost does grow with the radius, but much
+// more slowly than for a true gaussian.
+
+using BoxWidths = std::array<int, 3>;
+
+// Returns the (odd) widths for a series of box filters which together
+// approximate a gaussian with the specified standard deviation. See
+// "Fast Almost-Gaussian Filtering", Peter Kovesi, 2010.
+BoxWidths boxWidths( float sigma )
+{
+	const int n = BoxWidths().size();
+	const float idealWidth = std::sqrt( 12.0f * sigma * sigma / n + 1.0f );
+	int lowerWidth = std::floor( idealWidth );
+	if( lowerWidth % 2 == 0 )
+	{
+		lowerWidth--;
+	}
+	lowerWidth = max( lowerWidth, 1 );
+
+	const float m = (
+		12.0f * sigma * sigma - n * lowerWidth * lowerWidth - 4.0f * n * lowerWidth - 3.0f * n
+	) / ( -4.0f * lowerWidth - 4.0f );
+	const int numLower = max( 0, min( n, (int)std::round( m ) ) );
+
+	BoxWidths result;
+	for( int i = 0; i < n; ++i )
+	{
+		result[i] = i < numLower ? lowerWidth : lowerWidth + 2;
+	}
+	return result;
+}
+
+// The number of pixels either side of the output pixel which
+// contribute to it.
+int boxSupport( const BoxWidths &widths )
+{
+	int result = 0;
+	for( auto w : widths )
+	{
+		result += ( w - 1 ) / 2;
+	}
+	return result;
+}
+
+// Applies the box filters to `values`. `values` must contain `boxSupport( widths )`
+// extra samples at each end, and on return the filtered values are found
+// in between these.
+void boxFilter( vector<float> &values, vector<float> &scratch, const BoxWidths &widths )
+{
+	scratch.resize( values.size() );
+
+	int begin = 0;
+	int end = values.size();
+	for( auto w : widths )
+	{
+		const int r = ( w - 1 ) / 2;
+		if( !r )
+		{
+			continue;
+		}
+
+		// Accumulating in double precision prevents the running
+		// sum from drifting over long rows.
+		const double normalisation = 1.0 / w;
+		double sum = 0.0;
+		for( int i = begin; i < begin + 2 * r; ++i )
+		{
+			sum += values[i];
+		}
+		for( int i = begin + r; i < end - r; ++i )
+		{
+			sum += values[i + r];
+			scratch[i] = sum * normalisation;
+			sum -= values[i - r];
+		}
+
+		begin += r;
+		end -= r;
+		values.swap( scratch );
+	}
+}
+
+// Everything needed to compute the Fast mode, evaluated from the plugs
+// of a Blur node in the global context.
+struct FastBlur
+{
+
+	FastBlur( const Blur *blur, const Context *context )
+	{
+		ImagePlug::GlobalScope globalScope( context );
+
+		// The smoothGaussian filter is `exp( -5 * ( x / h )^2 )`, where `h` is
+		// half the filter width, and we scale it so that `h == 1 + radius`.
+		const V2f radius = blur->radiusPlug()->getValue();
+		widthsX = boxWidths( ( 1.0f + radius.x ) / std::sqrt( 10.0f ) );
+		widthsY = boxWidths( ( 1.0f + radius.y ) / std::sqrt( 10.0f ) );
+		support = V2i( boxSupport( widthsX ), boxSupport( widthsY ) );
+
+		boundingMode = (Sampler::BoundingMode)blur->boundingModePlug()->getValue();
+		inDataWindow = blur->inPlug()->dataWindowPlug()->getValue();
+		outDataWindow = inDataWindow;
+		if( !BufferAlgo::empty( inDataWindow ) && blur->expandDataWindowPlug()->getValue() )
+		{
+			outDataWindow.min -= support;
+			outDataWindow.max += support;
+		}
+	}
+
+	void hash( MurmurHash &h ) const
+	{
+		for( auto w : widthsX )
+		{
+			h.append( w );
+		}
+		for( auto w : widthsY )
+		{
+			h.append( w );
+		}
+		h.append( boundingMode );
+		h.append( inDataWindow );
+		h.append( outDataWindow );
+	}
+
+	// Returns the region of the tile at `tileOrigin` which is
+	// within the output data window.
+	Box2i outputBound( const V2i &tileOrigin ) const
+	{
+		return BufferAlgo::intersection( Box2i( tileOrigin, tileOrigin + V2i( ImagePlug::tileSize() ) ), outDataWindow );
+	}
+
+	// Returns the range of input rows that the vertical pass must read
+	// from the horizontal pass to compute `outputBound`, after clamping
+	// or discarding rows outside the input data window.
+	V2i sourceRows( const Box2i &outputBound ) const
+	{
+		const int begin = outputBound.min.y - support.y;
+		const int end = outputBound.max.y + support.y;
+		if( BufferAlgo::empty( inDataWindow ) || BufferAlgo::empty( outputBound ) )
+		{
+			return V2i( 0 );
+		}
+		if( boundingMode == Sampler::Clamp )
+		{
+			return V2i(
+				std::clamp( begin, inDataWindow.min.y, inDataWindow.max.y - 1 ),
+				std::clamp( end - 1, inDataWindow.min.y, inDataWindow.max.y - 1 ) + 1
+			);
+		}
+		return V2i( max( begin, inDataWindow.min.y ), min( end, inDataWindow.max.y ) );
+	}
+
+	BoxWidths widthsX;
+	BoxWidths widthsY;
+	V2i support;
+	Sampler::BoundingMode boundingMode;
+	Box2i inDataWindow;
+	Box2i outDataWindow;
+
+};
+
+} // namespace
+
 size_t Blur::g_firstPlugIndex = 0;
 
 Blur::Blur( const std::string &name )
@@ -69,6 +254,10 @@ Blur::Blur( const std::string &name )
 
 	addChild( resample );
 
+	addChild( new IntPlug( "mode", Plug::In, Accurate, Accurate, Fast ) );
+	addChild( new FloatVectorDataPlug( "__horizontalPass", Plug::Out, ImagePlug::blackTile() ) );
+	addChild( new FloatVectorDataPlug( "__verticalPass", Plug::Out, ImagePlug::blackTile() ) );
+
 	resample->inPlug()->setInput( inPlug() );
 	resample->filterPlug()->setValue( g_blurFilterName );
 	resample->boundingModePlug()->setInput( boundingModePlug() );
@@ -158,6 +347,36 @@ const Resample *Blur::resample() const
 	return getChild<Resample>( g_firstPlugIndex + 6 );
 }
 
+Gaffer::IntPlug *Blur::modePlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 7 );
+}
+
+const Gaffer::IntPlug *Blur::modePlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 7 );
+}
+
+Gaffer::FloatVectorDataPlug *Blur::horizontalPassPlug()
+{
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 8 );
+}
+
+const Gaffer::FloatVectorDataPlug *Blur::horizontalPassPlug() const
+{
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 8 );
+}
+
+Gaffer::FloatVectorDataPlug *Blur::verticalPassPlug()
+{
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 9 );
+}
+
+const Gaffer::FloatVectorDataPlug *Blur::verticalPassPlug() const
+{
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 9 );
+}
+
 void Blur::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	FlatImageProcessor::affects( input, outputs );
@@ -176,11 +395,39 @@ void Blur::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs )
 		outputs.push_back( outPlug()->channelDataPlug() );
 	}
 	else if(
-		input == resampledChannelDataPlug()
+		input == resampledChannelDataPlug() ||
+		input == verticalPassPlug()
 	)
 	{
 		outputs.push_back( outPlug()->channelDataPlug() );
 	}
+	else if( input == modePlug() )
+	{
+		outputs.push_back( outPlug()->dataWindowPlug() );
+		outputs.push_back( outPlug()->channelDataPlug() );
+	}
+
+	if(
+		input == inPlug()->channelDataPlug() ||
+		input == inPlug()->dataWindowPlug() ||
+		input == boundingModePlug() ||
+		input == expandDataWindowPlug() ||
+		input->parent<V2fPlug>() == radiusPlug()
+	)
+	{
+		outputs.push_back( horizontalPassPlug() );
+	}
+
+	if(
+		input == horizontalPassPlug() ||
+		input == inPlug()->dataWindowPlug() ||
+		input == boundingModePlug() ||
+		input == expandDataWindowPlug() ||
+		input->parent<V2fPlug>() == radiusPlug()
+	)
+	{
+		outputs.push_back( verticalPassPlug() );
+	}
 }
 
 void Blur::hash( const ValuePlug *output, const Context *context, IECore::MurmurHash &h ) const
@@ -191,6 +438,40 @@ void Blur::hash( const ValuePlug *output, const Context *context, IECore::Murmur
 	{
 		radiusPlug()->getChild<ValuePlug>( output->getName() )->hash( h );
 	}
+	else if( output == horizontalPassPlug() )
+	{
+		const FastBlur fastBlur( this, context );
+		fastBlur.hash( h );
+
+		const V2i tileOrigin = context->get<V2i>( ImagePlug::tileOriginContextName );
+		const string &channelName = context->get<string>( ImagePlug::channelNameContextName );
+		Sampler sampler(
+			inPlug(), channelName,
+			Box2i(
+				V2i( tileOrigin.x - fastBlur.support.x, tileOrigin.y ),
+				V2i( tileOrigin.x + ImagePlug::tileSize() + fastBlur.support.x, tileOrigin.y + ImagePlug::tileSize() )
+			),
+			fastBlur.boundingMode
+		);
+		sampler.hash( h );
+		h.append( tileOrigin );
+	}
+	else if( output == verticalPassPlug() )
+	{
+		const FastBlur fastBlur( this, context );
+		fastBlur.hash( h );
+
+		const V2i tileOrigin = context->get<V2i>( ImagePlug::tileOriginContextName );
+		const V2i sourceRows = fastBlur.sourceRows( fastBlur.outputBound( tileOrigin ) );
+		ImagePlug::ChannelDataScope channelDataScope( context );
+		for( int y = ImagePlug::tileOrigin( V2i( 0, sourceRows[0] ) ).y; y < sourceRows[1]; y += ImagePlug::tileSize() )
+		{
+			const V2i sourceTileOrigin( tileOrigin.x, y );
+			channelDataScope.setTileOrigin( &sourceTileOrigin );
+			horizontalPassPlug()->hash( h );
+		}
+		h.append( tileOrigin );
+	}
 }
 
 void Blur::compute( ValuePlug *output, const Context *context ) const
@@ -214,54 +495,236 @@ void Blur::compute( ValuePlug *output, const Context *context ) const
 		);
 		return;
 	}
+	else if( output == horizontalPassPlug() )
+	{
+		// Filter each row of the tile horizontally. Rows outside the
+		// input data window are never read by the vertical pass, so
+		// are left black.
+
+		const FastBlur fastBlur( this, context );
+		const V2i tileOrigin = context->get<V2i>( ImagePlug::tileOriginContextName );
+		const int y0 = tileOrigin.y;
+		const string &channelName = context->get<string>( ImagePlug::channelNameContextName );
+		const int width = ImagePlug::tileSize();
+		const int inputBegin = tileOrigin.x - fastBlur.support.x;
+		const int inputEnd = tileOrigin.x + width + fastBlur.support.x;
+
+		FloatVectorDataPtr resultData = new FloatVectorData;
+		vector<float> &result = resultData->writable();
+		result.resize( ImagePlug::tilePixels(), 0.0f );
+
+		const ThreadState &threadState = ThreadState::current();
+		tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+		tbb::parallel_for(
+			tbb::blocked_range<int>( y0, y0 + ImagePlug::tileSize() ),
+			[&] ( const tbb::blocked_range<int> &range ) {
+
+				ThreadState::Scope threadStateScope( threadState );
+				vector<float> values;
+				vector<float> scratch;
+				for( int y = range.begin(); y != range.end(); ++y )
+				{
+					Canceller::check( context->canceller() );
+					if( y < fastBlur.inDataWindow.min.y || y >= fastBlur.inDataWindow.max.y )
+					{
+						continue;
+					}
+
+					Sampler sampler( inPlug(), channelName, Box2i( V2i( inputBegin, y ), V2i( inputEnd, y + 1 ) ), fastBlur.boundingMode );
+					values.resize( inputEnd - inputBegin );
+					for( int x = inputBegin; x < inputEnd; ++x )
+					{
+						values[x - inputBegin] = sampler.sample( x, y );
+					}
+
+					boxFilter( values, scratch, fastBlur.widthsX );
+					std::copy(
+						values.begin() + fastBlur.support.x, values.begin() + fastBlur.support.x + width,
+						result.begin() + ( y - y0 ) * width
+					);
+				}
+			},
+			taskGroupContext
+		);
+
+		static_cast<FloatVectorDataPlug *>( output )->setValue( resultData );
+		return;
+	}
+	else if( output == verticalPassPlug() )
+	{
+		// Filter each column of the tile vertically, using the tiles
+		// output by the horizontal pass above and below it.
+
+		const FastBlur fastBlur( this, context );
+		const V2i tileOrigin = context->get<V2i>( ImagePlug::tileOriginContextName );
+		const Box2i outputBound = fastBlur.outputBound( tileOrigin );
+		const int inputBegin = outputBound.min.y - fastBlur.support.y;
+		const int inputEnd = outputBound.max.y + fastBlur.support.y;
+
+		FloatVectorDataPtr resultData = new FloatVectorData;
+		vector<float> &result = resultData->writable();
+		result.resize( ImagePlug::tilePixels(), 0.0f );
+
+		const V2i sourceRows = fastBlur.sourceRows( outputBound );
+		const int firstSourceTile = ImagePlug::tileOrigin( V2i( 0, sourceRows[0] ) ).y;
+		vector<ConstFloatVectorDataPtr> sourceTiles;
+		if( sourceRows[1] > sourceRows[0] )
+		{
+			sourceTiles.resize( ( sourceRows[1] - firstSourceTile + ImagePlug::tileSize() - 1 ) / ImagePlug::tileSize() );
+		}
+
+		const ThreadState &threadState = ThreadState::current();
+		tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, sourceTiles.size() ),
+			[&] ( const tbb::blocked_range<size_t> &range ) {
+
+				ImagePlug::ChannelDataScope channelDataScope( threadState );
+				for( size_t i = range.begin(); i != range.end(); ++i )
+				{
+					const V2i sourceTileOrigin( tileOrigin.x, firstSourceTile + i * ImagePlug::tileSize() );
+					channelDataScope.setTileOrigin( &sourceTileOrigin );
+					sourceTiles[i] = horizontalPassPlug()->getValue();
+				}
+			},
+			taskGroupContext
+		);
+
+		if( sourceTiles.size() )
+		{
+			vector<float> values;
+			vector<float> scratch;
+			for( int x = outputBound.min.x; x < outputBound.max.x; ++x )
+			{
+				Canceller::check( context->canceller() );
+				values.resize( inputEnd - inputBegin );
+				for( int y = inputBegin; y < inputEnd; ++y )
+				{
+					int sourceY = y;
+					if( fastBlur.boundingMode == Sampler::Clamp )
+					{
+						sourceY = std::clamp( y, sourceRows[0], sourceRows[1] - 1 );
+					}
+					else if( y < sourceRows[0] || y >= sourceRows[1] )
+					{
+						values[y - inputBegin] = 0.0f;
+						continue;
+					}
+
+					const int sourceTileIndex = ( sourceY - firstSourceTile ) / ImagePlug::tileSize();
+					const int sourceTileY = sourceY - firstSourceTile - sourceTileIndex * ImagePlug::tileSize();
+					values[y - inputBegin] = sourceTiles[sourceTileIndex]->readable()[sourceTileY * ImagePlug::tileSize() + x - tileOrigin.x];
+				}
+
+				boxFilter( values, scratch, fastBlur.widthsY );
+				for( int y = outputBound.min.y; y < outputBound.max.y; ++y )
+				{
+					result[( y - tileOrigin.y ) * ImagePlug::tileSize() + x - tileOrigin.x] = values[y - outputBound.min.y + fastBlur.support.y];
+				}
+			}
+		}
+
+		static_cast<FloatVectorDataPlug *>( output )->setValue( resultData );
+		return;
+	}
 
 	FlatImageProcessor::compute( output, context );
 }
 
+Gaffer::ValuePlug::CachePolicy Blur::computeCachePolicy( const Gaffer::ValuePlug *output ) const
+{
+	if( output == horizontalPassPlug() || output == verticalPassPlug() )
+	{
+		// Both passes spawn tasks, so other threads waiting
+		// for the result must be able to help compute it.
+		return ValuePlug::CachePolicy::TaskCollaboration;
+	}
+	return FlatImageProcessor::computeCachePolicy( output );
+}
+
+Gaffer::ValuePlug::CachePolicy Blur::hashCachePolicy( const Gaffer::ValuePlug *output ) const
+{
+	if( output == horizontalPassPlug() || output == verticalPassPlug() )
+	{
+		return ValuePlug::CachePolicy::TaskCollaboration;
+	}
+	return FlatImageProcessor::hashCachePolicy( output );
+}
+
 void Blur::hashDataWindow( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
-	if( radiusPlug()->getValue() != V2f( 0 ) && expandDataWindowPlug()->getValue() )
+	if( radiusPlug()->getValue() == V2f( 0 ) || !expandDataWindowPlug()->getValue() )
 	{
-		h = resampledDataWindowPlug()->hash();
+		h = inPlug()->dataWindowPlug()->hash();
+	}
+	else if( modePlug()->getValue() == Fast )
+	{
+		FlatImageProcessor::hashDataWindow( parent, context, h );
+		inPlug()->dataWindowPlug()->hash( h );
+		radiusPlug()->hash( h );
 	}
 	else
 	{
-		h = inPlug()->dataWindowPlug()->hash();
+		h = resampledDataWindowPlug()->hash();
 	}
 }
 
 Imath::Box2i Blur::computeDataWindow( const Gaffer::Context *context, const ImagePlug *parent ) const
 {
-	if( radiusPlug()->getValue() != V2f( 0 ) && expandDataWindowPlug()->getValue() )
+	if( radiusPlug()->getValue() == V2f( 0 ) || !expandDataWindowPlug()->getValue() )
 	{
-		return resampledDataWindowPlug()->getValue();
+		return inPlug()->dataWindowPlug()->getValue();
+	}
+	else if( modePlug()->getValue() == Fast )
+	{
+		return FastBlur( this, context ).outDataWindow;
 	}
 	else
 	{
-		return inPlug()->dataWindowPlug()->getValue();
+		return resampledDataWindowPlug()->getValue();
 	}
 }
 
 void Blur::hashChannelData( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
-	if( radiusPlug()->getValue() != V2f( 0 ) )
+	if( radiusPlug()->getValue() == V2f( 0 ) )
 	{
-		h = resampledChannelDataPlug()->hash();
+		h = inPlug()->channelDataPlug()->hash();
+	}
+	else if( modePlug()->getValue() == Fast )
+	{
+		const V2i tileOrigin = context->get<V2i>( ImagePlug::tileOriginContextName );
+		if( BufferAlgo::empty( FastBlur( this, context ).outputBound( tileOrigin ) ) )
+		{
+			h = ImagePlug::blackTile()->Object::hash();
+			return;
+		}
+
+		h = verticalPassPlug()->hash();
 	}
 	else
 	{
-		h = inPlug()->channelDataPlug()->hash();
+		h = resampledChannelDataPlug()->hash();
 	}
 }
 
 IECore::ConstFloatVectorDataPtr Blur::computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const
 {
-	if( radiusPlug()->getValue() != V2f( 0 ) )
+	if( radiusPlug()->getValue() == V2f( 0 ) )
 	{
-		return resampledChannelDataPlug()->getValue();
+		return inPlug()->channelDataPlug()->getValue();
+	}
+	else if( modePlug()->getValue() == Fast )
+	{
+		if( BufferAlgo::empty( FastBlur( this, context ).outputBound( tileOrigin ) ) )
+		{
+			return ImagePlug::blackTile();
+		}
+
+		return verticalPassPlug()->getValue();
 	}
 	else
 	{
-		return inPlug()->channelDataPlug()->getValue();
+		return resampledChannelDataPlug()->getValue();
 	}
 }
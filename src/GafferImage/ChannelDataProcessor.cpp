@@ -120,6 +120,11 @@ void ChannelDataProcessor::affects( const Gaffer::Plug *input, AffectedPlugsCont
 	}
 }
 
+int ChannelDataProcessor::nativeLOD( int lod ) const
+{
+	return lod;
+}
+
 bool ChannelDataProcessor::channelEnabled( const std::string &channel ) const
 {
 	if( !ImageProcessor::channelEnabled( channel ) )
@@ -37,11 +37,14 @@
 #include "GafferImage/ColorProcessor.h"
 
 #include "GafferImage/ImageAlgo.h"
+#include "GafferImage/Private/KernelTargets.h"
 
 #include "Gaffer/Context.h"
 
 #include "IECore/StringAlgo.h"
 
+#include <algorithm>
+
 using namespace std;
 using namespace IECore;
 using namespace Gaffer;
@@ -52,6 +55,52 @@ namespace
 
 const IECore::InternedString g_layerNameKey( "image:colorProcessor:__layerName" );
 
+// Returns the ColorProcessor whose output is connected to `in`, provided
+// that nothing else is using the intermediate image. If anything is, it will
+// need the upstream colorDataPlug() anyway, so we may as well use it rather
+// than duplicate the work.
+const ColorProcessor *upstreamColorProcessor( const ImagePlug *in )
+{
+	const Plug *source = in;
+	while( const Plug *input = source->getInput() )
+	{
+		if( input->outputs().size() != 1 )
+		{
+			return nullptr;
+		}
+		source = input;
+	}
+
+	const ColorProcessor *upstream = runTimeCast<const ColorProcessor>( source->node() );
+	if( upstream && source == upstream->outPlug() )
+	{
+		return upstream;
+	}
+	return nullptr;
+}
+
+// Pixels with no alpha aren't touched by either the unpremult or repremult.
+// This is expressed as a division or multiplication by one rather than a
+// branch, so that the loops can be vectorised.
+
+GAFFERIMAGE_KERNEL_TARGETS void unpremultiply( const float *alpha, float *c, int size )
+{
+	for( int i = 0; i < size; ++i )
+	{
+		const float d = alpha[i] != 0.0f ? alpha[i] : 1.0f;
+		c[i] = c[i] / d;
+	}
+}
+
+GAFFERIMAGE_KERNEL_TARGETS void premultiply( const float *alpha, float *c, int size )
+{
+	for( int i = 0; i < size; ++i )
+	{
+		const float m = alpha[i] != 0.0f ? alpha[i] : 1.0f;
+		c[i] = c[i] * m;
+	}
+}
+
 } // namespace
 
 GAFFER_NODE_DEFINE_TYPE( ColorProcessor );
@@ -137,6 +186,13 @@ void ColorProcessor::affects( const Gaffer::Plug *input, AffectedPlugsContainer
 	}
 }
 
+int ColorProcessor::nativeLOD( int lod ) const
+{
+	// Colour processing is independent of pixel position, so
+	// we can operate at any level of detail.
+	return lod;
+}
+
 void ColorProcessor::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	ImageProcessor::hash( output, context, h );
@@ -152,26 +208,42 @@ void ColorProcessor::compute( Gaffer::ValuePlug *output, const Gaffer::Context *
 	if( output == colorDataPlug() )
 	{
 		ConstStringVectorDataPtr channelNamesData;
-		bool unpremult;
 		{
 			ImagePlug::GlobalScope globalScope( context );
 			channelNamesData = inPlug()->channelNamesPlug()->getValue();
-			unpremult = processUnpremultipliedPlug()->getValue();
 		}
 		const vector<string> &channelNames = channelNamesData->readable();
 
 		const string &layerName = context->get<string>( g_layerNameKey );
 
+		// Rather than pulling our input through the colorDataPlug() of any
+		// ColorProcessors immediately upstream, we evaluate their processing
+		// ourselves, in place in the same buffers. This avoids allocating and
+		// caching intermediate results that nothing else will use.
+		const vector<const ColorProcessor *> chain = fusedChain( channelNames, layerName, context );
+		const ImagePlug *chainInPlug = chain.front()->inPlug();
+
+		vector<bool> unpremult;
+		bool anyUnpremult = false;
+		{
+			ImagePlug::GlobalScope globalScope( context );
+			for( const auto &processor : chain )
+			{
+				unpremult.push_back( processor->processUnpremultipliedPlug()->getValue() );
+				anyUnpremult = anyUnpremult || unpremult.back();
+			}
+		}
+
 		FloatVectorDataPtr rgb[3];
 		ConstFloatVectorDataPtr alpha;
 		int samples = -1;
 		{
 			ImagePlug::ChannelDataScope channelDataScope( context );
 
-			if( unpremult && ImageAlgo::channelExists( channelNames, ImageAlgo::channelNameA ) )
+			if( anyUnpremult && ImageAlgo::channelExists( channelNames, ImageAlgo::channelNameA ) )
 			{
 				channelDataScope.setChannelName( &ImageAlgo::channelNameA );
-				alpha = inPlug()->channelDataPlug()->getValue();
+				alpha = chainInPlug->channelDataPlug()->getValue();
 			}
 
 			int i = 0;
@@ -181,24 +253,8 @@ void ColorProcessor::compute( Gaffer::ValuePlug *output, const Gaffer::Context *
 				if( ImageAlgo::channelExists( channelNames, channelName ) )
 				{
 					channelDataScope.setChannelName( &channelName );
-					rgb[i] = inPlug()->channelDataPlug()->getValue()->copy();
-
+					rgb[i] = chainInPlug->channelDataPlug()->getValue()->copy();
 					samples = rgb[i]->readable().size();
-
-					if( unpremult && alpha )
-					{
-						const float *A = &alpha->readable().front();
-						float *C = &rgb[i]->writable().front();
-						for( int j = 0; j < samples; j++ )
-						{
-							if( *A != 0 )
-							{
-								*C /= *A;
-							}
-							A++;
-							C++;
-						}
-					}
 				}
 				else
 				{
@@ -223,26 +279,25 @@ void ColorProcessor::compute( Gaffer::ValuePlug *output, const Gaffer::Context *
 
 		}
 
-		processColorData( context, rgb[0].get(), rgb[1].get(), rgb[2].get() );
-
-		if( unpremult && alpha )
+		// Alpha is never modified by a ColorProcessor, so the alpha from the
+		// input to the chain is the right one for every node within it.
+		for( size_t c = 0; c < chain.size(); ++c )
 		{
-			for( int i = 0; i < 3; i++ )
+			if( unpremult[c] && alpha )
 			{
-				if( unpremult && alpha )
+				for( int i = 0; i < 3; i++ )
 				{
-					const float *A = &alpha->readable().front();
-					float *C = &rgb[i]->writable().front();
-					for( int j = 0; j < samples; j++ )
-					{
-						// Pixels with no alpha aren't touched by either the unpremult or repremult
-						if( *A != 0 )
-						{
-							*C *= *A;
-						}
-						A++;
-						C++;
-					}
+					unpremultiply( &alpha->readable().front(), &rgb[i]->writable().front(), samples );
+				}
+			}
+
+			chain[c]->processColorData( context, rgb[0].get(), rgb[1].get(), rgb[2].get() );
+
+			if( unpremult[c] && alpha )
+			{
+				for( int i = 0; i < 3; i++ )
+				{
+					premultiply( &alpha->readable().front(), &rgb[i]->writable().front(), samples );
 				}
 			}
 		}
@@ -322,6 +377,64 @@ IECore::ConstFloatVectorDataPtr ColorProcessor::computeChannelData( const std::s
 	return boost::static_pointer_cast<const FloatVectorData>( colorData->members()[ImageAlgo::colorIndex( baseName)] );
 }
 
+std::vector<const ColorProcessor *> ColorProcessor::fusedChain( const std::vector<std::string> &channelNames, const std::string &layerName, const Gaffer::Context *context ) const
+{
+	vector<const ColorProcessor *> result = { this };
+
+	string rgbNames[3];
+	int i = 0;
+	for( const auto &baseName : { "R", "G", "B" } )
+	{
+		rgbNames[i] = ImageAlgo::channelName( layerName, baseName );
+		if( !ImageAlgo::channelExists( channelNames, rgbNames[i] ) )
+		{
+			// We substitute black for missing channels on every evaluation,
+			// so we can't carry the processed values through from upstream.
+			return result;
+		}
+		i++;
+	}
+
+	const ImagePlug *in = inPlug();
+	while( const ColorProcessor *upstream = upstreamColorProcessor( in ) )
+	{
+		bool enabled;
+		{
+			ImagePlug::GlobalScope globalScope( context );
+			enabled = upstream->enabled();
+		}
+
+		if( enabled )
+		{
+			// The upstream node must process all of R, G and B, otherwise
+			// our input is a mix of processed and unprocessed channels.
+			bool processesRGB = true;
+			ImagePlug::ChannelDataScope channelDataScope( context );
+			for( const auto &channelName : rgbNames )
+			{
+				channelDataScope.setChannelName( &channelName );
+				if( !upstream->channelEnabled( channelName ) || !StringAlgo::matchMultiple( channelName, upstream->channelsPlug()->getValue() ) )
+				{
+					processesRGB = false;
+					break;
+				}
+			}
+			if( !processesRGB )
+			{
+				break;
+			}
+			result.push_back( upstream );
+		}
+		// Disabled nodes are just a pass-through, so we can skip straight
+		// past them to their input.
+
+		in = upstream->inPlug();
+	}
+
+	std::reverse( result.begin(), result.end() );
+	return result;
+}
+
 bool ColorProcessor::affectsColorData( const Gaffer::Plug *input ) const
 {
 	return input == inPlug()->channelDataPlug() || input == inPlug()->channelNamesPlug() || input == processUnpremultipliedPlug();
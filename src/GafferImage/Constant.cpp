@@ -119,26 +119,33 @@ void Constant::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outpu
 	}
 }
 
+int Constant::nativeLOD( int lod ) const
+{
+	return lod;
+}
+
 void Constant::hashFormat( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	FlatImageSource::hashFormat( output, context, h );
 	h.append( formatPlug()->hash() );
+	h.append( ImageAlgo::lod( context ) );
 }
 
 GafferImage::Format Constant::computeFormat( const Gaffer::Context *context, const ImagePlug *parent ) const
 {
-	return formatPlug()->getValue();
+	return ImageAlgo::lodFormat( formatPlug()->getValue(), ImageAlgo::lod( context ) );
 }
 
 void Constant::hashDataWindow( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	FlatImageSource::hashDataWindow( output, context, h );
 	h.append( formatPlug()->hash() );
+	h.append( ImageAlgo::lod( context ) );
 }
 
 Imath::Box2i Constant::computeDataWindow( const Gaffer::Context *context, const ImagePlug *parent ) const
 {
-	return formatPlug()->getValue().getDisplayWindow();
+	return ImageAlgo::lodWindow( formatPlug()->getValue().getDisplayWindow(), ImageAlgo::lod( context ) );
 }
 
 IECore::ConstCompoundDataPtr Constant::computeMetadata( const Gaffer::Context *context, const ImagePlug *parent ) const
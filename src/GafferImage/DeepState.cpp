@@ -924,6 +924,12 @@ void DeepState::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outp
 	}
 }
 
+int DeepState::nativeLOD( int lod ) const
+{
+	// Deep images are only supported at full resolution.
+	return inPlug()->deepPlug()->getValue() ? 0 : lod;
+}
+
 void DeepState::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	ImageProcessor::hash( output, context, h );
@@ -107,6 +107,11 @@ void DeleteChannels::affects( const Gaffer::Plug *input, AffectedPlugsContainer
 	}
 }
 
+int DeleteChannels::nativeLOD( int lod ) const
+{
+	return lod;
+}
+
 void DeleteChannels::hashChannelNames( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	ImageProcessor::hashChannelNames( output, context, h );
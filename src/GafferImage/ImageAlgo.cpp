@@ -536,3 +536,33 @@ bool GafferImage::ImageAlgo::viewIsValid( const Gaffer::Context *context, const
 
 	return false;
 }
+
+int GafferImage::ImageAlgo::lod( const Gaffer::Context *context )
+{
+	return context->get<int>( ImagePlug::lodContextName, 0 );
+}
+
+Imath::Box2i GafferImage::ImageAlgo::lodWindow( const Imath::Box2i &window, int lod )
+{
+	if( lod <= 0 || BufferAlgo::empty( window ) )
+	{
+		return window;
+	}
+
+	// Right shifts of signed integers round towards negative infinity,
+	// which is exactly what we need to round the window outwards.
+	const int offset = ( 1 << lod ) - 1;
+	return Imath::Box2i(
+		Imath::V2i( window.min.x >> lod, window.min.y >> lod ),
+		Imath::V2i( ( window.max.x + offset ) >> lod, ( window.max.y + offset ) >> lod )
+	);
+}
+
+GafferImage::Format GafferImage::ImageAlgo::lodFormat( const Format &format, int lod )
+{
+	if( lod <= 0 )
+	{
+		return format;
+	}
+	return Format( lodWindow( format.getDisplayWindow(), lod ), format.getPixelAspect() );
+}
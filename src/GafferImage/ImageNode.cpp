@@ -37,11 +37,17 @@
 
 #include "GafferImage/ImageNode.h"
 
+#include "GafferImage/BufferAlgo.h"
 #include "GafferImage/FormatPlug.h"
+#include "GafferImage/ImageAlgo.h"
 
 #include "Gaffer/Context.h"
 #include "Gaffer/ScriptNode.h"
 
+#include "IECore/Canceller.h"
+
+#include <algorithm>
+
 using namespace std;
 using namespace Imath;
 using namespace IECore;
@@ -50,6 +56,215 @@ using namespace Gaffer;
 
 GAFFER_NODE_DEFINE_TYPE( ImageNode );
 
+namespace
+{
+
+const IECore::InternedString g_imageCachePartition( "image" );
+
+// Scopes a copy of a context with the level of detail set to `lod`, removing
+// the variable entirely for full resolution images.
+struct LODScope : public Context::EditableScope
+{
+
+	LODScope( const Context *context, const int &lod )
+		:	EditableScope( context )
+	{
+		if( lod )
+		{
+			set( ImagePlug::lodContextName, &lod );
+		}
+		else
+		{
+			remove( ImagePlug::lodContextName );
+		}
+	}
+
+};
+
+void throwIfDeep( const ImagePlug *image )
+{
+	if( image->deepPlug()->getValue() )
+	{
+		throw IECore::Exception( "Deep images cannot be computed at a reduced level of detail" );
+	}
+}
+
+// Returns the region of the `nativeLOD` image which must be downsampled
+// to generate the tile at `tileOrigin`. Must be called with a LODScope.
+Box2i sourceRegion( const ImagePlug *image, const V2i &tileOrigin, int shift )
+{
+	ImagePlug::GlobalScope globalScope( Context::current() );
+	throwIfDeep( image );
+	return BufferAlgo::intersection(
+		Box2i( tileOrigin * ( 1 << shift ), ( tileOrigin + V2i( ImagePlug::tileSize() ) ) * ( 1 << shift ) ),
+		image->dataWindowPlug()->getValue()
+	);
+}
+
+// Hashes `output` at `lod` when it can only be computed directly at `nativeLOD`.
+void hashDownsampled( const ValuePlug *output, const ImagePlug *image, const Context *context, int lod, int nativeLOD, IECore::MurmurHash &h )
+{
+	const int shift = lod - nativeLOD;
+	LODScope lodScope( context, nativeLOD );
+
+	if( output == image->channelDataPlug() )
+	{
+		const V2i tileOrigin = context->get<V2i>( ImagePlug::tileOriginContextName );
+		const Box2i region = sourceRegion( image, tileOrigin, shift );
+		if( BufferAlgo::empty( region ) )
+		{
+			h = ImagePlug::blackTile()->Object::hash();
+			return;
+		}
+
+		h.append( tileOrigin );
+		h.append( region );
+		h.append( shift );
+
+		V2i sourceTileOrigin;
+		for( sourceTileOrigin.y = ImagePlug::tileOrigin( region.min ).y; sourceTileOrigin.y < region.max.y; sourceTileOrigin.y += ImagePlug::tileSize() )
+		{
+			for( sourceTileOrigin.x = ImagePlug::tileOrigin( region.min ).x; sourceTileOrigin.x < region.max.x; sourceTileOrigin.x += ImagePlug::tileSize() )
+			{
+				lodScope.set( ImagePlug::tileOriginContextName, &sourceTileOrigin );
+				image->channelDataPlug()->hash( h );
+			}
+		}
+	}
+	else if( output == image->sampleOffsetsPlug() )
+	{
+		ImagePlug::GlobalScope globalScope( lodScope.context() );
+		throwIfDeep( image );
+		h = ImagePlug::flatTileSampleOffsets()->Object::hash();
+	}
+	else
+	{
+		h = output->hash();
+		if( output == image->formatPlug() || output == image->dataWindowPlug() )
+		{
+			h.append( shift );
+		}
+	}
+}
+
+// Computes `output` at `lod` by downsampling it from `nativeLOD`.
+void computeDownsampled( ValuePlug *output, const ImagePlug *image, const Context *context, int lod, int nativeLOD )
+{
+	const int shift = lod - nativeLOD;
+
+	if( output == image->channelDataPlug() )
+	{
+		const V2i tileOrigin = context->get<V2i>( ImagePlug::tileOriginContextName );
+
+		FloatVectorDataPtr resultData;
+		{
+			LODScope lodScope( context, nativeLOD );
+			const Box2i region = sourceRegion( image, tileOrigin, shift );
+			if( !BufferAlgo::empty( region ) )
+			{
+				resultData = new FloatVectorData( vector<float>( ImagePlug::tilePixels(), 0.0f ) );
+				vector<float> &result = resultData->writable();
+				const float weight = 1.0f / (float)( 1 << ( 2 * shift ) );
+
+				V2i sourceTileOrigin;
+				for( sourceTileOrigin.y = ImagePlug::tileOrigin( region.min ).y; sourceTileOrigin.y < region.max.y; sourceTileOrigin.y += ImagePlug::tileSize() )
+				{
+					for( sourceTileOrigin.x = ImagePlug::tileOrigin( region.min ).x; sourceTileOrigin.x < region.max.x; sourceTileOrigin.x += ImagePlug::tileSize() )
+					{
+						IECore::Canceller::check( context->canceller() );
+
+						lodScope.set( ImagePlug::tileOriginContextName, &sourceTileOrigin );
+						ConstFloatVectorDataPtr sourceData = image->channelDataPlug()->getValue();
+						const vector<float> &source = sourceData->readable();
+
+						const Box2i sourceBound = BufferAlgo::intersection(
+							Box2i( sourceTileOrigin, sourceTileOrigin + V2i( ImagePlug::tileSize() ) ), region
+						);
+						for( int y = sourceBound.min.y; y < sourceBound.max.y; ++y )
+						{
+							const float *s = source.data() + ( y - sourceTileOrigin.y ) * ImagePlug::tileSize() - sourceTileOrigin.x;
+							float *r = result.data() + ( ( y >> shift ) - tileOrigin.y ) * ImagePlug::tileSize() - tileOrigin.x;
+							for( int x = sourceBound.min.x; x < sourceBound.max.x; ++x )
+							{
+								r[x >> shift] += s[x] * weight;
+							}
+						}
+					}
+				}
+			}
+		}
+
+		static_cast<FloatVectorDataPlug *>( output )->setValue(
+			resultData ? ConstFloatVectorDataPtr( resultData ) : ConstFloatVectorDataPtr( ImagePlug::blackTile() )
+		);
+	}
+	else if( output == image->sampleOffsetsPlug() )
+	{
+		{
+			LODScope lodScope( context, nativeLOD );
+			ImagePlug::GlobalScope globalScope( lodScope.context() );
+			throwIfDeep( image );
+		}
+		static_cast<IntVectorDataPlug *>( output )->setValue( ImagePlug::flatTileSampleOffsets() );
+	}
+	else if( output == image->formatPlug() )
+	{
+		Format format;
+		{
+			LODScope lodScope( context, nativeLOD );
+			format = image->formatPlug()->getValue();
+		}
+		static_cast<AtomicFormatPlug *>( output )->setValue( ImageAlgo::lodFormat( format, shift ) );
+	}
+	else if( output == image->dataWindowPlug() )
+	{
+		Box2i dataWindow;
+		{
+			LODScope lodScope( context, nativeLOD );
+			dataWindow = image->dataWindowPlug()->getValue();
+		}
+		static_cast<AtomicBox2iPlug *>( output )->setValue( ImageAlgo::lodWindow( dataWindow, shift ) );
+	}
+	else if( output == image->viewNamesPlug() )
+	{
+		ConstStringVectorDataPtr viewNames;
+		{
+			LODScope lodScope( context, nativeLOD );
+			viewNames = image->viewNamesPlug()->getValue();
+		}
+		static_cast<StringVectorDataPlug *>( output )->setValue( viewNames );
+	}
+	else if( output == image->channelNamesPlug() )
+	{
+		ConstStringVectorDataPtr channelNames;
+		{
+			LODScope lodScope( context, nativeLOD );
+			channelNames = image->channelNamesPlug()->getValue();
+		}
+		static_cast<StringVectorDataPlug *>( output )->setValue( channelNames );
+	}
+	else if( output == image->metadataPlug() )
+	{
+		ConstCompoundDataPtr metadata;
+		{
+			LODScope lodScope( context, nativeLOD );
+			metadata = image->metadataPlug()->getValue();
+		}
+		static_cast<AtomicCompoundDataPlug *>( output )->setValue( metadata );
+	}
+	else if( output == image->deepPlug() )
+	{
+		bool deep;
+		{
+			LODScope lodScope( context, nativeLOD );
+			deep = image->deepPlug()->getValue();
+		}
+		static_cast<BoolPlug *>( output )->setValue( deep );
+	}
+}
+
+} // namespace
+
 size_t ImageNode::g_firstPlugIndex = 0;
 
 ImageNode::ImageNode( const std::string &name )
@@ -99,6 +314,17 @@ void ImageNode::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *co
 	}
 	if( imagePlug && enabledValue )
 	{
+		const int lod = ImageAlgo::lod( context );
+		if( lod > 0 )
+		{
+			const int nativeLOD = clampedNativeLOD( lod, context );
+			if( nativeLOD < lod )
+			{
+				hashDownsampled( output, imagePlug, context, lod, nativeLOD, h );
+				return;
+			}
+		}
+
 		// We don't call ComputeNode::hash() immediately here, because for subclasses which
 		// want to pass through a specific hash in the hash*() methods it's a waste of time (the
 		// hash will get overwritten anyway). Instead we call ComputeNode::hash() in our
@@ -215,6 +441,17 @@ void ImageNode::compute( ValuePlug *output, const Context *context ) const
 		return;
 	}
 
+	const int lod = ImageAlgo::lod( context );
+	if( lod > 0 )
+	{
+		const int nativeLOD = clampedNativeLOD( lod, context );
+		if( nativeLOD < lod )
+		{
+			computeDownsampled( output, imagePlug, context, lod, nativeLOD );
+			return;
+		}
+	}
+
 	// node is enabled - defer to our derived classes to perform the appropriate computation
 
 	if( output == imagePlug->viewNamesPlug() )
@@ -285,6 +522,26 @@ void ImageNode::compute( ValuePlug *output, const Context *context ) const
 	}
 }
 
+int ImageNode::nativeLOD( int lod ) const
+{
+	return 0;
+}
+
+int ImageNode::clampedNativeLOD( int lod, const Gaffer::Context *context ) const
+{
+	ImagePlug::GlobalScope c( context );
+	return std::clamp( nativeLOD( lod ), 0, lod );
+}
+
+IECore::InternedString ImageNode::computeCachePartition( const Gaffer::ValuePlug *output ) const
+{
+	if( output->parent<ImagePlug>() )
+	{
+		return g_imageCachePartition;
+	}
+	return ComputeNode::computeCachePartition( output );
+}
+
 IECore::ConstStringVectorDataPtr ImageNode::computeViewNames( const Gaffer::Context *context, const ImagePlug *parent ) const
 {
 	throw IECore::NotImplementedException( string( typeName() ) + "::computeViewNames" );
@@ -62,6 +62,7 @@ GAFFER_PLUG_DEFINE_TYPE( ImagePlug );
 const IECore::InternedString ImagePlug::channelNameContextName = "image:channelName";
 const IECore::InternedString ImagePlug::viewNameContextName = "image:viewName";
 const IECore::InternedString ImagePlug::tileOriginContextName = "image:tileOrigin";
+const IECore::InternedString ImagePlug::lodContextName = "image:lod";
 
 const std::string ImagePlug::defaultViewName = "default";
 
@@ -361,6 +361,13 @@ void ImageReader::affects( const Plug *input, AffectedPlugsContainer &outputs )
 	}
 }
 
+int ImageReader::nativeLOD( int lod ) const
+{
+	// Our internal OpenImageIOReader is responsible for dealing
+	// with the level of detail, so we can just pass it through.
+	return lod;
+}
+
 void ImageReader::hash( const ValuePlug *output, const Context *context, IECore::MurmurHash &h ) const
 {
 	ImageNode::hash( output, context, h );
@@ -65,11 +65,18 @@
 
 #include "boost/algorithm/string.hpp"
 #include "boost/functional/hash.hpp"
+#include "boost/noncopyable.hpp"
 
 #include "tbb/spin_mutex.h"
 
+#include <chrono>
+#include <condition_variable>
+#include <deque>
 #include <filesystem>
+#include <functional>
 #include <memory>
+#include <mutex>
+#include <thread>
 
 #ifndef _MSC_VER
 #include <sys/utsname.h>
@@ -167,6 +174,144 @@ void copyDeepArea(
 
 using ImageOutputPtr = std::shared_ptr<ImageOutput>;
 
+// Upper limit on the amount of pixel data waiting to be written by an
+// AsynchronousWriter.
+const size_t g_maxQueuedBytes = 512 * 1024 * 1024;
+
+class AsynchronousWriter : boost::noncopyable
+{
+	// Performs writes to an ImageOutput on a dedicated thread, so that the
+	// encoding and disk I/O performed by OIIO overlaps with the computation
+	// of the tiles that follow. Writes are performed in the order they are
+	// queued, and the amount of queued data is bounded so that computation
+	// can't get arbitrarily far ahead of writing. An exception thrown by a
+	// write is rethrown from the next call to `write()`, or from `wait()`.
+	//
+	// If the AsynchronousWriter is destroyed without `wait()` being called
+	// then we are unwinding from an exception elsewhere, and any remaining
+	// writes are abandoned.
+	public :
+
+		using Write = std::function<void ()>;
+
+		AsynchronousWriter()
+			:	m_queuedBytes( 0 ), m_finished( false ), m_cancelled( false ), m_thread( [this] { run(); } )
+		{
+		}
+
+		~AsynchronousWriter()
+		{
+			{
+				std::unique_lock<std::mutex> lock( m_mutex );
+				m_cancelled = true;
+			}
+			finish();
+		}
+
+		// `bytes` is the amount of memory held by `write` until it
+		// has been performed.
+		void write( Write &&write, size_t bytes )
+		{
+			std::unique_lock<std::mutex> lock( m_mutex );
+			m_condition.wait(
+				lock,
+				[&] { return m_exception || !m_queuedBytes || m_queuedBytes + bytes <= g_maxQueuedBytes; }
+			);
+			if( m_exception )
+			{
+				std::rethrow_exception( m_exception );
+			}
+			m_queue.push_back( { std::move( write ), bytes } );
+			m_queuedBytes += bytes;
+			m_condition.notify_all();
+		}
+
+		// Blocks until all queued writes have been performed.
+		void wait()
+		{
+			finish();
+			if( m_exception )
+			{
+				std::rethrow_exception( m_exception );
+			}
+		}
+
+	private :
+
+		void finish()
+		{
+			if( !m_thread.joinable() )
+			{
+				return;
+			}
+
+			{
+				std::unique_lock<std::mutex> lock( m_mutex );
+				m_finished = true;
+			}
+			m_condition.notify_all();
+			m_thread.join();
+		}
+
+		void run()
+		{
+			while( true )
+			{
+				QueueEntry entry;
+				{
+					std::unique_lock<std::mutex> lock( m_mutex );
+					m_condition.wait( lock, [this] { return !m_queue.empty() || m_finished; } );
+					if( m_queue.empty() || m_cancelled )
+					{
+						return;
+					}
+					entry = std::move( m_queue.front() );
+					m_queue.pop_front();
+				}
+
+				std::exception_ptr exception;
+				try
+				{
+					entry.write();
+				}
+				catch( ... )
+				{
+					exception = std::current_exception();
+				}
+
+				{
+					std::unique_lock<std::mutex> lock( m_mutex );
+					m_queuedBytes -= entry.bytes;
+					m_exception = exception;
+				}
+				m_condition.notify_all();
+
+				if( exception )
+				{
+					return;
+				}
+			}
+		}
+
+		struct QueueEntry
+		{
+			Write write;
+			size_t bytes;
+		};
+
+		std::mutex m_mutex;
+		std::condition_variable m_condition;
+		std::deque<QueueEntry> m_queue;
+		size_t m_queuedBytes;
+		bool m_finished;
+		bool m_cancelled;
+		std::exception_ptr m_exception;
+		// Must be last, so that everything used by `run()` is
+		// initialised before the thread starts.
+		std::thread m_thread;
+
+};
+
 class TileSampleOffsetsProcessor
 {
 	public:
@@ -279,6 +424,13 @@ class FlatTileWriter
 	// black, which is what we want. So iterate over the remaining tiles, and
 	// if memory has been allocated for that tile, write it to the file, and if
 	// nothing has been allocated, write a black tile.
+	//
+	// Tiles ready to be written are accumulated until a complete row of
+	// output tiles is available, and the row is then written in a single
+	// call to `ImageOutput::write_tiles()`, allowing formats such as EXR to
+	// compress the tiles in parallel. The writing itself is performed by an
+	// AsynchronousWriter, so that it overlaps the computation of the
+	// following tiles.
 	public:
 		FlatTileWriter(
 				ImageOutputPtr out,
@@ -297,7 +449,8 @@ class FlatTileWriter
 				m_outputDataWindow( m_format.fromEXRSpace( Imath::Box2i( Imath::V2i( m_spec.x, m_spec.y ), Imath::V2i( m_spec.x + m_spec.width - 1, m_spec.y + m_spec.height - 1 ) ) ) ),
 				m_numTiles( Imath::V2i( (int)ceil( float( m_spec.width ) / m_spec.tile_width ), (int)ceil( float( m_spec.height ) / m_spec.tile_height ) ) ),
 				m_nextTileIndex( 0 ),
-				m_blackTile( nullptr )
+				m_blackTile( nullptr ),
+				m_pendingTilesBegin( 0 )
 		{
 			m_tilesData.resize( m_numTiles.x * m_numTiles.y );
 			m_tilesFilled.resize( m_numTiles.x * m_numTiles.y, false );
@@ -312,19 +465,21 @@ class FlatTileWriter
 		{
 			for( size_t tileIndex = m_nextTileIndex; tileIndex < m_tilesData.size(); ++tileIndex )
 			{
-				Imath::V2i tileOrigin = outTileOrigin( tileIndex );
 				if( !m_tilesData[tileIndex]->readable().empty() )
 				{
-					writeTile( tileOrigin, m_tilesData[tileIndex] );
+					addPendingTile( tileIndex, m_tilesData[tileIndex] );
 				}
 				else
 				{
 					// If the tileData object hasn't been resized, then
 					// we have never even tried to write data to this
 					// tile, so write the static black tile.
-					writeTile( tileOrigin, blackTile() );
+					addPendingTile( tileIndex, blackTile() );
 				}
 			}
+
+			writePendingTiles();
+			m_writer.wait();
 		}
 
 		void operator()( const ImagePlug *imagePlug, const string &channelName, const V2i &tileOrigin, ConstFloatVectorDataPtr data )
@@ -436,16 +591,14 @@ class FlatTileWriter
 			size_t tileIndex;
 			for( tileIndex = m_nextTileIndex; tileIndex < m_tilesData.size(); ++tileIndex )
 			{
-				Imath::V2i tileOrigin = outTileOrigin( tileIndex );
-
 				if( m_tilesFilled[tileIndex] )
 				{
-					writeTile( tileOrigin, m_tilesData[tileIndex] );
+					addPendingTile( tileIndex, m_tilesData[tileIndex] );
 					m_tilesData[tileIndex].reset();
 				}
 				else if( !BufferAlgo::intersects( m_inputTilesBounds, outTileBounds( tileIndex ) ) )
 				{
-					writeTile( tileOrigin, blackTile() );
+					addPendingTile( tileIndex, blackTile() );
 				}
 				else
 				{
@@ -457,11 +610,79 @@ class FlatTileWriter
 		}
 
 
-		void writeTile( const Imath::V2i &tileOrigin, ConstFloatVectorDataPtr tileData ) const
+		// Tiles are added in order, and are written once the last tile
+		// in the row has been added.
+		void addPendingTile( size_t tileIndex, ConstFloatVectorDataPtr tileData )
 		{
-			Imath::V2i exrTileOrigin = m_format.toEXRSpace( tileOrigin + Imath::V2i( 0, m_spec.tile_height - 1 ) );
+			if( m_pendingTiles.empty() )
+			{
+				m_pendingTilesBegin = tileIndex;
+			}
+
+			assert( tileIndex == m_pendingTilesBegin + m_pendingTiles.size() );
+			m_pendingTiles.push_back( tileData );
 
-			if( !m_out->write_tile( exrTileOrigin.x, exrTileOrigin.y, 0, TypeDesc::FLOAT, &tileData->readable()[0] ) )
+			if( ( tileIndex + 1 ) % m_numTiles.x == 0 )
+			{
+				writePendingTiles();
+			}
+		}
+
+		void writePendingTiles()
+		{
+			if( m_pendingTiles.empty() )
+			{
+				return;
+			}
+
+			const Imath::V2i exrTilesOrigin = m_format.toEXRSpace( outTileOrigin( m_pendingTilesBegin ) + Imath::V2i( 0, m_spec.tile_height - 1 ) );
+			const size_t bytes = m_pendingTiles.size() * m_spec.tile_width * m_spec.tile_height * m_channels.size() * sizeof( float );
+
+			m_writer.write(
+				[this, exrTilesOrigin, tiles = std::move( m_pendingTiles )] {
+					writeTiles( exrTilesOrigin, tiles );
+				},
+				bytes
+			);
+
+			m_pendingTiles.clear();
+		}
+
+		// Called on the AsynchronousWriter's thread.
+		void writeTiles( const Imath::V2i &exrTilesOrigin, const std::vector<ConstFloatVectorDataPtr> &tiles ) const
+		{
+			bool success;
+			if( tiles.size() == 1 )
+			{
+				success = m_out->write_tile( exrTilesOrigin.x, exrTilesOrigin.y, 0, TypeDesc::FLOAT, &tiles[0]->readable()[0] );
+			}
+			else
+			{
+				// `write_tiles()` requires a single buffer for the whole region,
+				// clipped to the data window, so we interleave the tiles into one.
+				const int exrXEnd = std::min( exrTilesOrigin.x + (int)tiles.size() * m_spec.tile_width, m_spec.x + m_spec.width );
+				const int exrYEnd = std::min( exrTilesOrigin.y + m_spec.tile_height, m_spec.y + m_spec.height );
+				const size_t numChannels = m_channels.size();
+				const size_t width = exrXEnd - exrTilesOrigin.x;
+				const size_t height = exrYEnd - exrTilesOrigin.y;
+
+				std::vector<float> buffer( width * height * numChannels );
+				for( size_t i = 0; i < tiles.size(); ++i )
+				{
+					const size_t x = i * m_spec.tile_width;
+					const size_t rowLength = std::min<size_t>( m_spec.tile_width, width - x ) * numChannels;
+					const float *tileData = &tiles[i]->readable()[0];
+					for( size_t y = 0; y < height; ++y )
+					{
+						const float *row = tileData + y * m_spec.tile_width * numChannels;
+						std::copy( row, row + rowLength, &buffer[( y * width + x ) * numChannels] );
+					}
+				}
+
+				success = m_out->write_tiles( exrTilesOrigin.x, exrXEnd, exrTilesOrigin.y, exrYEnd, 0, 1, TypeDesc::FLOAT, &buffer[0] );
+			}
+
+			if( !success )
 			{
 				throw IECore::Exception( boost::str( boost::format( "Could not write tile to \"%s\", error = %s" ) % m_fileName % m_out->geterror() ) );
 			}
@@ -480,6 +701,11 @@ class FlatTileWriter
 		std::vector<FloatVectorDataPtr> m_tilesData;
 		std::vector<bool> m_tilesFilled;
 		ConstFloatVectorDataPtr m_blackTile;
+		std::vector<ConstFloatVectorDataPtr> m_pendingTiles;
+		size_t m_pendingTilesBegin;
+		// Must be last, so that it is destroyed before the members
+		// used by queued writes.
+		AsynchronousWriter m_writer;
 };
 
 class FlatScanlineWriter
@@ -494,8 +720,8 @@ class FlatScanlineWriter
 	// It stores a vector of floats big enough to hold ImagePlug::tileSize()
 	// scanlines. As it receives each tile, it copies the data into the
 	// appropriate location in the buffer. When it's copied the last channel
-	// of the last tile of each row, it writes all of the data from the buffer
-	// into the ImageOutput object.
+	// of the last tile of each row, it hands the buffer to an AsynchronousWriter
+	// to be written into the ImageOutput object while the next row is computed.
 	public:
 		FlatScanlineWriter(
 				ImageOutputPtr out,
@@ -512,24 +738,22 @@ class FlatScanlineWriter
 				m_processWindow( processWindow ),
 				m_tilesBounds( Imath::Box2i( ImagePlug::tileOrigin( processWindow.min ), ImagePlug::tileOrigin( processWindow.max - Imath::V2i( 1 ) ) + Imath::V2i( ImagePlug::tileSize() ) ) )
 		{
-			m_scanlinesData.resize( m_spec.width * ImagePlug::tileSize() * m_channels.size(), 0.0 );
-
 			writeInitialBlankScanlines();
 		}
 
 		void finish()
 		{
-			if( BufferAlgo::empty( m_processWindow ) )
+			// If the source data window is empty, we handled everything during construction.
+			if( !BufferAlgo::empty( m_processWindow ) )
 			{
-				// If the source data window is empty, we handle everything during construct
-				return;
+				const int scanlinesEnd = m_format.toEXRSpace( m_tilesBounds.min.y - 1 );
+				if( scanlinesEnd < ( m_spec.y + m_spec.height ) )
+				{
+					writeBlankScanlines( scanlinesEnd, m_spec.y + m_spec.height );
+				}
 			}
 
-			const int scanlinesEnd = m_format.toEXRSpace( m_tilesBounds.min.y - 1 );
-			if( scanlinesEnd < ( m_spec.y + m_spec.height ) )
-			{
-				writeBlankScanlines( scanlinesEnd, m_spec.y + m_spec.height );
-			}
+			m_writer.wait();
 		}
 
 		void operator()( const ImagePlug *imagePlug, const string &channelName, const V2i &tileOrigin, ConstFloatVectorDataPtr data )
@@ -544,25 +768,31 @@ class FlatScanlineWriter
 
 			if( firstTileOfRow( channelIndex, tileOrigin ) )
 			{
-				std::fill( m_scanlinesData.begin(), m_scanlinesData.end(), 0.0 );
+				// The previous buffer is owned by the AsynchronousWriter until it has been
+				// written, so we need a new one.
+				m_scanlinesData = std::make_shared<vector<float>>( scanlinesDataSize(), 0.0 );
 			}
 
 			Imath::Box2i copyArea( BufferAlgo::intersection( m_processWindow, BufferAlgo::intersection( inTileBounds, scanlinesBounds ) ) );
 
-			copyBufferArea( &data->readable()[0], inTileBounds, &m_scanlinesData[0], scanlinesBounds, channelIndex, m_channels.size(), true, copyArea );
+			copyBufferArea( &data->readable()[0], inTileBounds, m_scanlinesData->data(), scanlinesBounds, channelIndex, m_channels.size(), true, copyArea );
 
 			if( lastTileOfRow( channelIndex, tileOrigin ) )
 			{
 				writeScanlines(
 					std::max( exrInTileBounds.min.y, m_spec.y ),
 					std::min( exrInTileBounds.max.y + 1, m_spec.y + m_spec.height ),
+					m_scanlinesData,
 					std::max( m_spec.y - exrInTileBounds.min.y, 0 )
 				);
+				m_scanlinesData.reset();
 			}
 		}
 
 	private:
 
+		using ScanlinesDataPtr = std::shared_ptr<vector<float>>;
+
 		inline bool firstTileOfRow( const size_t channelIndex, const Imath::V2i &tileOrigin ) const
 		{
 			return channelIndex == 0 && tileOrigin.x == m_tilesBounds.min.x;
@@ -573,22 +803,34 @@ class FlatScanlineWriter
 			return channelIndex == ( m_channels.size() - 1 ) && tileOrigin.x == ( m_tilesBounds.max.x - ImagePlug::tileSize() ) ;
 		}
 
-		void writeScanlines( const int exrYBegin, const int exrYEnd, const int scanlinesYOffset = 0 ) const
+		inline size_t scanlinesDataSize() const
 		{
-			if ( !m_out->write_scanlines( exrYBegin, exrYEnd, 0, TypeDesc::FLOAT, &m_scanlinesData[0] + ( scanlinesYOffset * m_spec.width * m_channels.size() ) ) )
-			{
-				throw IECore::Exception( boost::str( boost::format( "Could not write scanline to \"%s\", error = %s" ) % m_fileName % m_out->geterror() ) );
-			}
+			return m_spec.width * ImagePlug::tileSize() * m_channels.size();
+		}
+
+		void writeScanlines( const int exrYBegin, const int exrYEnd, const ScanlinesDataPtr &scanlinesData, const int scanlinesYOffset = 0 )
+		{
+			m_writer.write(
+				[this, exrYBegin, exrYEnd, scanlinesData, scanlinesYOffset] {
+					if ( !m_out->write_scanlines( exrYBegin, exrYEnd, 0, TypeDesc::FLOAT, scanlinesData->data() + ( scanlinesYOffset * m_spec.width * m_channels.size() ) ) )
+					{
+						throw IECore::Exception( boost::str( boost::format( "Could not write scanline to \"%s\", error = %s" ) % m_fileName % m_out->geterror() ) );
+					}
+				},
+				scanlinesData->size() * sizeof( float )
+			);
 		}
 
 		void writeBlankScanlines( int yBegin, int yEnd )
 		{
-			float *scanlines = &m_scanlinesData[0];
-			memset( scanlines, 0, sizeof(float) * m_spec.width * std::min( ImagePlug::tileSize(), yEnd - yBegin ) * m_channels.size() );
+			// Shared by all the writes, since it is never modified.
+			ScanlinesDataPtr blankScanlines = std::make_shared<vector<float>>(
+				m_spec.width * std::min( ImagePlug::tileSize(), yEnd - yBegin ) * m_channels.size(), 0.0
+			);
 			while( yBegin < yEnd )
 			{
 				const int numLines = std::min( yEnd - yBegin, ImagePlug::tileSize() );
-				writeScanlines( yBegin, yBegin + numLines );
+				writeScanlines( yBegin, yBegin + numLines, blankScanlines );
 				yBegin += numLines;
 			}
 		}
@@ -617,7 +859,10 @@ class FlatScanlineWriter
 		const ImageSpec m_spec;
 		const Imath::Box2i &m_processWindow;
 		const Imath::Box2i m_tilesBounds;
-		vector<float> m_scanlinesData;
+		ScanlinesDataPtr m_scanlinesData;
+		// Must be last, so that it is destroyed before the members
+		// used by queued writes.
+		AsynchronousWriter m_writer;
 };
 
 class DeepTileWriter
@@ -1810,6 +2055,10 @@ IECore::MurmurHash ImageWriter::hash( const Context *context ) const
 	h.append( fileNamePlug()->hash() );
 	h.append( channelsPlug()->hash() );
 	h.append( colorSpacePlug()->hash() );
+	h.append( layoutPartNamePlug()->hash() );
+	h.append( layoutChannelNamePlug()->hash() );
+	h.append( matchDataWindowsPlug()->hash() );
+
 	const std::string fileFormat = currentFileFormat();
 
 	if( fileFormat != "" )
@@ -1824,6 +2073,38 @@ IECore::MurmurHash ImageWriter::hash( const Context *context ) const
 	return h;
 }
 
+IECore::MurmurHash ImageWriter::outputHash( const Gaffer::Context *context ) const
+{
+	IECore::MurmurHash h = hash( context );
+	if( h == IECore::MurmurHash() )
+	{
+		return h;
+	}
+
+	// Unlike `hash()`, which is called for every dispatch, this is only
+	// called by incremental dispatches, so we can afford to hash the
+	// image itself. This means we are only skipped if exactly the same
+	// image would be written.
+	Context::Scope scope( context );
+	ConstStringVectorDataPtr viewNamesData = inPlug()->viewNames();
+	for( const std::string &viewName : viewNamesData->readable() )
+	{
+		h.append( ImageAlgo::imageHash( inPlug(), &viewName ) );
+	}
+
+	return h;
+}
+
+void ImageWriter::outputFiles( const Gaffer::Context *context, std::vector<std::string> &files ) const
+{
+	Context::Scope scope( context );
+	const std::string fileName = fileNamePlug()->getValue();
+	if( !fileName.empty() )
+	{
+		files.push_back( fileName );
+	}
+}
+
 void ImageWriter::execute() const
 {
 	// Create an OIIO::ImageOutput
@@ -2091,6 +2372,8 @@ void ImageWriter::execute() const
 
 	}
 
+	const auto startTime = std::chrono::steady_clock::now();
+
 	bool success;
 	if( parts.size() > 1 )
 	{
@@ -2176,4 +2459,22 @@ void ImageWriter::execute() const
 	}
 
 	out->close();
+
+	// Report the throughput we achieved, which includes the time taken to
+	// compute the image as well as to encode and write it.
+
+	std::error_code fileSizeError;
+	const uintmax_t fileSize = std::filesystem::file_size( fileName, fileSizeError );
+	if( !fileSizeError )
+	{
+		const std::chrono::duration<double> duration = std::chrono::steady_clock::now() - startTime;
+		const double megabytes = fileSize / ( 1024.0 * 1024.0 );
+		IECore::msg(
+			IECore::MessageHandler::Info, this->relativeName( this->scriptNode() ),
+			boost::str(
+				boost::format( "Wrote %.1f MB to \"%s\" in %.2fs (%.1f MB/s)" ) %
+					megabytes % fileName % duration.count() % ( megabytes / std::max( duration.count(), 1e-6 ) )
+			)
+		);
+	}
 }
@@ -37,6 +37,7 @@
 #include "GafferImage/Merge.h"
 
 #include "GafferImage/ImageAlgo.h"
+#include "GafferImage/Private/KernelTargets.h"
 
 #include "Gaffer/ArrayPlug.h"
 #include "Gaffer/Context.h"
@@ -266,6 +267,74 @@ inline MergeRegion tileRegion( int i, const Box2i &boundA, const Box2i &boundB,
 	return (MergeRegion)(( InsideA * inA ) | ( InsideB * inB ));
 }
 
+// Kernels for operating on a contiguous span of pixels within a single MergeRegion.
+// These are kept as separate functions containing nothing but a simple indexed loop,
+// so that the compiler can vectorise them, and so that we can provide variants for
+// the wider instruction sets via GAFFERIMAGE_KERNEL_TARGETS. The result is written
+// to R and r, which may be the same buffers as B and b when we are accumulating into
+// the merge buffers - we provide separate in-place kernels for that case, because
+// otherwise the compiler's runtime aliasing checks would fall back to the scalar loop.
+
+template<class Op>
+GAFFERIMAGE_KERNEL_TARGETS void operateBoth( const float *A, const float *a, const float *B, const float *b, float *R, float *r, int length )
+{
+	for( int j = 0; j < length; ++j )
+	{
+		const float aj = a[j];
+		const float bj = b[j];
+		R[j] = Op::operate( A[j], B[j], aj, bj );
+		r[j] = Op::operate( aj, bj, aj, bj );
+	}
+}
+
+template<class Op>
+GAFFERIMAGE_KERNEL_TARGETS void operateBothInPlace( const float *A, const float *a, float *B, float *b, int length )
+{
+	for( int j = 0; j < length; ++j )
+	{
+		const float aj = a[j];
+		const float bj = b[j];
+		B[j] = Op::operate( A[j], B[j], aj, bj );
+		b[j] = Op::operate( aj, bj, aj, bj );
+	}
+}
+
+// Outside A dataWindow, so call operator with 0 substituted for A and a
+template<class Op>
+GAFFERIMAGE_KERNEL_TARGETS void operateOnlyB( const float *B, const float *b, float *R, float *r, int length )
+{
+	for( int j = 0; j < length; ++j )
+	{
+		const float bj = b[j];
+		R[j] = Op::operate( 0.0f, B[j], 0.0f, bj );
+		r[j] = Op::operate( 0.0f, bj, 0.0f, bj );
+	}
+}
+
+template<class Op>
+GAFFERIMAGE_KERNEL_TARGETS void operateOnlyBInPlace( float *B, float *b, int length )
+{
+	for( int j = 0; j < length; ++j )
+	{
+		const float bj = b[j];
+		B[j] = Op::operate( 0.0f, B[j], 0.0f, bj );
+		b[j] = Op::operate( 0.0f, bj, 0.0f, bj );
+	}
+}
+
+// Outside B dataWindow, so call operator with 0 substituted for B and b. Since
+// B isn't read, it doesn't matter if R is the same buffer.
+template<class Op>
+GAFFERIMAGE_KERNEL_TARGETS void operateOnlyA( const float *A, const float *a, float *R, float *r, int length )
+{
+	for( int j = 0; j < length; ++j )
+	{
+		const float aj = a[j];
+		R[j] = Op::operate( A[j], 0.0f, aj, 0.0f );
+		r[j] = Op::operate( aj, 0.0f, aj, 0.0f );
+	}
+}
+
 struct MergeFunctor
 {
 	using ReturnType = void;
@@ -406,12 +475,6 @@ struct MergeFunctor
 					{
 						// In a region with one input where we know the operator just passes through
 						// an input, we can just copy it over.
-						// Note: that this does not actually currently improve performance measurably,
-						// the compiler probably does quite a good job of inlining Op::operate,
-						// noticing that it is a passthrough, and translating it into something memcpy'ish
-						// This structure still feels worthwhile since it's a bit more explicit about what
-						// is happening, and this structure could be useful if we pursue a bit of
-						// vectorization
 						memcpy( R, B, length * sizeof( float ) );
 						memcpy( r, b, length * sizeof( float ) );
 					}
@@ -421,15 +484,17 @@ struct MergeFunctor
 				}
 				else
 				{
-					// Outside A dataWindow, so call operator with 0 substituted for A and a
-					for( int j = 0; j < length; j++ )
+					if( R == B )
 					{
-						*R = Op::operate( 0.0f, *B, 0.0f, *b );
-						*r = Op::operate( 0.0f, *b, 0.0f, *b );
-						++B; ++b;
-						++R; ++r;
+						operateOnlyBInPlace<Op>( R, r, length );
+					}
+					else
+					{
+						operateOnlyB<Op>( B, b, R, r, length );
 					}
 					A += length; a += length;
+					B += length; b += length;
+					R += length; r += length;
 				}
 			}
 			else if( region == InsideA )
@@ -446,28 +511,26 @@ struct MergeFunctor
 				}
 				else
 				{
-					// Outside B dataWindow, so call operator with 0 substituted for B and b
-					for( int j = 0; j < length; j++ )
-					{
-						*R = Op::operate( *A, 0.0f, *a, 0.0f );
-						*r = Op::operate( *a, 0.0f, *a, 0.0f );
-						++A; ++a;
-						++R; ++r;
-					}
+					operateOnlyA<Op>( A, a, R, r, length );
+					A += length; a += length;
 					B += length; b += length;
+					R += length; r += length;
 				}
 			}
 			else
 			{
 				// Within both data windows, this is when we actually need to run the full operate()
-				for( int j = 0; j < length; j++ )
+				if( R == B )
+				{
+					operateBothInPlace<Op>( A, a, R, r, length );
+				}
+				else
 				{
-					*R = Op::operate( *A, *B, *a, *b );
-					*r = Op::operate( *a, *b, *a, *b );
-					++A; ++a;
-					++B; ++b;
-					++R; ++r;
+					operateBoth<Op>( A, a, B, b, R, r, length );
 				}
+				A += length; a += length;
+				B += length; b += length;
+				R += length; r += length;
 			}
 			i += length;
 		}
@@ -673,6 +736,11 @@ void Merge::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs
 	}
 }
 
+int Merge::nativeLOD( int lod ) const
+{
+	return lod;
+}
+
 void Merge::hashDataWindow( const GafferImage::ImagePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	FlatImageProcessor::hashDataWindow( output, context, h );
@@ -485,12 +485,17 @@ class File
 				nodeHandle.key() = ImagePlug::defaultViewName;
 				m_views.insert( std::move( nodeHandle ) );
 			}
+
+			for( auto &view : m_views )
+			{
+				addMipLevels( *view.second );
+			}
 		}
 
 		// Read a chunk of data from the file, formatted as a tile batch that will be stored on the tile batch plug
 		ConstObjectVectorPtr readTileBatch( const Context *c, V3i tileBatchIndex )
 		{
-			const View& view = lookupView( c );
+			const View& view = lookupLevel( c );
 			V2i batchFirstTile = V2i( tileBatchIndex.x, tileBatchIndex.y ) * view.tileBatchSize;
 			Box2i targetRegion = Box2i( batchFirstTile * ImagePlug::tileSize(),
 				( batchFirstTile + view.tileBatchSize ) * ImagePlug::tileSize()
@@ -513,7 +518,7 @@ class File
 			DeepData fileDeepData;
 			Box2i exrDataRegion;
 
-			const int nchannels = readRegion( tileBatchIndex.z, exrTargetRegion, fileData, fileDeepData, exrDataRegion );
+			const int nchannels = readRegion( tileBatchIndex.z, view.mipLevel, view.fileOffset, exrTargetRegion, fileData, fileDeepData, exrDataRegion );
 
 			// Convert the resulting region from readRegion back from EXR coordinates to Gaffer coordinates
 			Box2i fileDataRegion = flopDisplayWindow( exrDataRegion, view.imageSpec.full_y, view.imageSpec.full_height );
@@ -707,7 +712,7 @@ class File
 		// within that tile to use
 		void findTile( const Context *c, const std::string &channelName, const Imath::V2i &tileOrigin, V3i &batchIndex, int &batchSubIndex ) const
 		{
-			const View& view = lookupView( c );
+			const View& view = lookupLevel( c );
 			if( !channelName.size() )
 			{
 				// For computing sample offsets
@@ -728,6 +733,21 @@ class File
 			return lookupView( c ).imageSpec;
 		}
 
+		// As above, but for the mip level matching the `image:lod` context variable.
+		// The display and data windows are expressed in the reduced coordinate
+		// space of the level, with the same conventions as `imageSpec()`.
+		const ImageSpec &levelSpec( const Context *c ) const
+		{
+			return lookupLevel( c ).imageSpec;
+		}
+
+		// Returns the number of mip levels available, including the full
+		// resolution level.
+		int numLevels( const Context *c ) const
+		{
+			return lookupView( c ).levels.size() + 1;
+		}
+
 		std::string formatName() const
 		{
 			return m_imageInput->format_name();
@@ -765,6 +785,14 @@ class File
 			std::map<std::string, ChannelMapEntry> channelMap;
 			int firstSubImage;
 
+			// Mip level support. Levels other than the first are stored in `levels`, with
+			// an `imageSpec` that has been adjusted into the coordinate space of the level
+			// of detail. `fileOffset` converts from that space to the space of the data
+			// in the file.
+			int mipLevel = 0;
+			Imath::V2i fileOffset = Imath::V2i( 0 );
+			std::vector<std::unique_ptr<View>> levels;
+
 		private:
 
 			static V2i computeTileBatchSize( const ImageSpec &spec, bool tiled )
@@ -798,16 +826,18 @@ class File
 		//
 		// This is currenly only used by readTileBatch below - we always cache to tile batches when reading
 		// channel data.
-		int readRegion( int subImage, const Box2i &targetRegion, std::vector<float> &data, DeepData &deepData, Box2i &exrDataRegion )
+		int readRegion( int subImage, int mipLevel, const V2i &fileOffset, const Box2i &targetRegion, std::vector<float> &data, DeepData &deepData, Box2i &exrDataRegion )
 		{
-			ImageSpec spec = m_imageInput->spec( subImage, 0 );
+			ImageSpec spec = m_imageInput->spec( subImage, mipLevel );
 
 			const V2i fileDataOrigin( spec.x, spec.y );
 			const Box2i fileDataWindow( fileDataOrigin, fileDataOrigin + V2i( spec.width, spec.height ) );
 
 			// We may have expanded the region to tile boundary, intersect it down to just region actually
 			// covered by the file's data window
-			const Box2i fileTargetRegion = BufferAlgo::intersection( targetRegion, fileDataWindow );
+			const Box2i fileTargetRegion = BufferAlgo::intersection(
+				Box2i( targetRegion.min + fileOffset, targetRegion.max + fileOffset ), fileDataWindow
+			);
 
 			if( spec.tile_width == 0 && spec.tile_height == 0 )
 			{
@@ -818,14 +848,14 @@ class File
 				{
 					data.resize( spec.nchannels * exrDataRegion.size().x * exrDataRegion.size().y );
 					success = m_imageInput->read_scanlines(
-						subImage, 0,
+						subImage, mipLevel,
 						exrDataRegion.min.y, exrDataRegion.max.y, 0, 0, spec.nchannels, TypeDesc::FLOAT, &data[0]
 					);
 				}
 				else
 				{
 					success = m_imageInput->read_native_deep_scanlines(
-						subImage, 0,
+						subImage, mipLevel,
 						exrDataRegion.min.y, exrDataRegion.max.y, 0, 0, spec.nchannels, deepData
 					);
 				}
@@ -861,7 +891,7 @@ class File
 				{
 					data.resize( spec.nchannels * exrDataRegion.size().x * exrDataRegion.size().y );
 					success = m_imageInput->read_tiles (
-						subImage, 0,
+						subImage, mipLevel,
 						exrDataRegion.min.x, exrDataRegion.max.x,
 						exrDataRegion.min.y, exrDataRegion.max.y, 0, 1, 0, spec.nchannels, TypeDesc::FLOAT, &data[0]
 					);
@@ -869,7 +899,7 @@ class File
 				else
 				{
 					success = m_imageInput->read_native_deep_tiles (
-						subImage, 0,
+						subImage, mipLevel,
 						exrDataRegion.min.x, exrDataRegion.max.x,
 						exrDataRegion.min.y, exrDataRegion.max.y, 0, 1, 0, spec.nchannels, deepData
 					);
@@ -887,9 +917,79 @@ class File
 				}
 			}
 
+			exrDataRegion.min -= fileOffset;
+			exrDataRegion.max -= fileOffset;
+
 			return spec.nchannels;
 		}
 
+		// Adds a View for each additional mip level in the file. We only support this for
+		// flat images where all channels come from a single subimage, so that all reads
+		// for the view share the same level layout.
+		void addMipLevels( View &view )
+		{
+			if( view.imageSpec.deep )
+			{
+				return;
+			}
+
+			for( const auto &[channelName, channelMapEntry] : view.channelMap )
+			{
+				if( channelMapEntry.subImage != view.firstSubImage )
+				{
+					return;
+				}
+			}
+
+			const ImageSpec &baseSpec = view.imageSpec;
+			const Box2i displayWindow(
+				V2i( baseSpec.full_x, baseSpec.full_y ),
+				V2i( baseSpec.full_x + baseSpec.full_width, baseSpec.full_y + baseSpec.full_height )
+			);
+			const Box2i dataWindow = flopDisplayWindow(
+				Box2i( V2i( baseSpec.x, baseSpec.y ), V2i( baseSpec.x + baseSpec.width, baseSpec.y + baseSpec.height ) ),
+				baseSpec.full_y, baseSpec.full_height
+			);
+
+			for( int mipLevel = 1; ; ++mipLevel )
+			{
+				const ImageSpec fileSpec = m_imageInput->spec( view.firstSubImage, mipLevel );
+				if( fileSpec.format == TypeUnknown )
+				{
+					break;
+				}
+
+				// Place the level in the reduced coordinate space used by `ImageAlgo::lodWindow()`,
+				// anchoring it to the top left of the full resolution data window, since that is
+				// where mip levels originate in EXR space.
+
+				const Box2i levelDisplayWindow = ImageAlgo::lodWindow( displayWindow, mipLevel );
+				const Box2i lodDataWindow = ImageAlgo::lodWindow( dataWindow, mipLevel );
+				const Box2i levelDataWindow(
+					V2i( lodDataWindow.min.x, lodDataWindow.max.y - fileSpec.height ),
+					V2i( lodDataWindow.min.x + fileSpec.width, lodDataWindow.max.y )
+				);
+				const Box2i exrLevelDataWindow = flopDisplayWindow(
+					levelDataWindow, levelDisplayWindow.min.y, levelDisplayWindow.size().y
+				);
+
+				ImageSpec levelSpec = fileSpec;
+				levelSpec.full_x = levelDisplayWindow.min.x;
+				levelSpec.full_y = levelDisplayWindow.min.y;
+				levelSpec.full_width = levelDisplayWindow.size().x;
+				levelSpec.full_height = levelDisplayWindow.size().y;
+				levelSpec.x = exrLevelDataWindow.min.x;
+				levelSpec.y = exrLevelDataWindow.min.y;
+
+				auto level = std::make_unique<View>( levelSpec, view.firstSubImage );
+				level->channelMap = view.channelMap;
+				level->channelNames = view.channelNames;
+				level->mipLevel = mipLevel;
+				level->fileOffset = V2i( fileSpec.x, fileSpec.y ) - exrLevelDataWindow.min;
+				view.levels.push_back( std::move( level ) );
+			}
+		}
+
 		// Given a subImage index, and a tile origin, return an index to identify the tile batch which
 		// where this channel data will be found
 		V3i tileBatchIndex( const View &view, int subImage, V2i tileOrigin ) const
@@ -940,6 +1040,13 @@ class File
 			throw IECore::Exception( "OpenImageIOReader : Error in downstream node - incorrect request for invalid view \"" + viewName + "\"" );
 		}
 
+		inline const View &lookupLevel( const Context *c ) const
+		{
+			const View &view = lookupView( c );
+			const int lod = std::min<int>( ImageAlgo::lod( c ), view.levels.size() );
+			return lod > 0 ? *view.levels[lod-1] : view;
+		}
+
 		std::unique_ptr<ImageInput> m_imageInput;
 		StringVectorDataPtr m_viewNamesData;
 		std::map<std::string, std::unique_ptr< View > > m_views;
@@ -1180,6 +1287,7 @@ void OpenImageIOReader::hash( const ValuePlug *output, const Context *context, I
 	{
 		h.append( context->get<V3i>( g_tileBatchIndexContextName ) );
 		h.append( context->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName ) );
+		h.append( ImageAlgo::lod( context ) );
 
 		Gaffer::Context::EditableScope c( context );
 		c.remove( g_tileBatchIndexContextName );
@@ -1297,6 +1405,7 @@ void OpenImageIOReader::hashFormat( const GafferImage::ImagePlug *output, const
 	h.append( format.getDisplayWindow() );
 	h.append( format.getPixelAspect() );
 	h.append( context->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName ) );
+	h.append( ImageAlgo::lod( context ) );
 }
 
 GafferImage::Format OpenImageIOReader::computeFormat( const Gaffer::Context *context, const ImagePlug *parent ) const
@@ -1304,18 +1413,22 @@ GafferImage::Format OpenImageIOReader::computeFormat( const Gaffer::Context *con
 	// when we're in MissingFrameMode::Black we still want to
 	// match the format of the Hold frame, so pass true for holdForBlack.
 	FilePtr file = std::static_pointer_cast<File>( retrieveFile( context, true ) );
+	const int lod = ImageAlgo::lod( context );
 	if( !file )
 	{
-		return FormatPlug::getDefaultFormat( context );
+		return ImageAlgo::lodFormat( FormatPlug::getDefaultFormat( context ), lod );
 	}
 
 	const ImageSpec &spec = file->imageSpec( context );
-	return GafferImage::Format(
-		Imath::Box2i(
-			Imath::V2i( spec.full_x, spec.full_y ),
-			Imath::V2i( spec.full_x + spec.full_width, spec.full_y + spec.full_height )
+	return ImageAlgo::lodFormat(
+		GafferImage::Format(
+			Imath::Box2i(
+				Imath::V2i( spec.full_x, spec.full_y ),
+				Imath::V2i( spec.full_x + spec.full_width, spec.full_y + spec.full_height )
+			),
+			spec.get_float_attribute( "PixelAspectRatio", 1.0f )
 		),
-		spec.get_float_attribute( "PixelAspectRatio", 1.0f )
+		lod
 	);
 }
 
@@ -1326,6 +1439,7 @@ void OpenImageIOReader::hashDataWindow( const GafferImage::ImagePlug *output, co
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
 	h.append( context->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName ) );
+	h.append( ImageAlgo::lod( context ) );
 }
 
 Imath::Box2i OpenImageIOReader::computeDataWindow( const Gaffer::Context *context, const ImagePlug *parent ) const
@@ -1336,7 +1450,7 @@ Imath::Box2i OpenImageIOReader::computeDataWindow( const Gaffer::Context *contex
 		return parent->dataWindowPlug()->defaultValue();
 	}
 
-	const ImageSpec &spec = file->imageSpec( context );
+	const ImageSpec &spec = file->levelSpec( context );
 
 	Imath::Box2i dataWindow( Imath::V2i( spec.x, spec.y ), Imath::V2i( spec.width + spec.x, spec.height + spec.y ) );
 	return flopDisplayWindow( dataWindow, spec.full_y, spec.full_height );
@@ -1500,6 +1614,7 @@ void OpenImageIOReader::hashChannelData( const GafferImage::ImagePlug *output, c
 	h.append( context->get<V2i>( ImagePlug::tileOriginContextName ) );
 	h.append( context->get<std::string>( ImagePlug::channelNameContextName ) );
 	h.append( context->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName ) );
+	h.append( ImageAlgo::lod( context ) );
 
 	{
 		ImagePlug::GlobalScope c( context );
@@ -1550,6 +1665,19 @@ IECore::ConstFloatVectorDataPtr OpenImageIOReader::computeChannelData( const std
 	return IECore::runTimeCast< const FloatVectorData >( curTileChannel );
 }
 
+int OpenImageIOReader::nativeLOD( int lod ) const
+{
+	// Note : we pass `holdForBlack = true` so that missing frames are
+	// consistent with the format, which must match the held frame.
+	FilePtr file = std::static_pointer_cast<File>( retrieveFile( Context::current(), true ) );
+	if( !file )
+	{
+		// Our default outputs are trivially available at any level.
+		return lod;
+	}
+	return std::min( lod, file->numLevels( Context::current() ) - 1 );
+}
+
 void OpenImageIOReader::plugSet( Gaffer::Plug *plug )
 {
 	// this clears the cache every time the refresh count is updated, so you don't get entries
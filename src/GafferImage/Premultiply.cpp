@@ -37,11 +37,26 @@
 
 #include "GafferImage/Premultiply.h"
 
+#include "GafferImage/Private/KernelTargets.h"
+
 #include "Gaffer/Context.h"
 
 using namespace IECore;
 using namespace Gaffer;
 
+namespace
+{
+
+GAFFERIMAGE_KERNEL_TARGETS void premultiply( const float *a, float *out, size_t size )
+{
+	for( size_t i = 0; i < size; ++i )
+	{
+		out[i] *= a[i];
+	}
+}
+
+} // namespace
+
 namespace GafferImage
 {
 
@@ -126,11 +141,7 @@ void Premultiply::processChannelData( const Gaffer::Context *context, const Imag
 	const std::vector<float> &a = aData->readable();
 	std::vector<float> &out = outData->writable();
 
-	std::vector<float>::const_iterator aIt = a.begin();
-	for ( std::vector<float>::iterator outIt = out.begin(), outItEnd = out.end(); outIt != outItEnd; ++outIt, ++aIt )
-	{
-		*outIt *= *aIt;
-	}
+	premultiply( a.data(), out.data(), out.size() );
 }
 
 } // namespace GafferImage
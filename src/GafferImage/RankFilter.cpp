@@ -42,6 +42,8 @@
 
 #include <algorithm>
 #include <climits>
+#include <cstdint>
+#include <functional>
 
 using namespace std;
 using namespace Imath;
@@ -49,6 +51,194 @@ using namespace IECore;
 using namespace Gaffer;
 using namespace GafferImage;
 
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Fills `pixels` with the values within `bound`, in rows from bottom to top.
+void gatherPixels( Sampler &sampler, const Box2i &bound, vector<float> &pixels, const IECore::Canceller *canceller )
+{
+	pixels.resize( bound.size().x * bound.size().y );
+	vector<float>::iterator it = pixels.begin();
+	for( int y = bound.min.y; y < bound.max.y; ++y )
+	{
+		IECore::Canceller::check( canceller );
+		for( int x = bound.min.x; x < bound.max.x; ++x )
+		{
+			*it++ = sampler.sample( x, y );
+		}
+	}
+}
+
+// Writes the extreme (minimum or maximum, depending on `compare`) of every run
+// of `window` consecutive values from `in` to `out`, producing `size - window + 1`
+// results. Uses the van Herk/Gil-Werman algorithm, which costs three comparisons
+// per value regardless of the size of the window.
+template<typename Compare>
+void slidingExtreme( const float *in, size_t inStride, size_t size, size_t window, float *out, size_t outStride, vector<float> &prefix, vector<float> &suffix, Compare compare )
+{
+	// The values are divided into blocks of size `window`, and we compute
+	// the extreme from the start of each block to each value (`prefix`),
+	// and from each value to the end of its block (`suffix`). Any window
+	// then spans at most two blocks, and is the combination of a suffix and
+	// a prefix.
+	prefix.resize( size );
+	suffix.resize( size );
+	for( size_t i = 0; i < size; ++i )
+	{
+		const float v = in[i*inStride];
+		prefix[i] = i % window == 0 || compare( v, prefix[i-1] ) ? v : prefix[i-1];
+	}
+	for( size_t i = size; i-- > 0; )
+	{
+		const float v = in[i*inStride];
+		suffix[i] = i == size - 1 || ( i + 1 ) % window == 0 || compare( v, suffix[i+1] ) ? v : suffix[i+1];
+	}
+	for( size_t i = 0; i + window <= size; ++i )
+	{
+		const float a = suffix[i];
+		const float b = prefix[i+window-1];
+		out[i*outStride] = compare( b, a ) ? b : a;
+	}
+}
+
+// Computes the minimum or maximum over a rectangular window, by filtering
+// first horizontally and then vertically.
+template<typename Compare>
+void rectangularExtreme( const vector<float> &input, const V2i &inputSize, const V2i &radius, vector<float> &result, const IECore::Canceller *canceller, Compare compare )
+{
+	const int tileSize = ImagePlug::tileSize();
+	vector<float> prefix;
+	vector<float> suffix;
+
+	vector<float> horizontal( inputSize.y * tileSize );
+	for( int y = 0; y < inputSize.y; ++y )
+	{
+		IECore::Canceller::check( canceller );
+		slidingExtreme( &input[y*inputSize.x], 1, inputSize.x, 2 * radius.x + 1, &horizontal[y*tileSize], 1, prefix, suffix, compare );
+	}
+
+	result.resize( tileSize * tileSize );
+	for( int x = 0; x < tileSize; ++x )
+	{
+		IECore::Canceller::check( canceller );
+		slidingExtreme( &horizontal[x], tileSize, inputSize.y, 2 * radius.y + 1, &result[x], tileSize, prefix, suffix, compare );
+	}
+}
+
+// Computes the median of each window using Huang's sliding histogram
+// algorithm, traversing the tile in alternating directions so that each
+// step only adds and removes a single row or column of the window. Rather
+// than quantising values into a fixed number of bins, the histogram is
+// indexed by the rank of each value amongst all the input values, so the
+// result is identical to that of a full sort.
+void slidingMedian( const vector<float> &input, const V2i &inputSize, const V2i &radius, vector<float> &result, const IECore::Canceller *canceller )
+{
+	vector<float> values( input );
+	std::sort( values.begin(), values.end() );
+	values.erase( std::unique( values.begin(), values.end() ), values.end() );
+
+	vector<uint32_t> ranks( input.size() );
+	for( size_t i = 0; i < input.size(); ++i )
+	{
+		if( i % inputSize.x == 0 )
+		{
+			IECore::Canceller::check( canceller );
+		}
+		ranks[i] = std::lower_bound( values.begin(), values.end(), input[i] ) - values.begin();
+	}
+
+	// We track the bin containing the median, and the number of
+	// values in the bins below it. The median moves only a little
+	// between neighbouring windows, so it is cheap to update.
+	vector<uint32_t> histogram( values.size(), 0 );
+	const size_t medianIndex = ( 2 * radius.x + 1 ) * ( 2 * radius.y + 1 ) / 2;
+	size_t medianBin = 0;
+	size_t below = 0;
+
+	auto add = [&] ( int x, int y ) {
+		const uint32_t rank = ranks[y*inputSize.x+x];
+		histogram[rank]++;
+		below += rank < medianBin;
+	};
+
+	auto remove = [&] ( int x, int y ) {
+		const uint32_t rank = ranks[y*inputSize.x+x];
+		histogram[rank]--;
+		below -= rank < medianBin;
+	};
+
+	auto median = [&] () {
+		while( below > medianIndex )
+		{
+			below -= histogram[--medianBin];
+		}
+		while( below + histogram[medianBin] <= medianIndex )
+		{
+			below += histogram[medianBin++];
+		}
+		return values[medianBin];
+	};
+
+	const int tileSize = ImagePlug::tileSize();
+	result.resize( tileSize * tileSize );
+
+	// Window for the first pixel.
+	for( int y = 0; y <= 2 * radius.y; ++y )
+	{
+		IECore::Canceller::check( canceller );
+		for( int x = 0; x <= 2 * radius.x; ++x )
+		{
+			add( x, y );
+		}
+	}
+
+	// The window for pixel `( x, y )` spans `[x, x + 2 * radius.x]` and
+	// `[y, y + 2 * radius.y]` in the input.
+	int x = 0;
+	for( int y = 0; y < tileSize; ++y )
+	{
+		IECore::Canceller::check( canceller );
+
+		const int step = y % 2 ? -1 : 1;
+		while( true )
+		{
+			result[y*tileSize+x] = median();
+			const int nextX = x + step;
+			if( nextX < 0 || nextX >= tileSize )
+			{
+				break;
+			}
+			const int removeX = step > 0 ? x : x + 2 * radius.x;
+			const int addX = step > 0 ? x + 2 * radius.x + 1 : nextX;
+			for( int wy = y; wy <= y + 2 * radius.y; ++wy )
+			{
+				remove( removeX, wy );
+				add( addX, wy );
+			}
+			x = nextX;
+		}
+
+		if( y + 1 < tileSize )
+		{
+			for( int wx = x; wx <= x + 2 * radius.x; ++wx )
+			{
+				remove( wx, y );
+				add( wx, y + 2 * radius.y + 1 );
+			}
+		}
+	}
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// RankFilter
+//////////////////////////////////////////////////////////////////////////
+
 GAFFER_NODE_DEFINE_TYPE( RankFilter );
 
 size_t RankFilter::g_firstPlugIndex = 0;
@@ -398,39 +588,25 @@ IECore::ConstFloatVectorDataPtr RankFilter::computeChannelData( const std::strin
 		return resultData;
 	}
 
-	vector<float> pixels( ( 1 + 2 * radius.x ) * ( 1 + 2 * radius.y ) );
-	vector<float>::iterator resultIt = pixels.begin() + pixels.size() / 2;
+	// Rather than gathering and sorting the whole neighbourhood for each
+	// output pixel, we gather the input for the tile once and then use
+	// algorithms which slide the window incrementally from pixel to pixel.
+	// This reduces the cost per pixel from quadratic in the radius to linear
+	// for the median, and to constant for erode and dilate.
+	vector<float> input;
+	gatherPixels( sampler, inputBound, input, context->canceller() );
 
-	V2i p;
-	for( p.y = tileBound.min.y; p.y < tileBound.max.y; ++p.y )
+	switch( m_mode )
 	{
-		for( p.x = tileBound.min.x; p.x < tileBound.max.x; ++p.x )
-		{
-			IECore::Canceller::check( context->canceller() );
-
-			V2i o;
-			vector<float>::iterator pixelsIt = pixels.begin();
-			for( o.y = -radius.y; o.y <= radius.y; ++o.y )
-			{
-				for( o.x = -radius.x; o.x <= radius.x; ++o.x )
-				{
-					*pixelsIt++ = sampler.sample( p.x + o.x, p.y + o.y );
-				}
-			}
-			switch( m_mode )
-			{
-				case MedianRank:
-					nth_element( pixels.begin(), resultIt, pixels.end() );
-					break;
-				case ErodeRank:
-					resultIt = min_element( pixels.begin(), pixels.end() );
-					break;
-				case DilateRank:
-					resultIt = max_element( pixels.begin(), pixels.end() );
-					break;
-			}
-			result.push_back( *resultIt );
-		}
+		case MedianRank :
+			slidingMedian( input, inputBound.size(), radius, result, context->canceller() );
+			break;
+		case ErodeRank :
+			rectangularExtreme( input, inputBound.size(), radius, result, context->canceller(), std::less<float>() );
+			break;
+		case DilateRank :
+			rectangularExtreme( input, inputBound.size(), radius, result, context->canceller(), std::greater<float>() );
+			break;
 	}
 
 	return resultData;
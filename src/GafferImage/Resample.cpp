@@ -37,6 +37,7 @@
 #include "GafferImage/Resample.h"
 
 #include "GafferImage/FilterAlgo.h"
+#include "GafferImage/ImageAlgo.h"
 #include "GafferImage/Sampler.h"
 
 #include "Gaffer/Context.h"
@@ -216,6 +217,42 @@ void filterWeights( const OIIO::Filter2D *filter, const float inputFilterScale,
 	}
 }
 
+// The matrix and filter scale are specified in full resolution pixel space,
+// and are often computed by parent nodes from full resolution formats. So
+// we always evaluate them at full resolution, and then convert them to the
+// level of detail being computed.
+struct FullResolutionScope : public ImagePlug::GlobalScope
+{
+
+	FullResolutionScope( const Context *context )
+		:	GlobalScope( context )
+	{
+		remove( ImagePlug::lodContextName );
+	}
+
+};
+
+M33f lodMatrix( const M33f &matrix, int lod )
+{
+	// Scaling is unaffected by the level of detail, but translation
+	// is measured in pixels and must be reduced accordingly.
+	M33f result = matrix;
+	result[2][0] /= (float)( 1 << lod );
+	result[2][1] /= (float)( 1 << lod );
+	return result;
+}
+
+V2f lodFilterScale( const V2f &filterScale, int lod )
+{
+	// Don't allow the level of detail to shrink the filter below its
+	// natural width, unless it was already narrower to begin with.
+	const V2f result = filterScale / (float)( 1 << lod );
+	return V2f(
+		std::max( result.x, std::min( filterScale.x, 1.0f ) ),
+		std::max( result.y, std::min( filterScale.y, 1.0f ) )
+	);
+}
+
 Box2f transform( const Box2f &b, const M33f &m )
 {
 	if( b.isEmpty() )
@@ -377,15 +414,24 @@ void Resample::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outpu
 	}
 }
 
+int Resample::nativeLOD( int lod ) const
+{
+	return lod;
+}
+
 void Resample::hashDataWindow( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	FlatImageProcessor::hashDataWindow( parent, context, h );
 
 	inPlug()->dataWindowPlug()->hash( h );
-	matrixPlug()->hash( h );
+	{
+		FullResolutionScope fullResolutionScope( context );
+		matrixPlug()->hash( h );
+		filterScalePlug()->hash( h );
+	}
+	h.append( ImageAlgo::lod( context ) );
 	expandDataWindowPlug()->hash( h );
 	filterPlug()->hash( h );
-	filterScalePlug()->hash( h );
 	debugPlug()->hash( h );
 }
 
@@ -400,7 +446,14 @@ Imath::Box2i Resample::computeDataWindow( const Gaffer::Context *context, const
 	// Figure out our data window as a Box2f with fractional
 	// pixel values.
 
-	const M33f matrix = matrixPlug()->getValue();
+	const int lod = ImageAlgo::lod( context );
+	M33f matrix;
+	V2f filterScale;
+	{
+		FullResolutionScope fullResolutionScope( context );
+		matrix = lodMatrix( matrixPlug()->getValue(), lod );
+		filterScale = lodFilterScale( filterScalePlug()->getValue(), lod );
+	}
 	Box2f dstDataWindow = transform( Box2f( srcDataWindow.min, srcDataWindow.max ), matrix );
 
 	if( expandDataWindowPlug()->getValue() )
@@ -410,7 +463,7 @@ Imath::Box2i Resample::computeDataWindow( const Gaffer::Context *context, const
 
 		V2f inputFilterScale;
 		const OIIO::Filter2D *filter = filterAndScale( filterPlug()->getValue(), ratio, inputFilterScale );
-		inputFilterScale *= filterScalePlug()->getValue();
+		inputFilterScale *= filterScale;
 
 		const V2f filterRadius = V2f( filter->width(), filter->height() ) * inputFilterScale * 0.5f;
 
@@ -460,15 +513,17 @@ void Resample::hashChannelData( const GafferImage::ImagePlug *parent, const Gaff
 {
 	FlatImageProcessor::hashChannelData( parent, context, h );
 
-	V2f ratio, offset;
+	const int lod = ImageAlgo::lod( context );
+	V2f ratio, offset, filterScale;
 	{
-		ImagePlug::GlobalScope c( context );
-		ratioAndOffset( matrixPlug()->getValue(), ratio, offset );
+		FullResolutionScope fullResolutionScope( context );
+		ratioAndOffset( lodMatrix( matrixPlug()->getValue(), lod ), ratio, offset );
+		filterScale = lodFilterScale( filterScalePlug()->getValue(), lod );
 	}
 
 	V2f inputFilterScale;
 	const OIIO::Filter2D *filter = filterAndScale( filterPlug()->getValue(), ratio, inputFilterScale );
-	inputFilterScale *= filterScalePlug()->getValue();
+	inputFilterScale *= filterScale;
 
 	filterPlug()->hash( h );
 
@@ -503,15 +558,17 @@ void Resample::hashChannelData( const GafferImage::ImagePlug *parent, const Gaff
 
 IECore::ConstFloatVectorDataPtr Resample::computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const
 {
-	V2f ratio, offset;
+	const int lod = ImageAlgo::lod( context );
+	V2f ratio, offset, filterScale;
 	{
-		ImagePlug::GlobalScope c( context );
-		ratioAndOffset( matrixPlug()->getValue(), ratio, offset );
+		FullResolutionScope fullResolutionScope( context );
+		ratioAndOffset( lodMatrix( matrixPlug()->getValue(), lod ), ratio, offset );
+		filterScale = lodFilterScale( filterScalePlug()->getValue(), lod );
 	}
 
 	V2f inputFilterScale;
 	const OIIO::Filter2D *filter = filterAndScale( filterPlug()->getValue(), ratio, inputFilterScale );
-	inputFilterScale *= filterScalePlug()->getValue();
+	inputFilterScale *= filterScale;
 
 	const unsigned passes = requiredPasses( this, parent, filter );
 
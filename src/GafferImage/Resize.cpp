@@ -36,6 +36,7 @@
 
 #include "GafferImage/Resize.h"
 
+#include "GafferImage/ImageAlgo.h"
 #include "GafferImage/Resample.h"
 #include "GafferImage/Sampler.h"
 
@@ -237,14 +238,21 @@ void Resize::compute( ValuePlug *output, const Context *context ) const
 	FlatImageProcessor::compute( output, context );
 }
 
+int Resize::nativeLOD( int lod ) const
+{
+	// Our internal Resample deals with the level of detail itself.
+	return lod;
+}
+
 void Resize::hashFormat( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	h = formatPlug()->hash();
+	h.append( ImageAlgo::lod( context ) );
 }
 
 GafferImage::Format Resize::computeFormat( const Gaffer::Context *context, const ImagePlug *parent ) const
 {
-	return formatPlug()->getValue();
+	return ImageAlgo::lodFormat( formatPlug()->getValue(), ImageAlgo::lod( context ) );
 }
 
 void Resize::hashDataWindow( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const
@@ -270,6 +278,9 @@ IECore::ConstFloatVectorDataPtr Resize::computeChannelData( const std::string &c
 const ImagePlug *Resize::source() const
 {
 	ImagePlug::GlobalScope c( Context::current() );
+	// Compare at full resolution, since distinct formats may round to
+	// the same size at a reduced level of detail.
+	c.remove( ImagePlug::lodContextName );
 	if( formatPlug()->getValue().getDisplayWindow() == inPlug()->formatPlug()->getValue().getDisplayWindow() )
 	{
 		return inPlug();
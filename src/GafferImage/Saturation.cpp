@@ -36,11 +36,29 @@
 
 #include "GafferImage/Saturation.h"
 
+#include "GafferImage/Private/KernelTargets.h"
+
 using namespace std;
 using namespace IECore;
 using namespace Gaffer;
 using namespace GafferImage;
 
+namespace
+{
+
+GAFFERIMAGE_KERNEL_TARGETS void saturate( float *r, float *g, float *b, float saturation, int size )
+{
+	for( int i = 0; i < size; i++ )
+	{
+		float lum = r[i] * 0.2126 + g[i] * 0.7152 + b[i] * 0.0722;
+		r[i] = ( r[i] - lum ) * saturation + lum;
+		g[i] = ( g[i] - lum ) * saturation + lum;
+		b[i] = ( b[i] - lum ) * saturation + lum;
+	}
+}
+
+} // namespace
+
 GAFFER_NODE_DEFINE_TYPE( Saturation );
 
 size_t Saturation::g_firstPlugIndex = 0;
@@ -112,15 +130,8 @@ void Saturation::processColorData( const Gaffer::Context *context, IECore::Float
 		return;
 	}
 
-	std::vector<float> &r = rData->writable();
-	std::vector<float> &g = gData->writable();
-	std::vector<float> &b = bData->writable();
-
-	for( int i = 0; i < ImagePlug::tilePixels(); i++ )
-	{
-		float lum = r[i] * 0.2126 + g[i] * 0.7152 + b[i] * 0.0722;
-		r[i] = ( r[i] - lum ) * saturation + lum;
-		g[i] = ( g[i] - lum ) * saturation + lum;
-		b[i] = ( b[i] - lum ) * saturation + lum;
-	}
+	saturate(
+		rData->writable().data(), gData->writable().data(), bData->writable().data(),
+		saturation, ImagePlug::tilePixels()
+	);
 }
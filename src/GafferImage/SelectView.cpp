@@ -102,6 +102,11 @@ void SelectView::affects( const Gaffer::Plug *input, AffectedPlugsContainer &out
 	}
 }
 
+int SelectView::nativeLOD( int lod ) const
+{
+	return lod;
+}
+
 std::string SelectView::selectViewName( const Gaffer::Context *context ) const
 {
 	ImagePlug::GlobalScope g( context  );
@@ -152,6 +152,11 @@ void Shuffle::affects( const Gaffer::Plug *input, AffectedPlugsContainer &output
 	}
 }
 
+int Shuffle::nativeLOD( int lod ) const
+{
+	return lod;
+}
+
 void Shuffle::hashChannelNames( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
 	ImageProcessor::hashChannelNames( parent, context, h );
@@ -37,11 +37,29 @@
 
 #include "GafferImage/Unpremultiply.h"
 
+#include "GafferImage/Private/KernelTargets.h"
+
 #include "Gaffer/Context.h"
 
 using namespace IECore;
 using namespace Gaffer;
 
+namespace
+{
+
+// Pixels with zero alpha are left untouched. This is expressed as a division
+// by one rather than a branch, so that the loop can be vectorised.
+GAFFERIMAGE_KERNEL_TARGETS void unpremultiply( const float *a, float *out, size_t size )
+{
+	for( size_t i = 0; i < size; ++i )
+	{
+		const float d = a[i] != 0.0f ? a[i] : 1.0f;
+		out[i] = out[i] / d;
+	}
+}
+
+} // namespace
+
 namespace GafferImage
 {
 
@@ -127,14 +145,7 @@ void Unpremultiply::processChannelData( const Gaffer::Context *context, const Im
 	const std::vector<float> &a = aData->readable();
 	std::vector<float> &out = outData->writable();
 
-	std::vector<float>::const_iterator aIt = a.begin();
-	for ( std::vector<float>::iterator outIt = out.begin(), outItEnd = out.end(); outIt != outItEnd; ++outIt, ++aIt )
-	{
-		if ( *aIt != 0.0f )
-		{
-			*outIt /= *aIt;
-		}
-	}
+	unpremultiply( a.data(), out.data(), out.size() );
 }
 
 } // namespace GafferImage
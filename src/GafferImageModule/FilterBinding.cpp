@@ -50,7 +50,15 @@ using namespace GafferImage;
 
 void GafferImageModule::bindFilters()
 {
-	DependencyNodeClass<Blur>();
+	{
+		scope s = DependencyNodeClass<Blur>();
+
+		enum_<Blur::Mode>( "Mode" )
+			.value( "Accurate", Blur::Accurate )
+			.value( "Fast", Blur::Fast )
+		;
+	}
+
 	DependencyNodeClass<RankFilter>( nullptr, no_init );
 	DependencyNodeClass<Median>();
 	DependencyNodeClass<Dilate>();
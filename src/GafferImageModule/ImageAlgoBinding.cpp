@@ -214,6 +214,10 @@ void GafferImageModule::bindImageAlgo()
 	def( "channelExists", ( bool (*)( const std::vector<std::string> &channelNames, const std::string &channelName ) )&GafferImage::ImageAlgo::channelExists );
 	def( "sortedChannelNames", &sortedChannelNamesWrapper );
 
+	def( "lod", &ImageAlgo::lod );
+	def( "lodWindow", &ImageAlgo::lodWindow );
+	def( "lodFormat", &ImageAlgo::lodFormat );
+
 	enum_<ImageAlgo::TileOrder>( "TileOrder" )
 		.value( "Unordered", ImageAlgo::Unordered )
 		.value( "TopToBottom", ImageAlgo::TopToBottom )
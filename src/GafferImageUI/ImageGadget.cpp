@@ -113,6 +113,10 @@ void findUsableTextureFormats( GLenum &monochromeFormat, GLenum &colorFormat )
 
 uint64_t g_tileUpdateCount;
 
+// Beyond this, a tile covers so much of the image that there is
+// little to be gained by going further.
+const int g_maxLOD = 8;
+
 //////////////////////////////////////////////////////////////////////////
 // TileShader
 //////////////////////////////////////////////////////////////////////////
@@ -323,9 +327,12 @@ ImageGadget::ImageGadget()
 		m_soloChannel( -1 ),
 		m_labelsVisible( true ),
 		m_paused( false ),
+		m_adaptiveResolution( false ),
 		m_wipeEnabled( false ),
 		m_dirtyFlags( AllDirty ),
 		m_renderRequestPending( false ),
+		m_lod( 0 ),
+		m_tilesLOD( 0 ),
 		m_blendMode( BlendMode::Over )
 {
 	m_rgbaChannels[0] = "R";
@@ -484,6 +491,21 @@ bool ImageGadget::getPaused() const
 	return m_paused;
 }
 
+void ImageGadget::setAdaptiveResolution( bool adaptiveResolution )
+{
+	if( adaptiveResolution == m_adaptiveResolution )
+	{
+		return;
+	}
+	m_adaptiveResolution = adaptiveResolution;
+	Gadget::dirty( DirtyType::Render );
+}
+
+bool ImageGadget::getAdaptiveResolution() const
+{
+	return m_adaptiveResolution;
+}
+
 uint64_t ImageGadget::tileUpdateCount()
 {
 	return g_tileUpdateCount;
@@ -840,7 +862,36 @@ void ImageGadget::updateTiles()
 	}
 
 	stateChangedSignal()( this );
-	removeOutOfBoundsTiles();
+
+	// Figure out the data window for the level of detail we're
+	// computing. We can't just use `ImageAlgo::lodWindow()` because
+	// nodes with native support for reduced levels of detail may
+	// not round in exactly the same way.
+
+	const int lod = m_lod;
+	Context::EditableScope scopedContext( m_context.get() );
+	Box2i dataWindow;
+	if( lod && m_image )
+	{
+		scopedContext.set( ImagePlug::lodContextName, &lod );
+		dataWindow = m_image->dataWindowPlug()->getValue();
+	}
+	else
+	{
+		dataWindow = this->dataWindow();
+	}
+
+	if( lod && lod == m_tilesLOD )
+	{
+		m_tilesDataWindow = dataWindow;
+	}
+
+	removeOutOfBoundsTiles( lod, dataWindow );
+
+	// Only compute the tiles we can actually see.
+
+	m_tilesRegion = m_region;
+	const Box2i tilesWindow = BufferAlgo::intersection( dataWindow, ImageAlgo::lodWindow( m_region, lod ) );
 
 	// Decide which channels to compute. This is the intersection
 	// of the available channels (channelNames) and the channels
@@ -858,19 +909,17 @@ void ImageGadget::updateTiles()
 		}
 	}
 
-	const Box2i dataWindow = this->dataWindow();
-
 	// Do the actual work of generating the tiles asynchronously,
 	// in the background.
 
-	auto tileFunctor = [this, channelsToCompute] ( const ImagePlug *image, const V2i &tileOrigin ) {
+	auto tileFunctor = [this, channelsToCompute, lod] ( const ImagePlug *image, const V2i &tileOrigin ) {
 
 		vector<Tile::Update> updates;
 		ImagePlug::ChannelDataScope channelScope( Context::current() );
 		for( auto &channelName : channelsToCompute )
 		{
 			channelScope.setChannelName( &channelName );
-			Tile &tile = m_tiles[TileIndex(tileOrigin, channelName)];
+			Tile &tile = m_tiles[TileIndex(tileOrigin, channelName, lod)];
 			updates.push_back( tile.computeUpdate( image ) );
 		}
 
@@ -897,20 +946,27 @@ void ImageGadget::updateTiles()
 	// This means that any internal nodes of ImageGadget are not part of the automatic
 	// task cancellation and we must ensure that we never modify internal nodes while
 	// the background task is running ( this is easier now that there are no internal nodes ).
-	Context::Scope scopedContext( m_context.get() );
 	m_tilesTask = ParallelAlgo::callOnBackgroundThread(
 		// Subject
 		m_image.get(),
 		// OK to capture `this` via raw pointer, because ~ImageGadget waits for
 		// the background process to complete.
-		[ this, channelsToCompute, dataWindow, tileFunctor ] {
-			ImageAlgo::parallelProcessTiles( m_image.get(), tileFunctor, dataWindow );
+		[ this, channelsToCompute, dataWindow, tilesWindow, tileFunctor, lod ] {
+			ImageAlgo::parallelProcessTiles( m_image.get(), tileFunctor, tilesWindow );
 			m_dirtyFlags &= ~TilesDirty;
 			if( refCount() )
 			{
 				ImageGadgetPtr thisRef = this;
 				ParallelAlgo::callOnUIThread(
-					[thisRef] {
+					[thisRef, lod, dataWindow] {
+						if( lod != thisRef->m_tilesLOD && lod == thisRef->m_lod )
+						{
+							// We now have a complete set of tiles for the new
+							// level of detail, so can switch to displaying them.
+							thisRef->m_tilesLOD = lod;
+							thisRef->m_tilesDataWindow = dataWindow;
+							thisRef->Gadget::dirty( DirtyType::Render );
+						}
 						thisRef->stateChangedSignal()( thisRef.get() );
 					}
 				);
@@ -920,7 +976,7 @@ void ImageGadget::updateTiles()
 
 }
 
-void ImageGadget::removeOutOfBoundsTiles() const
+void ImageGadget::removeOutOfBoundsTiles( int lod, const Imath::Box2i &lodDataWindow ) const
 {
 	// In theory, any given tile we hold could turn out to be valid
 	// for some future image we want to display, particularly if the
@@ -928,13 +984,23 @@ void ImageGadget::removeOutOfBoundsTiles() const
 	// we don't want to accumulate unbounded numbers of tiles either,
 	// so here we prune out any tiles that we know can't be useful for
 	// the current image, because they either have an invalid channel
-	// name or are outside the data window.
-	const Box2i &dw = dataWindow();
+	// name, are outside the data window, or are for a level of detail
+	// that we are neither displaying nor computing.
 	const vector<string> &ch = channelNames();
 	for( Tiles::iterator it = m_tiles.begin(); it != m_tiles.end(); )
 	{
+		const Box2i *dw = nullptr;
+		if( it->first.lod == lod )
+		{
+			dw = &lodDataWindow;
+		}
+		else if( it->first.lod == m_tilesLOD )
+		{
+			dw = &tilesDataWindow();
+		}
+
 		const Box2i tileBound( it->first.tileOrigin, it->first.tileOrigin + V2i( ImagePlug::tileSize() ) );
-		if( !BufferAlgo::intersects( dw, tileBound ) || find( ch.begin(), ch.end(), it->first.channelName.string() ) == ch.end() )
+		if( !dw || !BufferAlgo::intersects( *dw, tileBound ) || find( ch.begin(), ch.end(), it->first.channelName.string() ) == ch.end() )
 		{
 			it = m_tiles.unsafe_erase( it );
 		}
@@ -945,6 +1011,95 @@ void ImageGadget::removeOutOfBoundsTiles() const
 	}
 }
 
+//////////////////////////////////////////////////////////////////////////
+// Level of detail
+//////////////////////////////////////////////////////////////////////////
+
+int ImageGadget::viewportLOD() const
+{
+	if( !m_adaptiveResolution )
+	{
+		return 0;
+	}
+
+	const ViewportGadget *viewport = ancestor<ViewportGadget>();
+	if( !viewport )
+	{
+		return 0;
+	}
+
+	// Measure vertically, so we don't need to account for pixel aspect.
+	const V2f p0 = viewport->gadgetToRasterSpace( V3f( 0.0f ), this );
+	const V2f p1 = viewport->gadgetToRasterSpace( V3f( 0.0f, 1.0f, 0.0f ), this );
+	const float rasterPixelsPerPixel = ( p1 - p0 ).length();
+	if( rasterPixelsPerPixel <= 0.0f || rasterPixelsPerPixel >= 1.0f )
+	{
+		return 0;
+	}
+
+	return std::min( (int)floorf( log2f( 1.0f / rasterPixelsPerPixel ) ), g_maxLOD );
+}
+
+void ImageGadget::updateLOD( int lod )
+{
+	if( lod == m_lod )
+	{
+		return;
+	}
+
+	// Cancel any update for the previous level unconditionally,
+	// since it would otherwise clear `TilesDirty` on completion.
+	m_tilesTask.reset();
+	m_lod = lod;
+	m_dirtyFlags |= TilesDirty;
+}
+
+const Imath::Box2i &ImageGadget::tilesDataWindow() const
+{
+	return m_tilesLOD ? m_tilesDataWindow : dataWindow();
+}
+
+//////////////////////////////////////////////////////////////////////////
+// Region of interest
+//////////////////////////////////////////////////////////////////////////
+
+Imath::Box2i ImageGadget::viewportRegion() const
+{
+	const ViewportGadget *viewport = ancestor<ViewportGadget>();
+	if( !viewport )
+	{
+		return dataWindow();
+	}
+
+	const V2f viewportSize( viewport->getViewport() );
+	Box2f region;
+	for( const auto &corner : { V2f( 0 ), V2f( viewportSize.x, 0 ), V2f( 0, viewportSize.y ), viewportSize } )
+	{
+		region.extendBy( pixelAt( viewport->rasterToGadgetSpace( corner, this ) ) );
+	}
+
+	return Box2i(
+		V2i( (int)floorf( region.min.x ), (int)floorf( region.min.y ) ),
+		V2i( (int)ceilf( region.max.x ), (int)ceilf( region.max.y ) )
+	);
+}
+
+void ImageGadget::updateRegion( const Imath::Box2i &visibleRegion )
+{
+	if( BufferAlgo::contains( m_tilesRegion, visibleRegion ) )
+	{
+		return;
+	}
+
+	// Pad by a tile at the current level of detail, and cancel any
+	// update in progress, since it is computing tiles we may no
+	// longer be able to see.
+	const int padding = ImagePlug::tileSize() << m_lod;
+	m_region = Box2i( visibleRegion.min - V2i( padding ), visibleRegion.max + V2i( padding ) );
+	m_tilesTask.reset();
+	m_dirtyFlags |= TilesDirty;
+}
+
 //////////////////////////////////////////////////////////////////////////
 // Rendering
 //////////////////////////////////////////////////////////////////////////
@@ -961,6 +1116,12 @@ void ImageGadget::renderTiles() const
 {
 	float radians = m_wipeAngle * M_PI / 180.0f;
 	const Box2i dataWindow = this->dataWindow();
+	const Box2f dataWindowF( V2f( dataWindow.min ), V2f( dataWindow.max ) );
+
+	// Tiles may be at a reduced level of detail, in which case we
+	// scale them back up to full resolution for drawing.
+	const Box2i tilesDataWindow = this->tilesDataWindow();
+	const float lodScale = (float)( 1 << m_tilesLOD );
 
 	TileShader::ScopedBinding shaderBinding(
 		*tileShader(),
@@ -971,17 +1132,17 @@ void ImageGadget::renderTiles() const
 
 	const float pixelAspect = this->format().getPixelAspect();
 
-	V2i tileOrigin = ImagePlug::tileOrigin( dataWindow.min );
-	for( ; tileOrigin.y < dataWindow.max.y; tileOrigin.y += ImagePlug::tileSize() )
+	V2i tileOrigin = ImagePlug::tileOrigin( tilesDataWindow.min );
+	for( ; tileOrigin.y < tilesDataWindow.max.y; tileOrigin.y += ImagePlug::tileSize() )
 	{
-		for( tileOrigin.x = ImagePlug::tileOrigin( dataWindow.min ).x; tileOrigin.x < dataWindow.max.x; tileOrigin.x += ImagePlug::tileSize() )
+		for( tileOrigin.x = ImagePlug::tileOrigin( tilesDataWindow.min ).x; tileOrigin.x < tilesDataWindow.max.x; tileOrigin.x += ImagePlug::tileSize() )
 		{
 			bool active = false;
 			IECoreGL::ConstTexturePtr channelTextures[4];
 			for( int i = 0; i < 4; ++i )
 			{
 				const InternedString channelName = ( m_soloChannel < 0 || i == 3 ) ? m_rgbaChannels[i] : m_rgbaChannels[m_soloChannel];
-				Tiles::const_iterator it = m_tiles.find( TileIndex( tileOrigin, channelName ) );
+				Tiles::const_iterator it = m_tiles.find( TileIndex( tileOrigin, channelName, m_tilesLOD ) );
 				if( it != m_tiles.end() )
 				{
 					channelTextures[i] = it->second.texture( active );
@@ -993,8 +1154,25 @@ void ImageGadget::renderTiles() const
 			}
 			shaderBinding.loadTile( channelTextures, active );
 
-			const Box2i tileBound( tileOrigin, tileOrigin + V2i( ImagePlug::tileSize() ) );
-			const Box2i validBound = BufferAlgo::intersection( tileBound, dataWindow );
+			const Box2i lodTileBound( tileOrigin, tileOrigin + V2i( ImagePlug::tileSize() ) );
+			const Box2i lodValidBound = BufferAlgo::intersection( lodTileBound, tilesDataWindow );
+			const Box2f tileBound( V2f( lodTileBound.min ) * lodScale, V2f( lodTileBound.max ) * lodScale );
+			// Reduced levels of detail round outwards, so clip back to the
+			// full resolution data window.
+			const Box2f validBound(
+				V2f(
+					std::max( (float)lodValidBound.min.x * lodScale, dataWindowF.min.x ),
+					std::max( (float)lodValidBound.min.y * lodScale, dataWindowF.min.y )
+				),
+				V2f(
+					std::min( (float)lodValidBound.max.x * lodScale, dataWindowF.max.x ),
+					std::min( (float)lodValidBound.max.y * lodScale, dataWindowF.max.y )
+				)
+			);
+			if( validBound.min.x >= validBound.max.x || validBound.min.y >= validBound.max.y )
+			{
+				continue;
+			}
 			const Box2f uvBound(
 				V2f(
 					lerpfactor<float>( validBound.min.x, tileBound.min.x, tileBound.max.x ),
@@ -1063,6 +1241,8 @@ void ImageGadget::renderLayer( Layer layer, const GafferUI::Style *style, Render
 	{
 		format = this->format();
 		dataWindow = this->dataWindow();
+		const_cast<ImageGadget *>( this )->updateLOD( viewportLOD() );
+		const_cast<ImageGadget *>( this )->updateRegion( viewportRegion() );
 		const_cast<ImageGadget *>( this )->updateTiles();
 	}
 	catch( ... )
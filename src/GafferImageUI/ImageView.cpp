@@ -1498,6 +1498,7 @@ ImageView::ImageView( const std::string &name )
 
 	addChild( new StringPlug( "displayTransform", Plug::In, "Default", Plug::Default & ~Plug::AcceptsInputs ) );
 	addChild( new BoolPlug( "lutGPU", Plug::In, true, Plug::Default & ~Plug::AcceptsInputs ) );
+	addChild( new BoolPlug( "adaptiveResolution", Plug::In, true, Plug::Default & ~Plug::AcceptsInputs ) );
 
 	ImagePlugPtr preprocessorOutput = new ImagePlug( "out", Plug::Out );
 	preprocessor->addChild( preprocessorOutput );
@@ -1581,6 +1582,7 @@ ImageView::ImageView( const std::string &name )
 
 	m_imageGadgets[0]->setImage( preprocessedInPlug<ImagePlug>() );
 	m_imageGadgets[0]->setContext( getContext() );
+	m_imageGadgets[0]->setAdaptiveResolution( adaptiveResolutionPlug()->getValue() );
 
 	m_comparisonSelect = new Gaffer::ContextVariables( "__comparisonSelect" );
 	addChild( m_comparisonSelect );
@@ -1593,6 +1595,7 @@ ImageView::ImageView( const std::string &name )
 	m_imageGadgets[1]->setImage( IECore::runTimeCast<GafferImage::ImagePlug>( m_comparisonSelect->outPlug() ) );
 	m_imageGadgets[1]->setContext( getContext() );
 	m_imageGadgets[1]->setLabelsVisible( false );
+	m_imageGadgets[1]->setAdaptiveResolution( adaptiveResolutionPlug()->getValue() );
 	m_imageGadgets[1]->setVisible( false );
 	viewportGadget()->addChild( m_imageGadgets[1] );
 
@@ -1738,6 +1741,16 @@ const Gaffer::BoolPlug *ImageView::lutGPUPlug() const
 	return getChild<BoolPlug>( "lutGPU" );
 }
 
+Gaffer::BoolPlug *ImageView::adaptiveResolutionPlug()
+{
+	return getChild<BoolPlug>( "adaptiveResolution" );
+}
+
+const Gaffer::BoolPlug *ImageView::adaptiveResolutionPlug() const
+{
+	return getChild<BoolPlug>( "adaptiveResolution" );
+}
+
 Gaffer::StringPlug *ImageView::viewPlug()
 {
 	return getChild<StringPlug>( "view" );
@@ -1876,6 +1889,12 @@ void ImageView::plugSet( Gaffer::Plug *plug )
 		m_lutGPU = lutGPUPlug()->getValue();
 		updateDisplayTransform();
 	}
+	else if( plug == adaptiveResolutionPlug() )
+	{
+		const bool adaptiveResolution = adaptiveResolutionPlug()->getValue();
+		m_imageGadgets[0]->setAdaptiveResolution( adaptiveResolution );
+		m_imageGadgets[1]->setAdaptiveResolution( adaptiveResolution );
+	}
 	else if( plug == compareModePlug() )
 	{
 		std::string compareMode = compareModePlug()->getValue();
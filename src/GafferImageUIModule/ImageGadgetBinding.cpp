@@ -114,6 +114,8 @@ void GafferImageUIModule::bindImageGadget()
 		.def( "getSoloChannel", &ImageGadget::getSoloChannel )
 		.def( "setPaused", &setPaused )
 		.def( "getPaused", &ImageGadget::getPaused )
+		.def( "setAdaptiveResolution", &ImageGadget::setAdaptiveResolution )
+		.def( "getAdaptiveResolution", &ImageGadget::getAdaptiveResolution )
 		.def( "tileUpdateCount", &ImageGadget::tileUpdateCount )
 		.staticmethod( "tileUpdateCount" )
 		.def( "resetTileUpdateCount", &ImageGadget::resetTileUpdateCount )
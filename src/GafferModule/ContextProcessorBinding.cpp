@@ -187,9 +187,17 @@ class ContextQuerySerialiser : public NodeSerialiser
 void GafferModule::bindContextProcessor()
 {
 
-	DependencyNodeClass<Loop>()
-		.def( "setup", &setupLoop )
-	;
+	{
+		scope s = DependencyNodeClass<Loop>()
+			.def( "setup", &setupLoop )
+		;
+
+		enum_<Loop::EvaluationMode>( "EvaluationMode" )
+			.value( "Recursive", Loop::Recursive )
+			.value( "Sequential", Loop::Sequential )
+			.value( "Parallel", Loop::Parallel )
+		;
+	}
 
 	DependencyNodeClass<ContextProcessor>()
 		.def( "setup", &setupContextProcessor )
@@ -105,6 +105,36 @@ void hash2( ValuePlug *plug, IECore::MurmurHash &h )
 	plug->hash( h);
 }
 
+std::string cacheStatisticsRepr( const ValuePlug::CacheStatistics &s )
+{
+	return boost::str(
+		boost::format( "Gaffer.ValuePlug.CacheStatistics( hits = %d, misses = %d, evictions = %d, residentBytes = %d )" )
+			% s.hits
+			% s.misses
+			% s.evictions
+			% s.residentBytes
+	);
+}
+
+boost::python::dict cacheStatistics()
+{
+	boost::python::dict result;
+	for( const auto &s : ValuePlug::cacheStatistics() )
+	{
+		result[s.first] = s.second;
+	}
+	return result;
+}
+
+boost::python::list cachePartitions()
+{
+	boost::python::list result;
+	for( const auto &partition : ValuePlug::cachePartitions() )
+	{
+		result.append( partition.string() );
+	}
+	return result;
+}
 
 } // namespace
 
@@ -127,14 +157,47 @@ void GafferModule::bindValuePlug()
 		.def( "defaultHash", &ValuePlug::defaultHash )
 		.def( "hash", hash )
 		.def( "hash", hash2 )
-		.def( "getCacheMemoryLimit", &ValuePlug::getCacheMemoryLimit )
+		.def( "getCacheMemoryLimit", (size_t (*)())&ValuePlug::getCacheMemoryLimit )
+		.def( "getCacheMemoryLimit", (size_t (*)( const IECore::InternedString & ))&ValuePlug::getCacheMemoryLimit )
 		.staticmethod( "getCacheMemoryLimit" )
-		.def( "setCacheMemoryLimit", &ValuePlug::setCacheMemoryLimit )
+		.def( "setCacheMemoryLimit", (void (*)( size_t ))&ValuePlug::setCacheMemoryLimit )
+		.def( "setCacheMemoryLimit", (void (*)( const IECore::InternedString &, size_t ))&ValuePlug::setCacheMemoryLimit )
 		.staticmethod( "setCacheMemoryLimit" )
-		.def( "cacheMemoryUsage", &ValuePlug::cacheMemoryUsage )
+		.def( "removeCacheMemoryLimit", &ValuePlug::removeCacheMemoryLimit )
+		.staticmethod( "removeCacheMemoryLimit" )
+		.def( "cacheMemoryUsage", (size_t (*)())&ValuePlug::cacheMemoryUsage )
+		.def( "cacheMemoryUsage", (size_t (*)( const IECore::InternedString & ))&ValuePlug::cacheMemoryUsage )
 		.staticmethod( "cacheMemoryUsage" )
+		.def( "cacheEvictions", &ValuePlug::cacheEvictions, ( arg( "partition" ) = "" ) )
+		.staticmethod( "cacheEvictions" )
+		.def( "cachePartitions", &cachePartitions )
+		.staticmethod( "cachePartitions" )
+		.def( "setCacheStatisticsEnabled", &ValuePlug::setCacheStatisticsEnabled )
+		.staticmethod( "setCacheStatisticsEnabled" )
+		.def( "getCacheStatisticsEnabled", &ValuePlug::getCacheStatisticsEnabled )
+		.staticmethod( "getCacheStatisticsEnabled" )
+		.def( "cacheStatistics", &cacheStatistics )
+		.staticmethod( "cacheStatistics" )
 		.def( "clearCache", &ValuePlug::clearCache )
 		.staticmethod( "clearCache" )
+		.def( "getCacheEvictionPolicy", &ValuePlug::getCacheEvictionPolicy )
+		.staticmethod( "getCacheEvictionPolicy" )
+		.def( "setCacheEvictionPolicy", &ValuePlug::setCacheEvictionPolicy )
+		.staticmethod( "setCacheEvictionPolicy" )
+		.def( "getPersistentCacheDirectory", &ValuePlug::getPersistentCacheDirectory )
+		.staticmethod( "getPersistentCacheDirectory" )
+		.def( "setPersistentCacheDirectory", &ValuePlug::setPersistentCacheDirectory )
+		.staticmethod( "setPersistentCacheDirectory" )
+		.def( "getPersistentCacheLimit", &ValuePlug::getPersistentCacheLimit )
+		.staticmethod( "getPersistentCacheLimit" )
+		.def( "setPersistentCacheLimit", &ValuePlug::setPersistentCacheLimit )
+		.staticmethod( "setPersistentCacheLimit" )
+		.def( "persistentCacheUsage", &ValuePlug::persistentCacheUsage )
+		.staticmethod( "persistentCacheUsage" )
+		.def( "persistentCacheHits", &ValuePlug::persistentCacheHits )
+		.staticmethod( "persistentCacheHits" )
+		.def( "persistentCacheMisses", &ValuePlug::persistentCacheMisses )
+		.staticmethod( "persistentCacheMisses" )
 		.def( "getHashCacheSizeLimit", &ValuePlug::getHashCacheSizeLimit )
 		.staticmethod( "getHashCacheSizeLimit" )
 		.def( "setHashCacheSizeLimit", &ValuePlug::setHashCacheSizeLimit )
@@ -147,6 +210,10 @@ void GafferModule::bindValuePlug()
 		.staticmethod( "getHashCacheMode" )
 		.def( "setHashCacheMode", &ValuePlug::setHashCacheMode )
 		.staticmethod( "setHashCacheMode" )
+		.def( "getHashCacheAdaptive", &ValuePlug::getHashCacheAdaptive )
+		.staticmethod( "getHashCacheAdaptive" )
+		.def( "setHashCacheAdaptive", &ValuePlug::setHashCacheAdaptive )
+		.staticmethod( "setHashCacheAdaptive" )
 		.def( "dirtyCount", &ValuePlug::dirtyCount )
 		.def( "__repr__", &repr )
 	;
@@ -157,6 +224,32 @@ void GafferModule::bindValuePlug()
 		.value( "Legacy", ValuePlug::HashCacheMode::Legacy )
 	;
 
+	class_<ValuePlug::CacheStatistics>( "CacheStatistics" )
+		.def(
+			init<size_t, size_t, size_t, size_t>(
+				(
+					arg( "hits" ) = 0,
+					arg( "misses" ) = 0,
+					arg( "evictions" ) = 0,
+					arg( "residentBytes" ) = 0
+				)
+			)
+		)
+		.def_readwrite( "hits", &ValuePlug::CacheStatistics::hits )
+		.def_readwrite( "misses", &ValuePlug::CacheStatistics::misses )
+		.def_readwrite( "evictions", &ValuePlug::CacheStatistics::evictions )
+		.def_readwrite( "residentBytes", &ValuePlug::CacheStatistics::residentBytes )
+		.def( self == self )
+		.def( self != self )
+		.def( self += self )
+		.def( "__repr__", &cacheStatisticsRepr )
+	;
+
+	enum_<ValuePlug::CacheEvictionPolicy>( "CacheEvictionPolicy" )
+		.value( "LRU", ValuePlug::CacheEvictionPolicy::LRU )
+		.value( "ComputeCost", ValuePlug::CacheEvictionPolicy::ComputeCost )
+	;
+
 	enum_<ValuePlug::CachePolicy>( "CachePolicy" )
 		.value( "Uncached", ValuePlug::CachePolicy::Uncached )
 		.value( "Standard", ValuePlug::CachePolicy::Standard )
@@ -56,6 +56,13 @@ using namespace Gaffer;
 
 GAFFER_NODE_DEFINE_TYPE( SceneNode );
 
+namespace
+{
+
+const IECore::InternedString g_sceneCachePartition( "scene" );
+
+} // namespace
+
 size_t SceneNode::g_firstPlugIndex = 0;
 
 SceneNode::SceneNode( const std::string &name )
@@ -438,6 +445,15 @@ Gaffer::ValuePlug::CachePolicy SceneNode::computeCachePolicy( const Gaffer::Valu
 	return ComputeNode::computeCachePolicy( output );
 }
 
+IECore::InternedString SceneNode::computeCachePartition( const Gaffer::ValuePlug *output ) const
+{
+	if( output->parent<ScenePlug>() )
+	{
+		return g_sceneCachePartition;
+	}
+	return ComputeNode::computeCachePartition( output );
+}
+
 IECore::MurmurHash SceneNode::hashOfTransformedChildBounds( const ScenePath &path, const ScenePlug *out, const IECore::InternedStringVectorData *childNamesData ) const
 {
 	ScenePlug::PathScope pathScope( Context::current(), &path );
@@ -46,6 +46,7 @@
 
 #include "boost/lexical_cast.hpp"
 #include "tbb/parallel_for.h"
+#include <functional>
 #include <random>
 #include <unordered_set>
 
@@ -324,6 +325,74 @@ void GafferTest::testContextCopyPerformance( int numEntries, int entrySize )
 
 }
 
+void GafferTest::testContextNestedScopePerformance( int numEntries, int depth )
+{
+	// Emulates the pattern used by Loop, where each iteration is evaluated
+	// in an EditableScope derived from the context of the next iteration,
+	// and the hash is needed at every level.
+	ContextPtr baseContext = new Context();
+	for( int i = 0; i < numEntries; i++ )
+	{
+		baseContext->set( InternedString( i ), std::string( 10, 'x' ) );
+	}
+	baseContext->hash();
+
+	const InternedString indexName = "loop:index";
+
+	std::function<void ( const Context *, int )> recurse;
+	recurse = [&recurse, &indexName, depth] ( const Context *context, int i ) {
+		Context::EditableScope scope( context );
+		scope.set( indexName, &i );
+		scope.context()->hash();
+		if( i < depth )
+		{
+			recurse( scope.context(), i + 1 );
+		}
+	};
+
+	tbb::parallel_for( tbb::blocked_range<int>( 0, 10000 ), [&]( const tbb::blocked_range<int> &r )
+		{
+			for( int i = r.begin(); i != r.end(); ++i )
+			{
+				recurse( baseContext.get(), 0 );
+			}
+		}
+	);
+}
+
+void GafferTest::testContextVariationPerformance( int numEntries, int numVariables )
+{
+	// Emulates the pattern used by Instancer, where each instance is
+	// evaluated in an EditableScope with several variables set from
+	// the instance's primitive variables.
+	ContextPtr baseContext = new Context();
+	for( int i = 0; i < numEntries; i++ )
+	{
+		baseContext->set( InternedString( i ), std::string( 10, 'x' ) );
+	}
+	baseContext->hash();
+
+	vector<InternedString> variableNames;
+	for( int i = 0; i < numVariables; i++ )
+	{
+		variableNames.push_back( "instancer:" + std::to_string( i ) );
+	}
+
+	tbb::parallel_for( tbb::blocked_range<int>( 0, 1000000 ), [&]( const tbb::blocked_range<int> &r )
+		{
+			for( int i = r.begin(); i != r.end(); ++i )
+			{
+				Context::EditableScope scope( baseContext.get() );
+				for( const auto &name : variableNames )
+				{
+					scope.set( name, &i );
+				}
+				scope.context()->hash();
+			}
+		}
+	);
+}
+
 void GafferTest::testCopyEditableScope()
 {
 	ContextPtr copy;
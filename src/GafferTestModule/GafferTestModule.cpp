@@ -105,6 +105,8 @@ BOOST_PYTHON_MODULE( _GafferTest )
 	def( "countContextHash32Collisions", &countContextHash32CollisionsWrapper );
 	def( "testContextHashPerformance", &testContextHashPerformance );
 	def( "testContextCopyPerformance", &testContextCopyPerformance );
+	def( "testContextNestedScopePerformance", &testContextNestedScopePerformance );
+	def( "testContextVariationPerformance", &testContextVariationPerformance );
 	def( "testCopyEditableScope", &testCopyEditableScope );
 	def( "testContextHashValidation", &testContextHashValidation );
 	def( "testComputeNodeThreading", &testComputeNodeThreading );
@@ -887,6 +887,114 @@ void testLRUCacheSetIfUncachedRecursion( const std::string &policy )
 	DispatchTest<TestLRUCacheSetIfUncachedRecursion>()( policy );
 }
 
+template<template<typename> class Policy>
+struct TestLRUCacheComputeCostEviction
+{
+
+	void operator()()
+	{
+		using Cache = LRUCache<int, int, Policy>;
+
+		for( auto evictionPolicy : { Cache::EvictionPolicy::LRU, Cache::EvictionPolicy::ComputeCost } )
+		{
+			Cache cache(
+				[]( int key, size_t &cost, const IECore::Canceller *canceller ) {
+					cost = 1000;
+					return key;
+				},
+				10000
+			);
+
+			cache.setEvictionPolicy( evictionPolicy );
+			GAFFERTEST_ASSERT( cache.getEvictionPolicy() == evictionPolicy );
+
+			auto costFunction = [] ( int value ) { return 1000; };
+
+			// Add an item that is expensive to compute, followed by
+			// enough cheap items to fill the cache twice over. With the
+			// LRU policy the expensive item is evicted, but with the
+			// ComputeCost policy it is retained.
+
+			cache.setIfUncached( 0, 0, costFunction, std::chrono::milliseconds( 1 ) );
+			for( int i = 1; i <= 20; ++i )
+			{
+				cache.setIfUncached( i, i, costFunction, std::chrono::nanoseconds( 1 ) );
+				GAFFERTEST_ASSERT( cache.currentCost() <= 10000 );
+			}
+
+			GAFFERTEST_ASSERTEQUAL( cache.cached( 0 ), evictionPolicy == Cache::EvictionPolicy::ComputeCost );
+
+			// But recency is still taken into account, so if the
+			// expensive item isn't used, it is evicted eventually.
+
+			for( int i = 21; i <= 200; ++i )
+			{
+				cache.setIfUncached( i, i, costFunction, std::chrono::nanoseconds( 1 ) );
+			}
+
+			GAFFERTEST_ASSERT( !cache.cached( 0 ) );
+		}
+	}
+
+};
+
+void testLRUCacheComputeCostEviction( const std::string &policy )
+{
+	DispatchTest<TestLRUCacheComputeCostEviction>()( policy );
+}
+
+template<template<typename> class Policy>
+struct TestLRUCacheEvictions
+{
+
+	void operator()()
+	{
+		using Cache = LRUCache<int, int, Policy>;
+		Cache cache(
+			[]( int key, size_t &cost, const IECore::Canceller *canceller ) {
+				cost = 1;
+				return key;
+			},
+			10
+		);
+
+		GAFFERTEST_ASSERTEQUAL( cache.evictions(), 0 );
+
+		for( int i = 0; i < 10; ++i )
+		{
+			cache.get( i );
+		}
+		GAFFERTEST_ASSERTEQUAL( cache.evictions(), 0 );
+
+		for( int i = 10; i < 20; ++i )
+		{
+			cache.get( i );
+		}
+		GAFFERTEST_ASSERTEQUAL( cache.evictions(), 10 );
+
+		// Explicit removals are not evictions.
+
+		cache.erase( 19 );
+		cache.clear();
+		GAFFERTEST_ASSERTEQUAL( cache.evictions(), 10 );
+
+		// But reducing the maximum cost is.
+
+		for( int i = 0; i < 10; ++i )
+		{
+			cache.get( i );
+		}
+		cache.setMaxCost( 5 );
+		GAFFERTEST_ASSERTEQUAL( cache.evictions(), 15 );
+	}
+
+};
+
+void testLRUCacheEvictions( const std::string &policy )
+{
+	DispatchTest<TestLRUCacheEvictions>()( policy );
+}
+
 } // namespace
 
 void GafferTestModule::bindLRUCacheTest()
@@ -904,4 +1012,6 @@ void GafferTestModule::bindLRUCacheTest()
 	def( "testLRUCacheGetIfCached", &testLRUCacheGetIfCached );
 	def( "testLRUCacheSetIfUncached", &testLRUCacheSetIfUncached );
 	def( "testLRUCacheSetIfUncachedRecursion", &testLRUCacheSetIfUncachedRecursion );
+	def( "testLRUCacheComputeCostEviction", &testLRUCacheComputeCostEviction );
+	def( "testLRUCacheEvictions", &testLRUCacheEvictions );
 }
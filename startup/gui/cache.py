@@ -36,6 +36,7 @@
 ##########################################################################
 
 import Gaffer
+import GafferUI
 import GafferImage
 
 # add plugs to the preferences node
@@ -44,6 +45,9 @@ preferences = application.root()["preferences"]
 preferences["cache"] = Gaffer.Plug()
 preferences["cache"]["enabled"] = Gaffer.BoolPlug( defaultValue = True )
 preferences["cache"]["memoryLimit"] = Gaffer.IntPlug( defaultValue = Gaffer.ValuePlug.getCacheMemoryLimit() // ( 1024 * 1024 ) )
+preferences["cache"]["sceneMemoryLimit"] = Gaffer.IntPlug( defaultValue = 0, minValue = 0 )
+preferences["cache"]["imageMemoryLimit"] = Gaffer.IntPlug( defaultValue = 0, minValue = 0 )
+preferences["cache"]["prefetchFrames"] = Gaffer.IntPlug( defaultValue = 0, minValue = 0 )
 
 Gaffer.Metadata.registerValue( preferences["cache"], "plugValueWidget:type", "GafferUI.LayoutPlugValueWidget", persistent = False )
 Gaffer.Metadata.registerValue( preferences["cache"], "layout:section", "Cache", persistent = False )
@@ -57,6 +61,30 @@ Gaffer.Metadata.registerValue(
 	persistent = False
 )
 
+for partition in ( "scene", "image" ) :
+	Gaffer.Metadata.registerValue(
+		preferences["cache"][partition + "MemoryLimit"],
+		"description",
+		"""
+		Reserves a separate portion of the cache for {0}s, so that they are
+		not evicted by other types of data. A value of 0 stores {0}s in the
+		main cache, sharing the limit above.
+		""".format( partition ),
+		persistent = False
+	)
+
+Gaffer.Metadata.registerValue(
+	preferences["cache"]["prefetchFrames"],
+	"description",
+	"""
+	The number of frames either side of the current frame to compute
+	in the background while the UI is idle, so that the Viewer can
+	step or play through them quickly. Prefetching stops when the
+	cache is full. A value of 0 disables prefetching.
+	""",
+	persistent = False
+)
+
 # update cache settings when they change
 
 def __plugSet( plug ) :
@@ -70,4 +98,13 @@ def __plugSet( plug ) :
 
 	Gaffer.ValuePlug.setCacheMemoryLimit( memoryLimit )
 
+	for partition in ( "scene", "image" ) :
+		partitionLimit = plug[partition + "MemoryLimit"].getValue() * 1024 * 1024
+		if not partitionLimit :
+			Gaffer.ValuePlug.removeCacheMemoryLimit( partition )
+		else :
+			Gaffer.ValuePlug.setCacheMemoryLimit( partition, partitionLimit if plug["enabled"].getValue() else 0 )
+
+	GafferUI.PlaybackPrefetcher.setFrames( plug["prefetchFrames"].getValue() if plug["enabled"].getValue() else 0 )
+
 preferences.plugSetSignal().connect( __plugSet, scoped = False )